@@ -281,6 +281,25 @@ class PermissionDenied(KmipError):
         )
 
 
+class ServerOverloaded(KmipError):
+    """
+    An error generated when the server sheds a request it has no capacity to
+    process.
+    """
+
+    def __init__(self, message):
+        """
+        Create a ServerOverloaded exception.
+
+        Args:
+            message (string): A string containing information about the error.
+        """
+        super(ServerOverloaded, self).__init__(
+            reason=enums.ResultReason.GENERAL_FAILURE,
+            message=message
+        )
+
+
 class AttributeNotSupported(Exception):
     """
     An error generated when an unsupported attribute is processed.
@@ -335,6 +354,14 @@ class InvalidPrimitiveLength(Exception):
     pass
 
 
+class MessageTooLarge(Exception):
+    """
+    An error generated when a received message is larger than the maximum
+    allowed message size.
+    """
+    pass
+
+
 class ShutdownError(Exception):
     """
     An error generated when a problem occurs with shutting down the server.
@@ -14,80 +14,9 @@
 # under the License.
 
 from kmip.core.factories.payloads import PayloadFactory
-from kmip.core.messages import payloads
 
 
 class ResponsePayloadFactory(PayloadFactory):
 
-    # TODO (peterhamilton) Alphabetize these
-    def _create_create_payload(self):
-        return payloads.CreateResponsePayload()
-
-    def _create_create_key_pair_payload(self):
-        return payloads.CreateKeyPairResponsePayload()
-
-    def _create_register_payload(self):
-        return payloads.RegisterResponsePayload()
-
-    def _create_derive_key_payload(self):
-        return payloads.DeriveKeyResponsePayload()
-
-    def _create_rekey_payload(self):
-        return payloads.RekeyResponsePayload()
-
-    def _create_rekey_key_pair_payload(self):
-        return payloads.RekeyKeyPairResponsePayload()
-
-    def _create_locate_payload(self):
-        return payloads.LocateResponsePayload()
-
-    def _create_check_payload(self):
-        return payloads.CheckResponsePayload()
-
-    def _create_get_payload(self):
-        return payloads.GetResponsePayload()
-
-    def _create_get_attribute_list_payload(self):
-        return payloads.GetAttributeListResponsePayload()
-
-    def _create_get_attributes_payload(self):
-        return payloads.GetAttributesResponsePayload()
-
-    def _create_delete_attribute_payload(self):
-        return payloads.DeleteAttributeResponsePayload()
-
-    def _create_set_attribute_payload(self):
-        return payloads.SetAttributeResponsePayload()
-
-    def _create_modify_attribute_payload(self):
-        return payloads.ModifyAttributeResponsePayload()
-
-    def _create_destroy_payload(self):
-        return payloads.DestroyResponsePayload()
-
-    def _create_query_payload(self):
-        return payloads.QueryResponsePayload()
-
-    def _create_discover_versions_payload(self):
-        return payloads.DiscoverVersionsResponsePayload()
-
-    def _create_activate_payload(self):
-        return payloads.ActivateResponsePayload()
-
-    def _create_revoke_payload(self):
-        return payloads.RevokeResponsePayload()
-
-    def _create_mac_payload(self):
-        return payloads.MACResponsePayload()
-
-    def _create_encrypt_payload(self):
-        return payloads.EncryptResponsePayload()
-
-    def _create_decrypt_payload(self):
-        return payloads.DecryptResponsePayload()
-
-    def _create_sign_payload(self):
-        return payloads.SignResponsePayload()
-
-    def _create_signature_verify_payload(self):
-        return payloads.SignatureVerifyResponsePayload()
+    def _get_payload_class(self, entry):
+        return entry.response_payload
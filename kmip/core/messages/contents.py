@@ -15,7 +15,10 @@
 
 import six
 
+from struct import pack, unpack
+
 from kmip.core import enums
+from kmip.core import exceptions
 from kmip.core import objects
 from kmip.core import utils
 
@@ -286,13 +289,60 @@ def protocol_version_to_kmip_version(value):
         return None
 
 
+def _get_operations():
+    # The operation registry imports the payloads, which import this module.
+    from kmip.core.messages import operations
+    return operations
+
+
 # 6.2
 class Operation(Enumeration):
+    """
+    The operation of a batch item.
+
+    Besides the members of the Operation enumeration, the value may be any
+    operation registered with kmip.core.messages.operations, including
+    extension enumeration members and integer operation codes.
+    """
 
     def __init__(self, value=None):
         super(Operation, self).__init__(
             enums.Operation, value, enums.Tags.OPERATION)
 
+    def read(self, istream, kmip_version=enums.KMIPVersion.KMIP_1_0):
+        super(Enumeration, self).read(istream, kmip_version=kmip_version)
+
+        if self.length != Enumeration.LENGTH:
+            raise exceptions.InvalidPrimitiveLength(
+                "enumeration length must be {0}".format(Enumeration.LENGTH))
+
+        value = unpack('!I', istream.read(Enumeration.LENGTH))[0]
+        try:
+            self.value = enums.Operation(value)
+        except ValueError:
+            self.value = _get_operations().decode_operation(value)
+        pad = unpack('!I', istream.read(Enumeration.LENGTH))[0]
+
+        if pad != 0:
+            raise exceptions.InvalidPaddingBytes("padding bytes must be zero")
+
+        self.validate()
+
+    def write(self, ostream, kmip_version=enums.KMIPVersion.KMIP_1_0):
+        super(Enumeration, self).write(ostream, kmip_version=kmip_version)
+        # Extension enumerations and integer codes are both accepted.
+        ostream.write(pack('!I', getattr(self.value, 'value', self.value)))
+        ostream.write(pack('!I', 0))
+
+    def validate(self):
+        if self.value is None or isinstance(self.value, enums.Operation):
+            super(Operation, self).validate()
+        elif _get_operations().get_operation(self.value) is None:
+            raise TypeError(
+                "operation {0} must be of type {1} or a registered "
+                "operation".format(self.value, enums.Operation)
+            )
+
 
 # 6.3
 class MaximumResponseSize(Integer):
@@ -16,11 +16,13 @@
 import six
 
 from kmip.core import enums
+from kmip.core import exceptions
 from kmip.core.enums import Tags
 
 from kmip.core.messages import contents
 from kmip.core.messages.contents import AsynchronousCorrelationValue
 from kmip.core.messages.contents import BatchErrorContinuationOption
+from kmip.core.messages import payloads
 
 from kmip.core.factories.payloads.request import RequestPayloadFactory
 from kmip.core.factories.payloads.response import ResponsePayloadFactory
@@ -108,40 +110,34 @@ class RequestHeader(Struct):
         self.is_oversized(tstream)
 
     def write(self, ostream, kmip_version=enums.KMIPVersion.KMIP_1_0):
-        tstream = BytearrayStream()
-
-        # Write the contents of a request header to the stream
-        self.protocol_version.write(tstream, kmip_version=kmip_version)
-        if self.maximum_response_size is not None:
-            self.maximum_response_size.write(
-                tstream,
-                kmip_version=kmip_version
-            )
-        if self.asynchronous_indicator is not None:
-            self.asynchronous_indicator.write(
-                tstream,
-                kmip_version=kmip_version
-            )
-        if self.authentication is not None:
-            self.authentication.write(tstream, kmip_version=kmip_version)
-        if self.batch_error_cont_option is not None:
-            self.batch_error_cont_option.write(
-                tstream,
-                kmip_version=kmip_version
-            )
-        if self.batch_order_option is not None:
-            self.batch_order_option.write(tstream, kmip_version=kmip_version)
-        if self.time_stamp is not None:
-            self.time_stamp.write(tstream, kmip_version=kmip_version)
-        self.batch_count.write(tstream, kmip_version=kmip_version)
-
-        # Write the length and value of the request header
-        self.length = tstream.length()
-        super(RequestHeader, self).write(
-            ostream,
-            kmip_version=kmip_version
-        )
-        ostream.write(tstream.buffer)
+        with self.write_structure(ostream, kmip_version=kmip_version):
+            # Write the contents of a request header to the stream
+            self.protocol_version.write(ostream, kmip_version=kmip_version)
+            if self.maximum_response_size is not None:
+                self.maximum_response_size.write(
+                    ostream,
+                    kmip_version=kmip_version
+                )
+            if self.asynchronous_indicator is not None:
+                self.asynchronous_indicator.write(
+                    ostream,
+                    kmip_version=kmip_version
+                )
+            if self.authentication is not None:
+                self.authentication.write(ostream, kmip_version=kmip_version)
+            if self.batch_error_cont_option is not None:
+                self.batch_error_cont_option.write(
+                    ostream,
+                    kmip_version=kmip_version
+                )
+            if self.batch_order_option is not None:
+                self.batch_order_option.write(
+                    ostream,
+                    kmip_version=kmip_version
+                )
+            if self.time_stamp is not None:
+                self.time_stamp.write(ostream, kmip_version=kmip_version)
+            self.batch_count.write(ostream, kmip_version=kmip_version)
 
 
 class ResponseHeader(Struct):
@@ -211,28 +207,19 @@ class ResponseHeader(Struct):
         self.validate()
 
     def write(self, ostream, kmip_version=enums.KMIPVersion.KMIP_1_0):
-        tstream = BytearrayStream()
-
-        # Write the contents of a response header to the stream
-        self.protocol_version.write(tstream, kmip_version=kmip_version)
-        self.time_stamp.write(tstream, kmip_version=kmip_version)
-
-        if kmip_version >= enums.KMIPVersion.KMIP_2_0:
-            if self._server_hashed_password:
-                self._server_hashed_password.write(
-                    tstream,
-                    kmip_version=kmip_version
-                )
+        with self.write_structure(ostream, kmip_version=kmip_version):
+            # Write the contents of a response header to the stream
+            self.protocol_version.write(ostream, kmip_version=kmip_version)
+            self.time_stamp.write(ostream, kmip_version=kmip_version)
 
-        self.batch_count.write(tstream, kmip_version=kmip_version)
+            if kmip_version >= enums.KMIPVersion.KMIP_2_0:
+                if self._server_hashed_password:
+                    self._server_hashed_password.write(
+                        ostream,
+                        kmip_version=kmip_version
+                    )
 
-        # Write the length and value of the request header
-        self.length = tstream.length()
-        super(ResponseHeader, self).write(
-            ostream,
-            kmip_version=kmip_version
-        )
-        ostream.write(tstream.buffer)
+            self.batch_count.write(ostream, kmip_version=kmip_version)
 
     def validate(self):
         if self.time_stamp is not None:
@@ -255,12 +242,55 @@ class RequestBatchItem(Struct):
 
         self.payload_factory = RequestPayloadFactory()
 
+        self._payload_encoding = None
+        self._payload_kmip_version = None
+        self._payload_error = None
+
         self.operation = operation
         self.unique_batch_item_id = unique_batch_item_id
         self.request_payload = request_payload
         self.message_extension = message_extension
         self.ephemeral = ephemeral
 
+    @property
+    def request_payload(self):
+        # The payload encoding can only be read once, so a decoding error is
+        # kept and raised again on every access.
+        if self._payload_error is not None:
+            raise self._payload_error
+        if self._payload_encoding is not None:
+            payload_encoding = self._payload_encoding
+            self._payload_encoding = None
+            try:
+                self._read_payload(
+                    payload_encoding,
+                    kmip_version=self._payload_kmip_version
+                )
+            except Exception as e:
+                self._request_payload = None
+                self._payload_error = exceptions.InvalidMessage(
+                    "Error parsing the request payload: {0}".format(e)
+                )
+                six.raise_from(self._payload_error, e)
+        return self._request_payload
+
+    @request_payload.setter
+    def request_payload(self, value):
+        self._payload_encoding = None
+        self._payload_error = None
+        self._request_payload = value
+
+    @property
+    def is_payload_decoded(self):
+        """
+        Whether the request payload has been decoded.
+
+        Batch items read lazily keep the payload encoding until the
+        request_payload property is first accessed. Payloads that failed to
+        decode are not decoded.
+        """
+        return self._payload_encoding is None and self._payload_error is None
+
     @property
     def ephemeral(self):
         if self._ephemeral:
@@ -280,7 +310,24 @@ class RequestBatchItem(Struct):
         else:
             raise TypeError("The ephemeral value must be a boolean.")
 
-    def read(self, istream, kmip_version=enums.KMIPVersion.KMIP_1_0):
+    def read(self,
+             istream,
+             kmip_version=enums.KMIPVersion.KMIP_1_0,
+             lazy=False):
+        """
+        Read the encoding of the RequestBatchItem from the input stream.
+
+        Args:
+            istream (stream): A buffer containing the encoded bytes of a
+                RequestBatchItem. Usually a BytearrayStream object. Required.
+            kmip_version (KMIPVersion): An enumeration defining the KMIP
+                version with which the object will be decoded. Optional,
+                defaults to KMIP 1.0.
+            lazy (bool): A flag indicating whether decoding the request
+                payload and message extension should be deferred until the
+                request payload is first accessed. Optional, defaults to
+                False.
+        """
         super(RequestBatchItem, self).read(
             istream,
             kmip_version=kmip_version
@@ -302,11 +349,19 @@ class RequestBatchItem(Struct):
             self.unique_batch_item_id = contents.UniqueBatchItemID()
             self.unique_batch_item_id.read(tstream, kmip_version=kmip_version)
 
+        if lazy:
+            self._request_payload = None
+            self._payload_encoding = tstream
+            self._payload_kmip_version = kmip_version
+        else:
+            self._read_payload(tstream, kmip_version=kmip_version)
+
+    def _read_payload(self, tstream, kmip_version=enums.KMIPVersion.KMIP_1_0):
         # Dynamically create the response payload class that belongs to the
         # operation
-        self.request_payload = self.payload_factory.create(
+        self._request_payload = self.payload_factory.create(
             self.operation.value)
-        self.request_payload.read(tstream, kmip_version=kmip_version)
+        self._request_payload.read(tstream, kmip_version=kmip_version)
 
         # Read the message extension if it is present
         if self.is_tag_next(Tags.MESSAGE_EXTENSION, tstream):
@@ -316,30 +371,27 @@ class RequestBatchItem(Struct):
         self.is_oversized(tstream)
 
     def write(self, ostream, kmip_version=enums.KMIPVersion.KMIP_1_0):
-        tstream = BytearrayStream()
-
-        # Write the contents of the batch item to the stream
-        self.operation.write(tstream, kmip_version=kmip_version)
-
-        if kmip_version >= enums.KMIPVersion.KMIP_2_0:
-            if self._ephemeral:
-                self._ephemeral.write(tstream, kmip_version=kmip_version)
+        with self.write_structure(ostream, kmip_version=kmip_version):
+            # Write the contents of the batch item to the stream
+            self.operation.write(ostream, kmip_version=kmip_version)
 
-        if self.unique_batch_item_id is not None:
-            self.unique_batch_item_id.write(tstream, kmip_version=kmip_version)
+            if kmip_version >= enums.KMIPVersion.KMIP_2_0:
+                if self._ephemeral:
+                    self._ephemeral.write(ostream, kmip_version=kmip_version)
 
-        self.request_payload.write(tstream, kmip_version=kmip_version)
+            if self.unique_batch_item_id is not None:
+                self.unique_batch_item_id.write(
+                    ostream,
+                    kmip_version=kmip_version
+                )
 
-        if self.message_extension is not None:
-            self.message_extension.write(tstream, kmip_version=kmip_version)
+            self.request_payload.write(ostream, kmip_version=kmip_version)
 
-        # Write the length and value of the batch item
-        self.length = tstream.length()
-        super(RequestBatchItem, self).write(
-            ostream,
-            kmip_version=kmip_version
-        )
-        ostream.write(tstream.buffer)
+            if self.message_extension is not None:
+                self.message_extension.write(
+                    ostream,
+                    kmip_version=kmip_version
+                )
 
 
 class ResponseBatchItem(Struct):
@@ -423,37 +475,45 @@ class ResponseBatchItem(Struct):
         self.validate()
 
     def write(self, ostream, kmip_version=enums.KMIPVersion.KMIP_1_0):
-        tstream = BytearrayStream()
-
-        # Write the contents of the batch item to the stream
-        if self.operation is not None:
-            self.operation.write(tstream, kmip_version=kmip_version)
-        if self.unique_batch_item_id is not None:
-            self.unique_batch_item_id.write(tstream, kmip_version=kmip_version)
-
-        self.result_status.write(tstream, kmip_version=kmip_version)
-
-        if self.result_reason is not None:
-            self.result_reason.write(tstream, kmip_version=kmip_version)
-        if self.result_message is not None:
-            self.result_message.write(tstream, kmip_version=kmip_version)
-        if self.async_correlation_value is not None:
-            self.async_correlation_value.write(
-                tstream,
-                kmip_version=kmip_version
-            )
-        if self.response_payload is not None:
-            self.response_payload.write(tstream, kmip_version=kmip_version)
-        if self.message_extension is not None:
-            self.message_extension.write(tstream, kmip_version=kmip_version)
-
-        # Write the length and value of the batch item
-        self.length = tstream.length()
-        super(ResponseBatchItem, self).write(
-            ostream,
-            kmip_version=kmip_version
-        )
-        ostream.write(tstream.buffer)
+        with self.write_structure(ostream, kmip_version=kmip_version):
+            # Write the contents of the batch item to the stream
+            if self.operation is not None:
+                self.operation.write(ostream, kmip_version=kmip_version)
+            if self.unique_batch_item_id is not None:
+                self.unique_batch_item_id.write(
+                    ostream,
+                    kmip_version=kmip_version
+                )
+
+            self.result_status.write(ostream, kmip_version=kmip_version)
+
+            if self.result_reason is not None:
+                self.result_reason.write(ostream, kmip_version=kmip_version)
+            if self.result_message is not None:
+                self.result_message.write(ostream, kmip_version=kmip_version)
+            if self.async_correlation_value is not None:
+                self.async_correlation_value.write(
+                    ostream,
+                    kmip_version=kmip_version
+                )
+            if self.response_payload is not None:
+                self._write_response_payload(ostream, kmip_version)
+            if self.message_extension is not None:
+                self.message_extension.write(
+                    ostream,
+                    kmip_version=kmip_version
+                )
+
+    def _write_response_payload(self, ostream, kmip_version):
+        # Splice in the cached encoding of static response payloads.
+        encoding = None
+        if isinstance(self.response_payload, payloads.ResponsePayload):
+            encoding = self.response_payload.get_cached_encoding(kmip_version)
+
+        if encoding is not None:
+            ostream.write(encoding)
+        else:
+            self.response_payload.write(ostream, kmip_version=kmip_version)
 
     def validate(self):
         pass
@@ -466,7 +526,25 @@ class RequestMessage(Struct):
         self.request_header = request_header
         self.batch_items = batch_items
 
-    def read(self, istream, kmip_version=enums.KMIPVersion.KMIP_1_0):
+    def read(self,
+             istream,
+             kmip_version=enums.KMIPVersion.KMIP_1_0,
+             lazy=False):
+        """
+        Read the encoding of the RequestMessage from the input stream.
+
+        Args:
+            istream (stream): A buffer containing the encoded bytes of a
+                RequestMessage. Usually a BytearrayStream object. Required.
+            kmip_version (KMIPVersion): An enumeration defining the KMIP
+                version with which the object will be decoded. Optional,
+                defaults to KMIP 1.0.
+            lazy (bool): A flag indicating whether the request payloads of
+                the batch items should be decoded on first access instead of
+                up front. The request header and the boundaries of each batch
+                item are always decoded immediately. Optional, defaults to
+                False.
+        """
         super(RequestMessage, self).read(
             istream,
             kmip_version=kmip_version
@@ -482,24 +560,15 @@ class RequestMessage(Struct):
         self.batch_items = []
         for _ in range(self.request_header.batch_count.value):
             batch_item = RequestBatchItem()
-            batch_item.read(istream, kmip_version=kmip_version)
+            batch_item.read(istream, kmip_version=kmip_version, lazy=lazy)
             self.batch_items.append(batch_item)
 
     def write(self, ostream, kmip_version=enums.KMIPVersion.KMIP_1_0):
-        tstream = BytearrayStream()
-
-        # Write the request header and all batch items
-        self.request_header.write(tstream, kmip_version=kmip_version)
-        for batch_item in self.batch_items:
-            batch_item.write(tstream, kmip_version=kmip_version)
-
-        # Write the TTLV encoding of the request message
-        self.length = tstream.length()
-        super(RequestMessage, self).write(
-            ostream,
-            kmip_version=kmip_version
-        )
-        ostream.write(tstream.buffer)
+        with self.write_structure(ostream, kmip_version=kmip_version):
+            # Write the request header and all batch items
+            self.request_header.write(ostream, kmip_version=kmip_version)
+            for batch_item in self.batch_items:
+                batch_item.write(ostream, kmip_version=kmip_version)
 
 
 class ResponseMessage(Struct):
@@ -531,20 +600,11 @@ class ResponseMessage(Struct):
         self.validate()
 
     def write(self, ostream, kmip_version=enums.KMIPVersion.KMIP_1_0):
-        tstream = BytearrayStream()
-
-        # Write the request header and all batch items
-        self.response_header.write(tstream, kmip_version=kmip_version)
-        for batch_item in self.batch_items:
-            batch_item.write(tstream, kmip_version=kmip_version)
-
-        # Write the TTLV encoding of the request message
-        self.length = tstream.length()
-        super(ResponseMessage, self).write(
-            ostream,
-            kmip_version=kmip_version
-        )
-        ostream.write(tstream.buffer)
+        with self.write_structure(ostream, kmip_version=kmip_version):
+            # Write the request header and all batch items
+            self.response_header.write(ostream, kmip_version=kmip_version)
+            for batch_item in self.batch_items:
+                batch_item.write(ostream, kmip_version=kmip_version)
 
     def validate(self):
         pass
@@ -0,0 +1,390 @@
+# Copyright (c) 2020 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import collections
+import enum
+import six
+
+from kmip.core import enums
+from kmip.core.messages import payloads
+
+
+OperationEntry = collections.namedtuple(
+    'OperationEntry',
+    [
+        'operation',
+        'request_payload',
+        'response_payload',
+        'handler',
+        'min_version'
+    ]
+)
+
+# Registrations are keyed by the integer code of the operation, so that
+# decoded codes, standard operations, and extension operations all find the
+# same entry.
+_registry = {}
+
+
+def get_operation_code(operation):
+    """
+    Get the integer code of an operation.
+
+    Args:
+        operation (Operation|Enum|int): The operation. Required.
+
+    Returns:
+        int: The code of the operation, or None if the operation is not an
+            enumeration with an integer value or an integer.
+    """
+    if isinstance(operation, enum.Enum):
+        operation = operation.value
+    if isinstance(operation, bool):
+        return None
+    if not isinstance(operation, six.integer_types):
+        return None
+    return operation
+
+
+def register_operation(operation,
+                       request_payload=None,
+                       response_payload=None,
+                       handler=None,
+                       min_version=enums.KMIPVersion.KMIP_1_0,
+                       replace=False):
+    """
+    Register the payloads and server handler of an operation.
+
+    Registered operations are decoded by the request and response payload
+    factories and dispatched by the server engine without any changes to
+    either.
+
+    Args:
+        operation (Operation|Enum|int): The operation being registered.
+            Either a member of the Operation enumeration, a member of an
+            extension enumeration with an integer value, or an integer
+            operation code. Codes of standard operations are converted to
+            the Operation enumeration. Required.
+        request_payload (class): The request payload class of the
+            operation. Optional, defaults to None.
+        response_payload (class): The response payload class of the
+            operation. Optional, defaults to None.
+        handler (string|callable): The server handler of the operation.
+            Either the name of a KmipEngine method taking the request
+            payload, or a function taking the KmipEngine and the request
+            payload. Both must return the response payload. Optional,
+            defaults to None (the server does not support the operation).
+        min_version (KMIPVersion): The first KMIP version in which the
+            server supports the operation. Optional, defaults to KMIP 1.0.
+        replace (bool): A flag allowing an existing registration to be
+            replaced. Optional, defaults to False.
+
+    Returns:
+        OperationEntry: The new registration.
+
+    Raises:
+        TypeError: Raised if the operation is not an enumeration or an
+            integer.
+        ValueError: Raised if the operation code is not an unsigned 32-bit
+            integer, if an extension enumeration reuses the code of a
+            standard operation, or if the operation is already registered
+            and replace is not set.
+    """
+    code = get_operation_code(operation)
+    if code is None:
+        raise TypeError(
+            "The operation must be an enumeration or an integer."
+        )
+    if not 0 <= code <= 0xFFFFFFFF:
+        raise ValueError(
+            "The operation code must be an unsigned 32-bit integer."
+        )
+    if not isinstance(operation, enums.Operation):
+        try:
+            standard_operation = enums.Operation(code)
+        except ValueError:
+            standard_operation = None
+        if standard_operation is not None:
+            if isinstance(operation, enum.Enum):
+                raise ValueError(
+                    "The {0} operation uses the code of the {1} "
+                    "operation.".format(
+                        operation.name,
+                        standard_operation.name
+                    )
+                )
+            operation = standard_operation
+    if code in _registry and not replace:
+        registered = _registry[code].operation
+        raise ValueError(
+            "The {0} operation is already registered.".format(
+                getattr(registered, 'name', get_operation_name(registered))
+            )
+        )
+
+    entry = OperationEntry(
+        operation,
+        request_payload,
+        response_payload,
+        handler,
+        min_version
+    )
+    _registry[code] = entry
+    return entry
+
+
+def unregister_operation(operation):
+    """
+    Remove the registration of an operation.
+
+    Args:
+        operation (Operation|Enum|int): The operation to remove. Required.
+
+    Returns:
+        OperationEntry: The removed registration, or None if the operation
+            was not registered.
+    """
+    return _registry.pop(get_operation_code(operation), None)
+
+
+def get_operation(operation):
+    """
+    Look up the registration of an operation.
+
+    Args:
+        operation (Operation|Enum|int): The operation to look up, or its
+            integer code. Required.
+
+    Returns:
+        OperationEntry: The registration of the operation, or None if the
+            operation is not registered.
+    """
+    return _registry.get(get_operation_code(operation))
+
+
+def decode_operation(code):
+    """
+    Convert an encoded operation code into its operation.
+
+    Args:
+        code (int): The operation code. Required.
+
+    Returns:
+        Operation|Enum|int: The Operation enumeration of a standard
+            operation, or the operation an extension was registered with.
+
+    Raises:
+        ValueError: Raised if the code is neither a standard nor a
+            registered operation.
+    """
+    try:
+        return enums.Operation(code)
+    except ValueError:
+        entry = _registry.get(code)
+        if entry is None:
+            raise
+        return entry.operation
+
+
+def get_operation_name(operation):
+    """
+    Get the display name of an operation.
+
+    Args:
+        operation (Operation|Enum|int): The operation. Required.
+
+    Returns:
+        string: The name of an enumerated operation (e.g., 'CreateKeyPair'),
+            or the hexadecimal code of an integer operation (e.g.,
+            '0x80000001').
+    """
+    if isinstance(operation, enum.Enum):
+        return ''.join([x.capitalize() for x in operation.name.split('_')])
+    return '0x{0:08X}'.format(operation)
+
+
+# The operations supported by PyKMIP. Handlers name the KmipEngine methods
+# implementing each operation; operations without a handler can be encoded
+# and decoded but are not supported by the server. Poll has no response
+# payload; its response carries the result of the polled operation.
+for _operation, _name, _handler, _min_version in [
+    (
+        enums.Operation.CREATE,
+        'Create',
+        '_process_create',
+        enums.KMIPVersion.KMIP_1_0
+    ),
+    (
+        enums.Operation.CREATE_KEY_PAIR,
+        'CreateKeyPair',
+        '_process_create_key_pair',
+        enums.KMIPVersion.KMIP_1_0
+    ),
+    (
+        enums.Operation.REGISTER,
+        'Register',
+        '_process_register',
+        enums.KMIPVersion.KMIP_1_0
+    ),
+    (
+        enums.Operation.REKEY,
+        'Rekey',
+        None,
+        enums.KMIPVersion.KMIP_1_0
+    ),
+    (
+        enums.Operation.DERIVE_KEY,
+        'DeriveKey',
+        '_process_derive_key',
+        enums.KMIPVersion.KMIP_1_0
+    ),
+    (
+        enums.Operation.LOCATE,
+        'Locate',
+        '_process_locate',
+        enums.KMIPVersion.KMIP_1_0
+    ),
+    (
+        enums.Operation.CHECK,
+        'Check',
+        None,
+        enums.KMIPVersion.KMIP_1_0
+    ),
+    (
+        enums.Operation.GET,
+        'Get',
+        '_process_get',
+        enums.KMIPVersion.KMIP_1_0
+    ),
+    (
+        enums.Operation.GET_ATTRIBUTES,
+        'GetAttributes',
+        '_process_get_attributes',
+        enums.KMIPVersion.KMIP_1_0
+    ),
+    (
+        enums.Operation.GET_ATTRIBUTE_LIST,
+        'GetAttributeList',
+        '_process_get_attribute_list',
+        enums.KMIPVersion.KMIP_1_0
+    ),
+    (
+        enums.Operation.MODIFY_ATTRIBUTE,
+        'ModifyAttribute',
+        '_process_modify_attribute',
+        enums.KMIPVersion.KMIP_1_0
+    ),
+    (
+        enums.Operation.DELETE_ATTRIBUTE,
+        'DeleteAttribute',
+        '_process_delete_attribute',
+        enums.KMIPVersion.KMIP_1_0
+    ),
+    (
+        enums.Operation.ACTIVATE,
+        'Activate',
+        '_process_activate',
+        enums.KMIPVersion.KMIP_1_0
+    ),
+    (
+        enums.Operation.REVOKE,
+        'Revoke',
+        '_process_revoke',
+        enums.KMIPVersion.KMIP_1_0
+    ),
+    (
+        enums.Operation.DESTROY,
+        'Destroy',
+        '_process_destroy',
+        enums.KMIPVersion.KMIP_1_0
+    ),
+    (
+        enums.Operation.QUERY,
+        'Query',
+        '_process_query',
+        enums.KMIPVersion.KMIP_1_0
+    ),
+    (
+        enums.Operation.CANCEL,
+        'Cancel',
+        '_process_cancel',
+        enums.KMIPVersion.KMIP_1_0
+    ),
+    (
+        enums.Operation.POLL,
+        'Poll',
+        '_process_poll',
+        enums.KMIPVersion.KMIP_1_0
+    ),
+    (
+        enums.Operation.REKEY_KEY_PAIR,
+        'RekeyKeyPair',
+        None,
+        enums.KMIPVersion.KMIP_1_1
+    ),
+    (
+        enums.Operation.DISCOVER_VERSIONS,
+        'DiscoverVersions',
+        '_process_discover_versions',
+        enums.KMIPVersion.KMIP_1_1
+    ),
+    (
+        enums.Operation.ENCRYPT,
+        'Encrypt',
+        '_process_encrypt',
+        enums.KMIPVersion.KMIP_1_2
+    ),
+    (
+        enums.Operation.DECRYPT,
+        'Decrypt',
+        '_process_decrypt',
+        enums.KMIPVersion.KMIP_1_2
+    ),
+    (
+        enums.Operation.SIGN,
+        'Sign',
+        '_process_sign',
+        enums.KMIPVersion.KMIP_1_2
+    ),
+    (
+        enums.Operation.SIGNATURE_VERIFY,
+        'SignatureVerify',
+        '_process_signature_verify',
+        enums.KMIPVersion.KMIP_1_2
+    ),
+    (
+        enums.Operation.MAC,
+        'MAC',
+        '_process_mac',
+        enums.KMIPVersion.KMIP_1_2
+    ),
+    (
+        enums.Operation.SET_ATTRIBUTE,
+        'SetAttribute',
+        '_process_set_attribute',
+        enums.KMIPVersion.KMIP_2_0
+    )
+]:
+    register_operation(
+        _operation,
+        request_payload=getattr(payloads, _name + 'RequestPayload'),
+        response_payload=getattr(
+            payloads,
+            _name + 'ResponsePayload',
+            None
+        ),
+        handler=_handler,
+        min_version=_min_version
+    )
@@ -15,6 +15,7 @@
 
 from kmip.core import enums
 from kmip.core import primitives
+from kmip.core import utils
 
 
 class RequestPayload(primitives.Struct):
@@ -32,3 +33,39 @@ class ResponsePayload(primitives.Struct):
 
     def __init__(self):
         super(ResponsePayload, self).__init__(enums.Tags.RESPONSE_PAYLOAD)
+        self._cached_encoding = None
+
+    def cache_encoding(self, kmip_version=enums.KMIPVersion.KMIP_1_0):
+        """
+        Encode the payload and keep the encoding for reuse.
+
+        The payload must not be modified once its encoding is cached; the
+        cached encoding is not updated when the payload fields change.
+
+        Args:
+            kmip_version (KMIPVersion): An enumeration defining the KMIP
+                version with which the payload will be encoded. Optional,
+                defaults to KMIP 1.0.
+        """
+        stream = utils.BytearrayStream()
+        self.write(stream, kmip_version=kmip_version)
+        self._cached_encoding = (kmip_version, stream.buffer)
+
+    def get_cached_encoding(self, kmip_version=enums.KMIPVersion.KMIP_1_0):
+        """
+        Get the cached encoding of the payload.
+
+        Args:
+            kmip_version (KMIPVersion): An enumeration defining the KMIP
+                version of the requested encoding. Optional, defaults to
+                KMIP 1.0.
+
+        Returns:
+            bytes: The cached encoding of the payload, or None if no encoding
+                is cached for the KMIP version.
+        """
+        cached_encoding = getattr(self, '_cached_encoding', None)
+        if cached_encoding is not None:
+            if cached_encoding[0] == kmip_version:
+                return cached_encoding[1]
+        return None
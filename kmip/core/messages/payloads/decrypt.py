@@ -20,6 +20,7 @@ from kmip.core import enums
 from kmip.core import primitives
 from kmip.core import utils
 from kmip.core.messages.payloads import base
+from kmip.core.messages.payloads import schema
 
 
 class DecryptRequestPayload(base.RequestPayload):
@@ -43,6 +44,47 @@ class DecryptRequestPayload(base.RequestPayload):
             Added in KMIP 1.4.
     """
 
+    _schema = schema.Schema(
+        schema.Field(
+            'unique_identifier',
+            enums.Tags.UNIQUE_IDENTIFIER,
+            primitives.TextString
+        ),
+        schema.Field(
+            'cryptographic_parameters',
+            enums.Tags.CRYPTOGRAPHIC_PARAMETERS,
+            attributes.CryptographicParameters
+        ),
+        schema.Field(
+            'data',
+            enums.Tags.DATA,
+            primitives.ByteString,
+            cardinality=schema.REQUIRED,
+            missing=(ValueError, "invalid payload missing the data attribute"),
+            missing_on_write=(
+                ValueError,
+                "invalid payload missing the data attribute"
+            )
+        ),
+        schema.Field(
+            'iv_counter_nonce',
+            enums.Tags.IV_COUNTER_NONCE,
+            primitives.ByteString
+        ),
+        schema.Field(
+            'auth_additional_data',
+            enums.Tags.AUTHENTICATED_ENCRYPTION_ADDITIONAL_DATA,
+            primitives.ByteString,
+            min_version=enums.KMIPVersion.KMIP_1_4
+        ),
+        schema.Field(
+            'auth_tag',
+            enums.Tags.AUTHENTICATED_ENCRYPTION_TAG,
+            primitives.ByteString,
+            min_version=enums.KMIPVersion.KMIP_1_4
+        )
+    )
+
     def __init__(self,
                  unique_identifier=None,
                  cryptographic_parameters=None,
@@ -224,66 +266,7 @@ class DecryptRequestPayload(base.RequestPayload):
             kmip_version=kmip_version
         )
         local_stream = utils.BytearrayStream(input_stream.read(self.length))
-
-        if self.is_tag_next(enums.Tags.UNIQUE_IDENTIFIER, local_stream):
-            self._unique_identifier = primitives.TextString(
-                tag=enums.Tags.UNIQUE_IDENTIFIER
-            )
-            self._unique_identifier.read(
-                local_stream,
-                kmip_version=kmip_version
-            )
-
-        if self.is_tag_next(
-                enums.Tags.CRYPTOGRAPHIC_PARAMETERS,
-                local_stream
-        ):
-            self._cryptographic_parameters = \
-                attributes.CryptographicParameters()
-            self._cryptographic_parameters.read(
-                local_stream,
-                kmip_version=kmip_version
-            )
-
-        if self.is_tag_next(enums.Tags.DATA, local_stream):
-            self._data = primitives.ByteString(tag=enums.Tags.DATA)
-            self._data.read(local_stream, kmip_version=kmip_version)
-        else:
-            raise ValueError("invalid payload missing the data attribute")
-
-        if self.is_tag_next(enums.Tags.IV_COUNTER_NONCE, local_stream):
-            self._iv_counter_nonce = primitives.ByteString(
-                tag=enums.Tags.IV_COUNTER_NONCE
-            )
-            self._iv_counter_nonce.read(
-                local_stream,
-                kmip_version=kmip_version
-            )
-
-        if kmip_version >= enums.KMIPVersion.KMIP_1_4:
-            if self.is_tag_next(
-                    enums.Tags.AUTHENTICATED_ENCRYPTION_ADDITIONAL_DATA,
-                    local_stream
-            ):
-                self._auth_additional_data = primitives.ByteString(
-                    tag=enums.Tags.AUTHENTICATED_ENCRYPTION_ADDITIONAL_DATA
-                )
-                self._auth_additional_data.read(
-                    local_stream,
-                    kmip_version=kmip_version
-                )
-            if self.is_tag_next(
-                    enums.Tags.AUTHENTICATED_ENCRYPTION_TAG, local_stream
-            ):
-                self._auth_tag = primitives.ByteString(
-                    tag=enums.Tags.AUTHENTICATED_ENCRYPTION_TAG
-                )
-                self._auth_tag.read(
-                    local_stream,
-                    kmip_version=kmip_version
-                )
-
-        self.is_oversized(local_stream)
+        self._schema.read(self, local_stream, kmip_version)
 
     def write(self, output_stream, kmip_version=enums.KMIPVersion.KMIP_1_0):
         """
@@ -300,48 +283,8 @@ class DecryptRequestPayload(base.RequestPayload):
         Raises:
             ValueError: Raised if the data attribute is not defined.
         """
-        local_stream = utils.BytearrayStream()
-
-        if self._unique_identifier:
-            self._unique_identifier.write(
-                local_stream,
-                kmip_version=kmip_version
-            )
-        if self._cryptographic_parameters:
-            self._cryptographic_parameters.write(
-                local_stream,
-                kmip_version=kmip_version
-            )
-
-        if self._data:
-            self._data.write(local_stream, kmip_version=kmip_version)
-        else:
-            raise ValueError("invalid payload missing the data attribute")
-
-        if self._iv_counter_nonce:
-            self._iv_counter_nonce.write(
-                local_stream,
-                kmip_version=kmip_version
-            )
-
-        if kmip_version >= enums.KMIPVersion.KMIP_1_4:
-            if self._auth_additional_data:
-                self._auth_additional_data.write(
-                    local_stream,
-                    kmip_version=kmip_version
-                )
-            if self._auth_tag:
-                self._auth_tag.write(
-                    local_stream,
-                    kmip_version=kmip_version
-                )
-
-        self.length = local_stream.length()
-        super(DecryptRequestPayload, self).write(
-            output_stream,
-            kmip_version=kmip_version
-        )
-        output_stream.write(local_stream.buffer)
+        with self.write_structure(output_stream, kmip_version=kmip_version):
+            self._schema.write(self, output_stream, kmip_version)
 
     def __eq__(self, other):
         if isinstance(other, DecryptRequestPayload):
@@ -403,6 +346,34 @@ class DecryptResponsePayload(base.ResponsePayload):
         data: The decrypted data in the form of a binary string.
     """
 
+    _schema = schema.Schema(
+        schema.Field(
+            'unique_identifier',
+            enums.Tags.UNIQUE_IDENTIFIER,
+            primitives.TextString,
+            cardinality=schema.REQUIRED,
+            missing=(
+                ValueError,
+                "invalid payload missing the unique identifier attribute"
+            ),
+            missing_on_write=(
+                ValueError,
+                "invalid payload missing the unique identifier attribute"
+            )
+        ),
+        schema.Field(
+            'data',
+            enums.Tags.DATA,
+            primitives.ByteString,
+            cardinality=schema.REQUIRED,
+            missing=(ValueError, "invalid payload missing the data attribute"),
+            missing_on_write=(
+                ValueError,
+                "invalid payload missing the data attribute"
+            )
+        )
+    )
+
     def __init__(self,
                  unique_identifier=None,
                  data=None):
@@ -484,27 +455,7 @@ class DecryptResponsePayload(base.ResponsePayload):
             kmip_version=kmip_version
         )
         local_stream = utils.BytearrayStream(input_stream.read(self.length))
-
-        if self.is_tag_next(enums.Tags.UNIQUE_IDENTIFIER, local_stream):
-            self._unique_identifier = primitives.TextString(
-                tag=enums.Tags.UNIQUE_IDENTIFIER
-            )
-            self._unique_identifier.read(
-                local_stream,
-                kmip_version=kmip_version
-            )
-        else:
-            raise ValueError(
-                "invalid payload missing the unique identifier attribute"
-            )
-
-        if self.is_tag_next(enums.Tags.DATA, local_stream):
-            self._data = primitives.ByteString(tag=enums.Tags.DATA)
-            self._data.read(local_stream, kmip_version=kmip_version)
-        else:
-            raise ValueError("invalid payload missing the data attribute")
-
-        self.is_oversized(local_stream)
+        self._schema.read(self, local_stream, kmip_version)
 
     def write(self, output_stream, kmip_version=enums.KMIPVersion.KMIP_1_0):
         """
@@ -522,29 +473,8 @@ class DecryptResponsePayload(base.ResponsePayload):
             ValueError: Raised if the unique_identifier or data attributes
                 are not defined.
         """
-        local_stream = utils.BytearrayStream()
-
-        if self._unique_identifier:
-            self._unique_identifier.write(
-                local_stream,
-                kmip_version=kmip_version
-            )
-        else:
-            raise ValueError(
-                "invalid payload missing the unique identifier attribute"
-            )
-
-        if self._data:
-            self._data.write(local_stream, kmip_version=kmip_version)
-        else:
-            raise ValueError("invalid payload missing the data attribute")
-
-        self.length = local_stream.length()
-        super(DecryptResponsePayload, self).write(
-            output_stream,
-            kmip_version=kmip_version
-        )
-        output_stream.write(local_stream.buffer)
+        with self.write_structure(output_stream, kmip_version=kmip_version):
+            self._schema.write(self, output_stream, kmip_version)
 
     def __eq__(self, other):
         if isinstance(other, DecryptResponsePayload):
@@ -22,6 +22,7 @@ from kmip.core import secrets
 from kmip.core import utils
 from kmip.core.factories import secrets as secret_factory
 from kmip.core.messages.payloads import base
+from kmip.core.messages.payloads import schema
 
 
 class GetRequestPayload(base.RequestPayload):
@@ -39,6 +40,31 @@ class GetRequestPayload(base.RequestPayload):
             a key.
     """
 
+    _schema = schema.Schema(
+        schema.Field(
+            'unique_identifier',
+            enums.Tags.UNIQUE_IDENTIFIER,
+            primitives.TextString
+        ),
+        schema.Field(
+            'key_format_type',
+            enums.Tags.KEY_FORMAT_TYPE,
+            primitives.Enumeration,
+            enum=enums.KeyFormatType
+        ),
+        schema.Field(
+            'key_compression_type',
+            enums.Tags.KEY_COMPRESSION_TYPE,
+            primitives.Enumeration,
+            enum=enums.KeyCompressionType
+        ),
+        schema.Field(
+            'key_wrapping_specification',
+            enums.Tags.KEY_WRAPPING_SPECIFICATION,
+            objects.KeyWrappingSpecification
+        )
+    )
+
     def __init__(self,
                  unique_identifier=None,
                  key_format_type=None,
@@ -172,48 +198,7 @@ class GetRequestPayload(base.RequestPayload):
             kmip_version=kmip_version
         )
         local_stream = utils.BytearrayStream(input_stream.read(self.length))
-
-        if self.is_tag_next(enums.Tags.UNIQUE_IDENTIFIER, local_stream):
-            self._unique_identifier = primitives.TextString(
-                tag=enums.Tags.UNIQUE_IDENTIFIER
-            )
-            self._unique_identifier.read(
-                local_stream,
-                kmip_version=kmip_version
-            )
-
-        if self.is_tag_next(enums.Tags.KEY_FORMAT_TYPE, local_stream):
-            self._key_format_type = primitives.Enumeration(
-                enum=enums.KeyFormatType,
-                tag=enums.Tags.KEY_FORMAT_TYPE
-            )
-            self._key_format_type.read(
-                local_stream,
-                kmip_version=kmip_version
-            )
-
-        if self.is_tag_next(enums.Tags.KEY_COMPRESSION_TYPE, local_stream):
-            self._key_compression_type = primitives.Enumeration(
-                enum=enums.KeyCompressionType,
-                tag=enums.Tags.KEY_COMPRESSION_TYPE
-            )
-            self._key_compression_type.read(
-                local_stream,
-                kmip_version=kmip_version
-            )
-
-        if self.is_tag_next(
-                enums.Tags.KEY_WRAPPING_SPECIFICATION,
-                local_stream
-        ):
-            self._key_wrapping_specification = \
-                objects.KeyWrappingSpecification()
-            self._key_wrapping_specification.read(
-                local_stream,
-                kmip_version=kmip_version
-            )
-
-        self.is_oversized(local_stream)
+        self._schema.read(self, local_stream, kmip_version)
 
     def write(self, output_stream, kmip_version=enums.KMIPVersion.KMIP_1_0):
         """
@@ -227,35 +212,8 @@ class GetRequestPayload(base.RequestPayload):
                 version with which the object will be encoded. Optional,
                 defaults to KMIP 1.0.
         """
-        local_stream = utils.BytearrayStream()
-
-        if self._unique_identifier is not None:
-            self._unique_identifier.write(
-                local_stream,
-                kmip_version=kmip_version
-            )
-        if self._key_format_type is not None:
-            self._key_format_type.write(
-                local_stream,
-                kmip_version=kmip_version
-            )
-        if self._key_compression_type is not None:
-            self._key_compression_type.write(
-                local_stream,
-                kmip_version=kmip_version
-            )
-        if self._key_wrapping_specification is not None:
-            self._key_wrapping_specification.write(
-                local_stream,
-                kmip_version=kmip_version
-            )
-
-        self.length = local_stream.length()
-        super(GetRequestPayload, self).write(
-            output_stream,
-            kmip_version=kmip_version
-        )
-        output_stream.write(local_stream.buffer)
+        with self.write_structure(output_stream, kmip_version=kmip_version):
+            self._schema.write(self, output_stream, kmip_version)
 
     def __eq__(self, other):
         if isinstance(other, GetRequestPayload):
@@ -309,6 +267,55 @@ class GetResponsePayload(base.ResponsePayload):
         secret: The managed object being returned.
     """
 
+    _schema = schema.Schema(
+        schema.Field(
+            'object_type',
+            enums.Tags.OBJECT_TYPE,
+            primitives.Enumeration,
+            enum=enums.ObjectType,
+            cardinality=schema.REQUIRED,
+            missing=(
+                ValueError,
+                "Parsed payload encoding is missing the object type field."
+            ),
+            missing_on_write=(
+                ValueError,
+                "Payload is missing the object type field."
+            )
+        ),
+        schema.Field(
+            'unique_identifier',
+            enums.Tags.UNIQUE_IDENTIFIER,
+            primitives.TextString,
+            cardinality=schema.REQUIRED,
+            missing=(
+                ValueError,
+                "Parsed payload encoding is missing the unique identifier "
+                "field."
+            ),
+            missing_on_write=(
+                ValueError,
+                "Payload is missing the unique identifier field."
+            )
+        ),
+        schema.Field(
+            'secret',
+            schema.MANAGED_OBJECT_TAGS,
+            create=lambda payload: payload.secret_factory.create(
+                payload.object_type
+            ),
+            cardinality=schema.REQUIRED,
+            missing=(
+                ValueError,
+                "Parsed payload encoding is missing the secret field."
+            ),
+            missing_on_write=(
+                ValueError,
+                "Payload is missing the secret field."
+            )
+        )
+    )
+
     def __init__(self,
                  object_type=None,
                  unique_identifier=None,
@@ -430,41 +437,7 @@ class GetResponsePayload(base.ResponsePayload):
             kmip_version=kmip_version
         )
         local_stream = utils.BytearrayStream(input_stream.read(self.length))
-
-        if self.is_tag_next(enums.Tags.OBJECT_TYPE, local_stream):
-            self._object_type = primitives.Enumeration(
-                enum=enums.ObjectType,
-                tag=enums.Tags.OBJECT_TYPE
-            )
-            self._object_type.read(local_stream, kmip_version=kmip_version)
-        else:
-            raise ValueError(
-                "Parsed payload encoding is missing the object type field."
-            )
-
-        if self.is_tag_next(enums.Tags.UNIQUE_IDENTIFIER, local_stream):
-            self._unique_identifier = primitives.TextString(
-                tag=enums.Tags.UNIQUE_IDENTIFIER
-            )
-            self._unique_identifier.read(
-                local_stream,
-                kmip_version=kmip_version
-            )
-        else:
-            raise ValueError(
-                "Parsed payload encoding is missing the unique identifier "
-                "field."
-            )
-
-        self.secret = self.secret_factory.create(self.object_type)
-        if self.is_tag_next(self._secret.tag, local_stream):
-            self._secret.read(local_stream, kmip_version=kmip_version)
-        else:
-            raise ValueError(
-                "Parsed payload encoding is missing the secret field."
-            )
-
-        self.is_oversized(local_stream)
+        self._schema.read(self, local_stream, kmip_version)
 
     def write(self, output_stream, kmip_version=enums.KMIPVersion.KMIP_1_0):
         """
@@ -482,34 +455,8 @@ class GetResponsePayload(base.ResponsePayload):
             ValueError: Raised if the object type, unique identifier, or
                 secret attributes are missing from the payload struct.
         """
-        local_stream = utils.BytearrayStream()
-
-        if self.object_type:
-            self._object_type.write(local_stream, kmip_version=kmip_version)
-        else:
-            raise ValueError("Payload is missing the object type field.")
-
-        if self.unique_identifier:
-            self._unique_identifier.write(
-                local_stream,
-                kmip_version=kmip_version
-            )
-        else:
-            raise ValueError(
-                "Payload is missing the unique identifier field."
-            )
-
-        if self.secret:
-            self._secret.write(local_stream, kmip_version=kmip_version)
-        else:
-            raise ValueError("Payload is missing the secret field.")
-
-        self.length = local_stream.length()
-        super(GetResponsePayload, self).write(
-            output_stream,
-            kmip_version=kmip_version
-        )
-        output_stream.write(local_stream.buffer)
+        with self.write_structure(output_stream, kmip_version=kmip_version):
+            self._schema.write(self, output_stream, kmip_version)
 
     def __eq__(self, other):
         if isinstance(other, GetResponsePayload):
@@ -20,6 +20,21 @@ from kmip.core import objects
 from kmip.core import primitives
 from kmip.core import utils
 from kmip.core.messages.payloads import base
+from kmip.core.messages.payloads import schema
+
+
+def _decode_attributes(attributes):
+    # TODO (ph) Add a new utility to avoid using TemplateAttributes
+    return objects.convert_attributes_to_template_attribute(
+        attributes
+    ).attributes
+
+
+def _encode_attributes(attributes):
+    # TODO (ph) Add a new utility to avoid using TemplateAttributes
+    return objects.convert_template_attribute_to_attributes(
+        objects.TemplateAttribute(attributes=attributes)
+    )
 
 
 class LocateRequestPayload(base.RequestPayload):
@@ -38,6 +53,45 @@ class LocateRequestPayload(base.RequestPayload):
             objects.
     """
 
+    _schema = schema.Schema(
+        schema.Field(
+            'maximum_items',
+            enums.Tags.MAXIMUM_ITEMS,
+            primitives.Integer
+        ),
+        schema.Field(
+            'offset_items',
+            enums.Tags.OFFSET_ITEMS,
+            primitives.Integer
+        ),
+        schema.Field(
+            'storage_status_mask',
+            enums.Tags.STORAGE_STATUS_MASK,
+            primitives.Integer
+        ),
+        schema.Field(
+            'object_group_member',
+            enums.Tags.OBJECT_GROUP_MEMBER,
+            primitives.Enumeration,
+            enum=enums.ObjectGroupMember
+        ),
+        schema.Field(
+            'attributes',
+            enums.Tags.ATTRIBUTE,
+            objects.Attribute,
+            cardinality=schema.MULTIPLE,
+            max_version=enums.KMIPVersion.KMIP_1_4
+        ),
+        schema.Field(
+            'attributes',
+            enums.Tags.ATTRIBUTES,
+            objects.Attributes,
+            min_version=enums.KMIPVersion.KMIP_2_0,
+            decode=_decode_attributes,
+            encode=_encode_attributes
+        )
+    )
+
     def __init__(self,
                  maximum_items=None,
                  offset_items=None,
@@ -210,58 +264,7 @@ class LocateRequestPayload(base.RequestPayload):
             kmip_version=kmip_version
         )
         local_buffer = utils.BytearrayStream(input_buffer.read(self.length))
-
-        if self.is_tag_next(enums.Tags.MAXIMUM_ITEMS, local_buffer):
-            self._maximum_items = primitives.Integer(
-                tag=enums.Tags.MAXIMUM_ITEMS
-            )
-            self._maximum_items.read(
-                local_buffer,
-                kmip_version=kmip_version
-            )
-
-        if self.is_tag_next(enums.Tags.OFFSET_ITEMS, local_buffer):
-            self._offset_items = primitives.Integer(
-                tag=enums.Tags.OFFSET_ITEMS
-            )
-            self._offset_items.read(
-                local_buffer,
-                kmip_version=kmip_version
-            )
-
-        if self.is_tag_next(enums.Tags.STORAGE_STATUS_MASK, local_buffer):
-            self._storage_status_mask = primitives.Integer(
-                tag=enums.Tags.STORAGE_STATUS_MASK
-            )
-            self._storage_status_mask.read(
-                local_buffer,
-                kmip_version=kmip_version
-            )
-
-        if self.is_tag_next(enums.Tags.OBJECT_GROUP_MEMBER, local_buffer):
-            self._object_group_member = primitives.Enumeration(
-                enums.ObjectGroupMember,
-                tag=enums.Tags.OBJECT_GROUP_MEMBER
-            )
-            self._object_group_member.read(
-                local_buffer,
-                kmip_version=kmip_version
-            )
-
-        if kmip_version < enums.KMIPVersion.KMIP_2_0:
-            while self.is_tag_next(enums.Tags.ATTRIBUTE, local_buffer):
-                attribute = objects.Attribute()
-                attribute.read(local_buffer, kmip_version=kmip_version)
-                self._attributes.append(attribute)
-        else:
-            if self.is_tag_next(enums.Tags.ATTRIBUTES, local_buffer):
-                attributes = objects.Attributes()
-                attributes.read(local_buffer, kmip_version=kmip_version)
-                # TODO (ph) Add a new utility to avoid using TemplateAttributes
-                temp_attr = objects.convert_attributes_to_template_attribute(
-                    attributes
-                )
-                self._attributes = temp_attr.attributes
+        self._schema.read(self, local_buffer, kmip_version)
 
     def write(self, output_buffer, kmip_version=enums.KMIPVersion.KMIP_1_0):
         """
@@ -274,50 +277,8 @@ class LocateRequestPayload(base.RequestPayload):
                 version with which the object will be encoded. Optional,
                 defaults to KMIP 1.0.
         """
-        local_buffer = utils.BytearrayStream()
-
-        if self._maximum_items:
-            self._maximum_items.write(local_buffer, kmip_version=kmip_version)
-
-        if self._offset_items:
-            self._offset_items.write(local_buffer, kmip_version=kmip_version)
-
-        if self._storage_status_mask:
-            self._storage_status_mask.write(
-                local_buffer,
-                kmip_version=kmip_version
-            )
-
-        if self._object_group_member:
-            self._object_group_member.write(
-                local_buffer,
-                kmip_version=kmip_version
-            )
-
-        if kmip_version < enums.KMIPVersion.KMIP_2_0:
-            if self._attributes:
-                for attribute in self.attributes:
-                    attribute.write(
-                        local_buffer,
-                        kmip_version=kmip_version
-                    )
-        else:
-            if self._attributes:
-                # TODO (ph) Add a new utility to avoid using TemplateAttributes
-                template_attribute = objects.TemplateAttribute(
-                    attributes=self.attributes
-                )
-                attributes = objects.convert_template_attribute_to_attributes(
-                    template_attribute
-                )
-                attributes.write(local_buffer, kmip_version=kmip_version)
-
-        self.length = local_buffer.length()
-        super(LocateRequestPayload, self).write(
-            output_buffer,
-            kmip_version=kmip_version
-        )
-        output_buffer.write(local_buffer.buffer)
+        with self.write_structure(output_buffer, kmip_version=kmip_version):
+            self._schema.write(self, output_buffer, kmip_version)
 
     def __eq__(self, other):
         if isinstance(other, LocateRequestPayload):
@@ -378,6 +339,20 @@ class LocateResponsePayload(base.ResponsePayload):
         unique_identifiers: The object identifiers for the matching objects.
     """
 
+    _schema = schema.Schema(
+        schema.Field(
+            'located_items',
+            enums.Tags.LOCATED_ITEMS,
+            primitives.Integer
+        ),
+        schema.Field(
+            'unique_identifiers',
+            enums.Tags.UNIQUE_IDENTIFIER,
+            primitives.TextString,
+            cardinality=schema.MULTIPLE
+        )
+    )
+
     def __init__(self,
                  located_items=None,
                  unique_identifiers=None):
@@ -462,25 +437,7 @@ class LocateResponsePayload(base.ResponsePayload):
             kmip_version=kmip_version
         )
         local_buffer = utils.BytearrayStream(input_buffer.read(self.length))
-
-        if self.is_tag_next(enums.Tags.LOCATED_ITEMS, local_buffer):
-            self._located_items = primitives.Integer(
-                tag=enums.Tags.LOCATED_ITEMS
-            )
-            self._located_items.read(
-                local_buffer,
-                kmip_version=kmip_version
-            )
-
-        self._unique_identifiers = []
-        while self.is_tag_next(enums.Tags.UNIQUE_IDENTIFIER, local_buffer):
-            unique_identifier = primitives.TextString(
-                tag=enums.Tags.UNIQUE_IDENTIFIER
-            )
-            unique_identifier.read(local_buffer, kmip_version=kmip_version)
-            self._unique_identifiers.append(unique_identifier)
-
-        self.is_oversized(local_buffer)
+        self._schema.read(self, local_buffer, kmip_version)
 
     def write(self, output_buffer, kmip_version=enums.KMIPVersion.KMIP_1_0):
         """
@@ -493,24 +450,8 @@ class LocateResponsePayload(base.ResponsePayload):
                 version with which the object will be encoded. Optional,
                 defaults to KMIP 1.0.
         """
-        local_buffer = utils.BytearrayStream()
-
-        if self._located_items:
-            self._located_items.write(local_buffer, kmip_version=kmip_version)
-
-        if self._unique_identifiers:
-            for unique_identifier in self._unique_identifiers:
-                unique_identifier.write(
-                    local_buffer,
-                    kmip_version=kmip_version
-                )
-
-        self.length = local_buffer.length()
-        super(LocateResponsePayload, self).write(
-            output_buffer,
-            kmip_version=kmip_version
-        )
-        output_buffer.write(local_buffer.buffer)
+        with self.write_structure(output_buffer, kmip_version=kmip_version):
+            self._schema.write(self, output_buffer, kmip_version)
 
     def __eq__(self, other):
         if isinstance(other, LocateResponsePayload):
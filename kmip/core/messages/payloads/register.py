@@ -23,6 +23,7 @@ from kmip.core import secrets
 from kmip.core import utils
 from kmip.core.factories import secrets as secret_factory
 from kmip.core.messages.payloads import base
+from kmip.core.messages.payloads import schema
 
 
 class RegisterRequestPayload(base.RequestPayload):
@@ -38,6 +39,94 @@ class RegisterRequestPayload(base.RequestPayload):
             Added in KMIP 2.0.
     """
 
+    # NOTE (ph) For now, leave attributes natively in TemplateAttribute form
+    # and just convert to the KMIP 2.0 Attributes form as needed for
+    # encoding/decoding purposes. Changing the payload to require the new
+    # Attributes structure will trigger a bunch of second-order effects
+    # across the client and server codebases that is beyond the scope of
+    # updating the Register payloads to support KMIP 2.0.
+    _schema = schema.Schema(
+        schema.Field(
+            'object_type',
+            enums.Tags.OBJECT_TYPE,
+            primitives.Enumeration,
+            enum=enums.ObjectType,
+            cardinality=schema.REQUIRED,
+            missing=(
+                exceptions.InvalidKmipEncoding,
+                "The Register request payload encoding is missing the object "
+                "type."
+            ),
+            missing_on_write=(
+                exceptions.InvalidField,
+                "The Register request payload is missing the object type "
+                "field."
+            )
+        ),
+        schema.Field(
+            'template_attribute',
+            enums.Tags.TEMPLATE_ATTRIBUTE,
+            objects.TemplateAttribute,
+            cardinality=schema.REQUIRED,
+            max_version=enums.KMIPVersion.KMIP_1_4,
+            missing=(
+                exceptions.InvalidKmipEncoding,
+                "The Register request payload encoding is missing the "
+                "template attribute."
+            ),
+            missing_on_write=(
+                exceptions.InvalidField,
+                "The Register request payload is missing the template "
+                "attribute field."
+            )
+        ),
+        schema.Field(
+            'template_attribute',
+            enums.Tags.ATTRIBUTES,
+            objects.Attributes,
+            cardinality=schema.REQUIRED,
+            min_version=enums.KMIPVersion.KMIP_2_0,
+            decode=objects.convert_attributes_to_template_attribute,
+            encode=objects.convert_template_attribute_to_attributes,
+            missing=(
+                exceptions.InvalidKmipEncoding,
+                "The Register request payload encoding is missing the "
+                "attributes structure."
+            ),
+            missing_on_write=(
+                exceptions.InvalidField,
+                "The Register request payload is missing the template "
+                "attribute field."
+            )
+        ),
+        schema.Field(
+            'managed_object',
+            schema.MANAGED_OBJECT_TAGS,
+            create=lambda payload: payload.secret_factory.create(
+                payload.object_type
+            ),
+            cardinality=schema.REQUIRED,
+            missing=(
+                exceptions.InvalidKmipEncoding,
+                "The Register request payload encoding is missing the managed "
+                "object."
+            ),
+            missing_on_write=(
+                exceptions.InvalidField,
+                "The Register request payload is missing the managed object "
+                "field."
+            )
+        ),
+        schema.Field(
+            'protection_storage_masks',
+            enums.Tags.PROTECTION_STORAGE_MASKS,
+            create=lambda payload: objects.ProtectionStorageMasks(
+                tag=enums.Tags.PROTECTION_STORAGE_MASKS
+            ),
+            min_version=enums.KMIPVersion.KMIP_2_0
+        )
+    )
+
     def __init__(self,
                  object_type=None,
                  template_attribute=None,
@@ -191,77 +280,7 @@ class RegisterRequestPayload(base.RequestPayload):
             kmip_version=kmip_version
         )
         local_buffer = utils.BytearrayStream(input_buffer.read(self.length))
-
-        if self.is_tag_next(enums.Tags.OBJECT_TYPE, local_buffer):
-            self._object_type = primitives.Enumeration(
-                enums.ObjectType,
-                tag=enums.Tags.OBJECT_TYPE
-            )
-            self._object_type.read(local_buffer, kmip_version=kmip_version)
-        else:
-            raise exceptions.InvalidKmipEncoding(
-                "The Register request payload encoding is missing the object "
-                "type."
-            )
-
-        if kmip_version < enums.KMIPVersion.KMIP_2_0:
-            if self.is_tag_next(enums.Tags.TEMPLATE_ATTRIBUTE, local_buffer):
-                self._template_attribute = objects.TemplateAttribute()
-                self._template_attribute.read(
-                    local_buffer,
-                    kmip_version=kmip_version
-                )
-            else:
-                raise exceptions.InvalidKmipEncoding(
-                    "The Register request payload encoding is missing the "
-                    "template attribute."
-                )
-        else:
-            # NOTE (ph) For now, leave attributes natively in TemplateAttribute
-            # form and just convert to the KMIP 2.0 Attributes form as needed
-            # for encoding/decoding purposes. Changing the payload to require
-            # the new Attributes structure will trigger a bunch of second-order
-            # effects across the client and server codebases that is beyond
-            # the scope of updating the Register payloads to support KMIP 2.0.
-            if self.is_tag_next(enums.Tags.ATTRIBUTES, local_buffer):
-                attributes = objects.Attributes()
-                attributes.read(local_buffer, kmip_version=kmip_version)
-                value = objects.convert_attributes_to_template_attribute(
-                    attributes
-                )
-                self._template_attribute = value
-            else:
-                raise exceptions.InvalidKmipEncoding(
-                    "The Register request payload encoding is missing the "
-                    "attributes structure."
-                )
-
-        managed_object = self.secret_factory.create(self.object_type)
-
-        if self.is_tag_next(managed_object.tag, local_buffer):
-            self._managed_object = managed_object
-            self._managed_object.read(local_buffer, kmip_version=kmip_version)
-        else:
-            raise exceptions.InvalidKmipEncoding(
-                "The Register request payload encoding is missing the managed "
-                "object."
-            )
-
-        if kmip_version >= enums.KMIPVersion.KMIP_2_0:
-            if self.is_tag_next(
-                enums.Tags.PROTECTION_STORAGE_MASKS,
-                local_buffer
-            ):
-                protection_storage_masks = objects.ProtectionStorageMasks(
-                    tag=enums.Tags.PROTECTION_STORAGE_MASKS
-                )
-                protection_storage_masks.read(
-                    local_buffer,
-                    kmip_version=kmip_version
-                )
-                self._protection_storage_masks = protection_storage_masks
-
-        self.is_oversized(local_buffer)
+        self._schema.read(self, local_buffer, kmip_version)
 
     def write(self, output_buffer, kmip_version=enums.KMIPVersion.KMIP_1_0):
         """
@@ -278,66 +297,8 @@ class RegisterRequestPayload(base.RequestPayload):
             InvalidField: Raised if the object type attribute, template
                 attribute, or managed object is not defined.
         """
-        local_buffer = utils.BytearrayStream()
-
-        if self._object_type:
-            self._object_type.write(local_buffer, kmip_version=kmip_version)
-        else:
-            raise exceptions.InvalidField(
-                "The Register request payload is missing the object type "
-                "field."
-            )
-
-        if kmip_version < enums.KMIPVersion.KMIP_2_0:
-            if self._template_attribute:
-                self._template_attribute.write(
-                    local_buffer,
-                    kmip_version=kmip_version
-                )
-            else:
-                raise exceptions.InvalidField(
-                    "The Register request payload is missing the template "
-                    "attribute field."
-                )
-        else:
-            # NOTE (ph) For now, leave attributes natively in TemplateAttribute
-            # form and just convert to the KMIP 2.0 Attributes form as needed
-            # for encoding/decoding purposes. Changing the payload to require
-            # the new Attributes structure will trigger a bunch of second-order
-            # effects across the client and server codebases that is beyond
-            # the scope of updating the Register payloads to support KMIP 2.0.
-            if self._template_attribute:
-                attributes = objects.convert_template_attribute_to_attributes(
-                    self._template_attribute
-                )
-                attributes.write(local_buffer, kmip_version=kmip_version)
-            else:
-                raise exceptions.InvalidField(
-                    "The Register request payload is missing the template "
-                    "attribute field."
-                )
-
-        if self._managed_object:
-            self._managed_object.write(local_buffer, kmip_version=kmip_version)
-        else:
-            raise exceptions.InvalidField(
-                "The Register request payload is missing the managed object "
-                "field."
-            )
-
-        if kmip_version >= enums.KMIPVersion.KMIP_2_0:
-            if self._protection_storage_masks:
-                self._protection_storage_masks.write(
-                    local_buffer,
-                    kmip_version=kmip_version
-                )
-
-        self.length = local_buffer.length()
-        super(RegisterRequestPayload, self).write(
-            output_buffer,
-            kmip_version=kmip_version
-        )
-        output_buffer.write(local_buffer.buffer)
+        with self.write_structure(output_buffer, kmip_version=kmip_version):
+            self._schema.write(self, output_buffer, kmip_version)
 
     def __eq__(self, other):
         if isinstance(other, RegisterRequestPayload):
@@ -396,6 +357,31 @@ class RegisterResponsePayload(base.ResponsePayload):
             object.
     """
 
+    _schema = schema.Schema(
+        schema.Field(
+            'unique_identifier',
+            enums.Tags.UNIQUE_IDENTIFIER,
+            primitives.TextString,
+            cardinality=schema.REQUIRED,
+            missing=(
+                exceptions.InvalidKmipEncoding,
+                "The Register response payload encoding is missing the unique "
+                "identifier."
+            ),
+            missing_on_write=(
+                exceptions.InvalidField,
+                "The Register response payload is missing the unique "
+                "identifier field."
+            )
+        ),
+        schema.Field(
+            'template_attribute',
+            enums.Tags.TEMPLATE_ATTRIBUTE,
+            objects.TemplateAttribute,
+            max_version=enums.KMIPVersion.KMIP_1_4
+        )
+    )
+
     def __init__(self,
                  unique_identifier=None,
                  template_attribute=None):
@@ -472,30 +458,7 @@ class RegisterResponsePayload(base.ResponsePayload):
             kmip_version=kmip_version
         )
         local_buffer = utils.BytearrayStream(input_buffer.read(self.length))
-
-        if self.is_tag_next(enums.Tags.UNIQUE_IDENTIFIER, local_buffer):
-            self._unique_identifier = primitives.TextString(
-                tag=enums.Tags.UNIQUE_IDENTIFIER
-            )
-            self._unique_identifier.read(
-                local_buffer,
-                kmip_version=kmip_version
-            )
-        else:
-            raise exceptions.InvalidKmipEncoding(
-                "The Register response payload encoding is missing the unique "
-                "identifier."
-            )
-
-        if kmip_version < enums.KMIPVersion.KMIP_2_0:
-            if self.is_tag_next(enums.Tags.TEMPLATE_ATTRIBUTE, local_buffer):
-                self._template_attribute = objects.TemplateAttribute()
-                self._template_attribute.read(
-                    local_buffer,
-                    kmip_version=kmip_version
-                )
-
-        self.is_oversized(local_buffer)
+        self._schema.read(self, local_buffer, kmip_version)
 
     def write(self, output_buffer, kmip_version=enums.KMIPVersion.KMIP_1_0):
         """
@@ -511,32 +474,8 @@ class RegisterResponsePayload(base.ResponsePayload):
         Raises:
             InvalidField: Raised if the unique identifier is not defined.
         """
-        local_buffer = utils.BytearrayStream()
-
-        if self._unique_identifier:
-            self._unique_identifier.write(
-                local_buffer,
-                kmip_version=kmip_version
-            )
-        else:
-            raise exceptions.InvalidField(
-                "The Register response payload is missing the unique "
-                "identifier field."
-            )
-
-        if kmip_version < enums.KMIPVersion.KMIP_2_0:
-            if self._template_attribute:
-                self._template_attribute.write(
-                    local_buffer,
-                    kmip_version=kmip_version
-                )
-
-        self.length = local_buffer.length()
-        super(RegisterResponsePayload, self).write(
-            output_buffer,
-            kmip_version=kmip_version
-        )
-        output_buffer.write(local_buffer.buffer)
+        with self.write_structure(output_buffer, kmip_version=kmip_version):
+            self._schema.write(self, output_buffer, kmip_version)
 
     def __eq__(self, other):
         if isinstance(other, RegisterResponsePayload):
@@ -0,0 +1,257 @@
+# Copyright (c) 2020 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+from struct import unpack
+
+from kmip.core import enums
+from kmip.core import exceptions
+from kmip.core import primitives
+
+
+OPTIONAL = 'optional'
+REQUIRED = 'required'
+MULTIPLE = 'multiple'
+
+# The tags of the managed object structures that can be carried by payloads
+# such as Get and Register.
+MANAGED_OBJECT_TAGS = (
+    enums.Tags.CERTIFICATE,
+    enums.Tags.OPAQUE_OBJECT,
+    enums.Tags.PRIVATE_KEY,
+    enums.Tags.PUBLIC_KEY,
+    enums.Tags.SECRET_DATA,
+    enums.Tags.SPLIT_KEY,
+    enums.Tags.SYMMETRIC_KEY,
+    enums.Tags.TEMPLATE
+)
+
+
+class Field(object):
+    """
+    A declarative description of a single payload field.
+
+    A field is stored on the payload as a primitive or structure object under
+    the private attribute named after the field (e.g., '_unique_identifier'
+    for the 'unique_identifier' field), matching the attributes used by the
+    public payload properties.
+
+    Attributes:
+        name: The name of the field.
+        tags: The tags that can encode the field.
+        cardinality: Whether the field is optional, required, or may repeat.
+        min_version: The first KMIP version that includes the field.
+        max_version: The last KMIP version that includes the field.
+    """
+
+    def __init__(self,
+                 name,
+                 tag,
+                 kind=None,
+                 enum=None,
+                 cardinality=OPTIONAL,
+                 min_version=None,
+                 max_version=None,
+                 create=None,
+                 decode=None,
+                 encode=None,
+                 missing=None,
+                 missing_on_write=None):
+        """
+        Create a Field.
+
+        Args:
+            name (string): The name of the field. Required.
+            tag (Tags): The tag of the field encoding. A tuple of tags can be
+                given for fields that may hold one of several structures.
+                Required.
+            kind (class): The primitive or structure class used to encode the
+                field. Optional if create is provided.
+            enum (class): The enumeration class of the field value, for
+                Enumeration fields. Optional, defaults to None.
+            cardinality (string): One of OPTIONAL, REQUIRED, or MULTIPLE.
+                Optional, defaults to OPTIONAL.
+            min_version (KMIPVersion): The first KMIP version that includes
+                the field. Optional, defaults to None (all versions).
+            max_version (KMIPVersion): The last KMIP version that includes
+                the field. Optional, defaults to None (all versions).
+            create (callable): A function that takes the payload being
+                decoded and returns an empty object to decode the field into.
+                Optional, defaults to None.
+            decode (callable): A function that converts the decoded object
+                into the value stored on the payload. Optional, defaults to
+                None.
+            encode (callable): A function that converts the value stored on
+                the payload into the object to encode. Optional, defaults to
+                None.
+            missing (tuple): An (exception class, message) pair raised when a
+                required field is missing from an encoding. Optional,
+                defaults to None.
+            missing_on_write (tuple): An (exception class, message) pair
+                raised when a field is missing from a payload being encoded.
+                Optional, defaults to None.
+        """
+        self.name = name
+        self.attribute = '_' + name
+        self.tags = tag if isinstance(tag, tuple) else (tag, )
+        self.cardinality = cardinality
+        self.min_version = min_version
+        self.max_version = max_version
+        self.decode = decode
+        self.encode = encode
+        self.missing = missing
+        self.missing_on_write = missing_on_write
+
+        if create is not None:
+            self.create = create
+        elif kind is primitives.Enumeration:
+            self.create = lambda payload: kind(enum, tag=self.tags[0])
+        elif kind.__module__ == primitives.__name__:
+            self.create = lambda payload: kind(tag=self.tags[0])
+        else:
+            self.create = lambda payload: kind()
+
+    def is_supported(self, kmip_version):
+        if self.min_version is not None and kmip_version < self.min_version:
+            return False
+        if self.max_version is not None and kmip_version > self.max_version:
+            return False
+        return True
+
+
+class Schema(object):
+    """
+    An ordered collection of payload fields compiled into a codec.
+
+    For each KMIP version, the schema precomputes the ordered list of fields
+    included in that version and a dispatch table mapping each encoded tag
+    value to its field. Decoding is then a single pass over the encoded
+    fields, peeking at each tag once.
+    """
+
+    def __init__(self, *fields):
+        """
+        Create a Schema.
+
+        Args:
+            fields (Field): The fields of the payload, in encoding order.
+        """
+        self._fields = {}
+        self._dispatch = {}
+
+        for kmip_version in enums.KMIPVersion:
+            supported = [f for f in fields if f.is_supported(kmip_version)]
+            dispatch = {}
+            for index, field in enumerate(supported):
+                for tag in field.tags:
+                    dispatch.setdefault(tag.value, (index, field))
+            self._fields[kmip_version] = supported
+            self._dispatch[kmip_version] = dispatch
+
+    def _check_required(self, fields, start, end):
+        for field in fields[start:end]:
+            if field.cardinality == REQUIRED:
+                if field.missing:
+                    error, message = field.missing
+                    raise error(message)
+                raise exceptions.InvalidKmipEncoding(
+                    "The payload encoding is missing the {0} field.".format(
+                        field.name
+                    )
+                )
+
+    def read(self, payload, input_stream, kmip_version):
+        """
+        Decode the payload fields from the input stream.
+
+        Fields are decoded in order until the next tag does not belong to a
+        field that can follow the fields already decoded. Any remaining
+        bytes cause the payload to be rejected as oversized.
+
+        Args:
+            payload (Struct): The payload to decode the fields into.
+                Required.
+            input_stream (stream): A buffer containing only the encoded
+                fields of the payload. Usually a BytearrayStream object.
+                Required.
+            kmip_version (KMIPVersion): An enumeration defining the KMIP
+                version with which the payload will be decoded. Required.
+        """
+        fields = self._fields[kmip_version]
+        dispatch = self._dispatch[kmip_version]
+
+        for field in fields:
+            if field.cardinality == MULTIPLE:
+                setattr(payload, field.attribute, [])
+
+        position = 0
+        while True:
+            tag = input_stream.peek(primitives.Base.TAG_SIZE)
+            if len(tag) != primitives.Base.TAG_SIZE:
+                break
+            tag = unpack('!I', b'\x00' + tag)[0]
+
+            entry = dispatch.get(tag)
+            if entry is None:
+                break
+            index, field = entry
+
+            if index < position:
+                repeated = (index == position - 1)
+                if not (repeated and field.cardinality == MULTIPLE):
+                    break
+            else:
+                self._check_required(fields, position, index)
+
+            value = field.create(payload)
+            if value.tag.value != tag:
+                break
+            value.read(input_stream, kmip_version=kmip_version)
+            if field.decode:
+                value = field.decode(value)
+
+            if field.cardinality == MULTIPLE:
+                getattr(payload, field.attribute).append(value)
+            else:
+                setattr(payload, field.attribute, value)
+            position = index + 1
+
+        self._check_required(fields, position, len(fields))
+        payload.is_oversized(input_stream)
+
+    def write(self, payload, output_stream, kmip_version):
+        """
+        Encode the payload fields to the output stream.
+
+        Args:
+            payload (Struct): The payload to encode the fields of. Required.
+            output_stream (stream): A buffer to contain the encoded fields of
+                the payload. Usually a BytearrayStream object. Required.
+            kmip_version (KMIPVersion): An enumeration defining the KMIP
+                version with which the payload will be encoded. Required.
+        """
+        for field in self._fields[kmip_version]:
+            value = getattr(payload, field.attribute)
+
+            if value is None or (isinstance(value, list) and not value):
+                if field.missing_on_write:
+                    error, message = field.missing_on_write
+                    raise error(message)
+            elif field.cardinality == MULTIPLE:
+                for item in value:
+                    item.write(output_stream, kmip_version=kmip_version)
+            else:
+                if field.encode:
+                    value = field.encode(value)
+                value.write(output_stream, kmip_version=kmip_version)
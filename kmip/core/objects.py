@@ -48,6 +48,8 @@ class Attribute(Struct):
 
     class AttributeName(TextString):
 
+        __slots__ = ()
+
         def __init__(self, value=None):
             super(Attribute.AttributeName, self).__init__(
                 value, Tags.ATTRIBUTE_NAME)
@@ -69,6 +71,8 @@ class Attribute(Struct):
 
     class AttributeIndex(Integer):
 
+        __slots__ = ()
+
         def __init__(self, value=None):
             super(Attribute.AttributeIndex, self).__init__(
                 value, Tags.ATTRIBUTE_INDEX)
@@ -13,10 +13,11 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import binascii
+import contextlib
 import enum as enumeration
 import logging
 import six
-import struct
 import sys
 import time
 
@@ -27,7 +28,80 @@ from kmip.core import exceptions
 from kmip.core import utils
 
 
+def _read_padding(istream, padding_length, class_name):
+    """
+    Read and verify the zero padding bytes that follow a string value.
+
+    Args:
+        istream (stream): The stream to read the padding bytes from.
+        padding_length (int): The number of padding bytes to read.
+        class_name (string): The name of the class reading the padding, used
+            to build the error message.
+
+    Raises:
+        ReadValueError: if any of the padding bytes is not zero.
+    """
+    padding = bytearray(istream.read(padding_length))
+    if len(padding) != padding_length:
+        raise exceptions.ReadValueError(
+            class_name,
+            'pad',
+            '{0} bytes'.format(padding_length),
+            '{0} bytes'.format(len(padding))
+        )
+    for pad in padding:
+        if pad != 0:
+            raise exceptions.ReadValueError(class_name, 'pad', 0, pad)
+
+
+def _decode_big_integer(data):
+    """
+    Convert big-endian, two's complement bytes into a signed integer.
+    """
+    if six.PY2:
+        if not data:
+            return 0
+        value = int(binascii.hexlify(data), 16)
+        if ord(data[0]) & 0x80:
+            value -= 1 << (len(data) * 8)
+        return value
+    return int.from_bytes(data, 'big', signed=True)
+
+
+def _encode_big_integer(value, length):
+    """
+    Convert a signed integer into big-endian, two's complement bytes.
+    """
+    if six.PY2:
+        value %= 1 << (length * 8)
+        return binascii.unhexlify('{0:0{1}x}'.format(value, length * 2))
+    return value.to_bytes(length, 'big', signed=True)
+
+
+# Precomputed encodings of the item header fields. Every item starts with a
+# 3-byte tag and a 1-byte type, so the combined 4-byte prefix for each
+# (tag, type) pair is built once here instead of being packed per item.
+TAG_BYTES = dict(
+    (tag, pack('!I', tag.value)[1:]) for tag in enums.Tags
+)
+TAG_TYPE_PREFIXES = dict(
+    ((tag, item_type), tag_bytes + pack('!B', item_type.value))
+    for tag, tag_bytes in six.iteritems(TAG_BYTES)
+    for item_type in enums.Types
+)
+
+# Reverse lookups from encoded values to enumerations, used when decoding
+# primitives and when tokenizing encodings in kmip.core.ttlv.
+TAGS_BY_VALUE = dict((tag.value, tag) for tag in enums.Tags)
+TYPES_BY_VALUE = dict((t.value, t) for t in enums.Types)
+
+
 class Base(object):
+    # Primitives are created in large numbers when decoding messages, so the
+    # primitive classes use slots instead of per-instance dictionaries.
+    # Subclasses that do not define __slots__ keep a dictionary as usual.
+    __slots__ = ('tag', 'type', 'length')
+
     TAG_SIZE = 3
     TYPE_SIZE = 1
     LENGTH_SIZE = 4
@@ -49,7 +123,9 @@ class Base(object):
         tts = istream.read(self.TAG_SIZE)
         tag = unpack('!I', b'\x00' + tts[0:self.TAG_SIZE])[0]
 
-        enum_tag = enums.Tags(tag)
+        enum_tag = TAGS_BY_VALUE.get(tag)
+        if enum_tag is None:
+            enum_tag = enums.Tags(tag)
 
         # Verify that the tag matches for the current object
         if enum_tag is not self.tag:
@@ -74,7 +150,9 @@ class Base(object):
             )
         typ = unpack('!B', tts)[0]
 
-        enum_typ = enums.Types(typ)
+        enum_typ = TYPES_BY_VALUE.get(typ)
+        if enum_typ is None:
+            enum_typ = enums.Types(typ)
 
         if enum_typ is not self.type:
             raise exceptions.ReadValueError(
@@ -102,13 +180,27 @@ class Base(object):
         raise NotImplementedError()
 
     def read(self, istream, kmip_version=enums.KMIPVersion.KMIP_1_0):
-        self.read_tag(istream)
-        self.read_type(istream)
-        self.read_length(istream)
+        header = istream.read(
+            self.TAG_SIZE + self.TYPE_SIZE + self.LENGTH_SIZE
+        )
+        prefix = TAG_TYPE_PREFIXES.get((self.tag, self.type))
+
+        # Fast path: the header matches the expected tag and type.
+        if len(header) == 8 and prefix is not None and header[:4] == prefix:
+            self.length = unpack('!I', header[4:])[0]
+            return
+
+        header = utils.BytearrayStream(header)
+        self.read_tag(header)
+        self.read_type(header)
+        self.read_length(header)
 
     def write_tag(self, ostream):
         # Write the tag to the output stream
-        ostream.write(pack('!I', self.tag.value)[1:])
+        tag_bytes = TAG_BYTES.get(self.tag)
+        if tag_bytes is None:
+            tag_bytes = pack('!I', self.tag.value)[1:]
+        ostream.write(tag_bytes)
 
     def write_type(self, ostream):
         if type(self.type) is not enums.Types:
@@ -136,6 +228,15 @@ class Base(object):
         raise NotImplementedError()
 
     def write(self, ostream, kmip_version=enums.KMIPVersion.KMIP_1_0):
+        prefix = TAG_TYPE_PREFIXES.get((self.tag, self.type))
+        length = self.length
+
+        # Fast path: a known tag and type with a valid length.
+        if prefix is not None and type(length) is int and \
+                0 <= length <= 0xFFFFFFFF:
+            ostream.write(prefix + pack('!I', length))
+            return
+
         self.write_tag(ostream)
         self.write_type(ostream)
         self.write_length(ostream)
@@ -148,6 +249,9 @@ class Base(object):
         next_tag = stream.peek(Base.TAG_SIZE)
         if len(next_tag) != Base.TAG_SIZE:
             return False
+        tag_bytes = TAG_BYTES.get(tag)
+        if tag_bytes is not None:
+            return next_tag == tag_bytes
         next_tag = unpack('!I', b'\x00' + next_tag)[0]
         if next_tag == tag.value:
             return True
@@ -172,16 +276,73 @@ class Base(object):
 
 class Struct(Base):
 
+    __slots__ = ()
+
     def __init__(self, tag=enums.Tags.DEFAULT):
         super(Struct, self).__init__(tag, type=enums.Types.STRUCTURE)
 
+    @contextlib.contextmanager
+    def write_structure(self,
+                        ostream,
+                        kmip_version=enums.KMIPVersion.KMIP_1_0):
+        """
+        Encode the fields of the Struct directly into the output stream.
+
+        The tag and type of the Struct are written first and space for its
+        length is reserved. The caller then writes the encodings of the Struct
+        fields straight into the output stream, after which the length is
+        patched in. This avoids encoding the fields into a temporary buffer
+        and copying it into the output stream. If encoding a field fails, the
+        partial encoding of the Struct is removed from the output stream.
+
+        Args:
+            ostream (stream): A buffer to contain the encoded bytes of the
+                Struct. Must be a BytearrayStream object. Required.
+            kmip_version (KMIPVersion): An enumeration defining the KMIP
+                version with which the object will be encoded. Optional,
+                defaults to KMIP 1.0.
+
+        Raises:
+            WriteOverflowError: if the encoded fields are too long for the
+                length of the Struct to be encoded.
+        """
+        start = ostream.length()
+        prefix = TAG_TYPE_PREFIXES.get((self.tag, self.type))
+        if prefix is not None:
+            ostream.write(prefix)
+        else:
+            self.write_tag(ostream)
+            self.write_type(ostream)
+        position = ostream.reserve(self.LENGTH_SIZE)
+
+        try:
+            yield
+        except Exception:
+            ostream.truncate(start)
+            raise
+
+        length = ostream.length() - position - self.LENGTH_SIZE
+        if length > 0xFFFFFFFF:
+            ostream.truncate(start)
+            raise exceptions.WriteOverflowError(
+                Struct.__name__,
+                'length',
+                self.LENGTH_SIZE,
+                utils.count_bytes(length)
+            )
+        self.length = length
+        ostream.patch(position, pack('!I', length))
+
     # NOTE (peter-hamilton) If seen, should indicate repr needs to be defined
     def __repr__(self):
         return "Struct()"
 
 
 class Integer(Base):
+    __slots__ = ('value', 'pack_string')
+
     LENGTH = 4
+    padding_length = LENGTH
 
     # Set for signed 32-bit integers
     MIN = -2147483648
@@ -195,7 +356,6 @@ class Integer(Base):
             self.value = 0
 
         self.length = self.LENGTH
-        self.padding_length = self.LENGTH
         if signed:
             self.pack_string = '!i'
         else:
@@ -307,6 +467,8 @@ class LongInteger(Base):
     9.1 of the KMIP 1.1 specification.
     """
 
+    __slots__ = ('value', )
+
     LENGTH = 8
 
     # Bounds for signed 64-bit integers
@@ -420,6 +582,8 @@ class BigInteger(Base):
     Section 9.1 of the KMIP 1.1 specification.
     """
 
+    __slots__ = ('value', )
+
     def __init__(self, value=0, tag=enums.Tags.DEFAULT):
         super(BigInteger, self).__init__(tag, type=enums.Types.BIG_INTEGER)
         self.value = value
@@ -450,31 +614,17 @@ class BigInteger(Base):
                 "invalid big integer length read; "
                 "expected: multiple of 8, observed: {0}".format(self.length))
 
-        sign = 1
-        binary = ''
-
-        # Read the value byte by byte and convert it into binary, padding each
-        # byte as needed.
-        for _ in range(self.length):
-            byte = struct.unpack('!B', istream.read(1))[0]
-            bits = "{0:b}".format(byte)
-            pad = len(bits) % 8
-            if pad:
-                bits = ('0' * (8 - pad)) + bits
-            binary += bits
-
-        # If the value is negative, convert via two's complement.
-        if binary[0] == '1':
-            sign = -1
-            binary = binary.replace('1', 'i')
-            binary = binary.replace('0', '1')
-            binary = binary.replace('i', '0')
-
-            pivot = binary.rfind('0')
-            binary = binary[0:pivot] + '1' + ('0' * len(binary[pivot + 1:]))
-
-        # Convert the value back to an integer and reapply the sign.
-        self.value = int(binary, 2) * sign
+        # Decode the value as a signed, big-endian, two's complement integer.
+        data = istream.read(self.length)
+        if len(data) != self.length:
+            raise exceptions.InvalidPrimitiveLength(
+                "invalid big integer encoding read; "
+                "expected: {0} bytes, observed: {1} bytes".format(
+                    self.length,
+                    len(data)
+                )
+            )
+        self.value = _decode_big_integer(data)
 
     def write(self, ostream, kmip_version=enums.KMIPVersion.KMIP_1_0):
         """
@@ -488,29 +638,14 @@ class BigInteger(Base):
                 version with which the object will be encoded. Optional,
                 defaults to KMIP 1.0.
         """
-        # Convert the value to binary and pad it as needed.
-        binary = "{0:b}".format(abs(self.value))
-        binary = ("0" * (64 - (len(binary) % 64))) + binary
-
-        # If the value is negative, convert via two's complement.
-        if self.value < 0:
-            binary = binary.replace('1', 'i')
-            binary = binary.replace('0', '1')
-            binary = binary.replace('i', '0')
-
-            pivot = binary.rfind('0')
-            binary = binary[0:pivot] + '1' + ('0' * len(binary[pivot + 1:]))
-
-        # Convert each byte to hex and build the hex string for the value.
-        hexadecimal = b''
-        for i in range(0, len(binary), 8):
-            byte = binary[i:i + 8]
-            byte = int(byte, 2)
-            hexadecimal += struct.pack('!B', byte)
-
-        self.length = len(hexadecimal)
+        # Encode the value as a signed, big-endian, two's complement integer,
+        # padded to a multiple of 8 bytes. A full extra 8 bytes is used when
+        # the magnitude of the value exactly fills a multiple of 8 bytes.
+        length = 8 * ((abs(self.value).bit_length() // 64) + 1)
+        data = _encode_big_integer(self.value, length)
+        self.length = len(data)
         super(BigInteger, self).write(ostream, kmip_version=kmip_version)
-        ostream.write(hexadecimal)
+        ostream.write(data)
 
     def validate(self):
         """
@@ -554,6 +689,8 @@ class Enumeration(Base):
     an unsigned, big-endian, 32-bit integer. For more information, see Section
     9.1 of the KMIP 1.1 specification.
     """
+    __slots__ = ('value', 'enum')
+
     LENGTH = 4
 
     # Bounds for unsigned 32-bit integers
@@ -689,8 +826,12 @@ class Boolean(Base):
     or False (0). For more information, see Section 9.1 of the KMIP 1.1
     specification.
     """
+    __slots__ = ('value', )
+
     LENGTH = 8
 
+    logger = logging.getLogger(__name__)
+
     def __init__(self, value=True, tag=enums.Tags.DEFAULT):
         """
         Create a Boolean object.
@@ -701,7 +842,6 @@ class Boolean(Base):
                 Optional, defaults to Tags.DEFAULT.
         """
         super(Boolean, self).__init__(tag, type=enums.Types.BOOLEAN)
-        self.logger = logging.getLogger(__name__)
         self.value = value
         self.length = self.LENGTH
 
@@ -815,6 +955,8 @@ class Boolean(Base):
 
 
 class TextString(Base):
+    __slots__ = ('value', 'padding_length')
+
     PADDING_SIZE = 8
     BYTE_FORMAT = '!c'
 
@@ -829,7 +971,7 @@ class TextString(Base):
         self.validate()
 
         if self.value is not None:
-            self.length = len(self.value)
+            self.length = len(self.value.encode())
             self.padding_length = self.PADDING_SIZE - (self.length %
                                                        self.PADDING_SIZE)
             if self.padding_length == self.PADDING_SIZE:
@@ -840,26 +982,23 @@ class TextString(Base):
 
     def read_value(self, istream, kmip_version=enums.KMIPVersion.KMIP_1_0):
         # Read string text
-        self.value = ''
-        for _ in range(self.length):
-            c = unpack(self.BYTE_FORMAT, istream.read(1))[0]
-            if sys.version >= '3':
-                c = c.decode()
-            self.value += c
+        data = istream.read(self.length)
+        if len(data) != self.length:
+            raise exceptions.ReadValueError(
+                TextString.__name__,
+                'value',
+                '{0} bytes'.format(self.length),
+                '{0} bytes'.format(len(data))
+            )
+        if sys.version >= '3':
+            data = data.decode()
+        self.value = data
 
         # Read padding and check content
         self.padding_length = self.PADDING_SIZE - (self.length %
                                                    self.PADDING_SIZE)
         if self.padding_length < self.PADDING_SIZE:
-            for _ in range(self.padding_length):
-                pad = unpack('!B', istream.read(1))[0]
-                if pad != 0:
-                    raise exceptions.ReadValueError(
-                        TextString.__name__,
-                        'pad',
-                        0,
-                        pad
-                    )
+            _read_padding(istream, self.padding_length, TextString.__name__)
 
     def read(self, istream, kmip_version=enums.KMIPVersion.KMIP_1_0):
         super(TextString, self).read(istream, kmip_version=kmip_version)
@@ -867,13 +1006,8 @@ class TextString(Base):
         self.validate()
 
     def write_value(self, ostream, kmip_version=enums.KMIPVersion.KMIP_1_0):
-        # Write string to stream
-        for char in self.value:
-            ostream.write(pack(self.BYTE_FORMAT, char.encode()))
-
-        # Write padding to stream
-        for _ in range(self.padding_length):
-            ostream.write(pack('!B', 0))
+        # Write string and padding to stream
+        ostream.write(self.value.encode() + (b'\x00' * self.padding_length))
 
     def write(self, ostream, kmip_version=enums.KMIPVersion.KMIP_1_0):
         super(TextString, self).write(ostream, kmip_version=kmip_version)
@@ -909,6 +1043,8 @@ class TextString(Base):
 
 
 class ByteString(Base):
+    __slots__ = ('value', 'padding_length')
+
     PADDING_SIZE = 8
     BYTE_FORMAT = '!B'
 
@@ -934,9 +1070,14 @@ class ByteString(Base):
 
     def read_value(self, istream, kmip_version=enums.KMIPVersion.KMIP_1_0):
         # Read bytes into bytearray
-        data = bytearray()
-        for _ in range(self.length):
-            data.append(istream.read(1)[0])
+        data = istream.read(self.length)
+        if len(data) != self.length:
+            raise exceptions.ReadValueError(
+                ByteString.__name__,
+                'value',
+                '{0} bytes'.format(self.length),
+                '{0} bytes'.format(len(data))
+            )
         self.value = bytes(data)
 
         # Read padding and check content
@@ -946,29 +1087,15 @@ class ByteString(Base):
             self.padding_length = 0
 
         if self.padding_length < self.PADDING_SIZE:
-            for _ in range(self.padding_length):
-                pad = unpack('!B', istream.read(1))[0]
-                if pad != 0:
-                    raise exceptions.ReadValueError(
-                        TextString.__name__,
-                        'pad',
-                        0,
-                        pad
-                    )
+            _read_padding(istream, self.padding_length, TextString.__name__)
 
     def read(self, istream, kmip_version=enums.KMIPVersion.KMIP_1_0):
         super(ByteString, self).read(istream, kmip_version=kmip_version)
         self.read_value(istream, kmip_version=kmip_version)
 
     def write_value(self, ostream, kmip_version=enums.KMIPVersion.KMIP_1_0):
-        # Write bytes to stream
-        data = bytearray(self.value)
-        for byte in data:
-            ostream.write(pack(self.BYTE_FORMAT, byte))
-
-        # Write padding to stream
-        for _ in range(self.padding_length):
-            ostream.write(pack('!B', 0))
+        # Write bytes and padding to stream
+        ostream.write(self.value + (b'\x00' * self.padding_length))
 
     def write(self, ostream, kmip_version=enums.KMIPVersion.KMIP_1_0):
         super(ByteString, self).write(ostream, kmip_version=kmip_version)
@@ -1015,6 +1142,8 @@ class DateTime(LongInteger):
     more information, see Section 9.1 of the KMIP 1.1 specification.
     """
 
+    __slots__ = ()
+
     def __init__(self, value=None, tag=enums.Tags.DEFAULT):
         """
         Create a DateTime.
@@ -1047,6 +1176,8 @@ class Interval(Base):
     of one second. For more information, see Section 9.1 of the KMIP 1.1
     specification.
     """
+    __slots__ = ('value', )
+
     LENGTH = 4
 
     # Bounds for unsigned 32-bit integers
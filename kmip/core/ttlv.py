@@ -0,0 +1,227 @@
+# Copyright (c) 2020 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import collections
+import struct
+
+from kmip.core import enums
+from kmip.core import exceptions
+from kmip.core import primitives
+
+from kmip.core.messages import operations
+
+
+HEADER_SIZE = 8
+
+Token = collections.namedtuple(
+    'Token',
+    ['depth', 'tag', 'type', 'length', 'value']
+)
+
+RequestSummary = collections.namedtuple(
+    'RequestSummary',
+    ['operation', 'batch_count', 'protocol_version']
+)
+
+# The unpack formats and required value lengths of the fixed-size types.
+_FIXED_TYPES = {
+    enums.Types.INTEGER: ('!i', 4),
+    enums.Types.LONG_INTEGER: ('!q', 8),
+    enums.Types.ENUMERATION: ('!I', 4),
+    enums.Types.BOOLEAN: ('!Q', 8),
+    enums.Types.DATE_TIME: ('!q', 8),
+    enums.Types.INTERVAL: ('!I', 4)
+}
+
+
+def _decode_value(item_type, length, value):
+    if item_type in _FIXED_TYPES:
+        value_format, value_length = _FIXED_TYPES[item_type]
+        if length != value_length:
+            raise exceptions.InvalidKmipEncoding(
+                "Invalid length for {0} value: expected {1}, found "
+                "{2}.".format(item_type.name, value_length, length)
+            )
+        value = struct.unpack(value_format, bytes(value))[0]
+        if item_type == enums.Types.BOOLEAN:
+            if value not in (0, 1):
+                raise exceptions.InvalidKmipEncoding(
+                    "Invalid boolean value: {0}.".format(value)
+                )
+            value = bool(value)
+        return value
+    elif item_type == enums.Types.BIG_INTEGER:
+        if length % 8 != 0:
+            raise exceptions.InvalidKmipEncoding(
+                "Invalid length for BIG_INTEGER value: {0} is not a "
+                "multiple of 8.".format(length)
+            )
+        return primitives._decode_big_integer(bytes(value))
+    return value
+
+
+def tokenize(data):
+    """
+    Walk a TTLV encoding, yielding one token per encoded item.
+
+    Tokens are produced directly from the encoding without building any
+    primitive or structure objects, so arbitrarily large encodings can be
+    inspected without materializing the object graph. Each token is a
+    (depth, tag, type, length, value) tuple:
+
+    * depth is the structure nesting level of the item, starting at 0;
+    * tag is the Tags enumeration, or the raw integer for unknown tags;
+    * type is the Types enumeration;
+    * length is the unpadded length of the value in bytes;
+    * value is None for structures (whose items follow as tokens of
+      the next depth), a memoryview of the value for text and byte
+      strings, and the decoded integer or boolean for all other types.
+
+    The tokenizer is lazy; encoding errors past the items consumed by the
+    caller are not detected.
+
+    Args:
+        data (bytes): The TTLV encoding. Any object supporting the buffer
+            protocol is accepted. Required.
+
+    Yields:
+        Token: The next encoded item.
+
+    Raises:
+        InvalidKmipEncoding: Raised if the encoding is truncated, uses an
+            unknown item type, or contains an invalid value.
+    """
+    view = memoryview(data)
+    end = len(view)
+    offset = 0
+    ends = []
+
+    while offset < end:
+        while ends and offset == ends[-1]:
+            ends.pop()
+        limit = ends[-1] if ends else end
+
+        if limit - offset < HEADER_SIZE:
+            raise exceptions.InvalidKmipEncoding(
+                "Truncated item header at offset {0}.".format(offset)
+            )
+        tag_type, length = struct.unpack(
+            '!II',
+            bytes(view[offset:offset + HEADER_SIZE])
+        )
+        tag = primitives.TAGS_BY_VALUE.get(tag_type >> 8, tag_type >> 8)
+        item_type = primitives.TYPES_BY_VALUE.get(tag_type & 0xFF)
+        if item_type is None or item_type == enums.Types.DEFAULT:
+            raise exceptions.InvalidKmipEncoding(
+                "Unknown item type 0x{0:02X} at offset {1}.".format(
+                    tag_type & 0xFF,
+                    offset
+                )
+            )
+
+        start = offset + HEADER_SIZE
+        if item_type == enums.Types.STRUCTURE:
+            padded_length = length
+        else:
+            padded_length = length + (-length % 8)
+        if limit - start < padded_length:
+            raise exceptions.InvalidKmipEncoding(
+                "Truncated {0} value at offset {1}.".format(
+                    item_type.name,
+                    offset
+                )
+            )
+
+        depth = len(ends)
+        if item_type == enums.Types.STRUCTURE:
+            ends.append(start + length)
+            offset = start
+            yield Token(depth, tag, item_type, length, None)
+        else:
+            offset = start + padded_length
+            value = _decode_value(
+                item_type,
+                length,
+                view[start:start + length]
+            )
+            yield Token(depth, tag, item_type, length, value)
+
+
+def peek_operation(data):
+    """
+    Classify a request message without decoding it.
+
+    Only the leading items of the encoding are examined, stopping at the
+    operation of the first batch item.
+
+    Args:
+        data (bytes): The TTLV encoding of a request message. Required.
+
+    Returns:
+        RequestSummary: A (operation, batch_count, protocol_version) tuple.
+            The operation is the operation of the first batch item, as
+            decoded by kmip.core.messages.operations.decode_operation, or the
+            raw integer for unknown operations. The protocol
+            version is a (major, minor) tuple of integers. Any field not
+            found in the encoding is None.
+
+    Raises:
+        InvalidKmipEncoding: Raised if the encoding is not a request message
+            or cannot be tokenized.
+    """
+    major = None
+    minor = None
+    batch_count = None
+    path = []
+
+    for depth, tag, item_type, _, value in tokenize(data):
+        del path[depth:]
+        if depth == 0 and tag != enums.Tags.REQUEST_MESSAGE:
+            raise exceptions.InvalidKmipEncoding(
+                "The encoding is not a request message."
+            )
+
+        if item_type == enums.Types.STRUCTURE:
+            path.append(tag)
+        elif path[1:] == [enums.Tags.REQUEST_HEADER]:
+            if tag == enums.Tags.BATCH_COUNT:
+                batch_count = value
+        elif path[1:] == [
+            enums.Tags.REQUEST_HEADER,
+            enums.Tags.PROTOCOL_VERSION
+        ]:
+            if tag == enums.Tags.PROTOCOL_VERSION_MAJOR:
+                major = value
+            elif tag == enums.Tags.PROTOCOL_VERSION_MINOR:
+                minor = value
+        elif path[1:] == [enums.Tags.BATCH_ITEM]:
+            if tag == enums.Tags.OPERATION:
+                try:
+                    operation = operations.decode_operation(value)
+                except ValueError:
+                    operation = value
+                return RequestSummary(
+                    operation,
+                    batch_count,
+                    _protocol_version(major, minor)
+                )
+
+    return RequestSummary(None, batch_count, _protocol_version(major, minor))
+
+
+def _protocol_version(major, minor):
+    if major is None or minor is None:
+        return None
+    return major, minor
@@ -63,61 +63,167 @@ def build_er_error(class_object, descriptor, expected, received,
 
 
 class BytearrayStream(io.RawIOBase):
+    """
+    A seekless byte stream used to encode and decode TTLV structures.
+
+    The stream keeps its data in a single buffer and tracks a read offset
+    into it. Reading advances the offset instead of slicing the consumed
+    bytes off the front of the buffer, so decoding a message of n bytes
+    copies each byte at most once. Writing appends to a growable bytearray.
+    """
+
     def __init__(self, data=None):
         if data is None:
-            self.buffer = bytes()
+            self._buffer = bytearray()
+        elif isinstance(data, bytes):
+            self._buffer = data
+        elif isinstance(data, memoryview) and data.readonly:
+            self._buffer = data
         else:
-            self.buffer = bytes(data)
+            self._buffer = bytes(data)
+        self._offset = 0
+
+    @property
+    def buffer(self):
+        """
+        The unread contents of the stream, as bytes.
+        """
+        return bytes(self._buffer[self._offset:])
+
+    def _consume(self, n):
+        start = self._offset
+        end = min(start + n, len(self._buffer))
+        self._offset = end
+        return start, end
 
     def read(self, n=None):
         if n is None or n == -1:
             return self.readall()
-        length = len(self.buffer)
-        if n > length:
-            n = length
-        data = self.buffer[0:n]
-        self.buffer = self.buffer[n:]
-        return data
+        start, end = self._consume(n)
+        return bytes(self._buffer[start:end])
 
     def readall(self):
-        data = self.buffer
-        self.buffer = bytes()
-        return data
+        start, end = self._consume(len(self._buffer))
+        return bytes(self._buffer[start:end])
 
-    # TODO (peter-hamilton) Unused, add documentation or cut.
     def readinto(self, b):
-        if len(b) <= len(self.buffer):
-            num_bytes_to_read = len(b)
-        else:
-            num_bytes_to_read = len(self.buffer)
-        b[:num_bytes_to_read] = self.buffer[:num_bytes_to_read]
-        self.buffer = self.buffer[num_bytes_to_read:]
-        return num_bytes_to_read
+        """
+        Read bytes from the stream into a pre-allocated, writable buffer.
+
+        Args:
+            b (bytearray, memoryview): The buffer to fill. Required.
+
+        Returns:
+            int: The number of bytes actually copied into the buffer.
+        """
+        view = memoryview(b)
+        start, end = self._consume(len(view))
+        view[:end - start] = memoryview(self._buffer)[start:end]
+        return end - start
+
+    def read_view(self, n):
+        """
+        Read up to n bytes from the stream without copying them.
+
+        The returned memoryview references the stream's underlying buffer.
+        Release it before writing to the stream again.
+
+        Args:
+            n (int): The number of bytes to read. Required.
+
+        Returns:
+            memoryview: A view of the bytes read from the stream.
+        """
+        start, end = self._consume(n)
+        return memoryview(self._buffer)[start:end]
 
     def peek(self, n=None):
-        length = len(self.buffer)
+        length = len(self._buffer) - self._offset
         if n is None or n > length:
             n = length
-        return self.buffer[0:n]
+        return bytes(self._buffer[self._offset:self._offset + n])
+
+    def remaining(self):
+        """
+        Get the number of unread bytes left in the stream.
+
+        Returns:
+            int: The number of bytes that can still be read.
+        """
+        return len(self._buffer) - self._offset
 
     def write(self, b):
-        prev_bytes = len(self.buffer)
-        self.buffer += b
-        return len(self.buffer) - prev_bytes
+        if not isinstance(self._buffer, bytearray):
+            self._buffer = bytearray(self._buffer[self._offset:])
+            self._offset = 0
+        elif self._offset and self._offset >= len(self._buffer) // 2:
+            # Reclaim consumed space once it dominates the buffer so that
+            # alternating writes and reads do not grow without bound.
+            del self._buffer[:self._offset]
+            self._offset = 0
+        prev_bytes = len(self._buffer)
+        self._buffer += b
+        return len(self._buffer) - prev_bytes
+
+    def reserve(self, n):
+        """
+        Append n zero bytes to the stream, to be filled in later by patch.
+
+        Args:
+            n (int): The number of bytes to reserve. Required.
+
+        Returns:
+            int: The position of the reserved bytes, relative to the start of
+                the unread data in the stream.
+        """
+        position = self.remaining()
+        self.write(bytes(bytearray(n)))
+        return position
+
+    def patch(self, position, b):
+        """
+        Overwrite bytes previously written to the stream.
+
+        Args:
+            position (int): The position of the first byte to overwrite,
+                relative to the start of the unread data in the stream, as
+                returned by reserve. Required.
+            b (bytes): The replacement bytes. Required.
+        """
+        start = self._offset + position
+        if start + len(b) > len(self._buffer):
+            raise ValueError("Cannot patch past the end of the stream.")
+        self._buffer[start:start + len(b)] = b
+
+    def truncate(self, position=None):
+        """
+        Discard all bytes written to the stream after the given position.
+
+        Args:
+            position (int): The number of unread bytes to keep. Optional,
+                defaults to keeping all unread bytes.
+
+        Returns:
+            int: The number of unread bytes left in the stream.
+        """
+        if position is not None and position < self.remaining():
+            if not isinstance(self._buffer, bytearray):
+                self._buffer = bytearray(self._buffer)
+            del self._buffer[self._offset + position:]
+        return self.remaining()
 
     def length(self):
-        return len(self.buffer)
+        return self.remaining()
 
     def __str__(self):
-        sbuffer = bytes(self.buffer[0:])
-        return str(hexlify(sbuffer))
+        return str(hexlify(self.buffer))
 
     def __len__(self):
-        return len(self.buffer)
+        return self.remaining()
 
     def __eq__(self, other):
         if isinstance(other, BytearrayStream):
-            if len(self.buffer) != len(other.buffer):
+            if len(self) != len(other):
                 return False
             elif self.buffer != other.buffer:
                 return False
@@ -271,7 +271,8 @@ class ProxyKmipClient(object):
                         public_name=None,
                         public_usage_mask=None,
                         private_name=None,
-                        private_usage_mask=None):
+                        private_usage_mask=None,
+                        asynchronous=False):
         """
         Create an asymmetric key pair on a KMIP appliance.
 
@@ -291,11 +292,16 @@ class ProxyKmipClient(object):
             private_usage_mask (list): A list of CryptographicUsageMask
                 enumerations indicating how the private key should be used.
                 Optional, defaults to None.
+            asynchronous (bool): Whether the server should create the key
+                pair asynchronously. Optional, defaults to False.
 
         Returns:
             string: The uid of the newly created public key.
             string: The uid of the newly created private key.
 
+            If asynchronous is True, the asynchronous correlation value to
+            poll for the uids is returned instead.
+
         Raises:
             ClientConnectionNotOpen: if the client connection is unusable
             KmipOperationFailure: if the operation result is a failure
@@ -373,6 +379,16 @@ class ProxyKmipClient(object):
                 tag=enums.Tags.PRIVATE_KEY_TEMPLATE_ATTRIBUTE
             )
 
+        if asynchronous:
+            return self.proxy.send_asynchronous_request_payload(
+                enums.Operation.CREATE_KEY_PAIR,
+                payloads.CreateKeyPairRequestPayload(
+                    common_template_attribute=template,
+                    private_key_template_attribute=private_template,
+                    public_key_template_attribute=public_template
+                )
+            )
+
         # Create the asymmetric key pair and handle the results
         result = self.proxy.create_key_pair(
             common_template_attribute=template,
@@ -674,6 +690,7 @@ class ProxyKmipClient(object):
                    unique_identifiers,
                    derivation_method,
                    derivation_parameters,
+                   asynchronous=False,
                    **kwargs):
         """
         Derive a new key or secret data from existing managed objects.
@@ -692,6 +709,8 @@ class ProxyKmipClient(object):
             derivation_parameters (dict): A dictionary containing various
                 settings for the key derivation process. See Note below.
                 Required.
+            asynchronous (bool): Whether the server should derive the key
+                asynchronously. Optional, defaults to False.
             **kwargs (various): A placeholder for object attributes that
                 should be set on the newly derived object. Currently
                 supported attributes include:
@@ -699,7 +718,9 @@ class ProxyKmipClient(object):
                     cryptographic_length (int)
 
         Returns:
-            string: The unique ID of the newly derived object.
+            string: The unique ID of the newly derived object. If
+                asynchronous is True, the asynchronous correlation value to
+                poll for the unique ID is returned instead.
 
         Raises:
             ClientConnectionNotOpen: if the client connection is unusable
@@ -785,6 +806,18 @@ class ProxyKmipClient(object):
             attributes=attributes
         )
 
+        if asynchronous:
+            return self.proxy.send_asynchronous_request_payload(
+                enums.Operation.DERIVE_KEY,
+                payloads.DeriveKeyRequestPayload(
+                    object_type=object_type,
+                    unique_identifiers=unique_identifiers,
+                    derivation_method=derivation_method,
+                    derivation_parameters=derivation_parameters,
+                    template_attribute=template_attribute
+                )
+            )
+
         # Derive the new key/data and handle the results
         result = self.proxy.derive_key(
             object_type,
@@ -804,6 +837,71 @@ class ProxyKmipClient(object):
                 result.get('result_message')
             )
 
+    @is_connected
+    def poll(self, asynchronous_correlation_value):
+        """
+        Poll a KMIP appliance for the result of an asynchronous operation.
+
+        Args:
+            asynchronous_correlation_value (bytes): The value returned by the
+                method that requested the operation asynchronously. Required.
+
+        Returns:
+            None: if the operation is still pending.
+            tuple: The uids of the new public and private keys, for a
+                CreateKeyPair operation.
+            string: The uid of the new object, for a DeriveKey operation.
+            struct: The response payload of any other operation.
+
+        Raises:
+            ClientConnectionNotOpen: if the client connection is unusable
+            OperationFailure: if the operation result is a failure
+            TypeError: if the input argument is invalid
+        """
+        if not isinstance(asynchronous_correlation_value, six.binary_type):
+            raise TypeError(
+                "The asynchronous correlation value must be bytes."
+            )
+
+        response_payload = self.proxy.poll(asynchronous_correlation_value)
+
+        if isinstance(
+            response_payload,
+            payloads.CreateKeyPairResponsePayload
+        ):
+            return (
+                response_payload.public_key_unique_identifier,
+                response_payload.private_key_unique_identifier
+            )
+        elif isinstance(response_payload, payloads.DeriveKeyResponsePayload):
+            return response_payload.unique_identifier
+        return response_payload
+
+    @is_connected
+    def cancel(self, asynchronous_correlation_value):
+        """
+        Cancel an asynchronous operation on a KMIP appliance.
+
+        Args:
+            asynchronous_correlation_value (bytes): The value returned by the
+                method that requested the operation asynchronously. Required.
+
+        Returns:
+            CancellationResult: An enumeration reporting whether the
+                operation was canceled or had already finished.
+
+        Raises:
+            ClientConnectionNotOpen: if the client connection is unusable
+            OperationFailure: if the Cancel request fails
+            TypeError: if the input argument is invalid
+        """
+        if not isinstance(asynchronous_correlation_value, six.binary_type):
+            raise TypeError(
+                "The asynchronous correlation value must be bytes."
+            )
+
+        return self.proxy.cancel(asynchronous_correlation_value)
+
     @is_connected
     def locate(self, maximum_items=None, storage_status_mask=None,
                object_group_member=None, attributes=None, offset_items=None):
@@ -35,7 +35,8 @@ app_specific_info_map = sqlalchemy.Table(
         sqlalchemy.ForeignKey(
             "managed_objects.uid",
             ondelete="CASCADE"
-        )
+        ),
+        index=True
     ),
     sqlalchemy.Column(
         "app_specific_info_id",
@@ -43,7 +44,8 @@ app_specific_info_map = sqlalchemy.Table(
         sqlalchemy.ForeignKey(
             "app_specific_info.id",
             ondelete="CASCADE"
-        )
+        ),
+        index=True
     )
 )
 
@@ -57,7 +59,8 @@ object_group_map = sqlalchemy.Table(
         sqlalchemy.ForeignKey(
             "managed_objects.uid",
             ondelete="CASCADE"
-        )
+        ),
+        index=True
     ),
     sqlalchemy.Column(
         "object_group_id",
@@ -65,7 +68,8 @@ object_group_map = sqlalchemy.Table(
         sqlalchemy.ForeignKey(
             "object_groups.id",
             ondelete="CASCADE"
-        )
+        ),
+        index=True
     )
 )
 
@@ -90,7 +94,11 @@ class ManagedObject(sql.Base):
 
     __tablename__ = 'managed_objects'
     unique_identifier = Column('uid', Integer, primary_key=True)
-    _object_type = Column('object_type', sql.EnumType(enums.ObjectType))
+    _object_type = Column(
+        'object_type',
+        sql.EnumType(enums.ObjectType),
+        index=True
+    )
     _class_type = Column('class_type', String(50))
     value = Column('value', VARBINARY(1024))
     name_index = Column(Integer, default=0)
@@ -107,8 +115,8 @@ class ManagedObject(sql.Base):
         default='default'
     )
     sensitive = Column("sensitive", Boolean, default=False)
-    initial_date = Column(Integer, default=0)
-    _owner = Column('owner', String(50), default=None)
+    initial_date = Column(Integer, default=0, index=True)
+    _owner = Column('owner', String(50), default=None, index=True)
 
     app_specific_info = sqlalchemy.orm.relationship(
         "ApplicationSpecificInformation",
@@ -129,9 +137,18 @@ class ManagedObject(sql.Base):
         'polymorphic_identity': 'ManagedObject',
         'polymorphic_on': _class_type
     }
-    __table_args__ = {
-        'sqlite_autoincrement': True
-    }
+    __table_args__ = (
+        # Access decisions depend on these columns only.
+        sqlalchemy.Index(
+            "ix_managed_objects_operation_policy_name_object_type_owner",
+            "operation_policy_name",
+            "object_type",
+            "owner"
+        ),
+        {
+            'sqlite_autoincrement': True
+        }
+    )
 
     @abstractmethod
     def __init__(self):
@@ -226,7 +243,7 @@ class CryptographicObject(ManagedObject):
                                primary_key=True)
     cryptographic_usage_masks = Column('cryptographic_usage_mask',
                                        sql.UsageMaskType)
-    state = Column('state', sql.EnumType(enums.State))
+    state = Column('state', sql.EnumType(enums.State), index=True)
     __mapper_args__ = {
         'polymorphic_identity': 'CryptographicObject'
     }
@@ -287,8 +304,11 @@ class Key(CryptographicObject):
                                ForeignKey('crypto_objects.uid'),
                                primary_key=True)
     cryptographic_algorithm = Column(
-        'cryptographic_algorithm', sql.EnumType(enums.CryptographicAlgorithm))
-    cryptographic_length = Column('cryptographic_length', Integer)
+        'cryptographic_algorithm',
+        sql.EnumType(enums.CryptographicAlgorithm),
+        index=True
+    )
+    cryptographic_length = Column('cryptographic_length', Integer, index=True)
     key_format_type = Column(
         'key_format_type', sql.EnumType(enums.KeyFormatType))
 
@@ -1410,7 +1430,7 @@ class Certificate(CryptographicObject):
                                ForeignKey('crypto_objects.uid'),
                                primary_key=True)
     certificate_type = Column(
-        'certificate_type', sql.EnumType(enums.CertificateType))
+        'certificate_type', sql.EnumType(enums.CertificateType), index=True)
 
     __mapper_args__ = {
         'polymorphic_identity': 'Certificate'
@@ -1815,6 +1835,13 @@ class ApplicationSpecificInformation(sql.Base):
         secondary=app_specific_info_map,
         back_populates="app_specific_info"
     )
+    __table_args__ = (
+        sqlalchemy.Index(
+            "ix_app_specific_info_application_namespace_data",
+            "application_namespace",
+            "application_data"
+        ),
+    )
 
     def __init__(self,
                  application_namespace=None,
@@ -1904,7 +1931,8 @@ class ObjectGroup(sql.Base):
     _object_group = sqlalchemy.Column(
         "object_group",
         sqlalchemy.String,
-        nullable=False
+        nullable=False,
+        index=True
     )
     managed_objects = sqlalchemy.orm.relationship(
         "ManagedObject",
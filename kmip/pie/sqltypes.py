@@ -132,8 +132,13 @@ class ManagedObjectName(Base):
 
     __tablename__ = 'managed_object_names'
     id = Column('id', Integer, primary_key=True)
-    mo_uid = Column('mo_uid', Integer, ForeignKey('managed_objects.uid'))
-    name = Column('name', String)
+    mo_uid = Column(
+        'mo_uid',
+        Integer,
+        ForeignKey('managed_objects.uid'),
+        index=True
+    )
+    name = Column('name', String, index=True)
     index = Column('name_index', Integer)
     name_type = Column('name_type', EnumType(enums.NameType))
 
@@ -0,0 +1,173 @@
+# Copyright (c) 2020 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import struct
+
+from kmip.core import exceptions
+
+
+# Every KMIP message is a TTLV structure: a 3-byte tag, a 1-byte type and a
+# 4-byte length, followed by that many bytes of content.
+HEADER_SIZE = 8
+
+
+class IncompleteMessage(ValueError):
+    """
+    An error generated when a connection closes in the middle of a message.
+    """
+
+    def __init__(self, expected, received):
+        """
+        Create an IncompleteMessage exception.
+
+        Args:
+            expected (int): The number of bytes expected for the message
+                header or body being read. Required.
+            received (int): The number of bytes actually received. Required.
+        """
+        super(IncompleteMessage, self).__init__(
+            "Invalid KMIP message received. Actual message length does not "
+            "match the advertised header length."
+        )
+        self.expected = expected
+        self.received = received
+
+
+def get_message_size(header, max_size=None):
+    """
+    Get the size of the message body advertised by a message header.
+
+    Args:
+        header (bytes): The 8-byte message header. Required.
+        max_size (int): The maximum allowed size of the message body.
+            Optional, defaults to None (unlimited).
+
+    Returns:
+        int: The number of bytes in the message body.
+
+    Raises:
+        MessageTooLarge: Raised if the advertised size exceeds max_size.
+    """
+    size = struct.unpack('!I', bytes(header[4:HEADER_SIZE]))[0]
+    if max_size is not None and size > max_size:
+        raise exceptions.MessageTooLarge(
+            "The message size ({0} bytes) exceeds the maximum allowed "
+            "message size ({1} bytes).".format(size, max_size)
+        )
+    return size
+
+
+def allocate_message(header, max_size=None):
+    """
+    Allocate the buffer of a whole message from its header.
+
+    Args:
+        header (bytes): The 8-byte message header. Required.
+        max_size (int): The maximum allowed size of the message body.
+            Optional, defaults to None (unlimited).
+
+    Returns:
+        memoryview: A writable view of the message buffer, starting with the
+            header. The message body is left to fill in.
+
+    Raises:
+        MessageTooLarge: Raised if the message body is larger than max_size.
+    """
+    size = get_message_size(header, max_size)
+    message = bytearray(HEADER_SIZE + size)
+    message[:HEADER_SIZE] = header
+    return memoryview(message)
+
+
+def receive_into(connection, view):
+    """
+    Fill a buffer with bytes received from a connection.
+
+    Args:
+        connection (socket): The connection to receive from. Required.
+        view (memoryview): The writable buffer to fill. Required.
+
+    Returns:
+        int: The number of bytes received. This is less than the size of the
+            buffer only if the connection was closed.
+    """
+    received = 0
+    while received < len(view):
+        count = connection.recv_into(view[received:])
+        if not count:
+            break
+        received += count
+    return received
+
+
+def receive_message(connection, max_size=None, on_header=None):
+    """
+    Receive a single message from a connection.
+
+    The header is read first, so that oversized messages are rejected before
+    their body is read. The body is then received directly into a buffer
+    preallocated for the whole message, which is returned without copying.
+
+    Args:
+        connection (socket): The connection to receive from. Required.
+        max_size (int): The maximum allowed size of the message body.
+            Optional, defaults to None (unlimited).
+        on_header (callable): A function called with no arguments once the
+            message header is received, for example to time the rest of the
+            message apart from the wait for it. Optional, defaults to None.
+
+    Returns:
+        memoryview: A read-only view of the message, including its header.
+
+    Raises:
+        ConnectionClosed: Raised if the connection was closed before the
+            message started.
+        IncompleteMessage: Raised if the connection was closed in the
+            middle of the message.
+        MessageTooLarge: Raised if the message body is larger than max_size.
+    """
+    header = bytearray(HEADER_SIZE)
+    received = receive_into(connection, memoryview(header))
+    if received == 0:
+        raise exceptions.ConnectionClosed()
+    elif received < HEADER_SIZE:
+        raise IncompleteMessage(HEADER_SIZE, received)
+
+    if on_header is not None:
+        on_header()
+    view = allocate_message(header, max_size)
+    size = len(view) - HEADER_SIZE
+    received = receive_into(connection, view[HEADER_SIZE:])
+    if received < size:
+        raise IncompleteMessage(size, received)
+
+    return readonly(view)
+
+
+def readonly(view):
+    """
+    Get a read-only version of a received message.
+
+    Args:
+        view (memoryview): A view of the message buffer. Required.
+
+    Returns:
+        memoryview: A read-only view of the message, or a copy of it as bytes
+            on Python versions without read-only views.
+    """
+    if hasattr(view, 'toreadonly'):
+        return view.toreadonly()
+    # Read-only views of a bytearray are unavailable before Python 3.8.
+    return bytes(view)
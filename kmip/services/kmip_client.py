@@ -46,6 +46,7 @@ from kmip.core.factories.credentials import CredentialFactory
 from kmip.core import objects
 from kmip.core import primitives
 
+from kmip.core.messages.contents import AsynchronousIndicator
 from kmip.core.messages.contents import Authentication
 from kmip.core.messages.contents import BatchCount
 from kmip.core.messages.contents import Operation
@@ -91,6 +92,13 @@ class KMIPProxy(object):
         # Otherwise, we can hit AttributeErrors when __del__ is called.
         self.socket = None
 
+        # The TLS context is kept across connections so that TLS sessions
+        # can be resumed instead of running a full handshake on reconnect.
+        self._ssl_context = None
+        self._tls_sessions = {}
+        self._tls_handshakes = 0
+        self._tls_resumptions = 0
+
         self._kmip_version = None
         if kmip_version:
             self.kmip_version = kmip_version
@@ -121,6 +129,21 @@ class KMIPProxy(object):
             AuthenticationSuite.BASIC,
             AuthenticationSuite.TLS12]
 
+    @property
+    def statistics(self):
+        """
+        Get the TLS connection counters of the client.
+
+        Returns:
+            dict: The number of completed TLS handshakes ('tls_handshakes')
+                and how many of them resumed a previous TLS session
+                ('tls_resumptions').
+        """
+        return {
+            'tls_handshakes': self._tls_handshakes,
+            'tls_resumptions': self._tls_resumptions
+        }
+
     @property
     def kmip_version(self):
         """
@@ -278,24 +301,51 @@ class KMIPProxy(object):
                 self.socket.close()
                 last_error = sys.exc_info()
             else:
+                if self.do_handshake_on_connect:
+                    self._tls_handshakes += 1
+                    if getattr(self.socket, 'session_reused', False):
+                        self._tls_resumptions += 1
+                    self._save_tls_session()
                 return
 
         self.socket = None
         if last_error:
             six.reraise(*last_error)
 
+    def _create_ssl_context(self):
+        context = ssl.SSLContext(self.ssl_version)
+        context.verify_mode = self.cert_reqs
+        if self.certfile:
+            context.load_cert_chain(self.certfile, self.keyfile)
+        if self.ca_certs:
+            context.load_verify_locations(self.ca_certs)
+        return context
+
     def _create_socket(self, sock):
-        self.socket = ssl.wrap_socket(
+        if self._ssl_context is None:
+            self._ssl_context = self._create_ssl_context()
+
+        kwargs = {}
+        session = self._tls_sessions.get((self.host, self.port))
+        if session is not None:
+            kwargs['session'] = session
+
+        self.socket = self._ssl_context.wrap_socket(
             sock,
-            keyfile=self.keyfile,
-            certfile=self.certfile,
-            cert_reqs=self.cert_reqs,
-            ssl_version=self.ssl_version,
-            ca_certs=self.ca_certs,
             do_handshake_on_connect=self.do_handshake_on_connect,
-            suppress_ragged_eofs=self.suppress_ragged_eofs)
+            suppress_ragged_eofs=self.suppress_ragged_eofs,
+            **kwargs
+        )
         self.socket.settimeout(self.timeout)
 
+    def _save_tls_session(self):
+        # TLS sessions are only exposed by Python 3.6+. With TLS 1.3 the
+        # session ticket arrives after the handshake, so the session is saved
+        # again when the connection is closed.
+        session = getattr(self.socket, 'session', None)
+        if session is not None:
+            self._tls_sessions[(self.host, self.port)] = session
+
     def __del__(self):
         # Close the socket properly, helpful in case close() is not called.
         self.close()
@@ -303,6 +353,11 @@ class KMIPProxy(object):
     def close(self):
         # Shutdown and close the socket.
         if self.socket:
+            try:
+                self._save_tls_session()
+            except Exception:
+                # The connection may not have completed a TLS handshake.
+                pass
             try:
                 self.socket.shutdown(socket.SHUT_RDWR)
                 self.socket.close()
@@ -363,25 +418,7 @@ class KMIPProxy(object):
                     "must be a ModifyAttributeRequestPayload object."
                 )
 
-        batch_item = messages.RequestBatchItem(
-            operation=primitives.Enumeration(
-                enums.Operation,
-                operation,
-                tag=enums.Tags.OPERATION
-            ),
-            request_payload=payload
-        )
-
-        request_message = self._build_request_message(credential, [batch_item])
-        response_message = self._send_and_receive_message(request_message)
-
-        if len(response_message.batch_items) != 1:
-            raise exceptions.InvalidMessage(
-                "The response message does not have the right number of "
-                "requested operation results."
-            )
-
-        batch_item = response_message.batch_items[0]
+        batch_item = self._send_single_request(operation, payload, credential)
 
         if batch_item.result_status.value != enums.ResultStatus.SUCCESS:
             raise exceptions.OperationFailure(
@@ -426,6 +463,170 @@ class KMIPProxy(object):
 
         return batch_item.response_payload
 
+    def send_asynchronous_request_payload(self,
+                                          operation,
+                                          payload,
+                                          credential=None):
+        """
+        Send a KMIP request to be processed asynchronously by the server.
+
+        Args:
+            operation (enum): An Operation enumeration specifying the type
+                of operation to be requested. Required.
+            payload (struct): A RequestPayload structure containing the
+                parameters for a specific KMIP operation. Required.
+            credential (struct): A Credential structure containing
+                authentication information for the server. Optional, defaults
+                to None.
+
+        Returns:
+            bytes: The asynchronous correlation value identifying the
+                operation in subsequent Poll and Cancel requests.
+
+        Raises:
+            TypeError: if the payload is not a RequestPayload instance
+            OperationFailure: if the server rejects the request
+            InvalidMessage: if the server does not report the operation as
+                pending
+        """
+        if not isinstance(payload, payloads.RequestPayload):
+            raise TypeError(
+                "The request payload must be a RequestPayload object."
+            )
+
+        batch_item = self._send_single_request(
+            operation,
+            payload,
+            credential,
+            asynchronous=True
+        )
+
+        status = batch_item.result_status.value
+        if status == enums.ResultStatus.OPERATION_FAILED:
+            raise exceptions.OperationFailure(
+                status,
+                batch_item.result_reason.value,
+                batch_item.result_message.value
+            )
+        if status != enums.ResultStatus.OPERATION_PENDING or \
+                batch_item.async_correlation_value is None:
+            raise exceptions.InvalidMessage(
+                "The server did not process the request asynchronously."
+            )
+
+        return batch_item.async_correlation_value.value
+
+    def poll(self, asynchronous_correlation_value, credential=None):
+        """
+        Poll the server for the result of an asynchronous operation.
+
+        Args:
+            asynchronous_correlation_value (bytes): The asynchronous
+                correlation value returned for the operation. Required.
+            credential (struct): A Credential structure containing
+                authentication information for the server. Optional, defaults
+                to None.
+
+        Returns:
+            struct: The ResponsePayload structure containing the results of
+                the operation, or None if the operation is still pending.
+
+        Raises:
+            OperationFailure: if the Poll request or the polled operation
+                failed
+        """
+        batch_item = self._send_single_request(
+            enums.Operation.POLL,
+            payloads.PollRequestPayload(
+                asynchronous_correlation_value=asynchronous_correlation_value
+            ),
+            credential
+        )
+
+        status = batch_item.result_status.value
+        if status == enums.ResultStatus.OPERATION_PENDING:
+            return None
+        if status != enums.ResultStatus.SUCCESS:
+            raise exceptions.OperationFailure(
+                status,
+                batch_item.result_reason.value,
+                batch_item.result_message.value
+            )
+
+        return batch_item.response_payload
+
+    def cancel(self, asynchronous_correlation_value, credential=None):
+        """
+        Cancel an asynchronous operation.
+
+        Args:
+            asynchronous_correlation_value (bytes): The asynchronous
+                correlation value returned for the operation. Required.
+            credential (struct): A Credential structure containing
+                authentication information for the server. Optional, defaults
+                to None.
+
+        Returns:
+            CancellationResult: An enumeration reporting whether the
+                operation was canceled.
+
+        Raises:
+            OperationFailure: if the Cancel request failed
+            InvalidMessage: if the response does not match the request
+        """
+        batch_item = self._send_single_request(
+            enums.Operation.CANCEL,
+            payloads.CancelRequestPayload(
+                asynchronous_correlation_value=asynchronous_correlation_value
+            ),
+            credential
+        )
+
+        if batch_item.result_status.value != enums.ResultStatus.SUCCESS:
+            raise exceptions.OperationFailure(
+                batch_item.result_status.value,
+                batch_item.result_reason.value,
+                batch_item.result_message.value
+            )
+        if not isinstance(
+            batch_item.response_payload,
+            payloads.CancelResponsePayload
+        ):
+            raise exceptions.InvalidMessage(
+                "Invalid response payload received for the Cancel operation."
+            )
+
+        return batch_item.response_payload.cancellation_result
+
+    def _send_single_request(self,
+                             operation,
+                             payload,
+                             credential,
+                             asynchronous=False):
+        batch_item = messages.RequestBatchItem(
+            operation=primitives.Enumeration(
+                enums.Operation,
+                operation,
+                tag=enums.Tags.OPERATION
+            ),
+            request_payload=payload
+        )
+
+        request_message = self._build_request_message(
+            credential,
+            [batch_item],
+            asynchronous=asynchronous
+        )
+        response_message = self._send_and_receive_message(request_message)
+
+        if len(response_message.batch_items) != 1:
+            raise exceptions.InvalidMessage(
+                "The response message does not have the right number of "
+                "requested operation results."
+            )
+
+        return response_message.batch_items[0]
+
     def create(self, object_type, template_attribute, credential=None):
         return self._create(object_type=object_type,
                             template_attribute=template_attribute,
@@ -1702,7 +1903,8 @@ class KMIPProxy(object):
         else:
             return ProtocolVersion(2, 0)
 
-    def _build_request_message(self, credential, batch_items):
+    def _build_request_message(self, credential, batch_items,
+                               asynchronous=False):
         protocol_version = self._build_protocol_version()
 
         if credential is None:
@@ -1712,10 +1914,17 @@ class KMIPProxy(object):
         if credential is not None:
             authentication = Authentication([credential])
 
+        asynchronous_indicator = None
+        if asynchronous:
+            asynchronous_indicator = AsynchronousIndicator(True)
+
         batch_count = BatchCount(len(batch_items))
-        req_header = messages.RequestHeader(protocol_version=protocol_version,
-                                            authentication=authentication,
-                                            batch_count=batch_count)
+        req_header = messages.RequestHeader(
+            protocol_version=protocol_version,
+            authentication=authentication,
+            asynchronous_indicator=asynchronous_indicator,
+            batch_count=batch_count
+        )
 
         return messages.RequestMessage(request_header=req_header,
                                        batch_items=batch_items)
@@ -13,19 +13,20 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
-from struct import unpack
-
 import binascii
 import logging
 
+from kmip.core import exceptions
 from kmip.core.utils import BytearrayStream
+from kmip.services import framing
 
 
 class KMIPProtocol(object):
     HEADER_SIZE = 8
 
-    def __init__(self, socket, buffer_size=1024):
+    def __init__(self, socket, buffer_size=1024, max_message_size=None):
         self.socket = socket
+        self.max_message_size = max_message_size
         self.logger = logging.getLogger(__name__)
         # DEBUG logging here may expose secrets, so log at INFO by default.
         # However, if consumers know the risks, let them go ahead and override.
@@ -41,35 +42,18 @@ class KMIPProtocol(object):
 
     def read(self):
         try:
-            header = self._recv_all(self.HEADER_SIZE)
-        except RequestLengthMismatch as e:
-            if e.received == 0:
-                raise EOFError("No data read from socket")
-            else:
-                raise
-        msg_size = unpack('!I', header[4:])[0]
-
-        payload = self._recv_all(msg_size)
-        data = BytearrayStream(header + payload)
-        self.logger.debug('KMIPProtocol.read: {0}'.format(
-            binascii.hexlify(bytes(data.buffer))))
-        return data
-
-    def _recv_all(self, total_bytes_to_be_read):
-        bytes_read = 0
-        total_msg = b''
-        while bytes_read < total_bytes_to_be_read:
-            msg = self.socket.recv(total_bytes_to_be_read - bytes_read)
-            if not msg:
-                break
-            bytes_read += len(msg)
-            total_msg += msg
-        if bytes_read != total_bytes_to_be_read:
-            msg = "expected {0}, received {1} bytes".format(
-                total_bytes_to_be_read, bytes_read)
-            raise RequestLengthMismatch(total_bytes_to_be_read, bytes_read)
-
-        return total_msg
+            message = framing.receive_message(
+                self.socket,
+                max_size=self.max_message_size
+            )
+        except exceptions.ConnectionClosed:
+            raise EOFError("No data read from socket")
+        except framing.IncompleteMessage as e:
+            raise RequestLengthMismatch(e.expected, e.received)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug('KMIPProtocol.read: {0}'.format(
+                binascii.hexlify(message)))
+        return BytearrayStream(message)
 
 
 class KMIPProtocolFactory(object):
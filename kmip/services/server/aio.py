@@ -0,0 +1,275 @@
+# Copyright (c) 2020 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import asyncio
+import logging
+
+from kmip.core import exceptions
+from kmip.core import utils
+from kmip.services import framing
+from kmip.services.server import metrics
+
+
+class AsyncioConnectionService(object):
+    """
+    An asyncio front end serving client connections for the KmipServer.
+
+    All client connections are multiplexed on a single event loop, so idle
+    connections cost a coroutine instead of a thread. Requests are framed
+    with non-blocking reads and then processed by KmipSession objects on a
+    WorkerPool, keeping the CPU-bound decoding, engine, and encoding work off
+    the event loop.
+    """
+
+    def __init__(self,
+                 server_socket,
+                 ssl_context,
+                 create_session,
+                 request_pool,
+                 max_connections=None,
+                 backlog=100,
+                 max_request_size=1048576):
+        """
+        Create an AsyncioConnectionService.
+
+        Args:
+            server_socket (socket): A bound TCP socket. The service listens
+                and accepts connections on it. Required.
+            ssl_context (SSLContext): The TLS context used to wrap every
+                client connection. If None, connections are not wrapped.
+                Required.
+            create_session (callable): A function taking the TLS object and
+                the address of a new connection and returning the KmipSession
+                used to process its requests. The session is never started
+                as a thread. Required.
+            request_pool (WorkerPool): The started pool of worker threads
+                processing requests. Required.
+            max_connections (int): The maximum number of open client
+                connections. Additional connections are closed as soon as
+                they are accepted. Optional, defaults to None (unlimited).
+            backlog (int): The maximum number of connections waiting to be
+                accepted. Optional, defaults to 100.
+            max_request_size (int): The maximum size of a request body.
+                Connections sending larger requests are closed before the
+                request body is read. Optional, defaults to 1 MiB.
+        """
+        self._logger = logging.getLogger('kmip.server.aio')
+
+        self._socket = server_socket
+        self._ssl_context = ssl_context
+        self._create_session = create_session
+        self._request_pool = request_pool
+        self._max_connections = max_connections
+        self._backlog = backlog
+        self._max_request_size = max_request_size
+
+        self._loop = asyncio.new_event_loop()
+        self._stopped = None
+        self._stopping = False
+        self._connections = set()
+        self._rejected_connections = 0
+
+    @property
+    def active_connections(self):
+        """
+        The number of open client connections.
+        """
+        return len(self._connections)
+
+    @property
+    def rejected_connections(self):
+        """
+        The number of client connections closed because the maximum number
+        of connections was reached.
+        """
+        return self._rejected_connections
+
+    def serve(self):
+        """
+        Serve client connections until stop is called.
+
+        This method blocks, running the event loop in the calling thread. It
+        can only be called once.
+        """
+        try:
+            asyncio.set_event_loop(self._loop)
+            self._loop.run_until_complete(self._serve())
+        finally:
+            asyncio.set_event_loop(None)
+            self._loop.close()
+
+    def stop(self):
+        """
+        Stop serving client connections.
+
+        This method can be called from any thread or from a signal handler,
+        including before serve is called.
+        """
+        try:
+            self._loop.call_soon_threadsafe(self._request_stop)
+        except RuntimeError:
+            # The event loop has already been closed.
+            pass
+
+    def _request_stop(self):
+        self._stopping = True
+        if self._stopped is not None:
+            self._stopped.set()
+
+    async def _serve(self):
+        self._stopped = asyncio.Event()
+        if self._stopping:
+            return
+
+        server = await asyncio.start_server(
+            self._handle_connection,
+            sock=self._socket,
+            ssl=self._ssl_context,
+            backlog=self._backlog
+        )
+        self._logger.info("Starting asyncio connection service...")
+        try:
+            await self._stopped.wait()
+        finally:
+            server.close()
+            connections = list(self._connections)
+            for connection in connections:
+                connection.cancel()
+            await asyncio.gather(*connections, return_exceptions=True)
+            await server.wait_closed()
+            self._logger.info("Stopping asyncio connection service.")
+
+    async def _handle_connection(self, reader, writer):
+        address = writer.get_extra_info('peername')
+        connection = writer.get_extra_info('ssl_object')
+
+        if self._max_connections is not None:
+            if len(self._connections) >= self._max_connections:
+                self._rejected_connections += 1
+                self._logger.warning(
+                    "Rejecting connection from {0}:{1}: the maximum of {2} "
+                    "connections is reached. Rejected connections: "
+                    "{3}".format(
+                        address[0],
+                        address[1],
+                        self._max_connections,
+                        self._rejected_connections
+                    )
+                )
+                writer.close()
+                return
+
+        try:
+            session = self._create_session(connection, address)
+        except Exception as e:
+            self._logger.warning("Failure occurred while creating session.")
+            self._logger.exception(e)
+            writer.close()
+            return
+
+        task = asyncio.current_task()
+        self._connections.add(task)
+        try:
+            while True:
+                timer = metrics.RequestTimer()
+                try:
+                    request_data = await self._receive_request(reader, timer)
+                except exceptions.MessageTooLarge as e:
+                    # The rest of the message is never read, so the
+                    # connection is closed once the client is told why.
+                    writer.write(bytes(session.reject_oversized_message(e)))
+                    await writer.drain()
+                    break
+                if request_data is None:
+                    break
+                timer.lap('read')
+                try:
+                    item = self._request_pool.submit(
+                        session.process_message,
+                        request_data,
+                        timer
+                    )
+                except exceptions.ServerOverloaded as e:
+                    response_data = session.reject_message(
+                        request_data,
+                        e,
+                        timer
+                    )
+                else:
+                    response_data = await self._wait(item)
+                if len(response_data) > 0:
+                    writer.write(bytes(response_data))
+                    await writer.drain()
+                timer.lap('send')
+                session.record_request(timer)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._logger.info("Failure handling message loop")
+            self._logger.exception(e)
+        finally:
+            self._connections.discard(task)
+            self._logger.info("Stopping session: {0}".format(session.name))
+            writer.close()
+
+    async def _wait(self, item):
+        loop = asyncio.get_event_loop()
+        future = loop.create_future()
+
+        def _set_result(item):
+            if future.cancelled():
+                return
+            try:
+                future.set_result(item.result())
+            except Exception as e:
+                future.set_exception(e)
+
+        def _notify(item):
+            try:
+                loop.call_soon_threadsafe(_set_result, item)
+            except RuntimeError:
+                # The event loop has been closed; nobody is waiting.
+                pass
+
+        item.add_done_callback(_notify)
+        return await future
+
+    async def _receive_request(self, reader, timer):
+        try:
+            header = await reader.readexactly(framing.HEADER_SIZE)
+        except asyncio.IncompleteReadError as e:
+            if e.partial:
+                raise ValueError(
+                    "Invalid KMIP message received. The connection closed "
+                    "within the message header."
+                )
+            return None
+        timer.restart()
+
+        # Read the body straight into the message buffer, as the threaded
+        # sessions do, rather than joining the header and body again.
+        message = framing.allocate_message(header, self._max_request_size)
+        received = framing.HEADER_SIZE
+        while received < len(message):
+            chunk = await reader.read(len(message) - received)
+            if not chunk:
+                raise ValueError(
+                    "Invalid KMIP message received. Actual message length "
+                    "does not match the advertised header length."
+                )
+            message[received:received + len(chunk)] = chunk
+            received += len(chunk)
+
+        return utils.BytearrayStream(framing.readonly(message))
@@ -14,6 +14,7 @@
 # under the License.
 
 from kmip.services.server.auth.api import AuthAPI
+from kmip.services.server.auth.cache import CachingAuthenticator
 from kmip.services.server.auth.slugs import SLUGSConnector
 
 from kmip.services.server.auth.utils import get_certificate_from_connection
@@ -22,13 +23,16 @@ from kmip.services.server.auth.utils import \
 from kmip.services.server.auth.utils import get_common_names_from_certificate
 from kmip.services.server.auth.utils import \
     get_extended_key_usage_from_certificate
+from kmip.services.server.auth.utils import load_certificate
 
 
 __all__ = [
     'AuthAPI',
+    'CachingAuthenticator',
     'SLUGSConnector',
     'get_certificate_from_connection',
     'get_client_identity_from_certificate',
     'get_common_names_from_certificate',
-    'get_extended_key_usage_from_certificate'
+    'get_extended_key_usage_from_certificate',
+    'load_certificate'
 ]
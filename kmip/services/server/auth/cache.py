@@ -0,0 +1,168 @@
+# Copyright (c) 2020 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import threading
+
+from kmip.core import exceptions
+from kmip.services.server import metrics
+from kmip.services.server.auth import api
+from kmip.services.server.auth import utils
+
+
+class _Lookup(object):
+    """
+    An authentication request in progress, shared by all callers waiting
+    for the same client.
+    """
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class CachingAuthenticator(api.AuthAPI):
+    """
+    An authentication API connector caching the results of another one.
+
+    Successful authentications are cached for a configurable time, and
+    denials for a separate, usually shorter, time. Concurrent requests for a
+    client with no cached result are coalesced into a single request to the
+    wrapped connector.
+
+    Results are keyed by the connection certificate alone, so only
+    connectors that authenticate clients from their certificate, like the
+    SLUGSConnector, should be wrapped.
+    """
+
+    def __init__(self, authenticator, ttl=300, negative_ttl=30,
+                 capacity=1024):
+        """
+        Construct a CachingAuthenticator.
+
+        Args:
+            authenticator (AuthAPI): The authentication API connector whose
+                results are cached. Required.
+            ttl (float): The number of seconds a successful authentication is
+                cached. Optional, defaults to 300. Zero disables the caching
+                of successful authentications.
+            negative_ttl (float): The number of seconds a denied
+                authentication is cached. Optional, defaults to 30. Zero
+                disables the caching of denials.
+            capacity (int): The maximum number of cached results. Optional,
+                defaults to 1024.
+        """
+        self._authenticator = authenticator
+        self._ttl = ttl
+        self._negative_ttl = negative_ttl
+
+        self._cache = utils.LRUCache(capacity)
+        self._lock = threading.Lock()
+        self._lookups = {}
+
+    def clear(self):
+        """
+        Remove all cached results.
+        """
+        self._cache.clear()
+
+    def authenticate(self,
+                     connection_certificate=None,
+                     connection_info=None,
+                     request_credentials=None):
+        """
+        Authenticate the client with the cached result or, failing that,
+        with the wrapped connector.
+
+        Args:
+            connection_certificate (cryptography.x509.Certificate): An X.509
+                certificate object obtained from the connection being
+                authenticated. Required.
+            connection_info (tuple): A tuple of information pertaining to the
+                connection being authenticated, including the source IP address
+                and a timestamp (e.g., ('127.0.0.1', 1519759267.467451)).
+                Optional, defaults to None. Passed to the wrapped connector.
+            request_credentials (list): A list of KMIP Credential structures
+                containing credential information to use for authentication.
+                Optional, defaults to None. Passed to the wrapped connector.
+
+        Returns:
+            tuple: The client identity and groups returned by the wrapped
+                connector.
+
+        Raises:
+            PermissionDenied: Raised if the wrapped connector denies the
+                client, now or within the negative cache time.
+        """
+        key = connection_certificate
+
+        entry = self._cache.get(key)
+        if entry is not None:
+            expires, result, error = entry
+            if metrics.clock() < expires:
+                if error is not None:
+                    # Raise a new error each time, so that the tracebacks of
+                    # the requests denied are not chained onto one object.
+                    error_type, error_args = error
+                    raise error_type(*error_args)
+                return result
+
+        with self._lock:
+            lookup = self._lookups.get(key)
+            leader = lookup is None
+            if leader:
+                lookup = _Lookup()
+                self._lookups[key] = lookup
+
+        if not leader:
+            lookup.done.wait()
+        else:
+            try:
+                lookup.result = self._authenticator.authenticate(
+                    connection_certificate,
+                    connection_info,
+                    request_credentials
+                )
+            except Exception as e:
+                lookup.error = e
+            self._store(key, lookup)
+
+            with self._lock:
+                del self._lookups[key]
+            lookup.done.set()
+
+        if lookup.error is not None:
+            raise lookup.error
+        return lookup.result
+
+    def _store(self, key, lookup):
+        if lookup.error is None:
+            ttl = self._ttl
+        elif isinstance(lookup.error, exceptions.PermissionDenied):
+            ttl = self._negative_ttl
+        else:
+            # Errors reaching the authentication service are not cached, so
+            # the next request tries again.
+            return
+
+        error = None
+        if lookup.error is not None:
+            error = (type(lookup.error), lookup.error.args)
+
+        if ttl > 0:
+            self._cache.put(
+                key,
+                (metrics.clock() + ttl, lookup.result, error)
+            )
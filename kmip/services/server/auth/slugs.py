@@ -26,19 +26,26 @@ class SLUGSConnector(api.AuthAPI):
     An authentication API connector for a SLUGS service.
     """
 
-    def __init__(self, url=None):
+    def __init__(self, url=None, timeout=10):
         """
         Construct a SLUGSConnector.
 
         Args:
             url (string): The base URL for the remote SLUGS instance. Optional,
                 defaults to None. Required for authentication.
+            timeout (float): The number of seconds to wait for the SLUGS
+                service to respond. Optional, defaults to 10.
         """
         self._url = None
         self.users_url = None
         self.groups_url = None
 
         self.url = url
+        self.timeout = timeout
+
+        # Requests share a pool of connections to the SLUGS service instead
+        # of opening a new connection for each one.
+        self._session = requests.Session()
 
     @property
     def url(self):
@@ -88,7 +95,10 @@ class SLUGSConnector(api.AuthAPI):
         )
 
         try:
-            response = requests.get(self.users_url.format(user_id))
+            response = self._session.get(
+                self.users_url.format(user_id),
+                timeout=self.timeout
+            )
         except Exception:
             raise exceptions.ConfigurationError(
                 "A connection could not be established using the SLUGS URL."
@@ -98,7 +108,15 @@ class SLUGSConnector(api.AuthAPI):
                 "Unrecognized user ID: {}".format(user_id)
             )
 
-        response = requests.get(self.groups_url.format(user_id))
+        try:
+            response = self._session.get(
+                self.groups_url.format(user_id),
+                timeout=self.timeout
+            )
+        except Exception:
+            raise exceptions.ConfigurationError(
+                "A connection could not be established using the SLUGS URL."
+            )
         if response.status_code == 404:
             raise exceptions.PermissionDenied(
                 "Group information could not be retrieved for user ID: "
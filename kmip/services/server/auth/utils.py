@@ -16,19 +16,101 @@
 from cryptography import x509
 from cryptography.hazmat import backends
 
+import collections
+import hashlib
+import threading
+
 from kmip.core import exceptions
 
 
+class LRUCache(object):
+    """
+    A thread-safe cache holding the most recently used values.
+    """
+
+    def __init__(self, capacity):
+        """
+        Create an LRUCache.
+
+        Args:
+            capacity (int): The maximum number of values held by the cache.
+                The least recently used value is evicted once it is reached.
+                Required.
+        """
+        self._capacity = capacity
+        self._values = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._values)
+
+    def get(self, key):
+        """
+        Look up a value, marking it as the most recently used.
+
+        Args:
+            key (hashable): The key of the value. Required.
+
+        Returns:
+            object: The cached value, or None if the key is not cached.
+        """
+        with self._lock:
+            value = self._values.pop(key, None)
+            if value is not None:
+                self._values[key] = value
+            return value
+
+    def put(self, key, value):
+        """
+        Add a value, evicting the least recently used value if needed.
+
+        Args:
+            key (hashable): The key of the value. Required.
+            value (object): The value to cache. Required.
+        """
+        with self._lock:
+            self._values.pop(key, None)
+            self._values[key] = value
+            while len(self._values) > self._capacity:
+                self._values.popitem(last=False)
+
+    def clear(self):
+        """
+        Remove all values from the cache.
+        """
+        with self._lock:
+            self._values.clear()
+
+
+# Parsed client certificates, keyed by the SHA-256 fingerprint of their DER
+# encoding, so that reconnecting clients do not have their certificate
+# parsed again.
+_certificate_cache = LRUCache(1024)
+
+
+def load_certificate(certificate_bytes):
+    """
+    Load a DER-encoded X.509 certificate, reusing a previously parsed
+    certificate with the same fingerprint.
+    """
+    fingerprint = hashlib.sha256(certificate_bytes).digest()
+    certificate = _certificate_cache.get(fingerprint)
+    if certificate is None:
+        certificate = x509.load_der_x509_certificate(
+            certificate_bytes,
+            backends.default_backend()
+        )
+        _certificate_cache.put(fingerprint, certificate)
+    return certificate
+
+
 def get_certificate_from_connection(connection):
     """
     Extract an X.509 certificate from a socket connection.
     """
     certificate = connection.getpeercert(binary_form=True)
     if certificate:
-        return x509.load_der_x509_certificate(
-            certificate,
-            backends.default_backend()
-        )
+        return load_certificate(certificate)
     return None
 
 
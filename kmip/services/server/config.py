@@ -16,6 +16,7 @@
 import logging
 import os
 import six
+import sys
 
 from six.moves import configparser
 
@@ -38,6 +39,14 @@ class KmipServerConfig(object):
         self.settings['tls_cipher_suites'] = []
         self.settings['logging_level'] = logging.INFO
         self.settings['auth_plugins'] = []
+        self.settings['serving_mode'] = 'threaded'
+        self.settings['worker_pool_size'] = 10
+        self.settings['request_queue_size'] = 100
+        self.settings['max_connections'] = 1000
+        self.settings['listen_backlog'] = 5
+        self.settings['worker_processes'] = 1
+        self.settings['slow_request_threshold'] = None
+        self.settings['metrics_port'] = None
 
         self._expected_settings = [
             'hostname',
@@ -52,7 +61,15 @@ class KmipServerConfig(object):
             'enable_tls_client_auth',
             'tls_cipher_suites',
             'logging_level',
-            'database_path'
+            'database_path',
+            'serving_mode',
+            'worker_pool_size',
+            'request_queue_size',
+            'max_connections',
+            'listen_backlog',
+            'worker_processes',
+            'slow_request_threshold',
+            'metrics_port'
         ]
 
     def set_setting(self, setting, value):
@@ -96,8 +113,24 @@ class KmipServerConfig(object):
             self._set_tls_cipher_suites(value)
         elif setting == 'logging_level':
             self._set_logging_level(value)
-        else:
+        elif setting == 'database_path':
             self._set_database_path(value)
+        elif setting == 'serving_mode':
+            self._set_serving_mode(value)
+        elif setting == 'worker_pool_size':
+            self._set_worker_pool_size(value)
+        elif setting == 'request_queue_size':
+            self._set_request_queue_size(value)
+        elif setting == 'max_connections':
+            self._set_max_connections(value)
+        elif setting == 'listen_backlog':
+            self._set_listen_backlog(value)
+        elif setting == 'worker_processes':
+            self._set_worker_processes(value)
+        elif setting == 'slow_request_threshold':
+            self._set_slow_request_threshold(value)
+        else:
+            self._set_metrics_port(value)
 
     def load_settings(self, path):
         """
@@ -184,6 +217,36 @@ class KmipServerConfig(object):
             )
         if parser.has_option('server', 'database_path'):
             self._set_database_path(parser.get('server', 'database_path'))
+        if parser.has_option('server', 'serving_mode'):
+            self._set_serving_mode(parser.get('server', 'serving_mode'))
+        if parser.has_option('server', 'worker_pool_size'):
+            self._set_worker_pool_size(
+                parser.getint('server', 'worker_pool_size')
+            )
+        if parser.has_option('server', 'request_queue_size'):
+            self._set_request_queue_size(
+                parser.getint('server', 'request_queue_size')
+            )
+        if parser.has_option('server', 'max_connections'):
+            self._set_max_connections(
+                parser.getint('server', 'max_connections')
+            )
+        if parser.has_option('server', 'listen_backlog'):
+            self._set_listen_backlog(
+                parser.getint('server', 'listen_backlog')
+            )
+        if parser.has_option('server', 'worker_processes'):
+            self._set_worker_processes(
+                parser.getint('server', 'worker_processes')
+            )
+        if parser.has_option('server', 'slow_request_threshold'):
+            self._set_slow_request_threshold(
+                parser.getfloat('server', 'slow_request_threshold')
+            )
+        if parser.has_option('server', 'metrics_port'):
+            self._set_metrics_port(
+                parser.getint('server', 'metrics_port')
+            )
 
     def _set_hostname(self, value):
         if isinstance(value, six.string_types):
@@ -350,3 +413,105 @@ class KmipServerConfig(object):
                 "The database path, if specified, must be a valid path to a "
                 "SQLite database file."
             )
+
+    def _set_serving_mode(self, value):
+        if not value:
+            self.settings['serving_mode'] = 'threaded'
+        elif value == 'threaded':
+            self.settings['serving_mode'] = value
+        elif value == 'asyncio':
+            if sys.version_info < (3, 7):
+                raise exceptions.ConfigurationError(
+                    "The asyncio serving mode requires Python 3.7 or newer."
+                )
+            self.settings['serving_mode'] = value
+        else:
+            raise exceptions.ConfigurationError(
+                "The serving mode must be one of the following: threaded, "
+                "asyncio"
+            )
+
+    def _set_worker_pool_size(self, value):
+        if value is None:
+            self.settings['worker_pool_size'] = 10
+        elif isinstance(value, six.integer_types) and \
+                not isinstance(value, bool) and value > 0:
+            self.settings['worker_pool_size'] = value
+        else:
+            raise exceptions.ConfigurationError(
+                "The worker pool size must be a positive integer."
+            )
+
+    def _set_request_queue_size(self, value):
+        if value is None:
+            self.settings['request_queue_size'] = 100
+        elif isinstance(value, six.integer_types) and \
+                not isinstance(value, bool) and value > 0:
+            self.settings['request_queue_size'] = value
+        else:
+            raise exceptions.ConfigurationError(
+                "The request queue size must be a positive integer."
+            )
+
+    def _set_max_connections(self, value):
+        if value is None:
+            self.settings['max_connections'] = 1000
+        elif isinstance(value, six.integer_types) and \
+                not isinstance(value, bool) and value > 0:
+            self.settings['max_connections'] = value
+        else:
+            raise exceptions.ConfigurationError(
+                "The maximum number of connections must be a positive "
+                "integer."
+            )
+
+    def _set_listen_backlog(self, value):
+        if value is None:
+            self.settings['listen_backlog'] = 5
+        elif isinstance(value, six.integer_types) and \
+                not isinstance(value, bool) and value > 0:
+            self.settings['listen_backlog'] = value
+        else:
+            raise exceptions.ConfigurationError(
+                "The listen backlog must be a positive integer."
+            )
+
+    def _set_worker_processes(self, value):
+        if value is None:
+            self.settings['worker_processes'] = 1
+        elif isinstance(value, six.integer_types) and \
+                not isinstance(value, bool) and value > 0:
+            if value > 1 and not hasattr(os, 'fork'):
+                raise exceptions.ConfigurationError(
+                    "Multiple worker processes require a platform that "
+                    "supports fork."
+                )
+            self.settings['worker_processes'] = value
+        else:
+            raise exceptions.ConfigurationError(
+                "The number of worker processes must be a positive integer."
+            )
+
+    def _set_slow_request_threshold(self, value):
+        if value is None:
+            self.settings['slow_request_threshold'] = None
+        elif isinstance(value, (six.integer_types, float)) and \
+                not isinstance(value, bool) and value > 0:
+            self.settings['slow_request_threshold'] = float(value)
+        else:
+            raise exceptions.ConfigurationError(
+                "The slow request threshold, if specified, must be a "
+                "positive number of seconds."
+            )
+
+    def _set_metrics_port(self, value):
+        if value is None:
+            self.settings['metrics_port'] = None
+        elif isinstance(value, six.integer_types) and \
+                not isinstance(value, bool) and 0 < value <= 65535:
+            self.settings['metrics_port'] = value
+        else:
+            raise exceptions.ConfigurationError(
+                "The metrics port, if specified, must be an integer in the "
+                "range 1 - 65535."
+            )
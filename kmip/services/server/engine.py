@@ -13,8 +13,10 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import collections
 import copy
 import logging
+import os
 import six
 import sqlalchemy
 
@@ -36,6 +38,7 @@ from kmip.core.factories import secrets
 
 from kmip.core.messages import contents
 from kmip.core.messages import messages
+from kmip.core.messages import operations
 
 from kmip.core.messages import payloads
 
@@ -43,10 +46,65 @@ from kmip.pie import factory
 from kmip.pie import objects
 from kmip.pie import sqltypes
 
+from kmip.services.server import metrics
 from kmip.services.server import policy
+from kmip.services.server import pool
 from kmip.services.server.crypto import engine
 
 
+AsynchronousOperation = collections.namedtuple(
+    'AsynchronousOperation',
+    ['operation', 'owner', 'item']
+)
+
+
+class RequestContext(object):
+    """
+    The state of a single request being processed by the KmipEngine.
+
+    Each request gets its own context, so that requests processed
+    concurrently by different threads do not share a protocol version,
+    client identity or database session.
+    """
+
+    def __init__(self, protocol_version, client_identity=None, timer=None):
+        """
+        Create a RequestContext.
+
+        Args:
+            protocol_version (ProtocolVersion): The KMIP version of the
+                request. Required.
+            client_identity (list): The identity of the client that sent the
+                request. Optional, defaults to None.
+            timer (RequestTimer): The timer of the request. Optional,
+                defaults to None.
+        """
+        self.protocol_version = protocol_version
+        self.attribute_policy = policy.AttributePolicy(protocol_version)
+        self.client_identity = client_identity or [None, None]
+        self.timer = timer
+        self.is_asynchronous = False
+        self.data_session = None
+        self.id_placeholder = None
+
+        # The access decisions made for the request, keyed by the policy
+        # name, client identity, ownership, object type, and operation.
+        self.policy_decisions = {}
+
+
+def _context_attribute(name):
+    """
+    Build an engine property delegating to the current request context.
+    """
+    def get(self):
+        return getattr(self._get_context(), name)
+
+    def set(self, value):
+        setattr(self._get_context(), name, value)
+
+    return property(get, set)
+
+
 class KmipEngine(object):
     """
     A KMIP request processor that acts as the core of the KmipServer.
@@ -60,7 +118,6 @@ class KmipEngine(object):
         * Numerous operations, objects, and attributes.
         * User authentication
         * Batch processing options: UNDO
-        * Asynchronous operations
         * Operation policies
         * Object archival
         * Key compression
@@ -72,7 +129,23 @@ class KmipEngine(object):
         * Cryptographic usage mask enforcement per object type
     """
 
-    def __init__(self, policies=None, database_path=None):
+    # The state of the request being processed, which is kept in the
+    # request context of the processing thread.
+    _protocol_version = _context_attribute('protocol_version')
+    _attribute_policy = _context_attribute('attribute_policy')
+    _client_identity = _context_attribute('client_identity')
+    _timer = _context_attribute('timer')
+    _data_session = _context_attribute('data_session')
+    _id_placeholder = _context_attribute('id_placeholder')
+    _policy_decisions = _context_attribute('policy_decisions')
+    is_asynchronous = _context_attribute('is_asynchronous')
+
+    def __init__(self,
+                 policies=None,
+                 database_path=None,
+                 metrics_sink=None,
+                 policy_changes=None,
+                 enable_asynchronous_operations=True):
         """
         Create a KmipEngine.
 
@@ -83,8 +156,20 @@ class KmipEngine(object):
             database_path (string): The path to the SQLite database file
                 used to store all server data. Optional, defaults to None.
                 If none, database path defaults to '/tmp/pykmip.database'.
+            metrics_sink (MetricsSink): The sink counting failed operations.
+                Optional, defaults to None.
+            policy_changes (Value): A shared counter of the changes made to
+                the operation policies by the policy monitor. If provided,
+                the policies are copied and only read again once it changes.
+                Optional, defaults to None.
+            enable_asynchronous_operations (bool): A flag enabling requests
+                processed asynchronously. Pending asynchronous operations
+                are only known to the engine they were submitted to, so
+                engines that are not the only one serving the clients must
+                disable them. Optional, defaults to True.
         """
         self._logger = logging.getLogger('kmip.server.engine')
+        self._metrics_sink = metrics_sink
 
         self._cryptography_engine = engine.CryptographyEngine()
 
@@ -97,14 +182,29 @@ class KmipEngine(object):
             echo=False,
             connect_args={'check_same_thread': False}
         )
+        sqlalchemy.event.listen(
+            self._data_store,
+            'connect',
+            self._configure_connection
+        )
         sqltypes.Base.metadata.create_all(self._data_store)
+        self._create_indexes()
         self._data_store_session_factory = sqlalchemy.orm.sessionmaker(
             bind=self._data_store
         )
+        sqlalchemy.event.listen(
+            self._data_store_session_factory,
+            'before_commit',
+            self._before_commit
+        )
+        sqlalchemy.event.listen(
+            self._data_store_session_factory,
+            'after_commit',
+            self._after_commit
+        )
 
-        self._lock = threading.RLock()
-
-        self._id_placeholder = None
+        # The request context of each processing thread.
+        self._contexts = threading.local()
 
         self._protocol_versions = [
             contents.ProtocolVersion(2, 0),
@@ -116,7 +216,6 @@ class KmipEngine(object):
         ]
 
         self.default_protocol_version = self._protocol_versions[3]
-        self._protocol_version = self._protocol_versions[3]
 
         self._object_map = {
             enums.ObjectType.CERTIFICATE: objects.X509Certificate,
@@ -129,37 +228,88 @@ class KmipEngine(object):
             enums.ObjectType.OPAQUE_DATA: objects.OpaqueObject
         }
 
-        self._attribute_policy = policy.AttributePolicy(self._protocol_version)
         self._operation_policies = policies
-        self._client_identity = [None, None]
+        self._policy_changes = policy_changes
+        self._policy_snapshot = None
+
+        # The Locate attributes compared in the database rather than against
+        # each stored object.
+        self._locate_query_attributes = frozenset([
+            "Name",
+            "Object Type",
+            "State",
+            "Cryptographic Algorithm",
+            "Cryptographic Length",
+            "Cryptographic Usage Mask",
+            "Certificate Type",
+            "Object Group",
+            "Application Specific Information",
+            "Operation Policy Name",
+            "Unique Identifier",
+            "Initial Date"
+        ])
+
+        # Encoded response payloads that depend only on the request and the
+        # server configuration, keyed by operation, request parameters, and
+        # KMIP version. The supported versions, operations, and server
+        # information they are built from are fixed when the engine is
+        # created, so entries stay valid for the life of the engine and are
+        # never invalidated.
+        self._response_cache = {}
+        self._response_cache_size = 256
+
+        # Operations requested asynchronously, keyed by their asynchronous
+        # correlation value until their results are polled.
+        self._enable_asynchronous_operations = enable_asynchronous_operations
+        self._asynchronous_lock = threading.Lock()
+        self._asynchronous_pool = None
+        self._asynchronous_operations = collections.OrderedDict()
+        self._max_asynchronous_operations = 1024
+        self._asynchronous_result_lifetime = 600
+
+    def _get_cached_response(self, key, build_response):
+        """
+        Return the encoded response payload cached for the given key.
+
+        On a cache miss, the response payload is built and encoded for the
+        KMIP version of the current request and added to the cache.
+
+        Args:
+            key (tuple): The operation and request parameters that uniquely
+                determine the response payload. Required.
+            build_response (callable): A function that builds the response
+                payload on a cache miss. Required.
+
+        Returns:
+            ResponsePayload: The response payload, with its encoding cached.
+        """
+        kmip_version = contents.protocol_version_to_kmip_version(
+            self._protocol_version
+        )
+        if kmip_version is None:
+            return build_response()
+
+        key = key + (kmip_version, )
+        response_payload = self._response_cache.get(key)
+        if response_payload is None:
+            response_payload = build_response()
+            response_payload.cache_encoding(kmip_version=kmip_version)
+            if len(self._response_cache) < self._response_cache_size:
+                self._response_cache[key] = response_payload
+        return response_payload
 
     def _get_enum_string(self, e):
         return ''.join([x.capitalize() for x in e.name.split('_')])
 
-    def _kmip_version_supported(supported):
-        def decorator(function):
-            def wrapper(self, *args, **kwargs):
-                if float(str(self._protocol_version)) < float(supported):
-                    name = function.__name__
-                    operation = ''.join(
-                        [x.capitalize() for x in name[9:].split('_')]
-                    )
-                    raise exceptions.OperationNotSupported(
-                        "{0} is not supported by KMIP {1}".format(
-                            operation,
-                            self._protocol_version
-                        )
-                    )
-                else:
-                    return function(self, *args, **kwargs)
-            return wrapper
-        return decorator
+    def _get_context(self):
+        context = getattr(self._contexts, 'current', None)
+        if context is None:
+            context = RequestContext(self.default_protocol_version)
+            self._contexts.current = context
+        return context
 
-    def _synchronize(function):
-        def decorator(self, *args, **kwargs):
-            with self._lock:
-                return function(self, *args, **kwargs)
-        return decorator
+    def _set_context(self, context):
+        self._contexts.current = context
 
     def _set_protocol_version(self, protocol_version):
         if protocol_version in self._protocol_versions:
@@ -186,8 +336,7 @@ class KmipEngine(object):
         # form of client identity.
         self._client_identity = connection_credential
 
-    @_synchronize
-    def process_request(self, request, credential=None):
+    def process_request(self, request, credential=None, timer=None):
         """
         Process a KMIP request message.
 
@@ -195,7 +344,10 @@ class KmipEngine(object):
         processes the request header, handles any message errors that may
         result, and then passes the set of request batch items on for
         processing. This routine is thread-safe, allowing multiple client
-        connections to use the same KmipEngine.
+        connections to use the same KmipEngine. The state of the request is
+        kept in a request context of the calling thread, so requests from
+        different threads are processed concurrently, each in its own
+        database session.
 
         Args:
             request (RequestMessage): The request message containing the batch
@@ -203,12 +355,17 @@ class KmipEngine(object):
             credential (string): Identifying information about the client
                 obtained from the client certificate. Optional, defaults to
                 None.
+            timer (RequestTimer): The timer of the request. The time spent
+                processing the operations and committing to the database is
+                recorded in it. Optional, defaults to None.
 
         Returns:
             ResponseMessage: The response containing all of the results from
                 the request batch items.
         """
-        self._client_identity = [None, None]
+        self._set_context(
+            RequestContext(self.default_protocol_version, timer=timer)
+        )
         header = request.request_header
 
         # Process the protocol version
@@ -268,14 +425,14 @@ class KmipEngine(object):
             ))
 
         # Process the asynchronous indicator
-        self.is_asynchronous = False
         if header.asynchronous_indicator is not None:
             self.is_asynchronous = header.asynchronous_indicator.value
-
-        if self.is_asynchronous:
-            raise exceptions.InvalidMessage(
-                "Asynchronous operations are not supported."
-            )
+            if self.is_asynchronous and \
+                    not self._enable_asynchronous_operations:
+                raise exceptions.OperationNotSupported(
+                    "Asynchronous operations are not supported by this "
+                    "server."
+                )
 
         # Process the authentication credentials
         if header.authentication:
@@ -303,11 +460,14 @@ class KmipEngine(object):
         if header.batch_order_option:
             batch_order_option = header.batch_order_option.value
 
-        response_batch = self._process_batch(
-            request.batch_items,
-            batch_error_option,
-            batch_order_option
-        )
+        try:
+            response_batch = self._process_batch(
+                request.batch_items,
+                batch_error_option,
+                batch_order_option
+            )
+        finally:
+            self._close_data_session()
         response = self._build_response(
             header.protocol_version,
             response_batch
@@ -358,16 +518,6 @@ class KmipEngine(object):
         self._data_session = self._data_store_session_factory()
 
         for batch_item in request_batch:
-            error_occurred = False
-
-            response_payload = None
-            result_status = None
-            result_reason = None
-            result_message = None
-
-            operation = batch_item.operation
-            request_payload = batch_item.request_payload
-
             # Process batch item ID.
             if len(request_batch) > 1:
                 if not batch_item.unique_batch_item_id:
@@ -381,57 +531,270 @@ class KmipEngine(object):
             # 2. If the indicator is True, raise an error.
             # 3. If the indicator is False, ignore the extension.
 
-            # Process batch payload.
-            try:
-                response_payload = self._process_operation(
-                    operation.value,
-                    request_payload
-                )
-
-                result_status = enums.ResultStatus.SUCCESS
-            except exceptions.KmipError as e:
-                error_occurred = True
-                result_status = e.status
-                result_reason = e.reason
-                result_message = str(e)
-            except Exception as e:
-                self._logger.warning(
-                    "Error occurred while processing operation."
-                )
-                self._logger.exception(e)
-
-                error_occurred = True
-                result_status = enums.ResultStatus.OPERATION_FAILED
-                result_reason = enums.ResultReason.GENERAL_FAILURE
-                result_message = (
-                    "Operation failed. See the server logs for more "
-                    "information."
-                )
-
-            # Compose operation result.
-            result_status = contents.ResultStatus(result_status)
-            if result_reason:
-                result_reason = contents.ResultReason(result_reason)
-            if result_message:
-                result_message = contents.ResultMessage(result_message)
-
-            batch_item = messages.ResponseBatchItem(
-                operation=batch_item.operation,
-                unique_batch_item_id=batch_item.unique_batch_item_id,
-                result_status=result_status,
-                result_reason=result_reason,
-                result_message=result_message,
-                response_payload=response_payload
-            )
-            response_batch.append(batch_item)
+            operation = batch_item.operation.value
+            if self.is_asynchronous and operation not in (
+                enums.Operation.POLL,
+                enums.Operation.CANCEL
+            ):
+                response_item, error_occurred = self._process_batch_item(
+                    batch_item,
+                    self._submit_asynchronous_operation
+                )
+            else:
+                response_item, error_occurred = self._process_batch_item(
+                    batch_item,
+                    self._process_operation
+                )
+            response_batch.append(response_item)
 
             # Handle batch error if necessary.
             if error_occurred:
+                if self._metrics_sink is not None:
+                    self._count_error(operation, response_item.result_reason)
                 if batch_handling == enums.BatchErrorContinuationOption.STOP:
                     break
 
         return response_batch
 
+    def _close_data_session(self):
+        # Release the database connection of the request, rolling back
+        # anything its operations did not commit.
+        if self._data_session is not None:
+            self._data_session.close()
+            self._data_session = None
+
+    def _count_error(self, operation, result_reason):
+        if result_reason is not None:
+            result_reason = result_reason.value
+        self._metrics_sink.count_error(
+            metrics.get_operation_label(operation),
+            metrics.get_reason_label(result_reason)
+        )
+
+    def _process_batch_item(self, batch_item, process):
+        error_occurred = False
+
+        response_payload = None
+        result_status = None
+        result_reason = None
+        result_message = None
+        async_correlation_value = None
+
+        # Process batch payload. Payloads of lazily read requests are
+        # decoded here, so decoding errors only fail this batch item.
+        try:
+            request_payload = batch_item.request_payload
+            response_payload = process(
+                batch_item.operation.value,
+                request_payload
+            )
+
+            result_status = enums.ResultStatus.SUCCESS
+        except exceptions.KmipError as e:
+            error_occurred = True
+            result_status = e.status
+            result_reason = e.reason
+            result_message = str(e)
+        except Exception as e:
+            self._logger.warning(
+                "Error occurred while processing operation."
+            )
+            self._logger.exception(e)
+
+            error_occurred = True
+            result_status = enums.ResultStatus.OPERATION_FAILED
+            result_reason = enums.ResultReason.GENERAL_FAILURE
+            result_message = (
+                "Operation failed. See the server logs for more "
+                "information."
+            )
+
+        if isinstance(response_payload, messages.ResponseBatchItem):
+            # Poll responds with the outcome of another batch item.
+            response_payload.unique_batch_item_id = (
+                batch_item.unique_batch_item_id
+            )
+            return response_payload, False
+        elif isinstance(
+            response_payload,
+            contents.AsynchronousCorrelationValue
+        ):
+            result_status = enums.ResultStatus.OPERATION_PENDING
+            async_correlation_value = response_payload
+            response_payload = None
+
+        # Compose operation result.
+        result_status = contents.ResultStatus(result_status)
+        if result_reason:
+            result_reason = contents.ResultReason(result_reason)
+        if result_message:
+            result_message = contents.ResultMessage(result_message)
+
+        response_item = messages.ResponseBatchItem(
+            operation=batch_item.operation,
+            unique_batch_item_id=batch_item.unique_batch_item_id,
+            result_status=result_status,
+            result_reason=result_reason,
+            result_message=result_message,
+            async_correlation_value=async_correlation_value,
+            response_payload=response_payload
+        )
+        return response_item, error_occurred
+
+    def _submit_asynchronous_operation(self, operation, payload):
+        """
+        Queue an operation for processing by the asynchronous worker.
+
+        Args:
+            operation (Operation): The operation to process. Required.
+            payload (RequestPayload): The request payload of the operation.
+                Required.
+
+        Returns:
+            AsynchronousCorrelationValue: The value identifying the queued
+                operation in Poll and Cancel requests.
+
+        Raises:
+            ServerOverloaded: Raised if too many asynchronous operations are
+                queued or waiting to be polled.
+        """
+        self._logger.info(
+            "Queueing asynchronous operation: {0}".format(
+                operations.get_operation_name(operation)
+            )
+        )
+
+        with self._asynchronous_lock:
+            # Forget results nobody polled in time, then the oldest results
+            # nobody polled yet, before refusing new work.
+            now = metrics.clock()
+            for key in list(self._asynchronous_operations.keys()):
+                item = self._asynchronous_operations[key].item
+                if item.done() and now - item.finish_time > \
+                        self._asynchronous_result_lifetime:
+                    del self._asynchronous_operations[key]
+            for key in list(self._asynchronous_operations.keys()):
+                if len(self._asynchronous_operations) < \
+                        self._max_asynchronous_operations:
+                    break
+                if self._asynchronous_operations[key].item.done():
+                    del self._asynchronous_operations[key]
+            if len(self._asynchronous_operations) >= \
+                    self._max_asynchronous_operations:
+                raise exceptions.ServerOverloaded(
+                    "Too many asynchronous operations are pending. Poll or "
+                    "cancel pending operations and retry the request later."
+                )
+
+            if self._asynchronous_pool is None:
+                # A single worker runs the operations in the order they were
+                # submitted.
+                self._asynchronous_pool = pool.WorkerPool(1, 64)
+                self._asynchronous_pool.start()
+
+            item = self._asynchronous_pool.submit(
+                self._run_asynchronous_operation,
+                operation,
+                payload,
+                self._protocol_version,
+                self._client_identity
+            )
+
+            correlation_value = os.urandom(16)
+            self._asynchronous_operations[correlation_value] = \
+                AsynchronousOperation(operation, self._get_requester(), item)
+        return contents.AsynchronousCorrelationValue(correlation_value)
+
+    def _run_asynchronous_operation(self,
+                                    operation,
+                                    payload,
+                                    protocol_version,
+                                    client_identity):
+        self._set_context(
+            RequestContext(protocol_version, client_identity=client_identity)
+        )
+        self._data_session = self._data_store_session_factory()
+
+        batch_item = messages.RequestBatchItem(
+            operation=contents.Operation(operation),
+            request_payload=payload
+        )
+        try:
+            response_item, _ = self._process_batch_item(
+                batch_item,
+                self._process_operation
+            )
+        finally:
+            self._close_data_session()
+        return response_item
+
+    def _create_indexes(self):
+        # Tables created by older server versions lack the indexes added to
+        # the data model since, which create_all does not add to existing
+        # tables. Create the missing ones, leaving the data in place.
+        # Indexes the data model does not declare are never dropped, since
+        # they may have been created by the server operators.
+        inspector = sqlalchemy.inspect(self._data_store)
+        for table in sqltypes.Base.metadata.sorted_tables:
+            existing_indexes = set(
+                [x.get('name') for x in inspector.get_indexes(table.name)]
+            )
+            for index in table.indexes:
+                if index.name not in existing_indexes:
+                    self._logger.info(
+                        "Creating database index: {0}".format(index.name)
+                    )
+                    index.create(self._data_store)
+
+    def _configure_connection(self, connection, record):
+        # Requests are processed concurrently, each in its own database
+        # session. Write-ahead logging lets them read while another one
+        # commits, instead of failing to commit while another one reads.
+        cursor = connection.cursor()
+        cursor.execute('PRAGMA journal_mode=WAL')
+        cursor.close()
+
+    def _before_commit(self, session):
+        if self._timer is not None:
+            self._timer.lap('handler')
+
+    def _after_commit(self, session):
+        if self._timer is not None:
+            self._timer.lap('commit')
+
+    def _get_requester(self):
+        if self._client_identity:
+            return self._client_identity[0]
+        return None
+
+    def _get_asynchronous_operation(self, correlation_value):
+        record = self._asynchronous_operations.get(correlation_value)
+        if record is None or record.owner != self._get_requester():
+            raise exceptions.ItemNotFound(
+                "Could not locate an asynchronous operation with the given "
+                "correlation value."
+            )
+        return record
+
+    def dispose(self):
+        """
+        Close the pooled database connections of the engine.
+
+        Database connections must not be shared across processes, so an
+        engine must be disposed before forking processes that could inherit
+        its connections. Connections are opened again as needed.
+        """
+        self._data_store.dispose()
+
+    def stop(self):
+        """
+        Stop the asynchronous worker once the operation being processed is
+        done. Queued operations are canceled.
+        """
+        if self._asynchronous_pool is not None:
+            self._asynchronous_pool.stop()
+            self._asynchronous_pool = None
+
     def _get_object_type(self, unique_identifier):
         try:
             object_type = self._data_session.query(
@@ -1063,26 +1426,66 @@ class KmipEngine(object):
         if session_groups is None:
             session_groups = [None]
 
+        # Decisions only depend on whether the client owns the object, so
+        # they are reused for all the objects of a request.
+        decision = (
+            policy_name,
+            session_user,
+            tuple(session_groups),
+            object_owner == session_user,
+            object_type,
+            operation
+        )
+        allowed = self._policy_decisions.get(decision)
+        if allowed is not None:
+            return allowed
+
+        allowed = False
         for session_group in session_groups:
-            allowed = self.is_allowed(
+            if self.is_allowed(
                 policy_name,
                 session_user,
                 session_group,
                 object_owner,
                 object_type,
                 operation
-            )
-            if allowed:
-                return True
+            ):
+                allowed = True
+                break
+
+        self._policy_decisions[decision] = allowed
+        return allowed
+
+    def _get_operation_policies(self):
+        """
+        Get the operation policies as of their last change.
+
+        The policies shared with the policy monitor are kept by another
+        process, so each look up is a round trip to it. They are copied
+        instead, and copied again only after the monitor changes them.
 
-        return False
+        Returns:
+            dict: The operation policies, keyed by policy name.
+        """
+        if self._policy_changes is None:
+            return self._operation_policies
+
+        policy_changes = self._policy_changes.value
+        snapshot = self._policy_snapshot
+        if snapshot is None or snapshot[0] != policy_changes:
+            snapshot = (
+                policy_changes,
+                dict(self._operation_policies.items())
+            )
+            self._policy_snapshot = snapshot
+        return snapshot[1]
 
     def get_relevant_policy_section(self, policy_name, group=None):
         """
         Look up the policy corresponding to the provided policy name and
         group (optional). Log any issues found during the look up.
         """
-        policy_bundle = self._operation_policies.get(policy_name)
+        policy_bundle = self._get_operation_policies().get(policy_name)
 
         if not policy_bundle:
             self._logger.warning(
@@ -1256,78 +1659,326 @@ class KmipEngine(object):
 
     def _list_objects_with_access_controls(
             self,
-            operation
+            operation,
+            query=None
     ):
-        managed_objects = None
-        managed_objects_allowed = list()
+        if query is None:
+            query = self._data_session.query(objects.ManagedObject)
+        query, _ = self._restrict_query_with_access_controls(
+            operation,
+            query
+        )
+        return query.all()
+
+    def _restrict_query_with_access_controls(self, operation, query):
+        """
+        Restrict a query to the objects the client is allowed to access.
+
+        The access decision for an object only depends on its operation
+        policy name, its object type, and whether the client owns it. The
+        matching objects are counted by policy name, object type, and owner
+        in the database, the operation policies are evaluated once per
+        policy name, object type, and ownership, and the query is filtered
+        down to the allowed objects, without loading any object.
+
+        Args:
+            operation (Operation): The operation the objects are accessed
+                for. Required.
+            query (Query): The query for the candidate managed objects.
+                Required.
 
-        managed_objects = self._data_session.query(objects.ManagedObject).all()
+        Returns:
+            tuple: The query (Query) restricted to the allowed objects and
+                the number (int) of allowed objects.
+        """
+        policy_name = objects.ManagedObject.operation_policy_name
+        object_type = objects.ManagedObject._object_type
+        owner = objects.ManagedObject._owner
+        session_user = self._client_identity[0]
 
-        for managed_object in managed_objects:
+        groups = query.with_entities(
+            policy_name,
+            object_type,
+            owner,
+            sqlalchemy.func.count(objects.ManagedObject.unique_identifier)
+        ).group_by(
+            policy_name,
+            object_type,
+            owner
+        ).all()
+
+        # The owners allowed for each policy name and object type: True for
+        # all owners, or the client only.
+        allowed_owners = {}
+        denied = False
+        count = 0
+        for group_policy, group_type, group_owner, size in groups:
             is_allowed = self._is_allowed_by_operation_policy(
-                managed_object.operation_policy_name,
+                group_policy,
                 self._client_identity,
-                managed_object._owner,
-                managed_object.object_type,
+                group_owner,
+                group_type,
                 operation
             )
             if is_allowed is True:
-                managed_objects_allowed.append(managed_object)
+                key = (group_policy, group_type)
+                allowed_owners.setdefault(key, set()).add(
+                    group_owner == session_user
+                )
+                count += size
+            else:
+                denied = True
+
+        if denied:
+            # Unset owners are neither equal nor unequal to a user in SQL.
+            if session_user is None:
+                not_owned = owner.isnot(None)
+            else:
+                not_owned = sqlalchemy.or_(
+                    owner.is_(None),
+                    owner != session_user
+                )
+
+            allowed_groups = []
+            for (group_policy, group_type), owned in allowed_owners.items():
+                group_filter = sqlalchemy.and_(
+                    policy_name == group_policy,
+                    object_type == group_type
+                )
+                if owned == set([True]):
+                    group_filter = sqlalchemy.and_(
+                        group_filter,
+                        owner == session_user
+                    )
+                elif owned == set([False]):
+                    group_filter = sqlalchemy.and_(
+                        group_filter,
+                        not_owned
+                    )
+                allowed_groups.append(group_filter)
+            query = query.filter(
+                sqlalchemy.or_(sqlalchemy.false(), *allowed_groups)
+            )
+        return query, count
+
+    def _build_locate_query(self, locate_attributes):
+        """
+        Build the database query for the objects matching Locate attributes.
+
+        Attributes that can be compared in the database are translated into
+        query filters, so that objects not matching them are never loaded.
+        The other attributes are returned, to be compared against the objects
+        found.
+
+        Args:
+            locate_attributes (list): The Attribute structures provided with
+                the Locate request. Required.
 
-        return managed_objects_allowed
+        Returns:
+            tuple: The query (Query) for the objects matching the translated
+                attributes and the list of the attributes left to compare.
+
+        Raises:
+            InvalidField: Raised if more than two Initial Date attributes are
+                provided.
+        """
+        managed_objects = objects.ManagedObject.__table__
+        crypto_objects = objects.CryptographicObject.__table__
+        keys = objects.Key.__table__
+        certificates = objects.Certificate.__table__
+
+        filters = []
+        tables = []
+        remaining_attributes = []
+        initial_date = {}
+
+        for locate_attribute in locate_attributes:
+            name = locate_attribute.attribute_name.value
+            value = locate_attribute.attribute_value
+
+            if name not in self._locate_query_attributes:
+                remaining_attributes.append(locate_attribute)
+                continue
+
+            # Objects the attribute is not applicable to do not match.
+            object_types = [
+                x for x in self._object_map.keys()
+                if self._attribute_policy.
+                is_attribute_applicable_to_object_type(name, x)
+            ]
+            if len(object_types) < len(self._object_map):
+                filters.append(
+                    managed_objects.c.object_type.in_(object_types)
+                )
+
+            # Objects without a value for single-valued attributes match, like
+            # they do when comparing the objects themselves.
+            column = None
+            # Multi-valued attributes are matched with subqueries selecting
+            # the objects with the value, driven by the index on the value.
+            if name == "Name":
+                if value.name_type == attributes.Name.NameType(
+                    enums.NameType.UNINTERPRETED_TEXT_STRING
+                ):
+                    names = sqltypes.ManagedObjectName.__table__
+                    filters.append(
+                        managed_objects.c.uid.in_(
+                            sqlalchemy.select([names.c.mo_uid]).where(
+                                names.c.name == value.name_value.value
+                            )
+                        )
+                    )
+                else:
+                    filters.append(sqlalchemy.false())
+            elif name == "Object Group":
+                object_groups = objects.ObjectGroup.__table__
+                group_map = objects.object_group_map
+                filters.append(
+                    managed_objects.c.uid.in_(
+                        sqlalchemy.select([group_map.c.managed_object_id])
+                        .where(
+                            group_map.c.object_group_id == object_groups.c.id
+                        ).where(
+                            object_groups.c.object_group == value.value
+                        )
+                    )
+                )
+            elif name == "Application Specific Information":
+                info = objects.ApplicationSpecificInformation.__table__
+                info_map = objects.app_specific_info_map
+                filters.append(
+                    managed_objects.c.uid.in_(
+                        sqlalchemy.select([info_map.c.managed_object_id])
+                        .where(
+                            info_map.c.app_specific_info_id == info.c.id
+                        ).where(
+                            info.c.application_namespace ==
+                            value.application_namespace
+                        ).where(
+                            info.c.application_data == value.application_data
+                        )
+                    )
+                )
+            elif name == "Unique Identifier":
+                filters.append(
+                    self._get_unique_identifier_filter(value.value)
+                )
+            elif name == "Cryptographic Usage Mask":
+                mask = 0
+                for mask_value in enums.get_enumerations_from_bit_mask(
+                    enums.CryptographicUsageMask,
+                    value.value
+                ):
+                    mask |= mask_value.value
+                if mask:
+                    column = sqlalchemy.type_coerce(
+                        crypto_objects.c.cryptographic_usage_mask,
+                        sqlalchemy.Integer
+                    )
+                    filters.append(column.op('&')(mask) == mask)
+                    tables.append(crypto_objects)
+            elif name == "Initial Date":
+                self._track_date_attributes(
+                    enums.AttributeType.INITIAL_DATE,
+                    initial_date,
+                    value.value
+                )
+            else:
+                if name == "Object Type":
+                    column = managed_objects.c.object_type
+                elif name == "Operation Policy Name":
+                    column = managed_objects.c.operation_policy_name
+                elif name == "State":
+                    column = crypto_objects.c.state
+                elif name == "Cryptographic Algorithm":
+                    column = keys.c.cryptographic_algorithm
+                elif name == "Cryptographic Length":
+                    column = keys.c.cryptographic_length
+                else:
+                    column = certificates.c.certificate_type
+                filters.append(
+                    sqlalchemy.or_(
+                        column == value.value,
+                        self._get_unset_filter(column)
+                    )
+                )
+                if column.table is not managed_objects:
+                    tables.append(column.table)
+
+        if initial_date:
+            column = managed_objects.c.initial_date
+            if initial_date.get("end") is None:
+                date_filter = column == initial_date.get("start")
+            else:
+                date_filter = column.between(
+                    initial_date.get("start"),
+                    initial_date.get("end")
+                )
+            filters.append(
+                sqlalchemy.or_(date_filter, column.is_(None), column == 0)
+            )
+
+        query = self._data_session.query(objects.ManagedObject)
+        for table in (crypto_objects, keys, certificates):
+            if table in tables:
+                query = query.outerjoin(
+                    table,
+                    table.c.uid == managed_objects.c.uid
+                )
+        if filters:
+            query = query.filter(*filters)
+
+        return query, remaining_attributes
+
+    def _get_unset_filter(self, column):
+        # Enumerations without a value are stored as -1 rather than NULL.
+        unset_filter = column.is_(None)
+        if isinstance(column.type, sqltypes.EnumType):
+            unset_filter = sqlalchemy.or_(
+                unset_filter,
+                sqlalchemy.type_coerce(column, sqlalchemy.Integer) == -1
+            )
+        return unset_filter
+
+    def _get_unique_identifier_filter(self, unique_identifier):
+        # Unique identifiers are stored as integers, and only their canonical
+        # string form identifies an object.
+        try:
+            uid = int(unique_identifier)
+        except ValueError:
+            return sqlalchemy.false()
+        if str(uid) != unique_identifier:
+            return sqlalchemy.false()
+        return objects.ManagedObject.unique_identifier == uid
 
     def _process_operation(self, operation, payload):
-        # TODO (peterhamilton) Alphabetize this.
-        if operation == enums.Operation.CREATE:
-            return self._process_create(payload)
-        elif operation == enums.Operation.CREATE_KEY_PAIR:
-            return self._process_create_key_pair(payload)
-        elif operation == enums.Operation.DELETE_ATTRIBUTE:
-            return self._process_delete_attribute(payload)
-        elif operation == enums.Operation.REGISTER:
-            return self._process_register(payload)
-        elif operation == enums.Operation.DERIVE_KEY:
-            return self._process_derive_key(payload)
-        elif operation == enums.Operation.LOCATE:
-            return self._process_locate(payload)
-        elif operation == enums.Operation.GET:
-            return self._process_get(payload)
-        elif operation == enums.Operation.GET_ATTRIBUTES:
-            return self._process_get_attributes(payload)
-        elif operation == enums.Operation.GET_ATTRIBUTE_LIST:
-            return self._process_get_attribute_list(payload)
-        elif operation == enums.Operation.ACTIVATE:
-            return self._process_activate(payload)
-        elif operation == enums.Operation.REVOKE:
-            return self._process_revoke(payload)
-        elif operation == enums.Operation.DESTROY:
-            return self._process_destroy(payload)
-        elif operation == enums.Operation.QUERY:
-            return self._process_query(payload)
-        elif operation == enums.Operation.DISCOVER_VERSIONS:
-            return self._process_discover_versions(payload)
-        elif operation == enums.Operation.ENCRYPT:
-            return self._process_encrypt(payload)
-        elif operation == enums.Operation.DECRYPT:
-            return self._process_decrypt(payload)
-        elif operation == enums.Operation.SIGNATURE_VERIFY:
-            return self._process_signature_verify(payload)
-        elif operation == enums.Operation.SET_ATTRIBUTE:
-            return self._process_set_attribute(payload)
-        elif operation == enums.Operation.MODIFY_ATTRIBUTE:
-            return self._process_modify_attribute(payload)
-        elif operation == enums.Operation.MAC:
-            return self._process_mac(payload)
-        elif operation == enums.Operation.SIGN:
-            return self._process_sign(payload)
-        else:
+        entry = operations.get_operation(operation)
+        if entry is None or entry.handler is None:
+            if isinstance(operation, enums.Operation):
+                name = operation.name.title()
+            else:
+                name = operations.get_operation_name(operation)
             raise exceptions.OperationNotSupported(
-                "{0} operation is not supported by the server.".format(
-                    operation.name.title()
+                "{0} operation is not supported by the server.".format(name)
+            )
+
+        # The registry is the only record of the version each operation was
+        # introduced in, for built-in and registered handlers alike.
+        kmip_version = contents.protocol_version_to_kmip_version(
+            self._protocol_version
+        )
+        if kmip_version < entry.min_version:
+            raise exceptions.OperationNotSupported(
+                "{0} is not supported by KMIP {1}".format(
+                    operations.get_operation_name(entry.operation),
+                    self._protocol_version
                 )
             )
 
-    @_kmip_version_supported('1.0')
+        if isinstance(entry.handler, six.string_types):
+            return getattr(self, entry.handler)(payload)
+        return entry.handler(self, payload)
+
     def _process_create(self, payload):
         self._logger.info("Processing operation: Create")
 
@@ -1419,7 +2070,6 @@ class KmipEngine(object):
 
         return response_payload
 
-    @_kmip_version_supported('1.0')
     def _process_create_key_pair(self, payload):
         self._logger.info("Processing operation: CreateKeyPair")
 
@@ -1591,7 +2241,6 @@ class KmipEngine(object):
         self._id_placeholder = str(private_key.unique_identifier)
         return response_payload
 
-    @_kmip_version_supported('1.0')
     def _process_delete_attribute(self, payload):
         self._logger.info("Processing operation: DeleteAttribute")
 
@@ -1676,7 +2325,6 @@ class KmipEngine(object):
 
         return response_payload
 
-    @_kmip_version_supported('2.0')
     def _process_set_attribute(self, payload):
         self._logger.info("Processing operation: SetAttribute")
 
@@ -1724,7 +2372,6 @@ class KmipEngine(object):
             unique_identifier=unique_identifier
         )
 
-    @_kmip_version_supported('1.0')
     def _process_modify_attribute(self, payload):
         self._logger.info("Processing operation: ModifyAttribute")
 
@@ -1941,7 +2588,6 @@ class KmipEngine(object):
                 attribute=modified_attribute
             )
 
-    @_kmip_version_supported('1.0')
     def _process_register(self, payload):
         self._logger.info("Processing operation: Register")
 
@@ -2007,7 +2653,6 @@ class KmipEngine(object):
 
         return response_payload
 
-    @_kmip_version_supported('1.0')
     def _process_derive_key(self, payload):
         self._logger.info("Processing operation: DeriveKey")
 
@@ -2191,21 +2836,28 @@ class KmipEngine(object):
         )
         return response_payload
 
-    @_kmip_version_supported('1.0')
     def _process_locate(self, payload):
         # TODO: Need to complete the filtering logic based on all given
         # objects in payload.
         self._logger.info("Processing operation: Locate")
 
-        managed_objects = self._list_objects_with_access_controls(
-                                enums.Operation.LOCATE)
+        query, locate_attributes = self._build_locate_query(
+            payload.attributes
+        )
 
-        # TODO (ph) Do a single pass on the provided attributes and preprocess
-        # them as needed (e.g., tracking multiple 'Initial Date' values, etc).
-        # Locate needs to be able to error out if multiple singleton attributes
-        # like 'State' are provided in the same request.
-        if payload.attributes:
+        # Sort the matching results by their creation date.
+        query = query.order_by(
+            objects.ManagedObject.initial_date.desc(),
+            objects.ManagedObject.unique_identifier
+        )
 
+        # TODO (ph) Locate needs to be able to error out if multiple singleton
+        # attributes like 'State' are provided in the same request.
+        if locate_attributes:
+            managed_objects = self._list_objects_with_access_controls(
+                enums.Operation.LOCATE,
+                query
+            )
             managed_objects_filtered = []
 
             # Filter the objects based on given attributes.
@@ -2219,7 +2871,7 @@ class KmipEngine(object):
                 add_object = True
                 initial_date = {}
 
-                for payload_attribute in payload.attributes:
+                for payload_attribute in locate_attributes:
                     name = payload_attribute.attribute_name.value
                     value = payload_attribute.attribute_value
 
@@ -2434,41 +3086,45 @@ class KmipEngine(object):
                     managed_objects_filtered.append(managed_object)
 
             managed_objects = managed_objects_filtered
+            located_items = len(managed_objects)
 
-        # Sort the matching results by their creation date.
-        managed_objects = sorted(
-            managed_objects,
-            key=lambda x: x.initial_date,
-            reverse=True
-        )
-
-        # Skip the requested offset items and keep the requested maximum items
-        if payload.offset_items is not None:
+            # Skip the requested offset items and keep the requested maximum
+            # items
+            start = payload.offset_items or 0
             if payload.maximum_items is not None:
                 managed_objects = managed_objects[
-                    payload.offset_items:(
-                        payload.offset_items + payload.maximum_items
-                    )
+                    start:(start + payload.maximum_items)
                 ]
             else:
-                managed_objects = managed_objects[payload.offset_items:]
+                managed_objects = managed_objects[start:]
         else:
+            # All attributes are compared in the database, so the requested
+            # page is selected there and only its objects are loaded.
+            query, located_items = self._restrict_query_with_access_controls(
+                enums.Operation.LOCATE,
+                query
+            )
+            if payload.offset_items is not None:
+                query = query.offset(payload.offset_items)
             if payload.maximum_items is not None:
-                managed_objects = managed_objects[:payload.maximum_items]
-            else:
-                pass
+                query = query.limit(payload.maximum_items)
+            managed_objects = query.all()
 
         unique_identifiers = [
             str(x.unique_identifier) for x in managed_objects
         ]
 
+        # The Located Items field was added in KMIP 1.3.
+        if self._protocol_version < contents.ProtocolVersion(1, 3):
+            located_items = None
+
         response_payload = payloads.LocateResponsePayload(
+            located_items=located_items,
             unique_identifiers=unique_identifiers
         )
 
         return response_payload
 
-    @_kmip_version_supported('1.0')
     def _process_get(self, payload):
         self._logger.info("Processing operation: Get")
 
@@ -2624,7 +3280,6 @@ class KmipEngine(object):
 
         return response_payload
 
-    @_kmip_version_supported('1.0')
     def _process_get_attributes(self, payload):
         self._logger.info("Processing operation: GetAttributes")
 
@@ -2649,7 +3304,6 @@ class KmipEngine(object):
 
         return response_payload
 
-    @_kmip_version_supported('1.0')
     def _process_get_attribute_list(self, payload):
         self._logger.info("Processing operation: GetAttributeList")
 
@@ -2678,7 +3332,6 @@ class KmipEngine(object):
 
         return response_payload
 
-    @_kmip_version_supported('1.0')
     def _process_activate(self, payload):
         self._logger.info("Processing operation: Activate")
 
@@ -2715,7 +3368,6 @@ class KmipEngine(object):
 
         return response_payload
 
-    @_kmip_version_supported('1.0')
     def _process_revoke(self, payload):
         self._logger.info("Processing operation: Revoke")
 
@@ -2770,7 +3422,6 @@ class KmipEngine(object):
 
         return response_payload
 
-    @_kmip_version_supported('1.0')
     def _process_destroy(self, payload):
         self._logger.info("Processing operation: Destroy")
 
@@ -2812,12 +3463,59 @@ class KmipEngine(object):
 
         return response_payload
 
-    @_kmip_version_supported('1.0')
+    def _process_poll(self, payload):
+        self._logger.info("Processing operation: Poll")
+
+        correlation_value = payload.asynchronous_correlation_value
+        record = self._get_asynchronous_operation(correlation_value)
+
+        if not record.item.done():
+            return messages.ResponseBatchItem(
+                operation=contents.Operation(record.operation),
+                result_status=contents.ResultStatus(
+                    enums.ResultStatus.OPERATION_PENDING
+                ),
+                async_correlation_value=contents.AsynchronousCorrelationValue(
+                    correlation_value
+                )
+            )
+
+        self._asynchronous_operations.pop(correlation_value, None)
+        return record.item.result()
+
+    def _process_cancel(self, payload):
+        self._logger.info("Processing operation: Cancel")
+
+        correlation_value = payload.asynchronous_correlation_value
+        record = self._get_asynchronous_operation(correlation_value)
+
+        if record.item.cancel():
+            self._asynchronous_operations.pop(correlation_value, None)
+            cancellation_result = enums.CancellationResult.CANCELED
+        elif not record.item.done():
+            cancellation_result = enums.CancellationResult.UNABLE_TO_CANCEL
+        elif record.item.result().result_status.value == \
+                enums.ResultStatus.SUCCESS:
+            cancellation_result = enums.CancellationResult.COMPLETED
+        else:
+            cancellation_result = enums.CancellationResult.FAILED
+
+        return payloads.CancelResponsePayload(
+            asynchronous_correlation_value=correlation_value,
+            cancellation_result=cancellation_result
+        )
+
     def _process_query(self, payload):
         self._logger.info("Processing operation: Query")
 
         queries = payload.query_functions
 
+        return self._get_cached_response(
+            (enums.Operation.QUERY, frozenset(queries)),
+            lambda: self._build_query_response(queries)
+        )
+
+    def _build_query_response(self, queries):
         operations = list()
         objects = list()
         vendor_identification = None
@@ -2838,7 +3536,9 @@ class KmipEngine(object):
                 enums.Operation.ACTIVATE,
                 enums.Operation.REVOKE,
                 enums.Operation.DESTROY,
-                enums.Operation.QUERY
+                enums.Operation.QUERY,
+                enums.Operation.CANCEL,
+                enums.Operation.POLL
             ])
 
             if self._protocol_version >= contents.ProtocolVersion(1, 1):
@@ -2879,13 +3579,27 @@ class KmipEngine(object):
 
         return response_payload
 
-    @_kmip_version_supported('1.1')
     def _process_discover_versions(self, payload):
         self._logger.info("Processing operation: DiscoverVersions")
+
+        return self._get_cached_response(
+            (
+                enums.Operation.DISCOVER_VERSIONS,
+                tuple(
+                    (version.major, version.minor)
+                    for version in payload.protocol_versions
+                )
+            ),
+            lambda: self._build_discover_versions_response(
+                payload.protocol_versions
+            )
+        )
+
+    def _build_discover_versions_response(self, protocol_versions):
         supported_versions = list()
 
-        if len(payload.protocol_versions) > 0:
-            for version in payload.protocol_versions:
+        if len(protocol_versions) > 0:
+            for version in protocol_versions:
                 if version in self._protocol_versions:
                     supported_versions.append(version)
         else:
@@ -2897,7 +3611,6 @@ class KmipEngine(object):
 
         return response_payload
 
-    @_kmip_version_supported('1.2')
     def _process_encrypt(self, payload):
         self._logger.info("Processing operation: Encrypt")
 
@@ -2963,7 +3676,6 @@ class KmipEngine(object):
         )
         return response_payload
 
-    @_kmip_version_supported('1.2')
     def _process_decrypt(self, payload):
         self._logger.info("Processing operation: Decrypt")
 
@@ -3027,7 +3739,6 @@ class KmipEngine(object):
         )
         return response_payload
 
-    @_kmip_version_supported('1.2')
     def _process_signature_verify(self, payload):
         self._logger.info("Processing operation: Signature Verify")
 
@@ -3095,7 +3806,6 @@ class KmipEngine(object):
         )
         return response_payload
 
-    @_kmip_version_supported('1.2')
     def _process_mac(self, payload):
         self._logger.info("Processing operation: MAC")
 
@@ -3168,7 +3878,6 @@ class KmipEngine(object):
 
         return response_payload
 
-    @_kmip_version_supported('1.2')
     def _process_sign(self, payload):
         self._logger.info("Processing operation: Sign")
 
@@ -0,0 +1,616 @@
+# Copyright (c) 2020 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import abc
+import bisect
+import collections
+import logging
+import six
+import threading
+import time
+
+from six.moves import BaseHTTPServer
+
+from kmip.core import enums
+from kmip.core.messages import operations
+
+
+# The clock timing requests. Python 2 has no monotonic clock, so the wall
+# clock is used there instead.
+clock = getattr(time, 'monotonic', time.time)
+
+# The phases of a request, in the order they occur. The TLS handshake is
+# recorded once per connection rather than per request.
+PHASES = (
+    'handshake',
+    'read',
+    'queue',
+    'certificate',
+    'decode',
+    'authenticate',
+    'handler',
+    'commit',
+    'encode',
+    'send'
+)
+
+# The upper bounds, in seconds, of the histogram buckets.
+BUCKETS = (
+    0.0001, 0.00025, 0.0005,
+    0.001, 0.0025, 0.005,
+    0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0,
+    10.0, float('inf')
+)
+
+
+# A metric in the Prometheus data model. Each sample is a tuple of a name
+# suffix (e.g., '_count'), a dictionary of labels and a value.
+Metric = collections.namedtuple(
+    'Metric',
+    ['name', 'type', 'help', 'samples']
+)
+
+
+def _get_label(value, enum):
+    if isinstance(value, enum):
+        return ''.join([x.capitalize() for x in value.name.split('_')])
+    return 'None'
+
+
+def get_operation_label(operation):
+    """
+    Get the label metrics are recorded under for an operation.
+
+    Args:
+        operation (Operation|Enum|int): An Operation enumeration, a
+            registered extension operation, or None for measurements not
+            tied to a specific operation.
+
+    Returns:
+        string: The name of the operation (e.g., 'CreateKeyPair'), or
+            'None' if no known operation is given.
+    """
+    if isinstance(operation, enums.Operation):
+        return _get_label(operation, enums.Operation)
+    # Only registered codes get their own label, so that clients sending
+    # arbitrary codes cannot create new metrics.
+    entry = operations.get_operation(operation)
+    if entry is not None:
+        return operations.get_operation_name(entry.operation)
+    return 'None'
+
+
+def get_reason_label(reason):
+    """
+    Get the label errors are counted under for a result reason.
+
+    Args:
+        reason (ResultReason): A ResultReason enumeration, or None.
+
+    Returns:
+        string: The name of the result reason (e.g., 'ItemNotFound'), or
+            'None' if no result reason is given.
+    """
+    return _get_label(reason, enums.ResultReason)
+
+
+@six.add_metaclass(abc.ABCMeta)
+class MetricsSink:
+    """
+    The base class for a destination of server request metrics.
+    """
+
+    @abc.abstractmethod
+    def observe(self, operation, phase, duration):
+        """
+        Record how long a phase of a request took.
+
+        Called by the session threads, so implementations must be
+        thread-safe and should return quickly.
+
+        Args:
+            operation (string): The label of the requested operation (e.g.,
+                'Create'). See get_operation_label.
+            phase (string): The name of the phase, one of PHASES or 'total'.
+            duration (float): The duration of the phase, in seconds.
+        """
+
+    def count_error(self, operation, reason):
+        """
+        Count an operation that failed.
+
+        Called by the session and engine threads, so implementations must
+        be thread-safe and should return quickly. Ignores errors by default.
+
+        Args:
+            operation (string): The label of the failed operation (e.g.,
+                'Get'). See get_operation_label.
+            reason (string): The label of the result reason of the failure
+                (e.g., 'ItemNotFound'). See get_reason_label.
+        """
+
+
+class Histogram(object):
+    """
+    A latency histogram with fixed bucket bounds.
+    """
+
+    def __init__(self, buckets=BUCKETS):
+        """
+        Create a Histogram.
+
+        Args:
+            buckets (tuple): The sorted upper bounds of the buckets, in
+                seconds. The last one should be infinite. Optional, defaults
+                to BUCKETS.
+        """
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def quantile(self, q):
+        """
+        Estimate a quantile of the observed values.
+
+        Args:
+            q (float): The quantile to estimate, between 0 and 1.
+
+        Returns:
+            float: The upper bound of the bucket holding the quantile, or
+                the largest observed value if that bound is infinite.
+        """
+        if self.count == 0:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= rank and count:
+                return min(bound, self.max)
+        return self.max
+
+    def merge(self, histogram):
+        for i, count in enumerate(histogram.counts):
+            self.counts[i] += count
+        self.count += histogram.count
+        self.sum += histogram.sum
+        self.max = max(self.max, histogram.max)
+
+    def copy(self):
+        histogram = Histogram(self.buckets)
+        histogram.counts = list(self.counts)
+        histogram.count = self.count
+        histogram.sum = self.sum
+        histogram.max = self.max
+        return histogram
+
+
+class _Shard(object):
+    """
+    The measurements recorded by a single thread.
+    """
+
+    def __init__(self, thread=None):
+        self.thread = thread
+        self.histograms = {}
+        self.errors = {}
+
+    def merge(self, shard):
+        for key, histogram in list(shard.histograms.items()):
+            total = self.histograms.get(key)
+            if total is None:
+                self.histograms[key] = histogram.copy()
+            else:
+                total.merge(histogram)
+        for key, count in list(shard.errors.items()):
+            self.errors[key] = self.errors.get(key, 0) + count
+
+
+class InMemoryMetricsSink(MetricsSink):
+    """
+    A metrics sink keeping a latency histogram per operation and phase, and
+    an error count per operation and result reason.
+
+    Each thread records into its own shard, so recording takes no lock. The
+    shards are merged when the measurements are read, and the shards of
+    threads that have exited are folded together.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._shards = []
+        self._retired = _Shard()
+
+    def _get_shard(self):
+        shard = getattr(self._local, 'shard', None)
+        if shard is None:
+            shard = _Shard(threading.current_thread())
+            with self._lock:
+                self._retire_shards()
+                self._shards.append(shard)
+            self._local.shard = shard
+        return shard
+
+    def _retire_shards(self):
+        # Threads serving a single connection come and go, so keep the
+        # number of shards bounded by the number of live threads.
+        live = []
+        for shard in self._shards:
+            if shard.thread.is_alive():
+                live.append(shard)
+            else:
+                self._retired.merge(shard)
+        self._shards = live
+
+    def _merge_shards(self):
+        total = _Shard()
+        with self._lock:
+            self._retire_shards()
+            total.merge(self._retired)
+            for shard in self._shards:
+                total.merge(shard)
+        return total
+
+    def observe(self, operation, phase, duration):
+        histograms = self._get_shard().histograms
+        histogram = histograms.get((operation, phase))
+        if histogram is None:
+            histogram = Histogram()
+            histograms[(operation, phase)] = histogram
+        histogram.observe(duration)
+
+    def count_error(self, operation, reason):
+        errors = self._get_shard().errors
+        errors[(operation, reason)] = errors.get((operation, reason), 0) + 1
+
+    def snapshot(self):
+        """
+        Get a copy of the recorded histograms.
+
+        Returns:
+            dict: The histograms, keyed by operation label and then by
+                phase name.
+        """
+        result = collections.defaultdict(dict)
+        for (operation, phase), histogram in six.iteritems(
+                self._merge_shards().histograms
+        ):
+            result[operation][phase] = histogram
+        return dict(result)
+
+    def error_counts(self):
+        """
+        Get the number of failed operations.
+
+        Returns:
+            dict: The error counts, keyed by operation label and result
+                reason label tuples.
+        """
+        return self._merge_shards().errors
+
+    def reset(self):
+        """
+        Drop all recorded measurements.
+        """
+        with self._lock:
+            for shard in self._shards:
+                shard.histograms = {}
+                shard.errors = {}
+            self._retired = _Shard()
+
+    def dump(self):
+        """
+        Summarize the recorded measurements.
+
+        Returns:
+            string: One line per operation and phase, with the number of
+                measurements and the mean, median, 99th percentile and
+                maximum durations in milliseconds, followed by one line per
+                operation and result reason with the number of errors.
+        """
+        order = dict((phase, i) for i, phase in enumerate(PHASES))
+        lines = []
+        for operation, phases in sorted(self.snapshot().items()):
+            for phase in sorted(phases, key=lambda p: order.get(p, 100)):
+                histogram = phases[phase]
+                lines.append(
+                    "{0} {1}: count={2} mean={3:.3f}ms p50={4:.3f}ms "
+                    "p99={5:.3f}ms max={6:.3f}ms".format(
+                        operation,
+                        phase,
+                        histogram.count,
+                        histogram.sum * 1000 / histogram.count,
+                        histogram.quantile(0.5) * 1000,
+                        histogram.quantile(0.99) * 1000,
+                        histogram.max * 1000
+                    )
+                )
+        for (operation, reason), count in sorted(self.error_counts().items()):
+            lines.append(
+                "{0} error {1}: count={2}".format(operation, reason, count)
+            )
+        return "\n".join(lines)
+
+    def collect(self):
+        """
+        Get the recorded measurements as Prometheus metrics.
+
+        Returns:
+            list: The Metric tuples for the number of requests, the phase
+                durations and the errors.
+        """
+        shard = self._merge_shards()
+
+        requests = Metric(
+            'kmip_requests_total',
+            'counter',
+            "The number of requests processed.",
+            []
+        )
+        durations = Metric(
+            'kmip_request_duration_seconds',
+            'histogram',
+            "The time spent in each phase of the requests.",
+            []
+        )
+        errors = Metric(
+            'kmip_errors_total',
+            'counter',
+            "The number of failed operations.",
+            []
+        )
+
+        for (operation, phase), histogram in sorted(shard.histograms.items()):
+            labels = {'operation': operation, 'phase': phase}
+            if phase == 'total':
+                requests.samples.append(
+                    ('', {'operation': operation}, histogram.count)
+                )
+            seen = 0
+            for bound, count in zip(histogram.buckets, histogram.counts):
+                seen += count
+                bucket_labels = dict(labels)
+                bucket_labels['le'] = bound
+                durations.samples.append(('_bucket', bucket_labels, seen))
+            durations.samples.append(('_sum', labels, histogram.sum))
+            durations.samples.append(('_count', labels, histogram.count))
+
+        for (operation, reason), count in sorted(shard.errors.items()):
+            errors.samples.append(
+                ('', {'operation': operation, 'reason': reason}, count)
+            )
+
+        return [requests, durations, errors]
+
+
+def _format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    elif value == float('-inf'):
+        return '-Inf'
+    elif isinstance(value, float):
+        return repr(value)
+    return str(value)
+
+
+def _format_label_value(value):
+    if not isinstance(value, six.string_types):
+        value = _format_value(value)
+    value = value.replace('\\', '\\\\')
+    value = value.replace('"', '\\"')
+    return value.replace('\n', '\\n')
+
+
+def format_metrics(metrics):
+    """
+    Format metrics in the Prometheus text exposition format.
+
+    Args:
+        metrics (list): The Metric tuples to format. Required.
+
+    Returns:
+        string: The formatted metrics, ending with a line feed.
+    """
+    lines = []
+    for metric in metrics:
+        lines.append("# HELP {0} {1}".format(metric.name, metric.help))
+        lines.append("# TYPE {0} {1}".format(metric.name, metric.type))
+        for suffix, labels, value in metric.samples:
+            if labels:
+                labels = "{{{0}}}".format(
+                    ",".join(
+                        '{0}="{1}"'.format(k, _format_label_value(v))
+                        for k, v in sorted(labels.items())
+                    )
+                )
+            else:
+                labels = ""
+            lines.append(
+                "{0}{1}{2} {3}".format(
+                    metric.name,
+                    suffix,
+                    labels,
+                    _format_value(value)
+                )
+            )
+    return "\n".join(lines) + "\n"
+
+
+class _MetricsRequestHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        if self.path.split('?')[0] != '/metrics':
+            self.send_error(404)
+            return
+
+        try:
+            body = self.server.collect().encode('utf-8')
+        except Exception as e:
+            self.server.logger.exception(e)
+            self.send_error(500)
+            return
+
+        self.send_response(200)
+        self.send_header(
+            'Content-Type',
+            'text/plain; version=0.0.4; charset=utf-8'
+        )
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        self.server.logger.debug(format % args)
+
+
+class MetricsListener(object):
+    """
+    An HTTP listener serving metrics to Prometheus on the /metrics path.
+
+    The listener only binds to a local address, and serves one request at a
+    time from its own thread.
+    """
+
+    def __init__(self, collect, port, hostname='127.0.0.1'):
+        """
+        Create a MetricsListener.
+
+        Args:
+            collect (callable): A function called with no arguments for each
+                scrape, returning the metrics in the Prometheus text
+                exposition format. Required.
+            port (int): The port number to listen on. Zero picks a free port.
+                Required.
+            hostname (string): The local address to listen on. Optional,
+                defaults to '127.0.0.1'.
+        """
+        self._logger = logging.getLogger('kmip.server.metrics')
+        self._collect = collect
+        self._address = (hostname, port)
+        self._server = None
+        self._thread = None
+
+    @property
+    def port(self):
+        """
+        The port number the listener is bound to, or None if not started.
+        """
+        if self._server is None:
+            return None
+        return self._server.server_address[1]
+
+    def start(self):
+        """
+        Bind the listener and start serving metrics.
+        """
+        self._server = BaseHTTPServer.HTTPServer(
+            self._address,
+            _MetricsRequestHandler
+        )
+        self._server.collect = self._collect
+        self._server.logger = self._logger
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            name='kmip.server.metrics'
+        )
+        self._thread.daemon = True
+        self._thread.start()
+        self._logger.info(
+            "Serving metrics on http://{0}:{1}/metrics".format(
+                self._address[0],
+                self.port
+            )
+        )
+
+    def stop(self):
+        """
+        Stop serving metrics and close the listener.
+        """
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join(10.0)
+        self._server = None
+        self._thread = None
+
+
+class RequestTimer(object):
+    """
+    A timer splitting the processing time of a request into phases.
+
+    The phases are timed back to back with monotonic timestamps: each call
+    to lap closes the phase that started with the previous call.
+    """
+
+    def __init__(self):
+        self.operation = None
+        self.phases = collections.OrderedDict()
+        self.restart()
+
+    def restart(self):
+        """
+        Restart the timer, dropping any recorded phase.
+        """
+        self.started = clock()
+        self._last = self.started
+        self.phases.clear()
+
+    def lap(self, phase):
+        """
+        Add the time elapsed since the last lap to a phase.
+
+        Args:
+            phase (string): The name of the phase that just ended.
+        """
+        now = clock()
+        self.phases[phase] = self.phases.get(phase, 0.0) + now - self._last
+        self._last = now
+
+    @property
+    def total(self):
+        """
+        The time elapsed between the start of the timer and the last lap.
+        """
+        return self._last - self.started
+
+    def record(self, sink):
+        """
+        Record the phases and the total duration of the request.
+
+        Args:
+            sink (MetricsSink): The sink to record the durations in.
+        """
+        operation = get_operation_label(self.operation)
+        for phase, duration in self.phases.items():
+            sink.observe(operation, phase, duration)
+        sink.observe(operation, 'total', self.total)
+
+    def __str__(self):
+        return ", ".join(
+            "{0}={1:.3f}s".format(phase, duration)
+            for phase, duration in self.phases.items()
+        )
@@ -64,6 +64,16 @@ class PolicyDirectoryMonitor(multiprocessing.Process):
 
         self.reserved_policies = ['default', 'public']
 
+        # Shared with the server processes, which report them as metrics.
+        # Only the monitor writes them, so they need no lock.
+        self.load_count = multiprocessing.RawValue('L', 0)
+        self.load_failure_count = multiprocessing.RawValue('L', 0)
+
+        # Shared with the server engines, which discard their copies of the
+        # policies when it changes. It is updated after each change made to
+        # the policy store.
+        self.policy_changes = multiprocessing.RawValue('L', 0)
+
         def interrupt_handler(trigger, frame):
             self.stop()
         signal.signal(signal.SIGINT, interrupt_handler)
@@ -102,7 +112,9 @@ class PolicyDirectoryMonitor(multiprocessing.Process):
                 except ValueError:
                     self.logger.error("Failure loading file: {}".format(f))
                     self.logger.debug("", exc_info=True)
+                    self.load_failure_count.value += 1
                     continue
+                self.load_count.value += 1
                 for p in new_p.keys():
                     self.logger.info("Loading policy: {}".format(p))
                     if p in self.reserved_policies:
@@ -127,6 +139,7 @@ class PolicyDirectoryMonitor(multiprocessing.Process):
                     else:
                         self.policy_cache[p] = []
                     self.policy_store[p] = new_p.get(p)
+                    self.policy_changes.value += 1
                     self.policy_map[p] = f
                 for p in set(old_p) - set(new_p.keys()):
                     self.disassociate_policy_and_file(p, f)
@@ -156,6 +169,7 @@ class PolicyDirectoryMonitor(multiprocessing.Process):
         for k in self.policy_store.keys():
             if k not in self.reserved_policies:
                 self.policy_store.pop(k, None)
+                self.policy_changes.value += 1
 
     def disassociate_policy_and_file(self, policy, file_name):
         c = self.policy_cache.get(policy, [])
@@ -167,9 +181,11 @@ class PolicyDirectoryMonitor(multiprocessing.Process):
         if len(c) == 0:
             self.logger.info("Removing policy: {}".format(policy))
             self.policy_store.pop(policy, None)
+            self.policy_changes.value += 1
             self.policy_map.pop(policy, None)
             self.policy_cache.pop(policy, None)
         else:
             e = c.pop()
             self.policy_store[policy] = e[2]
+            self.policy_changes.value += 1
             self.policy_map[policy] = e[1]
@@ -0,0 +1,266 @@
+# Copyright (c) 2020 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import logging
+import threading
+
+from six.moves import queue
+
+from kmip.core import enums
+from kmip.core import exceptions
+
+from kmip.services.server import metrics
+
+
+class WorkItem(object):
+    """
+    A request submitted to a WorkerPool, and eventually its result.
+    """
+
+    def __init__(self, function, args):
+        self._function = function
+        self._args = args
+
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+        self._started = False
+        self._canceled = False
+        self._callbacks = []
+        self._result = None
+        self._exception = None
+        self._finish_time = None
+
+    def run(self):
+        with self._lock:
+            if self._canceled:
+                return
+            self._started = True
+
+        try:
+            self._result = self._function(*self._args)
+        except Exception as e:
+            self._exception = e
+
+        self._finish()
+
+    def _finish(self):
+        with self._lock:
+            self._finish_time = metrics.clock()
+            self._done.set()
+            callbacks = self._callbacks
+            self._callbacks = []
+        for callback in callbacks:
+            callback(self)
+
+    def done(self):
+        return self._done.is_set()
+
+    @property
+    def finish_time(self):
+        """
+        The time at which the request was processed or canceled, as given by
+        kmip.services.server.metrics.clock, or None if it is not done.
+        """
+        return self._finish_time
+
+    def cancel(self, error=None):
+        """
+        Cancel the request if no worker thread has started processing it.
+
+        Args:
+            error (KmipError): The error raised as the result of the canceled
+                request. Optional, defaults to an
+                OPERATION_CANCELED_BY_REQUESTER error.
+
+        Returns:
+            bool: True if the request was canceled, False otherwise.
+        """
+        with self._lock:
+            if self._started or self._done.is_set():
+                return False
+            self._canceled = True
+            if error is None:
+                error = exceptions.KmipError(
+                    reason=enums.ResultReason.OPERATION_CANCELED_BY_REQUESTER,
+                    message="The request was canceled."
+                )
+            self._exception = error
+        self._finish()
+        return True
+
+    def result(self):
+        """
+        Wait for the request to be processed and return its result.
+
+        Returns:
+            object: The value returned by the submitted function.
+
+        Raises:
+            Exception: The exception raised by the submitted function, if any.
+        """
+        self._done.wait()
+        if self._exception is not None:
+            raise self._exception
+        return self._result
+
+    def add_done_callback(self, callback):
+        """
+        Register a function to call with this item once it has been
+        processed.
+
+        The callback runs in the worker thread, or immediately in the calling
+        thread if the item has already been processed.
+
+        Args:
+            callback (callable): A function taking the WorkItem. Required.
+        """
+        with self._lock:
+            if not self._done.is_set():
+                self._callbacks.append(callback)
+                return
+        callback(self)
+
+
+class WorkerPool(object):
+    """
+    A fixed set of worker threads processing requests from a bounded queue.
+
+    The pool separates request execution from connection handling. Requests
+    submitted while the queue is full are rejected immediately, so the
+    server sheds load instead of letting requests time out.
+    """
+
+    def __init__(self, worker_count, queue_size):
+        """
+        Create a WorkerPool.
+
+        Args:
+            worker_count (int): The number of worker threads. Required.
+            queue_size (int): The maximum number of requests waiting for a
+                worker. Required.
+        """
+        self._logger = logging.getLogger('kmip.server.pool')
+
+        self._worker_count = worker_count
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._workers = []
+
+        self._lock = threading.Lock()
+        self._rejected_requests = 0
+        self._stopped = False
+
+    @property
+    def queue_depth(self):
+        """
+        The number of requests waiting for a worker.
+        """
+        return self._queue.qsize()
+
+    @property
+    def rejected_requests(self):
+        """
+        The number of requests rejected because the queue was full.
+        """
+        return self._rejected_requests
+
+    def start(self):
+        """
+        Start the worker threads.
+        """
+        for i in range(self._worker_count):
+            worker = threading.Thread(
+                target=self._run,
+                name="kmip.server.worker.{0}".format(i)
+            )
+            worker.daemon = True
+            worker.start()
+            self._workers.append(worker)
+
+    def stop(self):
+        """
+        Stop the worker threads.
+
+        Requests being processed are completed, while requests still waiting
+        in the queue are canceled with a ServerOverloaded error, so stopping
+        never waits for a full queue to drain. Requests submitted afterwards
+        are rejected.
+        """
+        with self._lock:
+            self._stopped = True
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None:
+                item.cancel(
+                    exceptions.ServerOverloaded(
+                        "The server is shutting down. Retry the request "
+                        "later."
+                    )
+                )
+        for _ in self._workers:
+            self._queue.put(None)
+        for worker in self._workers:
+            worker.join()
+        self._workers = []
+
+    def submit(self, function, *args):
+        """
+        Queue a request for processing by a worker thread.
+
+        Args:
+            function (callable): The function processing the request.
+                Required.
+            args: The arguments to call the function with.
+
+        Returns:
+            WorkItem: The queued request.
+
+        Raises:
+            ServerOverloaded: Raised if the request queue is full or the pool
+                is stopped.
+        """
+        item = WorkItem(function, args)
+        try:
+            # Submitting and stopping are serialized, so that no request is
+            # queued once the queue has been emptied by stop.
+            with self._lock:
+                if self._stopped:
+                    raise exceptions.ServerOverloaded(
+                        "The server is shutting down. Retry the request "
+                        "later."
+                    )
+                self._queue.put_nowait(item)
+        except queue.Full:
+            with self._lock:
+                self._rejected_requests += 1
+                rejected_requests = self._rejected_requests
+            self._logger.warning(
+                "Rejecting request: the request queue is full. Rejected "
+                "requests: {0}".format(rejected_requests)
+            )
+            raise exceptions.ServerOverloaded(
+                "The server is too busy to process the request. Retry the "
+                "request later."
+            )
+        return item
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            item.run()
@@ -31,7 +31,9 @@ from kmip.core import policy as operation_policy
 from kmip.services import auth
 from kmip.services.server import config
 from kmip.services.server import engine
+from kmip.services.server import metrics
 from kmip.services.server import monitor
+from kmip.services.server import pool
 from kmip.services.server import session
 
 
@@ -61,7 +63,12 @@ class KmipServer(object):
             tls_cipher_suites=None,
             logging_level=None,
             live_policies=False,
-            database_path=None
+            database_path=None,
+            serving_mode=None,
+            worker_processes=None,
+            metrics_sink=None,
+            slow_request_threshold=None,
+            metrics_port=None
     ):
         """
         Create a KmipServer.
@@ -127,6 +134,27 @@ class KmipServer(object):
                 to False.
             database_path (string): The path to the server's SQLite database
                 file. Optional, defaults to None.
+            serving_mode (string): The way client connections are served.
+                Accepted values are: 'threaded' (one thread per connection),
+                'asyncio' (one event loop for all connections). Optional,
+                defaults to None.
+            worker_processes (int): The number of processes serving client
+                connections. Each process has its own KmipEngine and accepts
+                connections on the shared server socket. With more than one
+                process, requests asking for asynchronous processing are
+                rejected, since pending asynchronous operations are only
+                known to the process running them. Optional, defaults to
+                None.
+            metrics_sink (MetricsSink): The sink recording how long each
+                phase of each request takes. Optional, defaults to None. If
+                None, an InMemoryMetricsSink is used, whose summary is logged
+                when the server receives SIGUSR1.
+            slow_request_threshold (float): The number of seconds above which
+                a request is logged as slow, with the duration of each of its
+                phases. Optional, defaults to None.
+            metrics_port (int): The local port number on which metrics are
+                served over HTTP in the Prometheus text format. Optional,
+                defaults to None (metrics are not served).
         """
         self._logger = logging.getLogger('kmip.server')
         self._setup_logging(log_path)
@@ -144,7 +172,11 @@ class KmipServer(object):
             enable_tls_client_auth,
             tls_cipher_suites,
             logging_level,
-            database_path
+            database_path,
+            serving_mode,
+            worker_processes,
+            slow_request_threshold,
+            metrics_port
         )
         self.live_policies = live_policies
         self.policies = {}
@@ -159,6 +191,19 @@ class KmipServer(object):
 
         self._session_id = 1
         self._is_serving = False
+        self._engine = None
+        self._connection_service = None
+        self._request_pool = None
+        self._ssl_context = None
+        self._sessions = []
+        self._rejected_connections = 0
+        self._worker_id = None
+        self._worker_processes = []
+        self._metrics_listener = None
+
+        if metrics_sink is None:
+            metrics_sink = metrics.InMemoryMetricsSink()
+        self.metrics_sink = metrics_sink
 
     def _setup_logging(self, path):
         # Create the logging directory/file if it doesn't exist.
@@ -194,7 +239,11 @@ class KmipServer(object):
             enable_tls_client_auth=None,
             tls_cipher_suites=None,
             logging_level=None,
-            database_path=None
+            database_path=None,
+            serving_mode=None,
+            worker_processes=None,
+            slow_request_threshold=None,
+            metrics_port=None
     ):
         if path:
             self.config.load_settings(path)
@@ -227,6 +276,17 @@ class KmipServer(object):
             self.config.set_setting('logging_level', logging_level)
         if database_path:
             self.config.set_setting('database_path', database_path)
+        if serving_mode:
+            self.config.set_setting('serving_mode', serving_mode)
+        if worker_processes:
+            self.config.set_setting('worker_processes', worker_processes)
+        if slow_request_threshold:
+            self.config.set_setting(
+                'slow_request_threshold',
+                slow_request_threshold
+            )
+        if metrics_port:
+            self.config.set_setting('metrics_port', metrics_port)
 
     def start(self):
         """
@@ -261,7 +321,9 @@ class KmipServer(object):
 
         self._engine = engine.KmipEngine(
             policies=self.policies,
-            database_path=self.config.settings.get('database_path')
+            database_path=self.config.settings.get('database_path'),
+            metrics_sink=self.metrics_sink,
+            policy_changes=self.policy_monitor.policy_changes
         )
 
         self._logger.info("Starting server socket handler.")
@@ -287,18 +349,20 @@ class KmipServer(object):
         for cipher in auth_suite_ciphers:
             self._logger.debug(cipher)
 
-        self._socket = ssl.wrap_socket(
-            self._socket,
-            keyfile=self.config.settings.get('key_path'),
-            certfile=self.config.settings.get('certificate_path'),
-            server_side=True,
-            cert_reqs=ssl.CERT_REQUIRED,
-            ssl_version=self.auth_suite.protocol,
-            ca_certs=self.config.settings.get('ca_path'),
-            do_handshake_on_connect=False,
-            suppress_ragged_eofs=True,
-            ciphers=self.auth_suite.ciphers
-        )
+        # A single TLS context is shared by all client connections, so that
+        # TLS sessions can be resumed. Worker processes inherit a copy of it
+        # when forked: the session ticket keys generated with the context
+        # are the same in every worker, but each worker has its own session
+        # ID cache. The asyncio front end wraps each accepted connection
+        # itself.
+        self._ssl_context = self._create_ssl_context()
+        if self.config.settings.get('serving_mode') != 'asyncio':
+            self._socket = self._ssl_context.wrap_socket(
+                self._socket,
+                server_side=True,
+                do_handshake_on_connect=False,
+                suppress_ragged_eofs=True
+            )
 
         try:
             self._socket.bind(
@@ -322,6 +386,11 @@ class KmipServer(object):
                     self.config.settings.get('port')
                 )
             )
+            # With multiple worker processes, each worker sets up its own
+            # connection service once it has been started.
+            if self.config.settings.get('worker_processes') == 1:
+                self._setup_connection_service()
+                self._start_metrics_listener()
             self._is_serving = True
 
     def stop(self):
@@ -335,6 +404,16 @@ class KmipServer(object):
             NetworkingError: Raised if a failure occurs while sutting down
                 or closing the TLS server socket.
         """
+        self._stop_metrics_listener()
+
+        if self._request_pool is not None:
+            self._logger.info("Stopping request worker threads.")
+            self._request_pool.stop()
+
+        if self._engine is not None:
+            self._logger.info("Stopping asynchronous operation worker.")
+            self._engine.stop()
+
         self._logger.info("Cleaning up remaining connection threads.")
 
         for thread in threading.enumerate():
@@ -362,7 +441,8 @@ class KmipServer(object):
 
         self._logger.info("Shutting down server socket handler.")
         try:
-            self._socket.shutdown(socket.SHUT_RDWR)
+            if self._connection_service is None:
+                self._socket.shutdown(socket.SHUT_RDWR)
             self._socket.close()
         except Exception as e:
             self._logger.exception(e)
@@ -388,20 +468,39 @@ class KmipServer(object):
         as connections are handled. Set up signal handling to shutdown
         connection service as needed.
         """
-        self._socket.listen(5)
-
         def _signal_handler(signal_number, stack_frame):
             self._is_serving = False
 
+            if self._connection_service is not None:
+                self._connection_service.stop()
+                return
+
             # Python3.5+ silently ignores SIGINT and retries system calls if
             # the signal handler does not raise an exception. Explicitly
             # detect SIGINT and raise a KeyboardInterrupt exception to regain
-            # old functionality.
+            # old functionality. Worker processes are stopped with SIGTERM,
+            # so handle it the same way there.
             if signal_number == signal.SIGINT:
                 raise KeyboardInterrupt("SIGINT received")
+            if self._worker_id is not None:
+                raise KeyboardInterrupt("SIGTERM received")
 
         signal.signal(signal.SIGINT, _signal_handler)
         signal.signal(signal.SIGTERM, _signal_handler)
+        if hasattr(signal, 'SIGUSR1'):
+            signal.signal(signal.SIGUSR1, self._dump_metrics)
+
+        if self._connection_service is not None:
+            self._connection_service.serve()
+            self._is_serving = False
+            return
+
+        self._socket.listen(self.config.settings.get('listen_backlog'))
+
+        if self._worker_id is None:
+            if self.config.settings.get('worker_processes') > 1:
+                self._serve_worker_processes()
+                return
 
         self._logger.info("Starting connection service...")
 
@@ -432,7 +531,268 @@ class KmipServer(object):
 
         self._logger.info("Stopping connection service.")
 
-    def _setup_connection_handler(self, connection, address):
+    def _dump_metrics(self, signal_number, stack_frame):
+        dump = getattr(self.metrics_sink, 'dump', None)
+        if dump is None:
+            return
+        name = "Server" if self._worker_id is None else (
+            "Worker process {0}".format(self._worker_id)
+        )
+        summary = dump()
+        self._logger.info(
+            "{0} request metrics:\n{1}".format(
+                name,
+                summary if summary else "No requests recorded."
+            )
+        )
+
+    def _start_metrics_listener(self):
+        port = self.config.settings.get('metrics_port')
+        if port is None:
+            return
+        # Each worker process has its own metrics, served on its own port.
+        if self._worker_id is not None:
+            port += self._worker_id
+
+        listener = metrics.MetricsListener(self._collect_metrics, port)
+        try:
+            listener.start()
+        except Exception as e:
+            self._logger.warning(
+                "Failure occurred while starting the metrics listener on "
+                "port {0}. Metrics will not be served.".format(port)
+            )
+            self._logger.exception(e)
+        else:
+            self._metrics_listener = listener
+
+    def _stop_metrics_listener(self):
+        if self._metrics_listener is not None:
+            self._logger.info("Stopping the metrics listener.")
+            self._metrics_listener.stop()
+            self._metrics_listener = None
+
+    def _collect_metrics(self):
+        collected = []
+        collect = getattr(self.metrics_sink, 'collect', None)
+        if collect is not None:
+            collected.extend(collect())
+
+        statistics = self.statistics
+        for name, metric_type, key, description in (
+            (
+                'kmip_active_sessions',
+                'gauge',
+                'active_connections',
+                "The number of open client connections."
+            ),
+            (
+                'kmip_rejected_connections_total',
+                'counter',
+                'rejected_connections',
+                "The number of connections rejected at the connection limit."
+            ),
+            (
+                'kmip_request_queue_depth',
+                'gauge',
+                'queue_depth',
+                "The number of requests waiting for a worker thread."
+            ),
+            (
+                'kmip_rejected_requests_total',
+                'counter',
+                'rejected_requests',
+                "The number of requests rejected with a full request queue."
+            ),
+            (
+                'kmip_tls_handshakes_total',
+                'counter',
+                'tls_handshakes',
+                "The number of completed TLS handshakes."
+            ),
+            (
+                'kmip_tls_resumptions_total',
+                'counter',
+                'tls_resumptions',
+                "The number of TLS handshakes resuming a previous session."
+            )
+        ):
+            collected.append(
+                metrics.Metric(
+                    name,
+                    metric_type,
+                    description,
+                    [('', {}, statistics[key])]
+                )
+            )
+
+        policy_monitor = getattr(self, 'policy_monitor', None)
+        if policy_monitor is not None:
+            collected.append(
+                metrics.Metric(
+                    'kmip_policy_loads_total',
+                    'counter',
+                    "The number of operation policy files (re)loaded.",
+                    [('', {}, policy_monitor.load_count.value)]
+                )
+            )
+            collected.append(
+                metrics.Metric(
+                    'kmip_policy_load_failures_total',
+                    'counter',
+                    "The number of operation policy files that failed to "
+                    "load.",
+                    [('', {}, policy_monitor.load_failure_count.value)]
+                )
+            )
+
+        return metrics.format_metrics(collected)
+
+    def _setup_connection_service(self):
+        self._request_pool = pool.WorkerPool(
+            self.config.settings.get('worker_pool_size'),
+            self.config.settings.get('request_queue_size')
+        )
+        self._request_pool.start()
+
+        if self.config.settings.get('serving_mode') == 'asyncio':
+            from kmip.services.server import aio
+            self._connection_service = aio.AsyncioConnectionService(
+                self._socket,
+                self._ssl_context,
+                self._create_session,
+                self._request_pool,
+                max_connections=self.config.settings.get('max_connections'),
+                backlog=self.config.settings.get('listen_backlog')
+            )
+
+    def _serve_worker_processes(self):
+        def _signal_handler(signal_number, stack_frame):
+            self._is_serving = False
+
+        def _forward_signal(signal_number, stack_frame):
+            # Requests are only served by the workers, so let each of them
+            # report its own metrics.
+            for worker in self._worker_processes:
+                if worker is not None and worker.is_alive():
+                    os.kill(worker.pid, signal_number)
+
+        signal.signal(signal.SIGINT, _signal_handler)
+        signal.signal(signal.SIGTERM, _signal_handler)
+        if hasattr(signal, 'SIGUSR1'):
+            signal.signal(signal.SIGUSR1, _forward_signal)
+
+        # Workers must be forked so that they inherit the server socket and
+        # the connection to the shared policy store.
+        if six.PY2:
+            context = multiprocessing
+        else:
+            context = multiprocessing.get_context('fork')
+
+        # The server engine only prepared the database; its connections
+        # must not be inherited by the workers, which use their own engines.
+        if self._engine is not None:
+            self._engine.dispose()
+
+        worker_count = self.config.settings.get('worker_processes')
+        self._logger.info(
+            "Starting {0} worker processes...".format(worker_count)
+        )
+        self._worker_processes = [None] * worker_count
+
+        while self._is_serving:
+            for i, worker in enumerate(self._worker_processes):
+                if worker is not None and worker.is_alive():
+                    continue
+                if worker is not None:
+                    self._logger.warning(
+                        "Worker process {0} exited with code {1}. "
+                        "Restarting it.".format(i, worker.exitcode)
+                    )
+                worker = context.Process(
+                    target=self._run_worker_process,
+                    args=(i, ),
+                    name="kmip.server.worker_process.{0}".format(i)
+                )
+                worker.daemon = True
+                worker.start()
+                self._worker_processes[i] = worker
+
+            # Wake up periodically to check for worker exits and signals.
+            self._worker_processes[0].join(1.0)
+
+        self._logger.info("Stopping worker processes.")
+        for worker in self._worker_processes:
+            if worker.is_alive():
+                worker.terminate()
+        for worker in self._worker_processes:
+            worker.join(10.0)
+            if worker.is_alive():
+                self._logger.warning(
+                    "Cleanup failed for worker process: {0}. Process is "
+                    "still alive".format(worker.name)
+                )
+        self._worker_processes = []
+
+    def _run_worker_process(self, worker_id):
+        self._worker_id = worker_id
+        self._session_id = 1
+        self._logger.info(
+            "Worker process {0} started with PID {1}.".format(
+                worker_id,
+                os.getpid()
+            )
+        )
+
+        # Database connections cannot be shared with the parent process, so
+        # each worker uses its own engine. Asynchronous operations are
+        # disabled, since a Poll or Cancel request could reach a worker
+        # other than the one running the operation.
+        self._engine = engine.KmipEngine(
+            policies=self.policies,
+            database_path=self.config.settings.get('database_path'),
+            metrics_sink=self.metrics_sink,
+            policy_changes=self.policy_monitor.policy_changes,
+            enable_asynchronous_operations=False
+        )
+        self._setup_connection_service()
+        self._start_metrics_listener()
+
+        try:
+            self.serve()
+        finally:
+            self._stop_metrics_listener()
+            self._request_pool.stop()
+            for s in self._sessions:
+                s.join(10.0)
+            self._engine.stop()
+            self._logger.info(
+                "Worker process {0} stopped.".format(worker_id)
+            )
+
+    def _create_ssl_context(self):
+        context = ssl.SSLContext(self.auth_suite.protocol)
+        context.verify_mode = ssl.CERT_REQUIRED
+        context.load_cert_chain(
+            self.config.settings.get('certificate_path'),
+            keyfile=self.config.settings.get('key_path')
+        )
+        context.load_verify_locations(
+            cafile=self.config.settings.get('ca_path')
+        )
+        context.set_ciphers(self.auth_suite.ciphers)
+
+        # Let clients resume TLS sessions, either from the server session
+        # cache or with session tickets, skipping the full handshake and
+        # client certificate verification on reconnect. With several worker
+        # processes only tickets can be resumed by any worker; a session ID
+        # is only known to the worker that created it, and the ssl module
+        # offers no way to turn the session cache off. Clients reconnecting
+        # to another worker with a session ID get a full handshake.
+        context.options &= ~ssl.OP_NO_TICKET
+        return context
+
+    def _create_session(self, connection, address):
         self._logger.info(
             "Receiving incoming connection from: {0}:{1}".format(
                 address[0],
@@ -441,6 +801,8 @@ class KmipServer(object):
         )
 
         session_name = "{0:08}".format(self._session_id)
+        if self._worker_id is not None:
+            session_name = "{0}.{1}".format(self._worker_id, session_name)
         self._session_id += 1
 
         self._logger.info(
@@ -451,27 +813,109 @@ class KmipServer(object):
             )
         )
 
-        try:
-            s = session.KmipSession(
-                self._engine,
-                connection,
-                address,
-                name=session_name,
-                enable_tls_client_auth=self.config.settings.get(
-                    'enable_tls_client_auth'
-                ),
-                auth_settings=self.config.settings.get('auth_plugins')
+        return session.KmipSession(
+            self._engine,
+            connection,
+            address,
+            name=session_name,
+            enable_tls_client_auth=self.config.settings.get(
+                'enable_tls_client_auth'
+            ),
+            auth_settings=self.config.settings.get('auth_plugins'),
+            request_pool=self._request_pool,
+            metrics_sink=self.metrics_sink,
+            slow_request_threshold=self.config.settings.get(
+                'slow_request_threshold'
             )
+        )
+
+    def _setup_connection_handler(self, connection, address):
+        self._sessions = [x for x in self._sessions if x.is_alive()]
+        max_connections = self.config.settings.get('max_connections')
+        if max_connections and len(self._sessions) >= max_connections:
+            self._rejected_connections += 1
+            self._logger.warning(
+                "Rejecting connection from {0}:{1}: the maximum of {2} "
+                "connections is reached. Rejected connections: {3}".format(
+                    address[0],
+                    address[1],
+                    max_connections,
+                    self._rejected_connections
+                )
+            )
+            connection.close()
+            return
+
+        s = None
+        try:
+            s = self._create_session(connection, address)
             s.daemon = True
             s.start()
+            self._sessions.append(s)
         except Exception as e:
-            self._logger.warning(
-                "Failure occurred while starting session: {0}".format(
-                    session_name
+            if s is None:
+                self._logger.warning(
+                    "Failure occurred while creating a session for "
+                    "{0}:{1}".format(address[0], address[1])
+                )
+            else:
+                self._logger.warning(
+                    "Failure occurred while starting session: {0}".format(
+                        s.name
+                    )
                 )
-            )
             self._logger.exception(e)
 
+    @property
+    def statistics(self):
+        """
+        Get the load counters of the server.
+
+        Returns:
+            dict: The number of open client connections
+                ('active_connections'), of connections rejected because the
+                maximum number of connections was reached
+                ('rejected_connections'), of requests waiting for a worker
+                thread ('queue_depth'), of requests rejected because the
+                request queue was full ('rejected_requests'), of completed
+                TLS handshakes ('tls_handshakes'), and of handshakes that
+                resumed a previous TLS session ('tls_resumptions').
+        """
+        if self._connection_service is not None:
+            active_connections = self._connection_service.active_connections
+            rejected_connections = (
+                self._connection_service.rejected_connections
+            )
+        else:
+            active_connections = len(
+                [x for x in self._sessions if x.is_alive()]
+            )
+            rejected_connections = self._rejected_connections
+
+        if self._request_pool is not None:
+            queue_depth = self._request_pool.queue_depth
+            rejected_requests = self._request_pool.rejected_requests
+        else:
+            queue_depth = 0
+            rejected_requests = 0
+
+        if self._ssl_context is not None:
+            session_stats = self._ssl_context.session_stats()
+            tls_handshakes = session_stats.get('accept_good', 0)
+            tls_resumptions = session_stats.get('hits', 0)
+        else:
+            tls_handshakes = 0
+            tls_resumptions = 0
+
+        return {
+            'active_connections': active_connections,
+            'rejected_connections': rejected_connections,
+            'queue_depth': queue_depth,
+            'rejected_requests': rejected_requests,
+            'tls_handshakes': tls_handshakes,
+            'tls_resumptions': tls_resumptions
+        }
+
     def __enter__(self):
         self.start()
         return self
@@ -631,6 +1075,53 @@ def build_argument_parser():
             "file. Optional, defaults to None."
         ),
     )
+    parser.add_option(
+        "-m",
+        "--serving_mode",
+        action="store",
+        type="str",
+        default=None,
+        dest="serving_mode",
+        help=(
+            "A string representing the way client connections are served. "
+            "Options include 'threaded' and 'asyncio'. Optional, defaults to "
+            "None."
+        ),
+    )
+    parser.add_option(
+        "-w",
+        "--workers",
+        action="store",
+        type="int",
+        default=None,
+        dest="worker_processes",
+        help=(
+            "An integer representing the number of processes serving client "
+            "connections. Optional, defaults to None."
+        ),
+    )
+    parser.add_option(
+        "--slow_request_threshold",
+        action="store",
+        type="float",
+        default=None,
+        dest="slow_request_threshold",
+        help=(
+            "A float representing the number of seconds above which a "
+            "request is logged as slow. Optional, defaults to None."
+        ),
+    )
+    parser.add_option(
+        "--metrics_port",
+        action="store",
+        type="int",
+        default=None,
+        dest="metrics_port",
+        help=(
+            "An integer representing the local port on which metrics are "
+            "served over HTTP. Optional, defaults to None."
+        ),
+    )
 
     return parser
 
@@ -665,6 +1156,14 @@ def main(args=None):
         kwargs['logging_level'] = opts.logging_level
     if opts.database_path:
         kwargs['database_path'] = opts.database_path
+    if opts.serving_mode:
+        kwargs['serving_mode'] = opts.serving_mode
+    if opts.worker_processes:
+        kwargs['worker_processes'] = opts.worker_processes
+    if opts.slow_request_threshold:
+        kwargs['slow_request_threshold'] = opts.slow_request_threshold
+    if opts.metrics_port:
+        kwargs['metrics_port'] = opts.metrics_port
 
     kwargs['live_policies'] = True
 
@@ -16,7 +16,6 @@
 import binascii
 import logging
 import socket
-import struct
 import threading
 import time
 
@@ -24,11 +23,39 @@ from cryptography import x509
 
 from kmip.core import enums
 from kmip.core import exceptions
+from kmip.core import ttlv
 from kmip.core.messages import contents
 from kmip.core.messages import messages
 from kmip.core import utils
 
+from kmip.services import framing
 from kmip.services.server import auth
+from kmip.services.server import metrics
+
+
+# Authentication plugins are shared by all sessions, so their caches and
+# connection pools outlive individual client connections.
+_auth_plugins = {}
+_auth_plugins_lock = threading.Lock()
+
+
+def _get_auth_plugin(plugin_name, plugin_config):
+    key = (plugin_name, tuple(sorted(plugin_config.items())))
+    with _auth_plugins_lock:
+        plugin = _auth_plugins.get(key)
+        if plugin is None:
+            plugin = auth.CachingAuthenticator(
+                auth.SLUGSConnector(
+                    plugin_config.get("url"),
+                    timeout=float(plugin_config.get("timeout", 10))
+                ),
+                ttl=float(plugin_config.get("cache_ttl", 300)),
+                negative_ttl=float(
+                    plugin_config.get("cache_negative_ttl", 30)
+                )
+            )
+            _auth_plugins[key] = plugin
+    return plugin
 
 
 class KmipSession(threading.Thread):
@@ -42,7 +69,10 @@ class KmipSession(threading.Thread):
                  address,
                  name=None,
                  enable_tls_client_auth=True,
-                 auth_settings=None):
+                 auth_settings=None,
+                 request_pool=None,
+                 metrics_sink=None,
+                 slow_request_threshold=None):
         """
         Create a KmipSession.
 
@@ -64,6 +94,15 @@ class KmipSession(threading.Thread):
                 name of the 'auth:' settings block from the server config file,
                 and (2) a dictionary of configuration settings for a specific
                 authentication plugin. Optional, defaults to None.
+            request_pool (WorkerPool): The pool of worker threads processing
+                requests. Optional, defaults to None (requests are processed
+                by the session thread).
+            metrics_sink (MetricsSink): The sink recording how long each
+                phase of each request takes. Optional, defaults to None
+                (durations are not recorded).
+            slow_request_threshold (float): The number of seconds after
+                which a request is logged as slow, with the duration of each
+                of its phases. Optional, defaults to None (disabled).
         """
         super(KmipSession, self).__init__(
             group=None,
@@ -83,9 +122,16 @@ class KmipSession(threading.Thread):
 
         self._enable_tls_client_auth = enable_tls_client_auth
         self._auth_settings = [] if auth_settings is None else auth_settings
+        self._request_pool = request_pool
+        self._metrics_sink = metrics_sink
+        self._slow_request_threshold = slow_request_threshold
+
+        # The client certificate cannot change within a TLS session, so it
+        # is verified once and reused for every request of the session.
+        self._certificate = None
+        self._client_identity = None
 
         self._session_time = time.time()
-        self._max_buffer_size = 4096
         self._max_request_size = 1048576
         self._max_response_size = 1048576
 
@@ -99,7 +145,14 @@ class KmipSession(threading.Thread):
         self._logger.info("Starting session: {0}".format(self.name))
 
         try:
+            started = metrics.clock()
             self._connection.do_handshake()
+            if self._metrics_sink is not None:
+                self._metrics_sink.observe(
+                    metrics.get_operation_label(None),
+                    'handshake',
+                    metrics.clock() - started
+                )
         except Exception as e:
             self._logger.info("Failure running TLS handshake")
             self._logger.exception(e)
@@ -109,6 +162,16 @@ class KmipSession(threading.Thread):
                     self._handle_message_loop()
                 except exceptions.ConnectionClosed as e:
                     break
+                except exceptions.MessageTooLarge as e:
+                    # The rest of the message is never read, so the
+                    # connection cannot be used anymore once the client is
+                    # told why its request was rejected.
+                    try:
+                        self._send_response(self.reject_oversized_message(e))
+                    except Exception as e:
+                        self._logger.info("Failure rejecting request")
+                        self._logger.exception(e)
+                    break
                 except Exception as e:
                     self._logger.info("Failure handling message loop")
                     self._logger.exception(e)
@@ -118,57 +181,149 @@ class KmipSession(threading.Thread):
         self._logger.info("Stopping session: {0}".format(self.name))
 
     def _handle_message_loop(self):
-        request_data = self._receive_request()
-        request = messages.RequestMessage()
+        timer = metrics.RequestTimer()
+        request_data = self._receive_request(timer)
+        timer.lap('read')
+        if self._request_pool is None:
+            response_data = self.process_message(request_data, timer)
+        else:
+            try:
+                response_data = self._request_pool.submit(
+                    self.process_message,
+                    request_data,
+                    timer
+                ).result()
+            except exceptions.ServerOverloaded as e:
+                response_data = self.reject_message(request_data, e, timer)
+        self._send_response(response_data)
+        timer.lap('send')
+        self.record_request(timer)
+
+    def record_request(self, timer):
+        """
+        Record the phase durations of a request once its response is sent.
 
-        max_size = self._max_response_size
-        kmip_version = contents.protocol_version_to_kmip_version(
-            self._engine.default_protocol_version
-        )
+        Args:
+            timer (RequestTimer): The timer of the request. Required.
+        """
+        if self._metrics_sink is not None:
+            timer.record(self._metrics_sink)
 
-        try:
-            if hasattr(self._connection, 'shared_ciphers'):
-                shared_ciphers = self._connection.shared_ciphers()
-                self._logger.debug(
-                    "Possible session ciphers: {0}".format(len(shared_ciphers))
-                )
-                for cipher in shared_ciphers:
-                    self._logger.debug(cipher)
-            self._logger.debug(
-                "Session cipher selected: {0}".format(
-                    self._connection.cipher()
+        threshold = self._slow_request_threshold
+        if threshold is not None and timer.total >= threshold:
+            self._logger.warning(
+                "Slow request: {0} took {1:.3f}s ({2})".format(
+                    metrics.get_operation_label(timer.operation),
+                    timer.total,
+                    timer
                 )
             )
 
-            certificate = auth.get_certificate_from_connection(
-                self._connection
+    def reject_message(self, request_data, error, timer=None):
+        """
+        Build the error response for a request that will not be processed.
+
+        Only the protocol version is read from the request, so rejecting a
+        request is much cheaper than processing it.
+
+        Args:
+            request_data (BytearrayStream): The encoding of the request
+                message, including its header. Required.
+            error (KmipError): The reason the request is rejected. Required.
+            timer (RequestTimer): The timer of the request. Optional,
+                defaults to None.
+
+        Returns:
+            bytearray: The encoding of the error response message.
+        """
+        protocol_version = contents.ProtocolVersion(1, 0)
+        try:
+            summary = ttlv.peek_operation(request_data.buffer)
+        except Exception:
+            summary = ttlv.RequestSummary(None, None, None)
+        if summary.protocol_version is not None:
+            candidate = contents.ProtocolVersion(*summary.protocol_version)
+            if contents.protocol_version_to_kmip_version(candidate):
+                protocol_version = candidate
+        if timer is not None:
+            timer.operation = summary.operation
+
+        response = self._build_error_response(
+            protocol_version,
+            error.reason,
+            str(error),
+            summary.operation
+        )
+        response_data = utils.BytearrayStream()
+        response.write(
+            response_data,
+            kmip_version=contents.protocol_version_to_kmip_version(
+                protocol_version
             )
-            if certificate is None:
-                raise exceptions.PermissionDenied(
-                    "The client certificate could not be loaded from the "
-                    "session connection."
-                )
+        )
+        if timer is not None:
+            timer.lap('encode')
+        return response_data.buffer
 
-            if self._enable_tls_client_auth:
-                extension = auth.get_extended_key_usage_from_certificate(
-                    certificate
-                )
-                if extension is None:
-                    raise exceptions.PermissionDenied(
-                        "The extended key usage extension is missing from "
-                        "the client certificate."
-                    )
-                if x509.oid.ExtendedKeyUsageOID.CLIENT_AUTH not in extension:
-                    raise exceptions.PermissionDenied(
-                        "The extended key usage extension is not marked for "
-                        "client authentication in the client certificate."
-                    )
+    def reject_oversized_message(self, error):
+        """
+        Build the error response for a request larger than the maximum
+        request size.
+
+        Only the message header of such a request is read, so the response
+        carries neither the protocol version nor the operation of the
+        request.
+
+        Args:
+            error (MessageTooLarge): The error raised while receiving the
+                request, stating its advertised size. Required.
+
+        Returns:
+            bytearray: The encoding of the error response message.
+        """
+        self._logger.warning("Rejecting oversized request: {0}".format(error))
+        return self.reject_message(
+            utils.BytearrayStream(),
+            exceptions.InvalidMessage(str(error))
+        )
+
+    def process_message(self, request_data, timer=None):
+        """
+        Process a single encoded request message.
+
+        The request is authenticated and handed to the engine. Any failure is
+        reported to the client through an error response.
+
+        Args:
+            request_data (BytearrayStream): The encoding of the request
+                message, including its header. Required.
+            timer (RequestTimer): The timer splitting the processing time of
+                the request into phases. Optional, defaults to None.
+
+        Returns:
+            bytearray: The encoding of the response message.
+        """
+        if timer is None:
+            timer = metrics.RequestTimer()
+        timer.lap('queue')
 
-            request.read(request_data, kmip_version=kmip_version)
+        request = messages.RequestMessage()
+
+        max_size = self._max_response_size
+        kmip_version = contents.protocol_version_to_kmip_version(
+            self._engine.default_protocol_version
+        )
+
+        try:
+            certificate = self._get_client_certificate()
+            timer.lap('certificate')
+            request.read(request_data, kmip_version=kmip_version, lazy=True)
+            timer.lap('decode')
+            timer.operation = self._get_operation(request)
         except exceptions.PermissionDenied as e:
             self._logger.warning("Failure verifying the client certificate.")
             self._logger.exception(e)
-            response = self._engine.build_error_response(
+            response = self._build_error_response(
                 contents.ProtocolVersion(1, 0),
                 enums.ResultReason.AUTHENTICATION_NOT_SUCCESSFUL,
                 "Error verifying the client certificate. "
@@ -177,7 +332,7 @@ class KmipSession(threading.Thread):
         except Exception as e:
             self._logger.warning("Failure parsing request message.")
             self._logger.exception(e)
-            response = self._engine.build_error_response(
+            response = self._build_error_response(
                 contents.ProtocolVersion(1, 0),
                 enums.ResultReason.INVALID_MESSAGE,
                 "Error parsing request message. See server logs for more "
@@ -190,18 +345,22 @@ class KmipSession(threading.Thread):
                     "Session client identity: {}".format(client_identity[0])
                 )
             except Exception:
+                timer.lap('authenticate')
                 self._logger.warning("Authentication failed.")
-                response = self._engine.build_error_response(
+                response = self._build_error_response(
                     request.request_header.protocol_version,
                     enums.ResultReason.AUTHENTICATION_NOT_SUCCESSFUL,
                     "An error occurred during client authentication. "
-                    "See server logs for more information."
+                    "See server logs for more information.",
+                    timer.operation
                 )
             else:
+                timer.lap('authenticate')
                 try:
                     results = self._engine.process_request(
                         request,
-                        client_identity
+                        client_identity,
+                        timer=timer
                     )
                     response, max_response_size, protocol_version = results
                     kmip_version = contents.protocol_version_to_kmip_version(
@@ -211,10 +370,11 @@ class KmipSession(threading.Thread):
                     if max_response_size:
                         max_size = max_response_size
                 except exceptions.KmipError as e:
-                    response = self._engine.build_error_response(
+                    response = self._build_error_response(
                         request.request_header.protocol_version,
                         e.reason,
-                        str(e)
+                        str(e),
+                        timer.operation
                     )
                 except Exception as e:
                     self._logger.warning(
@@ -222,12 +382,14 @@ class KmipSession(threading.Thread):
                         "request."
                     )
                     self._logger.exception(e)
-                    response = self._engine.build_error_response(
+                    response = self._build_error_response(
                         request.request_header.protocol_version,
                         enums.ResultReason.GENERAL_FAILURE,
                         "An unexpected error occurred while processing "
-                        "request. See server logs for more information."
+                        "request. See server logs for more information.",
+                        timer.operation
                     )
+                timer.lap('handler')
 
         response_data = utils.BytearrayStream()
         response.write(response_data, kmip_version=kmip_version)
@@ -240,16 +402,78 @@ class KmipSession(threading.Thread):
                     self._max_response_size
                 )
             )
-            response = self._engine.build_error_response(
+            response = self._build_error_response(
                 request.request_header.protocol_version,
                 enums.ResultReason.RESPONSE_TOO_LARGE,
                 "Response message length too large. See server logs for "
-                "more information."
+                "more information.",
+                timer.operation
             )
             response_data = utils.BytearrayStream()
             response.write(response_data, kmip_version=kmip_version)
 
-        self._send_response(response_data.buffer)
+        timer.lap('encode')
+        return response_data.buffer
+
+    def _build_error_response(self, version, reason, message,
+                              operation=None):
+        if self._metrics_sink is not None:
+            self._metrics_sink.count_error(
+                metrics.get_operation_label(operation),
+                metrics.get_reason_label(reason)
+            )
+        return self._engine.build_error_response(version, reason, message)
+
+    def _get_operation(self, request):
+        # Requests are labeled with the operation of their first batch item.
+        if request.batch_items:
+            return request.batch_items[0].operation.value
+        return None
+
+    def _get_client_certificate(self):
+        if self._certificate is not None:
+            return self._certificate
+
+        if hasattr(self._connection, 'shared_ciphers'):
+            # No cipher list is available for resumed TLS sessions.
+            shared_ciphers = self._connection.shared_ciphers() or []
+            self._logger.debug(
+                "Possible session ciphers: {0}".format(len(shared_ciphers))
+            )
+            for cipher in shared_ciphers:
+                self._logger.debug(cipher)
+        self._logger.debug(
+            "Session cipher selected: {0}".format(
+                self._connection.cipher()
+            )
+        )
+
+        certificate = auth.get_certificate_from_connection(
+            self._connection
+        )
+        if certificate is None:
+            raise exceptions.PermissionDenied(
+                "The client certificate could not be loaded from the "
+                "session connection."
+            )
+
+        if self._enable_tls_client_auth:
+            extension = auth.get_extended_key_usage_from_certificate(
+                certificate
+            )
+            if extension is None:
+                raise exceptions.PermissionDenied(
+                    "The extended key usage extension is missing from "
+                    "the client certificate."
+                )
+            if x509.oid.ExtendedKeyUsageOID.CLIENT_AUTH not in extension:
+                raise exceptions.PermissionDenied(
+                    "The extended key usage extension is not marked for "
+                    "client authentication in the client certificate."
+                )
+
+        self._certificate = certificate
+        return certificate
 
     def authenticate(self, certificate, request):
         credentials = []
@@ -264,7 +488,7 @@ class KmipSession(threading.Thread):
             if plugin_name.startswith("auth:slugs"):
                 if plugin_config.get("enabled") == "True":
                     plugin_enabled = True
-                    plugin = auth.SLUGSConnector(plugin_config.get("url"))
+                    plugin = _get_auth_plugin(plugin_name, plugin_config)
                     self._logger.debug(
                         "Authenticating with plugin: {}".format(plugin_name)
                     )
@@ -293,6 +517,9 @@ class KmipSession(threading.Thread):
                 )
 
         if not plugin_enabled:
+            if self._client_identity is not None:
+                return self._client_identity
+
             self._logger.debug(
                 "No authentication plugins are enabled. The client identity "
                 "will be extracted from the client certificate."
@@ -310,46 +537,24 @@ class KmipSession(threading.Thread):
                         client_identity
                     )
                 )
-                return tuple([client_identity, None])
+                self._client_identity = tuple([client_identity, None])
+                return self._client_identity
 
         raise exceptions.PermissionDenied("Authentication failed.")
 
-    def _receive_request(self):
-        header = self._receive_bytes(8)
-        message_size = struct.unpack('!I', header[4:])[0]
-
-        payload = self._receive_bytes(message_size)
-        data = utils.BytearrayStream(header + payload)
-
-        return data
-
-    def _receive_bytes(self, message_size):
-        bytes_received = 0
-        message = b''
-
-        while bytes_received < message_size:
-            partial_message = self._connection.recv(
-                min(message_size - bytes_received, self._max_buffer_size)
-            )
-
-            if partial_message is None:
-                break
-            elif len(partial_message) == 0:
-                raise exceptions.ConnectionClosed()
-            else:
-                bytes_received += len(partial_message)
-                message += partial_message
-
-        if bytes_received != message_size:
-            raise ValueError(
-                "Invalid KMIP message received. Actual message length "
-                "does not match the advertised header length."
-            )
-        else:
+    def _receive_request(self, timer):
+        # The request is timed from the arrival of its header, leaving out
+        # the time the connection was idle.
+        message = framing.receive_message(
+            self._connection,
+            max_size=self._max_request_size,
+            on_header=timer.restart
+        )
+        if self._logger.isEnabledFor(logging.DEBUG):
             self._logger.debug(
                 "Request encoding: {}".format(binascii.hexlify(message))
             )
-            return message
+        return utils.BytearrayStream(message)
 
     def _send_response(self, data):
         if len(data) > 0:
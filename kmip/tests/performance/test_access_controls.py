@@ -0,0 +1,154 @@
+# Copyright (c) 2020 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import copy
+import multiprocessing
+import os
+import shutil
+import six
+import tempfile
+import testtools
+import time
+
+from kmip.core import enums
+from kmip.core import policy
+
+from kmip.core.factories import attributes as attribute_factory
+
+from kmip.core.messages import contents
+from kmip.core.messages import messages
+from kmip.core.messages import payloads
+
+from kmip.services.server import engine
+
+from kmip.tests.performance import test_database_indexes
+
+
+def build_request(payload):
+    return messages.RequestMessage(
+        request_header=messages.RequestHeader(
+            protocol_version=contents.ProtocolVersion(1, 3),
+            batch_count=contents.BatchCount(1)
+        ),
+        batch_items=[
+            messages.RequestBatchItem(
+                operation=contents.Operation(enums.Operation.LOCATE),
+                request_payload=payload
+            )
+        ]
+    )
+
+
+class TestAccessControls(testtools.TestCase):
+    """
+    Benchmarks for listing the objects a client can access among the objects
+    of many other clients.
+
+    Each benchmark fills a database with symmetric keys owned by another
+    client, adds the keys of the benchmark client, and times Locate requests
+    for all of its keys, with the policies shared by a multiprocessing
+    manager as they are by the server. Run them with 'tox -e performance'.
+    """
+
+    def setUp(self):
+        super(TestAccessControls, self).setUp()
+
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+        self.credential = ['Benchmark Client', None]
+
+        self.manager = multiprocessing.Manager()
+        self.addCleanup(self.manager.shutdown)
+        self.policies = self.manager.dict()
+        for name, policy_set in six.iteritems(copy.deepcopy(policy.policies)):
+            self.policies[name] = policy_set
+        self.policy_changes = multiprocessing.RawValue('L', 0)
+
+    def _time_request(self, kmip_engine, request, repeat=5):
+        durations = []
+        for _ in range(repeat):
+            start = time.time()
+            response, _, _ = kmip_engine.process_request(
+                request,
+                self.credential
+            )
+            durations.append(time.time() - start)
+
+            batch_item = response.batch_items[0]
+            if batch_item.result_status.value != enums.ResultStatus.SUCCESS:
+                raise AssertionError(batch_item.result_message.value)
+        return min(durations), batch_item.response_payload
+
+    def _measure(self, count, owned=100):
+        kmip_engine = engine.KmipEngine(
+            policies=self.policies,
+            database_path=os.path.join(
+                self.directory,
+                '{0}.database'.format(count)
+            ),
+            policy_changes=self.policy_changes
+        )
+        test_database_indexes.populate(kmip_engine, count, 'Other Client')
+        test_database_indexes.populate(
+            kmip_engine,
+            owned,
+            self.credential[0],
+            start=count + 1
+        )
+
+        factory = attribute_factory.AttributeFactory()
+        requests = (
+            ('Locate', build_request(payloads.LocateRequestPayload())),
+            # Cryptographic Parameters are compared against each object
+            # loaded from the database.
+            ('Locate by Cryptographic Parameters', build_request(
+                payloads.LocateRequestPayload(attributes=[
+                    factory.create_attribute(
+                        enums.AttributeType.CRYPTOGRAPHIC_PARAMETERS,
+                        {'block_cipher_mode': enums.BlockCipherMode.CBC}
+                    )
+                ])
+            ))
+        )
+        for name, request in requests:
+            duration, payload = self._time_request(kmip_engine, request)
+            print(
+                "{0} objects: {1} of {2} owned objects: {3:.2f} ms".format(
+                    count + owned,
+                    name,
+                    owned,
+                    duration * 1000
+                )
+            )
+            self.assertEqual(owned, payload.located_items)
+            self.assertEqual(
+                [str(count + owned - x) for x in range(owned)],
+                payload.unique_identifiers
+            )
+
+    def test_locate_100000_objects(self):
+        """
+        Report the Locate latency for the 100 keys of a client among 100,000
+        keys of another client.
+        """
+        self._measure(10 ** 5)
+
+    def test_locate_1000000_objects(self):
+        """
+        Report the Locate latency for the 100 keys of a client among
+        1,000,000 keys of another client.
+        """
+        self._measure(10 ** 6)
@@ -0,0 +1,73 @@
+# Copyright (c) 2020 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import random
+import testtools
+import timeit
+
+from kmip.core import primitives
+from kmip.core import utils
+
+
+class TestBigIntegerPerformance(testtools.TestCase):
+    """
+    Microbenchmarks for the BigInteger codec.
+
+    These tests measure wall-clock time and are therefore kept out of the
+    unit test suite. Run them with 'tox -e performance'.
+    """
+
+    def setUp(self):
+        super(TestBigIntegerPerformance, self).setUp()
+        self.random = random.Random(2048)
+
+    def time_codec(self, bits, number=2000):
+        # Use a value with the top bit set, like an RSA modulus.
+        value = self.random.getrandbits(bits) | (1 << (bits - 1))
+
+        stream = utils.BytearrayStream()
+        primitives.BigInteger(value).write(stream)
+        encoding = stream.buffer
+
+        def encode():
+            primitives.BigInteger(value).write(utils.BytearrayStream())
+
+        def decode():
+            big_integer = primitives.BigInteger()
+            big_integer.read(utils.BytearrayStream(encoding))
+            return big_integer
+
+        self.assertEqual(value, decode().value)
+
+        encode_time = min(timeit.repeat(encode, number=number, repeat=3))
+        decode_time = min(timeit.repeat(decode, number=number, repeat=3))
+        encode_time = (encode_time / number) * 1e6
+        decode_time = (decode_time / number) * 1e6
+        print(
+            "BigInteger {0}-bit: encode {1:.2f} us/op, "
+            "decode {2:.2f} us/op".format(bits, encode_time, decode_time)
+        )
+        return encode_time, decode_time
+
+    def test_big_integer_codec(self):
+        """
+        Test that BigInteger encoding and decoding cost grows at most linearly
+        between 2048- and 4096-bit values.
+        """
+        encode_2048, decode_2048 = self.time_codec(2048)
+        encode_4096, decode_4096 = self.time_codec(4096)
+
+        self.assertLess(encode_4096, encode_2048 * 4)
+        self.assertLess(decode_4096, decode_2048 * 4)
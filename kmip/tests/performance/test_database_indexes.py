@@ -0,0 +1,235 @@
+# Copyright (c) 2020 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import copy
+import os
+import shutil
+import tempfile
+import testtools
+import time
+
+from kmip.core import attributes
+from kmip.core import enums
+from kmip.core import policy
+
+from kmip.core.factories import attributes as attribute_factory
+
+from kmip.core.messages import contents
+from kmip.core.messages import messages
+from kmip.core.messages import payloads
+
+from kmip.pie import objects
+from kmip.pie import sqltypes
+
+from kmip.services.server import engine
+
+
+def build_request(operation, payload):
+    return messages.RequestMessage(
+        request_header=messages.RequestHeader(
+            protocol_version=contents.ProtocolVersion(1, 2),
+            batch_count=contents.BatchCount(1)
+        ),
+        batch_items=[
+            messages.RequestBatchItem(
+                operation=contents.Operation(operation),
+                request_payload=payload
+            )
+        ]
+    )
+
+
+def populate(kmip_engine, count, owner, batch_size=10000, start=1):
+    """
+    Store symmetric keys named 'key-<uid>', bypassing the ORM for speed.
+
+    The keys get the identifiers from start to start + count - 1.
+    """
+    tables = (
+        (objects.ManagedObject.__table__, lambda uid: {
+            'uid': uid,
+            'object_type': enums.ObjectType.SYMMETRIC_KEY,
+            'class_type': 'SymmetricKey',
+            'value': b'\x00' * 16,
+            'name_index': 1,
+            'operation_policy_name': 'default',
+            'sensitive': False,
+            'initial_date': uid,
+            'owner': owner
+        }),
+        (objects.CryptographicObject.__table__, lambda uid: {
+            'uid': uid,
+            'cryptographic_usage_mask': [
+                enums.CryptographicUsageMask.ENCRYPT
+            ],
+            'state': enums.State.ACTIVE
+        }),
+        (objects.Key.__table__, lambda uid: {
+            'uid': uid,
+            'cryptographic_algorithm': enums.CryptographicAlgorithm.AES,
+            'cryptographic_length': 128,
+            'key_format_type': enums.KeyFormatType.RAW
+        }),
+        (objects.SymmetricKey.__table__, lambda uid: {'uid': uid}),
+        (sqltypes.ManagedObjectName.__table__, lambda uid: {
+            'mo_uid': uid,
+            'name': 'key-{0}'.format(uid),
+            'name_index': 0,
+            'name_type': enums.NameType.UNINTERPRETED_TEXT_STRING
+        })
+    )
+
+    with kmip_engine._data_store.begin() as connection:
+        end = start + count
+        for first in range(start, end, batch_size):
+            uids = range(first, min(first + batch_size, end))
+            for table, build_row in tables:
+                # Enumerations without a value are stored as -1, which is
+                # only written for values given explicitly.
+                unset = dict(
+                    (column.name, None) for column in table.columns
+                    if isinstance(column.type, sqltypes.EnumType)
+                )
+                rows = []
+                for uid in uids:
+                    row = dict(unset)
+                    row.update(build_row(uid))
+                    rows.append(row)
+                connection.execute(table.insert(), rows)
+
+
+class TestDatabaseIndexes(testtools.TestCase):
+    """
+    Benchmarks for the lookups of the server data store with and without its
+    indexes.
+
+    Each benchmark fills a database with symmetric keys, then times Locate
+    and GetAttributes requests before and after the indexes are added by the
+    online upgrade of the KmipEngine. Run them with 'tox -e performance'.
+    """
+
+    def setUp(self):
+        super(TestDatabaseIndexes, self).setUp()
+
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+        self.credential = ['Benchmark Client', None]
+        self.policies = copy.deepcopy(policy.policies)
+
+    def _create_engine(self, path):
+        return engine.KmipEngine(
+            policies=self.policies,
+            database_path=path
+        )
+
+    def _time_request(self, kmip_engine, request, repeat=5):
+        durations = []
+        for _ in range(repeat):
+            start = time.time()
+            response, _, _ = kmip_engine.process_request(
+                request,
+                self.credential
+            )
+            durations.append(time.time() - start)
+
+            batch_item = response.batch_items[0]
+            if batch_item.result_status.value != enums.ResultStatus.SUCCESS:
+                raise AssertionError(batch_item.result_message.value)
+        return min(durations)
+
+    def _time_requests(self, kmip_engine, count):
+        factory = attribute_factory.AttributeFactory()
+        uid = str(count // 2)
+        requests = (
+            ('Locate by Name', build_request(
+                enums.Operation.LOCATE,
+                payloads.LocateRequestPayload(attributes=[
+                    factory.create_attribute(
+                        enums.AttributeType.NAME,
+                        attributes.Name.create(
+                            'key-{0}'.format(uid),
+                            enums.NameType.UNINTERPRETED_TEXT_STRING
+                        )
+                    )
+                ])
+            )),
+            ('Locate by Initial Date', build_request(
+                enums.Operation.LOCATE,
+                payloads.LocateRequestPayload(attributes=[
+                    factory.create_attribute(
+                        enums.AttributeType.INITIAL_DATE,
+                        int(uid)
+                    )
+                ])
+            )),
+            ('GetAttributes', build_request(
+                enums.Operation.GET_ATTRIBUTES,
+                payloads.GetAttributesRequestPayload(
+                    unique_identifier=uid,
+                    attribute_names=['Name']
+                )
+            ))
+        )
+        return [
+            (name, self._time_request(kmip_engine, request))
+            for name, request in requests
+        ]
+
+    def _measure(self, count):
+        path = os.path.join(self.directory, '{0}.database'.format(count))
+        kmip_engine = self._create_engine(path)
+
+        # Start from a database created without the indexes.
+        for table in sqltypes.Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.drop(kmip_engine._data_store)
+        populate(kmip_engine, count, self.credential[0])
+        unindexed = self._time_requests(kmip_engine, count)
+
+        start = time.time()
+        kmip_engine = self._create_engine(path)
+        upgrade = time.time() - start
+        indexed = self._time_requests(kmip_engine, count)
+
+        print("{0} objects: online upgrade took {1:.1f} seconds".format(
+            count,
+            upgrade
+        ))
+        for (name, before), (_, after) in zip(unindexed, indexed):
+            print(
+                "{0} objects: {1}: {2:.2f} ms without indexes, {3:.2f} ms "
+                "with indexes".format(
+                    count,
+                    name,
+                    before * 1000,
+                    after * 1000
+                )
+            )
+            self.assertLess(after, before)
+
+    def test_lookups_100000_objects(self):
+        """
+        Report the Locate and GetAttributes latency with 100,000 stored
+        objects.
+        """
+        self._measure(10 ** 5)
+
+    def test_lookups_1000000_objects(self):
+        """
+        Report the Locate and GetAttributes latency with 1,000,000 stored
+        objects.
+        """
+        self._measure(10 ** 6)
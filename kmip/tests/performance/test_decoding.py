@@ -0,0 +1,72 @@
+# Copyright (c) 2020 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import testtools
+import timeit
+
+from kmip.core import utils
+from kmip.core.messages import payloads
+
+
+def build_locate_response_encoding(count):
+    payload = payloads.LocateResponsePayload(
+        located_items=count,
+        unique_identifiers=[str(i) for i in range(count)]
+    )
+    stream = utils.BytearrayStream()
+    payload.write(stream)
+    return stream.buffer
+
+
+def time_locate_response_decoding(encoding, repeat=3):
+    def decode():
+        payload = payloads.LocateResponsePayload()
+        payload.read(utils.BytearrayStream(encoding))
+
+    return min(timeit.repeat(decode, number=1, repeat=repeat))
+
+
+class TestDecodingPerformance(testtools.TestCase):
+    """
+    Benchmarks for decoding large TTLV encodings.
+
+    These tests measure wall-clock time and are therefore kept out of the
+    unit test suite. Run them with 'tox -e performance'.
+    """
+
+    def test_locate_response_decoding_scales_linearly(self):
+        """
+        Test that the time spent decoding a Locate response grows linearly
+        with the number of unique identifiers it contains.
+        """
+        sizes = [1000, 8000, 32000]
+        per_item = []
+        for size in sizes:
+            encoding = build_locate_response_encoding(size)
+            elapsed = time_locate_response_decoding(encoding)
+            per_item.append(elapsed / size)
+            print(
+                "Locate response decode: {0:>6} items, {1:>8} bytes, "
+                "{2:.4f} s, {3:.2f} us/item".format(
+                    size,
+                    len(encoding),
+                    elapsed,
+                    (elapsed / size) * 1e6
+                )
+            )
+
+        # A quadratic decoder would show a 32x jump in per-item cost across
+        # this range; allow generous headroom for timing noise.
+        self.assertLess(per_item[-1], per_item[0] * 3)
@@ -0,0 +1,97 @@
+# Copyright (c) 2020 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import testtools
+import timeit
+
+from kmip.core import enums
+from kmip.core import utils
+from kmip.core.messages import contents
+from kmip.core.messages import messages
+from kmip.core.messages import payloads
+
+
+def build_locate_response_message(count):
+    payload = payloads.LocateResponsePayload(
+        located_items=count,
+        unique_identifiers=[str(i) for i in range(count)]
+    )
+    batch_item = messages.ResponseBatchItem(
+        operation=contents.Operation(enums.Operation.LOCATE),
+        result_status=contents.ResultStatus(enums.ResultStatus.SUCCESS),
+        response_payload=payload
+    )
+    header = messages.ResponseHeader(
+        protocol_version=contents.ProtocolVersion(1, 2),
+        time_stamp=contents.TimeStamp(0),
+        batch_count=contents.BatchCount(1)
+    )
+    return messages.ResponseMessage(
+        response_header=header,
+        batch_items=[batch_item]
+    )
+
+
+def time_encoding(message, repeat=3, number=1):
+    def encode():
+        message.write(utils.BytearrayStream())
+
+    return min(timeit.repeat(encode, number=number, repeat=repeat)) / number
+
+
+class TestEncodingPerformance(testtools.TestCase):
+    """
+    Benchmarks for encoding large TTLV messages.
+
+    These tests measure wall-clock time and are therefore kept out of the
+    unit test suite. Run them with 'tox -e performance'.
+    """
+
+    def test_locate_response_encoding_scales_linearly(self):
+        """
+        Test that the time spent encoding a Locate response message grows
+        linearly with the number of unique identifiers it contains.
+        """
+        sizes = [1000, 8000, 32000]
+        per_item = []
+        for size in sizes:
+            message = build_locate_response_message(size)
+            elapsed = time_encoding(message)
+            per_item.append(elapsed / size)
+            print(
+                "Locate response encode: {0:>6} items, {1:.4f} s, "
+                "{2:.2f} us/item".format(
+                    size,
+                    elapsed,
+                    (elapsed / size) * 1e6
+                )
+            )
+
+        self.assertLess(per_item[-1], per_item[0] * 3)
+
+    def test_locate_response_encoding_1000_items(self):
+        """
+        Benchmark encoding a Locate response message with 1000 unique
+        identifiers, the common case dominated by per-item header encoding.
+        """
+        message = build_locate_response_message(1000)
+        elapsed = time_encoding(message, repeat=7, number=10)
+        print(
+            "Locate response encode: 1000 items, {0:.3f} ms".format(
+                elapsed * 1e3
+            )
+        )
+
+        self.assertLess(elapsed, 0.5)
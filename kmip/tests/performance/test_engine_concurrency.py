@@ -0,0 +1,199 @@
+# Copyright (c) 2020 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import copy
+import os
+import shutil
+import tempfile
+import testtools
+import threading
+import time
+
+from kmip.core import enums
+from kmip.core import objects
+from kmip.core import policy
+
+from kmip.core.factories import attributes
+
+from kmip.core.messages import contents
+from kmip.core.messages import messages
+from kmip.core.messages import payloads
+
+from kmip.services.server import engine
+
+
+class SerializedKmipEngine(engine.KmipEngine):
+    """
+    A KmipEngine processing one request at a time, as it did when all
+    requests shared a single engine lock.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(SerializedKmipEngine, self).__init__(*args, **kwargs)
+        self._serial_lock = threading.RLock()
+
+    def process_request(self, *args, **kwargs):
+        with self._serial_lock:
+            return super(SerializedKmipEngine, self).process_request(
+                *args,
+                **kwargs
+            )
+
+
+def build_request(operation, payload):
+    return messages.RequestMessage(
+        request_header=messages.RequestHeader(
+            protocol_version=contents.ProtocolVersion(1, 2),
+            batch_count=contents.BatchCount(1)
+        ),
+        batch_items=[
+            messages.RequestBatchItem(
+                operation=contents.Operation(operation),
+                request_payload=payload
+            )
+        ]
+    )
+
+
+def build_create_request():
+    factory = attributes.AttributeFactory()
+    template_attribute = objects.TemplateAttribute(
+        attributes=[
+            factory.create_attribute(
+                enums.AttributeType.CRYPTOGRAPHIC_ALGORITHM,
+                enums.CryptographicAlgorithm.AES
+            ),
+            factory.create_attribute(
+                enums.AttributeType.CRYPTOGRAPHIC_LENGTH,
+                256
+            ),
+            factory.create_attribute(
+                enums.AttributeType.CRYPTOGRAPHIC_USAGE_MASK,
+                [
+                    enums.CryptographicUsageMask.ENCRYPT,
+                    enums.CryptographicUsageMask.DECRYPT
+                ]
+            )
+        ]
+    )
+    return build_request(
+        enums.Operation.CREATE,
+        payloads.CreateRequestPayload(
+            enums.ObjectType.SYMMETRIC_KEY,
+            template_attribute
+        )
+    )
+
+
+def process(kmip_engine, request, credential):
+    response, _, _ = kmip_engine.process_request(request, credential)
+    batch_item = response.batch_items[0]
+    if batch_item.result_status.value != enums.ResultStatus.SUCCESS:
+        raise AssertionError(batch_item.result_message.value)
+    return batch_item.response_payload
+
+
+class TestEngineConcurrency(testtools.TestCase):
+    """
+    Benchmarks for the throughput of the KmipEngine used by several threads.
+
+    Each benchmark drives an engine directly, without any network traffic,
+    with reader threads issuing Get requests while writer threads issue
+    Create requests. Run them with 'tox -e performance'.
+    """
+
+    def setUp(self):
+        super(TestEngineConcurrency, self).setUp()
+
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+        self.credential = ['Benchmark Client', None]
+
+    def _measure_throughput(self, engine_class, readers=4, writers=2,
+                            duration=5):
+        kmip_engine = engine_class(
+            policies=copy.deepcopy(policy.policies),
+            database_path=os.path.join(
+                self.directory,
+                '{0}.database'.format(engine_class.__name__)
+            )
+        )
+        uid = process(
+            kmip_engine,
+            build_create_request(),
+            self.credential
+        ).unique_identifier
+        get_request = build_request(
+            enums.Operation.GET,
+            payloads.GetRequestPayload(unique_identifier=uid)
+        )
+
+        counts = {'reads': 0, 'writes': 0}
+        lock = threading.Lock()
+        deadline = time.time() + duration
+
+        def run(request, key):
+            count = 0
+            while time.time() < deadline:
+                process(kmip_engine, request, self.credential)
+                count += 1
+            with lock:
+                counts[key] += count
+
+        threads = [
+            threading.Thread(target=run, args=(get_request, 'reads'))
+            for _ in range(readers)
+        ] + [
+            threading.Thread(
+                target=run,
+                args=(build_create_request(), 'writes')
+            ) for _ in range(writers)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        return (
+            float(counts['reads']) / duration,
+            float(counts['writes']) / duration
+        )
+
+    def test_mixed_throughput(self):
+        """
+        Report the Get and Create request throughput of an engine processing
+        requests concurrently, compared to one processing a request at a
+        time.
+
+        Get requests no longer wait for Create requests to commit, so their
+        throughput improves. The total throughput is bounded by the
+        interpreter lock, since most of the processing is Python code.
+        """
+        throughput = {}
+        for engine_class in (SerializedKmipEngine, engine.KmipEngine):
+            throughput[engine_class] = self._measure_throughput(engine_class)
+            print(
+                "{0}: {1:.1f} Get requests/second, {2:.1f} Create "
+                "requests/second".format(
+                    engine_class.__name__,
+                    *throughput[engine_class]
+                )
+            )
+
+        self.assertGreater(
+            throughput[engine.KmipEngine][0],
+            throughput[SerializedKmipEngine][0]
+        )
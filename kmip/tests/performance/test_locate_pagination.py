@@ -0,0 +1,135 @@
+# Copyright (c) 2020 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import copy
+import os
+import shutil
+import tempfile
+import testtools
+import time
+
+from kmip.core import enums
+from kmip.core import policy
+
+from kmip.core.messages import contents
+from kmip.core.messages import messages
+from kmip.core.messages import payloads
+
+from kmip.services.server import engine
+
+from kmip.tests.performance import test_database_indexes
+
+
+def build_request(payload):
+    return messages.RequestMessage(
+        request_header=messages.RequestHeader(
+            protocol_version=contents.ProtocolVersion(1, 3),
+            batch_count=contents.BatchCount(1)
+        ),
+        batch_items=[
+            messages.RequestBatchItem(
+                operation=contents.Operation(enums.Operation.LOCATE),
+                request_payload=payload
+            )
+        ]
+    )
+
+
+class TestLocatePagination(testtools.TestCase):
+    """
+    Benchmarks for paging through the Locate results of a large data store.
+
+    Each benchmark fills a database with symmetric keys, then times Locate
+    requests for the first and the last page of the matching objects. Run
+    them with 'tox -e performance'.
+    """
+
+    def setUp(self):
+        super(TestLocatePagination, self).setUp()
+
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+        self.credential = ['Benchmark Client', None]
+
+    def _time_page(self, kmip_engine, offset, page_size, repeat=5):
+        request = build_request(
+            payloads.LocateRequestPayload(
+                offset_items=offset,
+                maximum_items=page_size
+            )
+        )
+        durations = []
+        for _ in range(repeat):
+            start = time.time()
+            response, _, _ = kmip_engine.process_request(
+                request,
+                self.credential
+            )
+            durations.append(time.time() - start)
+
+            batch_item = response.batch_items[0]
+            if batch_item.result_status.value != enums.ResultStatus.SUCCESS:
+                raise AssertionError(batch_item.result_message.value)
+        return min(durations), batch_item.response_payload
+
+    def _measure(self, count, page_size=100):
+        kmip_engine = engine.KmipEngine(
+            policies=copy.deepcopy(policy.policies),
+            database_path=os.path.join(
+                self.directory,
+                '{0}.database'.format(count)
+            )
+        )
+        test_database_indexes.populate(
+            kmip_engine,
+            count,
+            self.credential[0]
+        )
+
+        for name, offset in (
+            ('first page', 0),
+            ('last page', count - page_size)
+        ):
+            duration, payload = self._time_page(
+                kmip_engine,
+                offset,
+                page_size
+            )
+            print(
+                "{0} objects: Locate {1} of {2} objects: {3:.2f} ms".format(
+                    count,
+                    name,
+                    page_size,
+                    duration * 1000
+                )
+            )
+            self.assertEqual(count, payload.located_items)
+            self.assertEqual(
+                [str(count - x) for x in range(offset, offset + page_size)],
+                payload.unique_identifiers
+            )
+
+    def test_pages_100000_objects(self):
+        """
+        Report the Locate latency for a page of 100 of 100,000 objects.
+        """
+        self._measure(10 ** 5)
+
+    def test_pages_1000000_objects(self):
+        """
+        Report the Locate latency for a page of 100 of 1,000,000 objects.
+        """
+        self._measure(10 ** 6)
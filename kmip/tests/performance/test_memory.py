@@ -0,0 +1,115 @@
+# Copyright (c) 2020 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import gc
+import testtools
+import tracemalloc
+
+from kmip.core import enums
+from kmip.core import objects
+from kmip.core import primitives
+from kmip.core import utils
+from kmip.core.messages import payloads
+
+
+def build_get_attributes_response_encoding(count):
+    attributes = [
+        objects.Attribute(
+            attribute_name=objects.Attribute.AttributeName('Initial Date'),
+            attribute_value=primitives.DateTime(
+                i,
+                tag=enums.Tags.ATTRIBUTE_VALUE
+            )
+        ) for i in range(count)
+    ]
+    payload = payloads.GetAttributesResponsePayload(
+        unique_identifier='1',
+        attributes=attributes
+    )
+    stream = utils.BytearrayStream()
+    payload.write(stream)
+    return stream.buffer
+
+
+def build_locate_response_encoding(count):
+    payload = payloads.LocateResponsePayload(
+        located_items=count,
+        unique_identifiers=[str(i) for i in range(count)]
+    )
+    stream = utils.BytearrayStream()
+    payload.write(stream)
+    return stream.buffer
+
+
+def measure_decoded_size(payload_class, encoding):
+    """
+    Return the number of bytes still allocated by a decoded payload.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        payload = payload_class()
+        payload.read(utils.BytearrayStream(encoding))
+        gc.collect()
+        end = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+    # Keep the payload alive until the allocation has been measured.
+    del payload
+    return end - start
+
+
+class TestMemoryUsage(testtools.TestCase):
+    """
+    Benchmarks for the memory used by decoded TTLV messages.
+
+    Run them with 'tox -e performance'.
+    """
+
+    def test_get_attributes_response_memory(self):
+        """
+        Report the bytes allocated per attribute of a decoded GetAttributes
+        response.
+        """
+        count = 1000
+        size = measure_decoded_size(
+            payloads.GetAttributesResponsePayload,
+            build_get_attributes_response_encoding(count)
+        )
+        print(
+            "GetAttributes response decode: {0} attributes, {1:.1f} "
+            "bytes/attribute".format(count, float(size) / count)
+        )
+
+        self.assertLess(size / count, 475)
+
+    def test_locate_response_memory(self):
+        """
+        Report the bytes allocated per unique identifier of a decoded Locate
+        response.
+        """
+        count = 1000
+        size = measure_decoded_size(
+            payloads.LocateResponsePayload,
+            build_locate_response_encoding(count)
+        )
+        print(
+            "Locate response decode: {0} unique identifiers, {1:.1f} "
+            "bytes/identifier".format(count, float(size) / count)
+        )
+
+        self.assertLess(size / count, 155)
@@ -0,0 +1,236 @@
+# Copyright (c) 2020 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+from cryptography import x509
+from cryptography.hazmat import backends
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+import datetime
+import multiprocessing
+import os
+import shutil
+import signal
+import socket
+import tempfile
+import testtools
+import time
+
+from kmip.core import enums
+from kmip.pie import client
+from kmip.services.server import server
+
+
+def create_certificate(path, subject_name, signing_key=None, issuer=None,
+                       client_auth=False):
+    key = rsa.generate_private_key(
+        public_exponent=65537,
+        key_size=2048,
+        backend=backends.default_backend()
+    )
+    subject = x509.Name([
+        x509.NameAttribute(x509.NameOID.COMMON_NAME, subject_name)
+    ])
+    builder = x509.CertificateBuilder().subject_name(
+        subject
+    ).issuer_name(
+        issuer or subject
+    ).public_key(
+        key.public_key()
+    ).serial_number(
+        x509.random_serial_number()
+    ).not_valid_before(
+        datetime.datetime.utcnow() - datetime.timedelta(days=1)
+    ).not_valid_after(
+        datetime.datetime.utcnow() + datetime.timedelta(days=1)
+    )
+    if issuer is None:
+        builder = builder.add_extension(
+            x509.BasicConstraints(ca=True, path_length=None),
+            critical=True
+        )
+    if client_auth:
+        builder = builder.add_extension(
+            x509.ExtendedKeyUsage([x509.ExtendedKeyUsageOID.CLIENT_AUTH]),
+            critical=True
+        )
+    certificate = builder.sign(
+        signing_key or key,
+        hashes.SHA256(),
+        backends.default_backend()
+    )
+
+    with open(path + '.crt', 'wb') as f:
+        f.write(certificate.public_bytes(serialization.Encoding.PEM))
+    with open(path + '.key', 'wb') as f:
+        f.write(key.private_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PrivateFormat.PKCS8,
+            encryption_algorithm=serialization.NoEncryption()
+        ))
+    return key, certificate
+
+
+def get_free_port():
+    s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    s.bind(('127.0.0.1', 0))
+    port = s.getsockname()[1]
+    s.close()
+    return port
+
+
+def run_server(directory, port, worker_processes):
+    s = server.KmipServer(
+        hostname='127.0.0.1',
+        port=port,
+        certificate_path=os.path.join(directory, 'server.crt'),
+        key_path=os.path.join(directory, 'server.key'),
+        ca_path=os.path.join(directory, 'ca.crt'),
+        auth_suite='TLS1.2',
+        config_path=None,
+        log_path=os.path.join(directory, 'server.log'),
+        database_path=os.path.join(directory, 'server.db'),
+        logging_level='WARNING',
+        worker_processes=worker_processes
+    )
+    with s:
+        s.serve()
+
+
+def create_client(directory, port):
+    return client.ProxyKmipClient(
+        hostname='127.0.0.1',
+        port=port,
+        cert=os.path.join(directory, 'client.crt'),
+        key=os.path.join(directory, 'client.key'),
+        ca=os.path.join(directory, 'ca.crt'),
+        config_file=os.path.join(directory, 'client.conf')
+    )
+
+
+def run_client(directory, port, uid, deadline, results):
+    count = 0
+    with create_client(directory, port) as c:
+        while time.time() < deadline:
+            c.get(uid)
+            count += 1
+    results.put(count)
+
+
+class TestServerWorkerScaling(testtools.TestCase):
+    """
+    Benchmarks for the throughput of the server with multiple worker
+    processes.
+
+    Each benchmark starts a local server and drives it with several client
+    processes issuing Get requests. Run them with 'tox -e performance'.
+    """
+
+    def setUp(self):
+        super(TestServerWorkerScaling, self).setUp()
+
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+        ca_key, ca_certificate = create_certificate(
+            os.path.join(self.directory, 'ca'),
+            u"Root CA"
+        )
+        create_certificate(
+            os.path.join(self.directory, 'server'),
+            u"127.0.0.1",
+            signing_key=ca_key,
+            issuer=ca_certificate.subject
+        )
+        create_certificate(
+            os.path.join(self.directory, 'client'),
+            u"Benchmark Client",
+            signing_key=ca_key,
+            issuer=ca_certificate.subject,
+            client_auth=True
+        )
+        with open(os.path.join(self.directory, 'client.conf'), 'w') as f:
+            f.write("[client]\n")
+
+        self.context = multiprocessing.get_context('fork')
+
+    def _start_server(self, worker_processes):
+        port = get_free_port()
+        process = self.context.Process(
+            target=run_server,
+            args=(self.directory, port, worker_processes)
+        )
+        process.start()
+        self.addCleanup(self._stop_server, process)
+
+        for _ in range(100):
+            try:
+                socket.create_connection(('127.0.0.1', port), 1).close()
+                break
+            except socket.error:
+                time.sleep(0.1)
+        return port
+
+    def _stop_server(self, process):
+        if process.is_alive():
+            os.kill(process.pid, signal.SIGINT)
+        process.join(30)
+        if process.is_alive():
+            process.kill()
+            process.join()
+
+    def _measure_throughput(self, worker_processes, clients=8, duration=5):
+        port = self._start_server(worker_processes)
+        with create_client(self.directory, port) as c:
+            uid = c.create(enums.CryptographicAlgorithm.AES, 256)
+
+        results = self.context.Queue()
+        deadline = time.time() + duration
+        processes = [
+            self.context.Process(
+                target=run_client,
+                args=(self.directory, port, uid, deadline, results)
+            ) for _ in range(clients)
+        ]
+        for process in processes:
+            process.start()
+        total = sum(results.get(timeout=duration + 60) for _ in processes)
+        for process in processes:
+            process.join()
+
+        return float(total) / duration
+
+    def test_get_throughput(self):
+        """
+        Report the Get request throughput for an increasing number of worker
+        processes.
+        """
+        throughput = {}
+        for worker_processes in (1, 2, 4):
+            throughput[worker_processes] = self._measure_throughput(
+                worker_processes
+            )
+            print(
+                "Get throughput: {0} worker process(es), {1:.1f} "
+                "requests/second".format(
+                    worker_processes,
+                    throughput[worker_processes]
+                )
+            )
+
+        # Scaling can only be observed with more than one core available.
+        if (os.cpu_count() or 1) >= 2:
+            self.assertGreater(throughput[2], throughput[1] * 1.2)
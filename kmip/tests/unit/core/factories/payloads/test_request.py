@@ -163,13 +163,12 @@ class TestRequestPayloadFactory(testtools.TestCase):
         self._test_payload_type(payload, payloads.QueryRequestPayload)
 
     def test_create_cancel_payload(self):
-        self._test_not_implemented(
-            self.factory.create,
-            enums.Operation.CANCEL
-        )
+        payload = self.factory.create(enums.Operation.CANCEL)
+        self._test_payload_type(payload, payloads.CancelRequestPayload)
 
     def test_create_poll_payload(self):
-        self._test_not_implemented(self.factory.create, enums.Operation.POLL)
+        payload = self.factory.create(enums.Operation.POLL)
+        self._test_payload_type(payload, payloads.PollRequestPayload)
 
     def test_create_notify_payload(self):
         self._test_not_implemented(
@@ -161,10 +161,8 @@ class TestResponsePayloadFactory(testtools.TestCase):
         self._test_payload_type(payload, payloads.QueryResponsePayload)
 
     def test_create_cancel_payload(self):
-        self._test_not_implemented(
-            self.factory.create,
-            enums.Operation.CANCEL
-        )
+        payload = self.factory.create(enums.Operation.CANCEL)
+        self._test_payload_type(payload, payloads.CancelResponsePayload)
 
     def test_create_poll_payload(self):
         self._test_not_implemented(self.factory.create, enums.Operation.POLL)
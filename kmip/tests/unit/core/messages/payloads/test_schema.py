@@ -0,0 +1,231 @@
+# Copyright (c) 2020 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import testtools
+
+from kmip.core import enums
+from kmip.core import exceptions
+from kmip.core import primitives
+from kmip.core import utils
+
+from kmip.core.messages.payloads import base
+from kmip.core.messages.payloads import schema
+
+
+class ExamplePayload(base.RequestPayload):
+
+    _schema = schema.Schema(
+        schema.Field(
+            'object_type',
+            enums.Tags.OBJECT_TYPE,
+            primitives.Enumeration,
+            enum=enums.ObjectType,
+            cardinality=schema.REQUIRED,
+            missing_on_write=(ValueError, "missing object type")
+        ),
+        schema.Field(
+            'unique_identifiers',
+            enums.Tags.UNIQUE_IDENTIFIER,
+            primitives.TextString,
+            cardinality=schema.MULTIPLE
+        ),
+        schema.Field(
+            'offset_items',
+            enums.Tags.OFFSET_ITEMS,
+            primitives.Integer,
+            min_version=enums.KMIPVersion.KMIP_1_4
+        )
+    )
+
+    def __init__(self):
+        super(ExamplePayload, self).__init__()
+        self._object_type = None
+        self._unique_identifiers = []
+        self._offset_items = None
+
+    def read(self, input_buffer, kmip_version=enums.KMIPVersion.KMIP_1_0):
+        super(ExamplePayload, self).read(
+            input_buffer,
+            kmip_version=kmip_version
+        )
+        local_buffer = utils.BytearrayStream(input_buffer.read(self.length))
+        self._schema.read(self, local_buffer, kmip_version)
+
+    def write(self, output_buffer, kmip_version=enums.KMIPVersion.KMIP_1_0):
+        with self.write_structure(output_buffer, kmip_version=kmip_version):
+            self._schema.write(self, output_buffer, kmip_version)
+
+
+class TestSchema(testtools.TestCase):
+    """
+    A test suite for the declarative payload field schemas.
+    """
+
+    def setUp(self):
+        super(TestSchema, self).setUp()
+
+        self.object_type = primitives.Enumeration(
+            enums.ObjectType,
+            value=enums.ObjectType.SYMMETRIC_KEY,
+            tag=enums.Tags.OBJECT_TYPE
+        )
+        self.unique_identifiers = [
+            primitives.TextString(
+                value=str(i),
+                tag=enums.Tags.UNIQUE_IDENTIFIER
+            ) for i in range(3)
+        ]
+        self.offset_items = primitives.Integer(
+            value=2,
+            tag=enums.Tags.OFFSET_ITEMS
+        )
+
+    def _encode(self, *fields):
+        local_buffer = utils.BytearrayStream()
+        for field in fields:
+            field.write(local_buffer)
+        payload = primitives.Struct(enums.Tags.REQUEST_PAYLOAD)
+        payload.length = len(local_buffer)
+        buffer = utils.BytearrayStream()
+        payload.write(buffer)
+        buffer.write(local_buffer.buffer)
+        return buffer
+
+    def test_read(self):
+        """
+        Test that all fields, including repeated ones, can be read.
+        """
+        payload = ExamplePayload()
+        payload.read(
+            self._encode(
+                self.object_type,
+                *(self.unique_identifiers + [self.offset_items])
+            ),
+            kmip_version=enums.KMIPVersion.KMIP_1_4
+        )
+
+        self.assertEqual(self.object_type, payload._object_type)
+        self.assertEqual(self.unique_identifiers, payload._unique_identifiers)
+        self.assertEqual(self.offset_items, payload._offset_items)
+
+    def test_read_optional_fields_missing(self):
+        """
+        Test that optional and repeated fields can be omitted.
+        """
+        payload = ExamplePayload()
+        payload._unique_identifiers = list(self.unique_identifiers)
+        payload.read(self._encode(self.object_type))
+
+        self.assertEqual(self.object_type, payload._object_type)
+        self.assertEqual([], payload._unique_identifiers)
+        self.assertIsNone(payload._offset_items)
+
+    def test_read_missing_required_field(self):
+        """
+        Test that an InvalidKmipEncoding error is raised by default when a
+        required field is missing from the encoding.
+        """
+        payload = ExamplePayload()
+        args = (self._encode(*self.unique_identifiers), )
+        self.assertRaisesRegex(
+            exceptions.InvalidKmipEncoding,
+            "The payload encoding is missing the object_type field.",
+            payload.read,
+            *args
+        )
+
+    def test_read_unsupported_version(self):
+        """
+        Test that a field is not decoded for a KMIP version that does not
+        include it.
+        """
+        payload = ExamplePayload()
+        args = (self._encode(self.object_type, self.offset_items), )
+        kwargs = {'kmip_version': enums.KMIPVersion.KMIP_1_0}
+        self.assertRaises(
+            exceptions.StreamNotEmptyError,
+            payload.read,
+            *args,
+            **kwargs
+        )
+
+    def test_read_out_of_order(self):
+        """
+        Test that a field encoded out of order is rejected.
+        """
+        payload = ExamplePayload()
+        args = (
+            self._encode(
+                self.object_type,
+                self.offset_items,
+                self.unique_identifiers[0]
+            ),
+        )
+        kwargs = {'kmip_version': enums.KMIPVersion.KMIP_1_4}
+        self.assertRaises(
+            exceptions.StreamNotEmptyError,
+            payload.read,
+            *args,
+            **kwargs
+        )
+
+    def test_write(self):
+        """
+        Test that the payload fields are written in schema order.
+        """
+        payload = ExamplePayload()
+        payload._object_type = self.object_type
+        payload._unique_identifiers = self.unique_identifiers
+        payload._offset_items = self.offset_items
+
+        buffer = utils.BytearrayStream()
+        payload.write(buffer, kmip_version=enums.KMIPVersion.KMIP_1_4)
+
+        self.assertEqual(
+            self._encode(
+                self.object_type,
+                *(self.unique_identifiers + [self.offset_items])
+            ),
+            buffer
+        )
+
+    def test_write_unsupported_version(self):
+        """
+        Test that a field is not encoded for a KMIP version that does not
+        include it.
+        """
+        payload = ExamplePayload()
+        payload._object_type = self.object_type
+        payload._offset_items = self.offset_items
+
+        buffer = utils.BytearrayStream()
+        payload.write(buffer, kmip_version=enums.KMIPVersion.KMIP_1_0)
+
+        self.assertEqual(self._encode(self.object_type), buffer)
+
+    def test_write_missing_field(self):
+        """
+        Test that the configured error is raised when a field is missing from
+        the payload being written, and that nothing is written.
+        """
+        payload = ExamplePayload()
+        buffer = utils.BytearrayStream()
+        self.assertRaisesRegex(
+            ValueError,
+            "missing object type",
+            payload.write,
+            buffer
+        )
+        self.assertEqual(0, len(buffer))
@@ -16,6 +16,7 @@
 import testtools
 from testtools import TestCase
 import binascii
+import mock
 import six
 
 from kmip.core.factories.secrets import SecretFactory
@@ -123,6 +124,77 @@ class TestRequestBatchItem(testtools.TestCase):
         )
         self.assertTrue(request_batch_item.ephemeral)
 
+    def test_read_lazy(self):
+        """
+        Test that a RequestBatchItem structure read lazily only decodes its
+        request payload when the payload is first accessed.
+        """
+        request_batch_item = messages.RequestBatchItem()
+        request_batch_item.read(
+            self.encoding_kmip_2_0,
+            kmip_version=enums.KMIPVersion.KMIP_2_0,
+            lazy=True
+        )
+
+        self.assertEqual(0, len(self.encoding_kmip_2_0))
+        self.assertEqual(
+            enums.Operation.DESTROY,
+            request_batch_item.operation.value
+        )
+        self.assertTrue(request_batch_item.ephemeral)
+        self.assertFalse(request_batch_item.is_payload_decoded)
+
+        request_payload = request_batch_item.request_payload
+
+        self.assertTrue(request_batch_item.is_payload_decoded)
+        self.assertIsInstance(request_payload, payloads.DestroyRequestPayload)
+        self.assertEqual(
+            "fb4b5b9c-6188-4c63-8142-fe9c328129fc",
+            request_payload.unique_identifier.value
+        )
+        self.assertIs(request_payload, request_batch_item.request_payload)
+
+    def test_read_lazy_invalid_payload(self):
+        """
+        Test that an InvalidMessage error is raised when the request payload
+        of a lazily read RequestBatchItem cannot be decoded.
+        """
+        # The length of the Unique Identifier in the payload is corrupted.
+        encoding = utils.BytearrayStream(
+            b'\x42\x00\x0F\x01\x00\x00\x00\x48'
+            b'\x42\x00\x5C\x05\x00\x00\x00\x04\x00\x00\x00\x14\x00\x00\x00\x00'
+            b'\x42\x00\x79\x01\x00\x00\x00\x30'
+            b'\x42\x00\x94\x07\x00\x00\x00\x44'
+            b'\x66\x62\x34\x62\x35\x62\x39\x63\x2D\x36\x31\x38\x38\x2D\x34\x63'
+            b'\x36\x33\x2D\x38\x31\x34\x32\x2D\x66\x65\x39\x63\x33\x32\x38\x31'
+            b'\x32\x39\x66\x63\x00\x00\x00\x00'
+        )
+
+        request_batch_item = messages.RequestBatchItem()
+        request_batch_item.read(encoding, lazy=True)
+
+        self.assertEqual(
+            enums.Operation.DESTROY,
+            request_batch_item.operation.value
+        )
+        # Every access fails, not only the one decoding the payload.
+        for _ in range(2):
+            self.assertRaisesRegex(
+                exceptions.InvalidMessage,
+                "Error parsing the request payload",
+                getattr,
+                request_batch_item,
+                "request_payload"
+            )
+            self.assertFalse(request_batch_item.is_payload_decoded)
+
+        request_batch_item.request_payload = payloads.DestroyRequestPayload()
+        self.assertIsInstance(
+            request_batch_item.request_payload,
+            payloads.DestroyRequestPayload
+        )
+        self.assertTrue(request_batch_item.is_payload_decoded)
+
     def test_write_kmip_2_0(self):
         """
         Test that a RequestBatchItem structure can be written to a data
@@ -700,6 +772,27 @@ class TestRequestMessage(TestCase):
             request_payload.unique_identifier
         )
 
+    def test_get_request_read_lazy(self):
+        self.stream = BytearrayStream(self.get)
+
+        request_message = messages.RequestMessage()
+        request_message.read(self.stream, lazy=True)
+
+        self.assertEqual(0, len(self.stream))
+        self.assertEqual(1, request_message.request_header.batch_count.value)
+        self.assertEqual(1, len(request_message.batch_items))
+
+        batch_item = request_message.batch_items[0]
+        self.assertEqual(enums.Operation.GET, batch_item.operation.value)
+        self.assertFalse(batch_item.is_payload_decoded)
+
+        request_payload = batch_item.request_payload
+        self.assertIsInstance(request_payload, payloads.GetRequestPayload)
+        self.assertEqual(
+            '49a1ca88-6bea-4fb2-b450-7e58802c3038',
+            request_payload.unique_identifier
+        )
+
     def test_get_request_write(self):
         prot_ver = contents.ProtocolVersion(1, 1)
 
@@ -2004,6 +2097,57 @@ class TestResponseMessage(TestCase):
         msg = "Bad response message write: encoding mismatch"
         self.assertEqual(self.destroy, result, msg)
 
+    def test_destroy_response_write_cached_payload(self):
+        prot_ver = contents.ProtocolVersion(1, 1)
+        time_stamp = contents.TimeStamp(0x4f9a54e5)
+        batch_count = contents.BatchCount(1)
+        resp_hdr = messages.ResponseHeader(protocol_version=prot_ver,
+                                           time_stamp=time_stamp,
+                                           batch_count=batch_count)
+
+        operation = contents.Operation(enums.Operation.DESTROY)
+        result_status = contents.ResultStatus(enums.ResultStatus.SUCCESS)
+
+        uuid = attr.UniqueIdentifier('fb4b5b9c-6188-4c63-8142-fe9c328129fc')
+        resp_pl = payloads.DestroyResponsePayload(unique_identifier=uuid)
+        resp_pl.cache_encoding()
+
+        # The cached encoding is used in place of the payload fields.
+        resp_pl.unique_identifier = attr.UniqueIdentifier('invalid')
+        resp_pl.write = mock.MagicMock()
+
+        batch_item = messages.ResponseBatchItem(operation=operation,
+                                                result_status=result_status,
+                                                response_payload=resp_pl)
+        response_message = messages.ResponseMessage(response_header=resp_hdr,
+                                                    batch_items=[batch_item])
+        response_message.write(self.stream)
+
+        resp_pl.write.assert_not_called()
+        self.assertEqual(self.destroy, self.stream.read())
+
+    def test_response_write_cached_payload_other_version(self):
+        uuid = attr.UniqueIdentifier('fb4b5b9c-6188-4c63-8142-fe9c328129fc')
+        resp_pl = payloads.DestroyResponsePayload(unique_identifier=uuid)
+        resp_pl.cache_encoding(kmip_version=enums.KMIPVersion.KMIP_2_0)
+
+        self.assertIsNone(resp_pl.get_cached_encoding())
+
+        resp_pl.unique_identifier = attr.UniqueIdentifier('1')
+        batch_item = messages.ResponseBatchItem(
+            operation=contents.Operation(enums.Operation.DESTROY),
+            result_status=contents.ResultStatus(enums.ResultStatus.SUCCESS),
+            response_payload=resp_pl
+        )
+        batch_item.write(self.stream)
+
+        result = messages.ResponseBatchItem()
+        result.read(self.stream)
+        self.assertEqual(
+            '1',
+            result.response_payload.unique_identifier.value
+        )
+
     def test_register_response_read(self):
         self.stream = BytearrayStream(self.register)
 
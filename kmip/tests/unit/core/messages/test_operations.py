@@ -12,3 +12,273 @@
 # WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
 # License for the specific language governing permissions and limitations
 # under the License.
+
+import enum
+import testtools
+
+from kmip.core import enums
+from kmip.core.factories.payloads.request import RequestPayloadFactory
+from kmip.core.factories.payloads.response import ResponsePayloadFactory
+from kmip.core.messages import operations
+from kmip.core.messages import contents
+from kmip.core.messages import payloads
+
+from kmip.core import utils
+
+
+class ExtensionOperation(enum.Enum):
+    ARCHIVE_ALL = 0x80000001
+    CREATE_ALL = 0x00000001
+
+
+class TestOperations(testtools.TestCase):
+    """
+    A test suite for the operation registry.
+    """
+
+    def setUp(self):
+        super(TestOperations, self).setUp()
+        self.addCleanup(
+            operations.unregister_operation,
+            enums.Operation.ARCHIVE
+        )
+        self.addCleanup(
+            operations.unregister_operation,
+            ExtensionOperation.ARCHIVE_ALL
+        )
+
+    def test_builtin_operations(self):
+        """
+        Test that the built-in operations are registered at import time.
+        """
+        entry = operations.get_operation(enums.Operation.ENCRYPT)
+
+        self.assertEqual(enums.Operation.ENCRYPT, entry.operation)
+        self.assertEqual(payloads.EncryptRequestPayload, entry.request_payload)
+        self.assertEqual(
+            payloads.EncryptResponsePayload,
+            entry.response_payload
+        )
+        self.assertEqual('_process_encrypt', entry.handler)
+        self.assertEqual(enums.KMIPVersion.KMIP_1_2, entry.min_version)
+
+        entry = operations.get_operation(enums.Operation.CHECK)
+        self.assertEqual(payloads.CheckRequestPayload, entry.request_payload)
+        self.assertIsNone(entry.handler)
+
+        self.assertIsNone(operations.get_operation(enums.Operation.ARCHIVE))
+        self.assertIsNone(operations.get_operation(None))
+
+    def test_register_operation(self):
+        """
+        Test that a registered operation is used by the payload factories.
+        """
+        entry = operations.register_operation(
+            enums.Operation.ARCHIVE,
+            request_payload=payloads.PollRequestPayload,
+            handler='_process_archive',
+            min_version=enums.KMIPVersion.KMIP_1_1
+        )
+
+        self.assertEqual(
+            entry,
+            operations.get_operation(enums.Operation.ARCHIVE)
+        )
+        self.assertIsInstance(
+            RequestPayloadFactory().create(enums.Operation.ARCHIVE),
+            payloads.PollRequestPayload
+        )
+        self.assertRaises(
+            NotImplementedError,
+            ResponsePayloadFactory().create,
+            enums.Operation.ARCHIVE
+        )
+
+    def test_register_operation_duplicate(self):
+        """
+        Test that a ValueError is raised when registering an operation twice,
+        unless the existing registration is replaced.
+        """
+        operations.register_operation(enums.Operation.ARCHIVE)
+        args = (enums.Operation.ARCHIVE, )
+        self.assertRaisesRegex(
+            ValueError,
+            "The ARCHIVE operation is already registered.",
+            operations.register_operation,
+            *args
+        )
+
+        entry = operations.register_operation(
+            enums.Operation.ARCHIVE,
+            request_payload=payloads.PollRequestPayload,
+            replace=True
+        )
+        self.assertEqual(
+            entry,
+            operations.get_operation(enums.Operation.ARCHIVE)
+        )
+
+    def test_register_operation_invalid_operation(self):
+        """
+        Test that a TypeError is raised when registering an invalid
+        operation.
+        """
+        for operation in ('Archive', None, True):
+            self.assertRaisesRegex(
+                TypeError,
+                "The operation must be an enumeration or an integer.",
+                operations.register_operation,
+                operation
+            )
+
+    def test_register_operation_invalid_code(self):
+        """
+        Test that a ValueError is raised when registering an operation code
+        that cannot be encoded.
+        """
+        for code in (-1, 0x100000000):
+            self.assertRaisesRegex(
+                ValueError,
+                "The operation code must be an unsigned 32-bit integer.",
+                operations.register_operation,
+                code
+            )
+
+    def test_register_operation_integer_code(self):
+        """
+        Test that operations can be registered by integer code, and that the
+        codes of standard operations are converted to the Operation
+        enumeration.
+        """
+        entry = operations.register_operation(0x80000001)
+
+        self.assertEqual(0x80000001, entry.operation)
+        self.assertEqual(entry, operations.get_operation(0x80000001))
+
+        entry = operations.register_operation(0x15)
+
+        self.assertEqual(enums.Operation.ARCHIVE, entry.operation)
+        self.assertEqual(
+            entry,
+            operations.get_operation(enums.Operation.ARCHIVE)
+        )
+
+    def test_register_operation_extension_enumeration(self):
+        """
+        Test that extension enumeration members can be registered and are
+        found by their code.
+        """
+        entry = operations.register_operation(ExtensionOperation.ARCHIVE_ALL)
+
+        self.assertEqual(ExtensionOperation.ARCHIVE_ALL, entry.operation)
+        self.assertEqual(entry, operations.get_operation(0x80000001))
+        self.assertEqual(
+            entry,
+            operations.get_operation(ExtensionOperation.ARCHIVE_ALL)
+        )
+
+        args = (0x80000001, )
+        self.assertRaisesRegex(
+            ValueError,
+            "The ARCHIVE_ALL operation is already registered.",
+            operations.register_operation,
+            *args
+        )
+
+    def test_register_operation_extension_standard_code(self):
+        """
+        Test that a ValueError is raised when an extension enumeration
+        member reuses the code of a standard operation.
+        """
+        args = (ExtensionOperation.CREATE_ALL, )
+        self.assertRaisesRegex(
+            ValueError,
+            "The CREATE_ALL operation uses the code of the CREATE operation.",
+            operations.register_operation,
+            *args
+        )
+
+    def test_decode_operation(self):
+        """
+        Test that operation codes decode to standard or registered
+        operations.
+        """
+        self.assertEqual(
+            enums.Operation.CREATE,
+            operations.decode_operation(0x01)
+        )
+        self.assertRaises(
+            ValueError,
+            operations.decode_operation,
+            0x80000001
+        )
+
+        operations.register_operation(ExtensionOperation.ARCHIVE_ALL)
+        self.assertEqual(
+            ExtensionOperation.ARCHIVE_ALL,
+            operations.decode_operation(0x80000001)
+        )
+
+    def test_get_operation_name(self):
+        """
+        Test that the display names of operations are computed correctly.
+        """
+        self.assertEqual(
+            'CreateKeyPair',
+            operations.get_operation_name(enums.Operation.CREATE_KEY_PAIR)
+        )
+        self.assertEqual(
+            'ArchiveAll',
+            operations.get_operation_name(ExtensionOperation.ARCHIVE_ALL)
+        )
+        self.assertEqual(
+            '0x80000001',
+            operations.get_operation_name(0x80000001)
+        )
+
+    def test_extension_operation_encoding(self):
+        """
+        Test that registered extension operations can be encoded and decoded
+        as batch item operations, while unregistered codes are rejected.
+        """
+        encoding = (
+            b'\x42\x00\x5C\x05\x00\x00\x00\x04'
+            b'\x80\x00\x00\x01\x00\x00\x00\x00'
+        )
+
+        self.assertRaises(
+            ValueError,
+            contents.Operation().read,
+            utils.BytearrayStream(encoding)
+        )
+        self.assertRaises(
+            TypeError,
+            contents.Operation,
+            ExtensionOperation.ARCHIVE_ALL
+        )
+
+        operations.register_operation(ExtensionOperation.ARCHIVE_ALL)
+
+        operation = contents.Operation()
+        operation.read(utils.BytearrayStream(encoding))
+        self.assertEqual(ExtensionOperation.ARCHIVE_ALL, operation.value)
+
+        for value in (ExtensionOperation.ARCHIVE_ALL, 0x80000001):
+            stream = utils.BytearrayStream()
+            contents.Operation(value).write(stream)
+            self.assertEqual(encoding, stream.buffer)
+
+    def test_unregister_operation(self):
+        """
+        Test that an operation can be unregistered.
+        """
+        entry = operations.register_operation(enums.Operation.ARCHIVE)
+
+        self.assertEqual(
+            entry,
+            operations.unregister_operation(enums.Operation.ARCHIVE)
+        )
+        self.assertIsNone(operations.get_operation(enums.Operation.ARCHIVE))
+        self.assertIsNone(
+            operations.unregister_operation(enums.Operation.ARCHIVE)
+        )
@@ -15,6 +15,7 @@
 
 import testtools
 
+from kmip.core import enums
 from kmip.core import exceptions
 from kmip.core import primitives
 from kmip.core import utils
@@ -125,6 +126,33 @@ class TestBase(testtools.TestCase):
         base.length = 4
         base.read(self.stream)
 
+    def test_read_mismatched_tag(self):
+        self.stream.write(b'\x42\x00\x01\x00\x00\x00\x00\x04')
+        base = primitives.Base()
+        self.assertRaises(
+            exceptions.ReadValueError,
+            base.read,
+            self.stream
+        )
+
+    def test_read_mismatched_type(self):
+        self.stream.write(b'\x42\x00\x00\x01\x00\x00\x00\x04')
+        base = primitives.Base()
+        self.assertRaises(
+            exceptions.ReadValueError,
+            base.read,
+            self.stream
+        )
+
+    def test_read_length_underflow_on_read(self):
+        self.stream.write(b'\x42\x00\x00\x00\x00')
+        base = primitives.Base()
+        self.assertRaises(
+            exceptions.ReadValueError,
+            base.read,
+            self.stream
+        )
+
     def test_write_tag(self):
         encoding = (b'\x42\x00\x00')
         base = primitives.Base()
@@ -214,6 +242,39 @@ class TestBase(testtools.TestCase):
         self.assertEqual(
             encoding, result, self.bad_encoding.format('type/length'))
 
+    def test_write_invalid_length(self):
+        base = primitives.Base()
+        base.length = ''
+        self.assertRaises(TypeError, base.write, self.stream)
+        self.assertEqual(b'\x42\x00\x00\x00', self.stream.read())
+
+    def test_header_tables(self):
+        tag = enums.Tags.UNIQUE_IDENTIFIER
+        item_type = enums.Types.TEXT_STRING
+
+        self.assertEqual(b'\x42\x00\x94', primitives.TAG_BYTES[tag])
+        self.assertEqual(
+            b'\x42\x00\x94\x07',
+            primitives.TAG_TYPE_PREFIXES[(tag, item_type)]
+        )
+        self.assertIs(tag, primitives.TAGS_BY_VALUE[0x420094])
+        self.assertIs(item_type, primitives.TYPES_BY_VALUE[0x07])
+
+    def test_slots(self):
+        values = [
+            primitives.Integer(),
+            primitives.LongInteger(),
+            primitives.BigInteger(),
+            primitives.Enumeration(enums.Tags),
+            primitives.Boolean(),
+            primitives.TextString(),
+            primitives.ByteString(),
+            primitives.DateTime(),
+            primitives.Interval()
+        ]
+        for value in values:
+            self.assertFalse(hasattr(value, '__dict__'), type(value))
+
     def test_is_tag_next(self):
         encoding = (b'\x42\x00\x00')
         base = primitives.Base()
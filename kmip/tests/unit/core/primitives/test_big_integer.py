@@ -157,6 +157,20 @@ class TestBigInteger(testtools.TestCase):
             exceptions.InvalidPrimitiveLength, big_int.read,
             self.encoding_bad_length)
 
+    def test_read_on_truncated_value(self):
+        """
+        Test that an InvalidPrimitiveLength exception is thrown when attempting
+        to decode a BigInteger whose value is shorter than its encoded length.
+        """
+        big_int = primitives.BigInteger()
+        self.assertRaises(
+            exceptions.InvalidPrimitiveLength, big_int.read,
+            utils.BytearrayStream(
+                b'\x42\x00\x00\x04\x00\x00\x00\x10\xFF\xFF\xFF\xFF\xFF\xFF\xFC'
+                b'\x18'
+            )
+        )
+
     def test_write_zero(self):
         """
         Test that a BigInteger representing the value 0 can be read written to
@@ -187,6 +201,27 @@ class TestBigInteger(testtools.TestCase):
         big_int.write(stream)
         self.assertEqual(self.encoding_negative, stream)
 
+    def test_write_sign_boundaries(self):
+        """
+        Test that BigIntegers whose magnitudes fill a whole number of 8-byte
+        blocks are padded with an extra block to hold the sign bit.
+        """
+        args = [
+            (2 ** 63 - 1, b'\x7F' + b'\xFF' * 7),
+            (2 ** 63, b'\x00' * 8 + b'\x80' + b'\x00' * 7),
+            (-(2 ** 63) + 1, b'\x80' + b'\x00' * 6 + b'\x01'),
+            (-(2 ** 63), b'\xFF' * 8 + b'\x80' + b'\x00' * 7),
+            (-1, b'\xFF' * 8)
+        ]
+        for value, encoding in args:
+            stream = utils.BytearrayStream()
+            primitives.BigInteger(value).write(stream)
+            self.assertEqual(encoding, stream.buffer[8:])
+
+            big_int = primitives.BigInteger()
+            big_int.read(utils.BytearrayStream(stream.buffer))
+            self.assertEqual(value, big_int.value)
+
     def test_repr(self):
         """
         Test that the representation of a BigInteger is formatted properly.
@@ -0,0 +1,93 @@
+# Copyright (c) 2020 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import testtools
+
+from kmip.core import enums
+from kmip.core import primitives
+from kmip.core import utils
+
+
+class TestStruct(testtools.TestCase):
+
+    def setUp(self):
+        super(TestStruct, self).setUp()
+
+        # Encoding of a Struct (tag: Default) containing an Integer
+        # (tag: Activation Date, value: 8) and an empty nested Struct
+        # (tag: Attribute).
+        self.encoding = utils.BytearrayStream(
+            b'\x42\x00\x00\x01\x00\x00\x00\x18'
+            b'\x42\x00\x01\x02\x00\x00\x00\x04\x00\x00\x00\x08\x00\x00\x00\x00'
+            b'\x42\x00\x08\x01\x00\x00\x00\x00'
+        )
+
+    def tearDown(self):
+        super(TestStruct, self).tearDown()
+
+    def test_write_structure(self):
+        """
+        Test that a Struct can be encoded directly into the output stream,
+        with nested Struct lengths patched in once their fields are written.
+        """
+        struct = primitives.Struct()
+        nested = primitives.Struct(tag=enums.Tags.ATTRIBUTE)
+        integer = primitives.Integer(8, tag=enums.Tags.ACTIVATION_DATE)
+
+        stream = utils.BytearrayStream()
+        with struct.write_structure(stream):
+            integer.write(stream)
+            with nested.write_structure(stream):
+                pass
+
+        self.assertEqual(24, struct.length)
+        self.assertEqual(0, nested.length)
+        self.assertEqual(len(self.encoding), len(stream))
+        self.assertEqual(str(self.encoding), str(stream))
+
+    def test_write_structure_after_existing_data(self):
+        """
+        Test that a Struct encoded into a stream that already contains data
+        patches its own length and leaves the existing data untouched.
+        """
+        struct = primitives.Struct()
+        integer = primitives.Integer(8, tag=enums.Tags.ACTIVATION_DATE)
+
+        stream = utils.BytearrayStream(b'\xFF' * 8)
+        with struct.write_structure(stream):
+            integer.write(stream)
+
+        self.assertEqual(
+            b'\xFF' * 8 + b'\x42\x00\x00\x01\x00\x00\x00\x10',
+            stream.read(16)
+        )
+
+    def test_write_structure_error(self):
+        """
+        Test that the partial encoding of a Struct is removed from the output
+        stream if encoding one of its fields fails.
+        """
+        struct = primitives.Struct()
+        integer = primitives.Integer(8, tag=enums.Tags.ACTIVATION_DATE)
+
+        stream = utils.BytearrayStream(b'\xFF' * 8)
+
+        def write():
+            with struct.write_structure(stream):
+                integer.write(stream)
+                raise ValueError("missing field")
+
+        self.assertRaises(ValueError, write)
+        self.assertEqual(b'\xFF' * 8, stream.buffer)
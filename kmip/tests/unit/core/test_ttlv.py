@@ -0,0 +1,272 @@
+# Copyright (c) 2020 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import testtools
+
+from kmip.core import enums
+from kmip.core import exceptions
+from kmip.core import ttlv
+
+
+class TestTokenize(testtools.TestCase):
+
+    def setUp(self):
+        super(TestTokenize, self).setUp()
+
+        # Encoding obtained from the KMIP 1.1 testing document,
+        # Section 3.1.1.
+        #
+        # This encoding matches the following set of values:
+        # Request Message
+        #     Request Header
+        #         Protocol Version
+        #             Protocol Version Major - 1
+        #             Protocol Version Minor - 1
+        #         Batch Count - 1
+        #     Batch Item
+        #         Operation - Destroy
+        #         Request Payload
+        #             Unique Identifier - fb4b5b9c-6188-4c63-8142-fe9c328129fc
+        self.encoding = (
+            b'\x42\x00\x78\x01\x00\x00\x00\x90'
+            b'\x42\x00\x77\x01\x00\x00\x00\x38'
+            b'\x42\x00\x69\x01\x00\x00\x00\x20'
+            b'\x42\x00\x6A\x02\x00\x00\x00\x04\x00\x00\x00\x01\x00\x00\x00\x00'
+            b'\x42\x00\x6B\x02\x00\x00\x00\x04\x00\x00\x00\x01\x00\x00\x00\x00'
+            b'\x42\x00\x0D\x02\x00\x00\x00\x04\x00\x00\x00\x01\x00\x00\x00\x00'
+            b'\x42\x00\x0F\x01\x00\x00\x00\x48'
+            b'\x42\x00\x5C\x05\x00\x00\x00\x04\x00\x00\x00\x14\x00\x00\x00\x00'
+            b'\x42\x00\x79\x01\x00\x00\x00\x30'
+            b'\x42\x00\x94\x07\x00\x00\x00\x24'
+            b'\x66\x62\x34\x62\x35\x62\x39\x63\x2D\x36\x31\x38\x38\x2D\x34\x63'
+            b'\x36\x33\x2D\x38\x31\x34\x32\x2D\x66\x65\x39\x63\x33\x32\x38\x31'
+            b'\x32\x39\x66\x63\x00\x00\x00\x00'
+        )
+
+        # This encoding matches the following set of values:
+        # Long Integer - 1
+        # Big Integer - -1
+        # Boolean - True
+        # Byte String - 0x0102
+        # Date Time - 0x4F9A54E5
+        # Interval - 10
+        # Unknown Tag (0x540000) Integer - -2
+        self.primitives_encoding = (
+            b'\x42\x00\x6A\x03\x00\x00\x00\x08\x00\x00\x00\x00\x00\x00\x00\x01'
+            b'\x42\x00\x6A\x04\x00\x00\x00\x08\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF'
+            b'\x42\x00\x6A\x06\x00\x00\x00\x08\x00\x00\x00\x00\x00\x00\x00\x01'
+            b'\x42\x00\x6A\x08\x00\x00\x00\x02\x01\x02\x00\x00\x00\x00\x00\x00'
+            b'\x42\x00\x6A\x09\x00\x00\x00\x08\x00\x00\x00\x00\x4F\x9A\x54\xE5'
+            b'\x42\x00\x6A\x0A\x00\x00\x00\x04\x00\x00\x00\x0A\x00\x00\x00\x00'
+            b'\x54\x00\x00\x02\x00\x00\x00\x04\xFF\xFF\xFF\xFE\x00\x00\x00\x00'
+        )
+
+    def test_tokenize(self):
+        """
+        Test that a request message can be tokenized.
+        """
+        tokens = list(ttlv.tokenize(self.encoding))
+
+        self.assertEqual(10, len(tokens))
+        self.assertEqual(
+            (0, enums.Tags.REQUEST_MESSAGE, enums.Types.STRUCTURE, 144, None),
+            tokens[0]
+        )
+        self.assertEqual(
+            (3, enums.Tags.PROTOCOL_VERSION_MAJOR, enums.Types.INTEGER, 4, 1),
+            tokens[3]
+        )
+        self.assertEqual(
+            (1, enums.Tags.BATCH_ITEM, enums.Types.STRUCTURE, 72, None),
+            tokens[6]
+        )
+        self.assertEqual(
+            (2, enums.Tags.OPERATION, enums.Types.ENUMERATION, 4, 20),
+            tokens[7]
+        )
+
+        depth, tag, item_type, length, value = tokens[9]
+        self.assertEqual(3, depth)
+        self.assertEqual(enums.Tags.UNIQUE_IDENTIFIER, tag)
+        self.assertEqual(enums.Types.TEXT_STRING, item_type)
+        self.assertEqual(36, length)
+        self.assertIsInstance(value, memoryview)
+        self.assertEqual(
+            b'fb4b5b9c-6188-4c63-8142-fe9c328129fc',
+            value.tobytes()
+        )
+
+    def test_tokenize_primitives(self):
+        """
+        Test that each primitive type is decoded and that unknown tags are
+        returned as integers.
+        """
+        tokens = list(ttlv.tokenize(self.primitives_encoding))
+
+        self.assertEqual(
+            [1, -1, True, b'\x01\x02', 0x4F9A54E5, 10, -2],
+            [
+                t.value.tobytes() if isinstance(t.value, memoryview)
+                else t.value for t in tokens
+            ]
+        )
+        self.assertEqual(0x540000, tokens[6].tag)
+        self.assertEqual([0] * 7, [t.depth for t in tokens])
+
+    def test_tokenize_is_lazy(self):
+        """
+        Test that tokens are produced before the rest of the encoding is
+        examined.
+        """
+        encoding = self.encoding[:107] + b'\x0B' + self.encoding[108:]
+        tokens = ttlv.tokenize(encoding)
+
+        self.assertEqual(enums.Tags.REQUEST_MESSAGE, next(tokens).tag)
+        self.assertRaises(exceptions.InvalidKmipEncoding, list, tokens)
+
+    def test_tokenize_truncated_header(self):
+        """
+        Test that an InvalidKmipEncoding error is raised for a truncated item
+        header.
+        """
+        tokens = ttlv.tokenize(self.encoding[:4])
+        self.assertRaisesRegex(
+            exceptions.InvalidKmipEncoding,
+            "Truncated item header at offset 0.",
+            list,
+            tokens
+        )
+
+    def test_tokenize_truncated_value(self):
+        """
+        Test that an InvalidKmipEncoding error is raised for a value that
+        overruns its enclosing structure.
+        """
+        tokens = ttlv.tokenize(self.encoding[:-8])
+        self.assertRaisesRegex(
+            exceptions.InvalidKmipEncoding,
+            "Truncated STRUCTURE value at offset 0.",
+            list,
+            tokens
+        )
+
+    def test_tokenize_unknown_type(self):
+        """
+        Test that an InvalidKmipEncoding error is raised for an unknown item
+        type.
+        """
+        tokens = ttlv.tokenize(b'\x42\x00\x6A\x0B\x00\x00\x00\x00')
+        self.assertRaisesRegex(
+            exceptions.InvalidKmipEncoding,
+            "Unknown item type 0x0B at offset 0.",
+            list,
+            tokens
+        )
+
+    def test_tokenize_invalid_length(self):
+        """
+        Test that an InvalidKmipEncoding error is raised for a fixed-size
+        value with the wrong length.
+        """
+        tokens = ttlv.tokenize(
+            b'\x42\x00\x6A\x02\x00\x00\x00\x08\x00\x00\x00\x00\x00\x00\x00\x01'
+        )
+        self.assertRaisesRegex(
+            exceptions.InvalidKmipEncoding,
+            "Invalid length for INTEGER value: expected 4, found 8.",
+            list,
+            tokens
+        )
+
+    def test_tokenize_invalid_boolean(self):
+        """
+        Test that an InvalidKmipEncoding error is raised for a boolean value
+        other than 0 or 1.
+        """
+        tokens = ttlv.tokenize(
+            b'\x42\x00\x6A\x06\x00\x00\x00\x08\x00\x00\x00\x00\x00\x00\x00\x02'
+        )
+        self.assertRaisesRegex(
+            exceptions.InvalidKmipEncoding,
+            "Invalid boolean value: 2.",
+            list,
+            tokens
+        )
+
+
+class TestPeekOperation(testtools.TestCase):
+
+    def setUp(self):
+        super(TestPeekOperation, self).setUp()
+
+        # See TestTokenize for the contents of this encoding.
+        self.encoding = (
+            b'\x42\x00\x78\x01\x00\x00\x00\x90'
+            b'\x42\x00\x77\x01\x00\x00\x00\x38'
+            b'\x42\x00\x69\x01\x00\x00\x00\x20'
+            b'\x42\x00\x6A\x02\x00\x00\x00\x04\x00\x00\x00\x01\x00\x00\x00\x00'
+            b'\x42\x00\x6B\x02\x00\x00\x00\x04\x00\x00\x00\x01\x00\x00\x00\x00'
+            b'\x42\x00\x0D\x02\x00\x00\x00\x04\x00\x00\x00\x01\x00\x00\x00\x00'
+            b'\x42\x00\x0F\x01\x00\x00\x00\x48'
+            b'\x42\x00\x5C\x05\x00\x00\x00\x04\x00\x00\x00\x14\x00\x00\x00\x00'
+            b'\x42\x00\x79\x01\x00\x00\x00\x30'
+            b'\x42\x00\x94\x07\x00\x00\x00\x24'
+            b'\x66\x62\x34\x62\x35\x62\x39\x63\x2D\x36\x31\x38\x38\x2D\x34\x63'
+            b'\x36\x33\x2D\x38\x31\x34\x32\x2D\x66\x65\x39\x63\x33\x32\x38\x31'
+            b'\x32\x39\x66\x63\x00\x00\x00\x00'
+        )
+
+    def test_peek_operation(self):
+        """
+        Test that the operation, batch count, and protocol version can be
+        read from a request message.
+        """
+        summary = ttlv.peek_operation(self.encoding)
+
+        self.assertEqual(enums.Operation.DESTROY, summary.operation)
+        self.assertEqual(1, summary.batch_count)
+        self.assertEqual((1, 1), summary.protocol_version)
+
+    def test_peek_operation_stops_at_operation(self):
+        """
+        Test that the encoding after the first operation is not examined.
+        """
+        encoding = self.encoding[:99] + b'\x0B' + self.encoding[100:]
+        summary = ttlv.peek_operation(encoding)
+        self.assertEqual(enums.Operation.DESTROY, summary.operation)
+
+    def test_peek_operation_no_batch_items(self):
+        """
+        Test that a request message without batch items yields no operation.
+        """
+        encoding = b'\x42\x00\x78\x01\x00\x00\x00\x40' + self.encoding[8:72]
+        summary = ttlv.peek_operation(encoding)
+
+        self.assertIsNone(summary.operation)
+        self.assertEqual(1, summary.batch_count)
+        self.assertEqual((1, 1), summary.protocol_version)
+
+    def test_peek_operation_not_a_request(self):
+        """
+        Test that an InvalidKmipEncoding error is raised for an encoding that
+        is not a request message.
+        """
+        encoding = b'\x42\x00\x7B' + self.encoding[3:]
+        self.assertRaisesRegex(
+            exceptions.InvalidKmipEncoding,
+            "The encoding is not a request message.",
+            ttlv.peek_operation,
+            encoding
+        )
@@ -113,33 +113,127 @@ class TestBytearrayStream(TestCase):
         self.assertEqual(0, length, msg)
 
     def test_read(self):
-        # TODO (peter-hamilton) Finish implementation.
-        self.skipTest('')
+        b = utils.BytearrayStream(b'\x00\x01\x02\x03')
+
+        self.assertEqual(b'\x00\x01', b.read(2))
+        self.assertEqual(b'\x02\x03', b.buffer)
+        self.assertEqual(2, b.remaining())
+
+    def test_read_overflow(self):
+        b = utils.BytearrayStream(b'\x00\x01')
+
+        self.assertEqual(b'\x00\x01', b.read(4))
+        self.assertEqual(b'', b.read(1))
+        self.assertEqual(0, b.remaining())
+
+    def test_read_all(self):
+        b = utils.BytearrayStream(b'\x00\x01\x02\x03')
+        b.read(1)
+
+        self.assertEqual(b'\x01\x02\x03', b.read())
+        self.assertEqual(b'', b.buffer)
+
+    def test_readinto(self):
+        b = utils.BytearrayStream(b'\x00\x01\x02\x03')
+        data = bytearray(3)
+
+        self.assertEqual(3, b.readinto(data))
+        self.assertEqual(bytearray(b'\x00\x01\x02'), data)
+        self.assertEqual(b'\x03', b.buffer)
+
+    def test_readinto_overflow(self):
+        b = utils.BytearrayStream(b'\x00\x01')
+        data = bytearray(4)
+
+        self.assertEqual(2, b.readinto(data))
+        self.assertEqual(bytearray(b'\x00\x01\x00\x00'), data)
+        self.assertEqual(0, b.remaining())
+
+    def test_read_view(self):
+        value = b'\x00\x01\x02\x03'
+        b = utils.BytearrayStream(value)
+
+        view = b.read_view(2)
+        self.assertIsInstance(view, memoryview)
+        self.assertEqual(b'\x00\x01', view.tobytes())
+        self.assertEqual(b'\x02\x03', b.buffer)
 
     def test_write(self):
-        # TODO (peter-hamilton) Finish implementation.
-        self.skipTest('')
+        b = utils.BytearrayStream()
+
+        self.assertEqual(2, b.write(b'\x00\x01'))
+        self.assertEqual(1, b.write(b'\x02'))
+        self.assertEqual(b'\x00\x01\x02', b.buffer)
+
+    def test_write_after_read(self):
+        b = utils.BytearrayStream(b'\x00\x01\x02\x03')
+        b.read(3)
+        b.write(b'\x04\x05')
+
+        self.assertEqual(b'\x03\x04\x05', b.buffer)
+        self.assertEqual(b'\x03\x04', b.read(2))
+        self.assertEqual(1, len(b))
+
+    def test_write_does_not_modify_input(self):
+        value = bytearray(b'\x00\x01')
+        b = utils.BytearrayStream(value)
+        b.write(b'\x02')
+
+        self.assertEqual(bytearray(b'\x00\x01'), value)
+
+    def test_reserve_and_patch(self):
+        b = utils.BytearrayStream(b'\x00')
+
+        position = b.reserve(2)
+        b.write(b'\x03')
+        b.patch(position, b'\x01\x02')
+
+        self.assertEqual(1, position)
+        self.assertEqual(b'\x00\x01\x02\x03', b.buffer)
+
+    def test_patch_overflow(self):
+        b = utils.BytearrayStream()
+        position = b.reserve(2)
+
+        self.assertRaises(ValueError, b.patch, position, b'\x01\x02\x03')
+
+    def test_truncate(self):
+        b = utils.BytearrayStream(b'\x00\x01\x02\x03')
+        b.read(1)
+
+        self.assertEqual(2, b.truncate(2))
+        self.assertEqual(b'\x01\x02', b.buffer)
 
     def test_peek(self):
-        # TODO (peter-hamilton) Finish implementation.
         value = (b'\x00\x01\x02\x03')
-        expected = value
-        b = expected
-        expected = b
         b = utils.BytearrayStream(value)
 
+        self.assertEqual(b'\x00\x01', b.peek(2))
+        self.assertEqual(value, b.buffer)
+
     def test_peek_overflow(self):
-        # TODO (peter-hamilton) Finish implementation.
-        self.skipTest('')
+        value = (b'\x00\x01\x02\x03')
+        b = utils.BytearrayStream(value)
+
+        self.assertEqual(value, b.peek(8))
+        self.assertEqual(4, b.remaining())
 
     def test_peek_empty(self):
-        # TODO (peter-hamilton) Finish implementation.
-        self.skipTest('')
+        b = utils.BytearrayStream()
+
+        self.assertEqual(b'', b.peek(1))
 
     def test_peek_none(self):
-        # TODO (peter-hamilton) Finish implementation.
-        self.skipTest('')
+        value = (b'\x00\x01\x02\x03')
+        b = utils.BytearrayStream(value)
+        b.read(1)
+
+        self.assertEqual(b'\x01\x02\x03', b.peek())
 
     def test_length(self):
-        # TODO (peter-hamilton) Finish implementation.
-        self.skipTest('')
+        b = utils.BytearrayStream(b'\x00\x01\x02\x03')
+        self.assertEqual(4, b.length())
+
+        b.read(3)
+        self.assertEqual(1, b.length())
+        self.assertEqual(1, len(b))
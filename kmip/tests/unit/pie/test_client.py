@@ -514,6 +514,45 @@ class TestProxyKmipClient(testtools.TestCase):
             self.assertIsInstance(public_uid, six.string_types)
             self.assertIsInstance(private_uid, six.string_types)
 
+    @mock.patch('kmip.pie.client.KMIPProxy',
+                mock.MagicMock(spec_set=KMIPProxy))
+    def test_create_key_pair_asynchronous(self):
+        """
+        Test that an asymmetric key pair can be created asynchronously and
+        that the asynchronous correlation value is returned.
+        """
+        algorithm_attribute = self.attribute_factory.create_attribute(
+            enums.AttributeType.CRYPTOGRAPHIC_ALGORITHM,
+            enums.CryptographicAlgorithm.RSA
+        )
+        length_attribute = self.attribute_factory.create_attribute(
+            enums.AttributeType.CRYPTOGRAPHIC_LENGTH,
+            4096
+        )
+        template = obj.TemplateAttribute(
+            attributes=[algorithm_attribute, length_attribute],
+            tag=enums.Tags.COMMON_TEMPLATE_ATTRIBUTE
+        )
+
+        with ProxyKmipClient() as client:
+            client.proxy.send_asynchronous_request_payload.return_value = \
+                b'\x01'
+
+            result = client.create_key_pair(
+                enums.CryptographicAlgorithm.RSA,
+                4096,
+                asynchronous=True
+            )
+
+            client.proxy.send_asynchronous_request_payload.assert_called_with(
+                enums.Operation.CREATE_KEY_PAIR,
+                payloads.CreateKeyPairRequestPayload(
+                    common_template_attribute=template
+                )
+            )
+            client.proxy.create_key_pair.assert_not_called()
+            self.assertEqual(b'\x01', result)
+
     @mock.patch('kmip.pie.client.KMIPProxy',
                 mock.MagicMock(spec_set=KMIPProxy))
     def test_create_key_pair_with_operation_policy_name(self):
@@ -1864,6 +1903,112 @@ class TestProxyKmipClient(testtools.TestCase):
 
         self.assertEqual('1', derived_id)
 
+    @mock.patch(
+        'kmip.pie.client.KMIPProxy', mock.MagicMock(spec_set=KMIPProxy)
+    )
+    def test_derive_key_asynchronous(self):
+        """
+        Test that the client can derive a key asynchronously.
+        """
+        client = ProxyKmipClient()
+        client.open()
+        client.proxy.send_asynchronous_request_payload.return_value = b'\x01'
+
+        result = client.derive_key(
+            enums.ObjectType.SYMMETRIC_KEY,
+            ['2'],
+            enums.DerivationMethod.PBKDF2,
+            {
+                'salt': b'\x01\x02\x03\x04',
+                'iteration_count': 100000
+            },
+            asynchronous=True,
+            cryptographic_length=128
+        )
+
+        self.assertEqual(b'\x01', result)
+        client.proxy.derive_key.assert_not_called()
+        args = client.proxy.send_asynchronous_request_payload.call_args[0]
+        self.assertEqual(enums.Operation.DERIVE_KEY, args[0])
+        self.assertIsInstance(args[1], payloads.DeriveKeyRequestPayload)
+        self.assertEqual(enums.ObjectType.SYMMETRIC_KEY, args[1].object_type)
+        self.assertEqual(['2'], args[1].unique_identifiers)
+        self.assertEqual(100000, args[1].derivation_parameters.iteration_count)
+
+    @mock.patch(
+        'kmip.pie.client.KMIPProxy', mock.MagicMock(spec_set=KMIPProxy)
+    )
+    def test_poll(self):
+        """
+        Test that the client can poll for the results of asynchronous
+        operations.
+        """
+        client = ProxyKmipClient()
+        client.open()
+
+        client.proxy.poll.return_value = None
+        self.assertIsNone(client.poll(b'\x01'))
+        client.proxy.poll.assert_called_with(b'\x01')
+
+        client.proxy.poll.return_value = \
+            payloads.CreateKeyPairResponsePayload(
+                private_key_unique_identifier='2',
+                public_key_unique_identifier='1'
+            )
+        self.assertEqual(('1', '2'), client.poll(b'\x01'))
+
+        client.proxy.poll.return_value = payloads.DeriveKeyResponsePayload(
+            unique_identifier='3'
+        )
+        self.assertEqual('3', client.poll(b'\x01'))
+
+        response_payload = payloads.LocateResponsePayload()
+        client.proxy.poll.return_value = response_payload
+        self.assertIs(response_payload, client.poll(b'\x01'))
+
+        self.assertRaisesRegex(
+            TypeError,
+            "The asynchronous correlation value must be bytes.",
+            client.poll,
+            1
+        )
+
+    @mock.patch(
+        'kmip.pie.client.KMIPProxy', mock.MagicMock(spec_set=KMIPProxy)
+    )
+    def test_cancel(self):
+        """
+        Test that the client can cancel asynchronous operations.
+        """
+        client = ProxyKmipClient()
+        client.open()
+        client.proxy.cancel.return_value = enums.CancellationResult.CANCELED
+
+        self.assertEqual(
+            enums.CancellationResult.CANCELED,
+            client.cancel(b'\x01')
+        )
+        client.proxy.cancel.assert_called_with(b'\x01')
+
+        self.assertRaisesRegex(
+            TypeError,
+            "The asynchronous correlation value must be bytes.",
+            client.cancel,
+            1
+        )
+
+    @mock.patch(
+        'kmip.pie.client.KMIPProxy', mock.MagicMock(spec_set=KMIPProxy)
+    )
+    def test_poll_on_closed_client(self):
+        """
+        Test that a ClientConnectionNotOpen exception is raised when polling
+        or canceling with an unopened client connection.
+        """
+        client = ProxyKmipClient()
+        self.assertRaises(ClientConnectionNotOpen, client.poll, b'\x01')
+        self.assertRaises(ClientConnectionNotOpen, client.cancel, b'\x01')
+
     @mock.patch(
         'kmip.pie.client.KMIPProxy', mock.MagicMock(spec_set=KMIPProxy)
     )
@@ -0,0 +1,210 @@
+# Copyright (c) 2020 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import mock
+import testtools
+import threading
+import time
+
+from kmip.core import enums
+from kmip.core import exceptions
+from kmip.services.server import auth
+
+
+class TestCachingAuthenticator(testtools.TestCase):
+    """
+    Test suite for the CachingAuthenticator.
+    """
+
+    def setUp(self):
+        super(TestCachingAuthenticator, self).setUp()
+
+        self.connector = mock.MagicMock(auth.AuthAPI)
+        self.connector.authenticate.return_value = ("John Doe", ["Group A"])
+
+        self.now = 1000.0
+        patcher = mock.patch(
+            'kmip.services.server.metrics.clock',
+            side_effect=lambda: self.now
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_authenticate(self):
+        """
+        Test that a successful authentication is cached until its TTL
+        expires.
+        """
+        authenticator = auth.CachingAuthenticator(
+            self.connector,
+            ttl=60,
+            negative_ttl=5
+        )
+
+        for _ in range(2):
+            result = authenticator.authenticate(
+                "certificate",
+                ("127.0.0.1", 1000.0),
+                []
+            )
+            self.assertEqual(("John Doe", ["Group A"]), result)
+        self.connector.authenticate.assert_called_once_with(
+            "certificate",
+            ("127.0.0.1", 1000.0),
+            []
+        )
+
+        self.now += 59
+        authenticator.authenticate("certificate")
+        self.assertEqual(1, self.connector.authenticate.call_count)
+
+        self.now += 1
+        authenticator.authenticate("certificate")
+        self.assertEqual(2, self.connector.authenticate.call_count)
+
+        authenticator.authenticate("other certificate")
+        self.assertEqual(3, self.connector.authenticate.call_count)
+
+    def test_authenticate_denied(self):
+        """
+        Test that a denied authentication is cached until its negative TTL
+        expires.
+        """
+        self.connector.authenticate.side_effect = exceptions.PermissionDenied(
+            "Unrecognized user ID: John Doe"
+        )
+        authenticator = auth.CachingAuthenticator(
+            self.connector,
+            ttl=60,
+            negative_ttl=5
+        )
+
+        errors = []
+        for _ in range(3):
+            errors.append(
+                self.assertRaises(
+                    exceptions.PermissionDenied,
+                    authenticator.authenticate,
+                    "certificate"
+                )
+            )
+        self.assertEqual(1, self.connector.authenticate.call_count)
+
+        # Each cached denial raises its own error.
+        self.assertIsNot(errors[1], errors[2])
+        for error in errors:
+            self.assertEqual("Unrecognized user ID: John Doe", str(error))
+            self.assertEqual(
+                enums.ResultReason.PERMISSION_DENIED,
+                error.reason
+            )
+
+        self.now += 5
+        self.assertRaises(
+            exceptions.PermissionDenied,
+            authenticator.authenticate,
+            "certificate"
+        )
+        self.assertEqual(2, self.connector.authenticate.call_count)
+
+    def test_authenticate_with_connection_failure(self):
+        """
+        Test that failures to reach the authentication service are not
+        cached.
+        """
+        self.connector.authenticate.side_effect = [
+            exceptions.ConfigurationError("No connection."),
+            ("John Doe", ["Group A"])
+        ]
+        authenticator = auth.CachingAuthenticator(self.connector)
+
+        self.assertRaises(
+            exceptions.ConfigurationError,
+            authenticator.authenticate,
+            "certificate"
+        )
+        self.assertEqual(
+            ("John Doe", ["Group A"]),
+            authenticator.authenticate("certificate")
+        )
+        self.assertEqual(2, self.connector.authenticate.call_count)
+
+    def test_authenticate_with_caching_disabled(self):
+        """
+        Test that a zero TTL disables caching.
+        """
+        authenticator = auth.CachingAuthenticator(self.connector, ttl=0)
+
+        authenticator.authenticate("certificate")
+        authenticator.authenticate("certificate")
+
+        self.assertEqual(2, self.connector.authenticate.call_count)
+
+    def test_authenticate_concurrently(self):
+        """
+        Test that concurrent authentications of the same client are
+        coalesced into a single request.
+        """
+        started = threading.Event()
+        release = threading.Event()
+
+        def authenticate(*args):
+            started.set()
+            release.wait(10)
+            return ("John Doe", ["Group A"])
+
+        self.connector.authenticate.side_effect = authenticate
+        authenticator = auth.CachingAuthenticator(self.connector, ttl=0)
+
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(
+                    authenticator.authenticate("certificate")
+                )
+            ) for _ in range(4)
+        ]
+        threads[0].start()
+        started.wait(10)
+
+        # Count the callers waiting for the pending request.
+        lookup = authenticator._lookups["certificate"]
+        done = lookup.done
+        waiting = []
+
+        def wait(*args):
+            waiting.append(threading.current_thread())
+            return done.wait(*args)
+
+        lookup.done = mock.MagicMock(set=done.set, wait=wait)
+
+        for thread in threads[1:]:
+            thread.start()
+        for _ in range(1000):
+            if len(waiting) == 3:
+                break
+            time.sleep(0.01)
+        release.set()
+        for thread in threads:
+            thread.join(10)
+
+        self.assertEqual(3, len(waiting))
+        self.assertEqual([("John Doe", ["Group A"])] * 4, results)
+        self.connector.authenticate.assert_called_once_with(
+            "certificate",
+            None,
+            None
+        )
+        self.assertEqual({}, authenticator._lookups)
@@ -13,14 +13,82 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import json
 import mock
 import requests
 import testtools
+import threading
+
+from six.moves import BaseHTTPServer
+from six.moves import socketserver
+from six.moves.urllib import parse
 
 from kmip.core import exceptions
 from kmip.services.server import auth
 
 
+class SLUGSRequestHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+    """
+    A request handler serving the users and groups of a stand-in SLUGS
+    service.
+    """
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        self.server.requests.append((self.client_address, self.path))
+
+        parts = parse.unquote(self.path).strip('/').split('/')
+        user = parts[2] if len(parts) > 2 else None
+        if parts[:2] != ['slugs', 'users'] or user not in self.server.users:
+            self._send(404, {})
+        elif len(parts) == 3:
+            self._send(200, {'user': user})
+        elif parts[3:] == ['groups']:
+            self._send(200, {'groups': self.server.users[user]})
+        else:
+            self._send(404, {})
+
+    def _send(self, status, body):
+        data = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+class SLUGSStandIn(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    """
+    A local HTTP server standing in for a SLUGS service.
+    """
+
+    daemon_threads = True
+    block_on_close = False
+
+    def __init__(self, users):
+        BaseHTTPServer.HTTPServer.__init__(
+            self,
+            ('127.0.0.1', 0),
+            SLUGSRequestHandler
+        )
+        self.users = users
+        self.requests = []
+        self.url = "http://127.0.0.1:{0}/slugs/".format(self.server_port)
+
+    def start(self):
+        thread = threading.Thread(target=self.serve_forever)
+        thread.daemon = True
+        thread.start()
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
 class TestSLUGSConnector(testtools.TestCase):
     """
     Test suite for the SLUGSConnector.
@@ -42,9 +110,13 @@ class TestSLUGSConnector(testtools.TestCase):
         """
         Test that a SLUGSConnector can be constructed with arguments.
         """
-        connector = auth.SLUGSConnector(url='http://127.0.0.1:8080/slugs/')
+        connector = auth.SLUGSConnector(
+            url='http://127.0.0.1:8080/slugs/',
+            timeout=2.5
+        )
 
         self.assertEqual('http://127.0.0.1:8080/slugs/', connector.url)
+        self.assertEqual(2.5, connector.timeout)
         self.assertEqual(
             'http://127.0.0.1:8080/slugs/users/{}',
             connector.users_url
@@ -111,7 +183,7 @@ class TestSLUGSConnector(testtools.TestCase):
             *args
         )
 
-    @mock.patch('requests.get')
+    @mock.patch('requests.Session.get')
     @mock.patch(
         'kmip.services.server.auth.utils.get_client_identity_from_certificate'
     )
@@ -137,14 +209,16 @@ class TestSLUGSConnector(testtools.TestCase):
 
         mock_get_client_identity.assert_called_once_with("test")
         mock_request_get.assert_any_call(
-            "http://127.0.0.1:8080/test/slugs/users/John Doe"
+            "http://127.0.0.1:8080/test/slugs/users/John Doe",
+            timeout=10
         )
         mock_request_get.assert_any_call(
-            "http://127.0.0.1:8080/test/slugs/users/John Doe/groups"
+            "http://127.0.0.1:8080/test/slugs/users/John Doe/groups",
+            timeout=10
         )
         self.assertEqual(('John Doe', ['Group A', 'Group B']), result)
 
-    @mock.patch('requests.get')
+    @mock.patch('requests.Session.get')
     @mock.patch(
         'kmip.services.server.auth.utils.get_client_identity_from_certificate'
     )
@@ -165,7 +239,7 @@ class TestSLUGSConnector(testtools.TestCase):
             *args
         )
 
-    @mock.patch('requests.get')
+    @mock.patch('requests.Session.get')
     @mock.patch(
         'kmip.services.server.auth.utils.get_client_identity_from_certificate'
     )
@@ -190,7 +264,7 @@ class TestSLUGSConnector(testtools.TestCase):
             *args
         )
 
-    @mock.patch('requests.get')
+    @mock.patch('requests.Session.get')
     @mock.patch(
         'kmip.services.server.auth.utils.get_client_identity_from_certificate'
     )
@@ -219,7 +293,7 @@ class TestSLUGSConnector(testtools.TestCase):
             *args
         )
 
-    @mock.patch('requests.get')
+    @mock.patch('requests.Session.get')
     @mock.patch(
         'kmip.services.server.auth.utils.get_client_identity_from_certificate'
     )
@@ -249,3 +323,122 @@ class TestSLUGSConnector(testtools.TestCase):
             connector.authenticate,
             *args
         )
+
+    @mock.patch('requests.Session.get')
+    @mock.patch(
+        'kmip.services.server.auth.utils.get_client_identity_from_certificate'
+    )
+    def test_authenticate_with_groups_connection_failure(
+            self,
+            mock_get_client_identity,
+            mock_request_get):
+        """
+        Test that a ConfigurationError is raised when the groups request to
+        SLUGS fails to connect.
+        """
+        mock_get_client_identity.return_value = "John Doe"
+
+        users_response = mock.MagicMock(requests.Response)
+        users_response.status_code = 200
+
+        mock_request_get.side_effect = [
+            users_response,
+            requests.exceptions.Timeout()
+        ]
+
+        connector = auth.SLUGSConnector(
+            url="http://127.0.0.1:8080/test/slugs/"
+        )
+        args = ("test", )
+        self.assertRaisesRegex(
+            exceptions.ConfigurationError,
+            "A connection could not be established using the SLUGS URL.",
+            connector.authenticate,
+            *args
+        )
+
+
+class TestSLUGSConnectorWithService(testtools.TestCase):
+    """
+    Test suite for the SLUGSConnector against a local stand-in SLUGS service.
+    """
+
+    def setUp(self):
+        super(TestSLUGSConnectorWithService, self).setUp()
+
+        self.service = SLUGSStandIn({'John Doe': ['Group A', 'Group B']})
+        self.service.start()
+        self.addCleanup(self.service.stop)
+
+        patcher = mock.patch(
+            'kmip.services.server.auth.utils.'
+            'get_client_identity_from_certificate',
+            side_effect=lambda certificate: certificate
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_authenticate(self):
+        """
+        Test that consecutive authentications reuse a single connection to
+        the SLUGS service.
+        """
+        connector = auth.SLUGSConnector(url=self.service.url)
+        self.addCleanup(connector._session.close)
+
+        for _ in range(3):
+            self.assertEqual(
+                ('John Doe', ['Group A', 'Group B']),
+                connector.authenticate('John Doe')
+            )
+
+        self.assertEqual(6, len(self.service.requests))
+        self.assertEqual(
+            1,
+            len(set(address for address, _ in self.service.requests))
+        )
+
+    def test_authenticate_unrecognized_user(self):
+        """
+        Test that a PermissionDenied error is raised for a user unknown to
+        the SLUGS service.
+        """
+        connector = auth.SLUGSConnector(url=self.service.url)
+        self.addCleanup(connector._session.close)
+
+        args = ('Jane Doe', )
+        self.assertRaisesRegex(
+            exceptions.PermissionDenied,
+            "Unrecognized user ID: Jane Doe",
+            connector.authenticate,
+            *args
+        )
+
+    def test_authenticate_with_cache(self):
+        """
+        Test that a CachingAuthenticator only queries the SLUGS service once
+        per user, for both recognized and unrecognized users.
+        """
+        connector = auth.SLUGSConnector(url=self.service.url)
+        self.addCleanup(connector._session.close)
+        authenticator = auth.CachingAuthenticator(connector)
+
+        for _ in range(3):
+            self.assertEqual(
+                ('John Doe', ['Group A', 'Group B']),
+                authenticator.authenticate('John Doe')
+            )
+            self.assertRaises(
+                exceptions.PermissionDenied,
+                authenticator.authenticate,
+                'Jane Doe'
+            )
+
+        self.assertEqual(
+            [
+                '/slugs/users/John Doe',
+                '/slugs/users/John Doe/groups',
+                '/slugs/users/Jane Doe'
+            ],
+            [parse.unquote(path) for _, path in self.service.requests]
+        )
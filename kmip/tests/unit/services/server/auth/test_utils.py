@@ -165,6 +165,25 @@ class TestUtils(testtools.TestCase):
 
         self.assertIsInstance(result, x509.Certificate)
 
+    def test_load_certificate(self):
+        """
+        Test that a certificate is only parsed once for a given fingerprint.
+        """
+        utils._certificate_cache.clear()
+        self.addCleanup(utils._certificate_cache.clear)
+
+        with mock.patch(
+            'cryptography.x509.load_der_x509_certificate',
+            side_effect=x509.load_der_x509_certificate
+        ) as load_mock:
+            a = utils.load_certificate(self.certificate_bytes)
+            b = utils.load_certificate(bytes(self.certificate_bytes))
+
+        self.assertIsInstance(a, x509.Certificate)
+        self.assertIs(a, b)
+        self.assertEqual(1, load_mock.call_count)
+        self.assertEqual(1, len(utils._certificate_cache))
+
     def test_get_certificate_from_connection_with_load_failure(self):
         """
         Test that the right value is returned when the certificate cannot be
@@ -268,3 +287,51 @@ class TestUtils(testtools.TestCase):
             utils.get_client_identity_from_certificate,
             *args
         )
+
+
+class TestLRUCache(testtools.TestCase):
+    """
+    Test suite for the LRUCache.
+    """
+
+    def test_get_and_put(self):
+        """
+        Test that cached values can be retrieved and replaced.
+        """
+        cache = utils.LRUCache(2)
+
+        self.assertIsNone(cache.get('a'))
+        cache.put('a', 1)
+        self.assertEqual(1, cache.get('a'))
+        cache.put('a', 2)
+        self.assertEqual(2, cache.get('a'))
+        self.assertEqual(1, len(cache))
+
+    def test_eviction(self):
+        """
+        Test that the least recently used value is evicted once the cache is
+        full.
+        """
+        cache = utils.LRUCache(2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+
+        # Using 'a' makes 'b' the least recently used value.
+        cache.get('a')
+        cache.put('c', 3)
+
+        self.assertEqual(2, len(cache))
+        self.assertEqual(1, cache.get('a'))
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(3, cache.get('c'))
+
+    def test_clear(self):
+        """
+        Test that all values can be removed from the cache.
+        """
+        cache = utils.LRUCache(2)
+        cache.put('a', 1)
+        cache.clear()
+
+        self.assertEqual(0, len(cache))
+        self.assertIsNone(cache.get('a'))
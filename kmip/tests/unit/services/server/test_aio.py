@@ -0,0 +1,227 @@
+# Copyright (c) 2020 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import mock
+import pytest
+import socket
+import struct
+import sys
+import testtools
+import threading
+
+from kmip.core import exceptions
+from kmip.services.server import metrics
+from kmip.services.server import pool
+
+# The asyncio front end uses syntax and APIs added in Python 3.7, so it
+# cannot even be imported by older versions.
+if sys.version_info < (3, 7):
+    pytest.skip(
+        "The asyncio serving mode requires Python 3.7 or newer.",
+        allow_module_level=True
+    )
+
+from kmip.services.server import aio  # noqa: E402
+
+
+class TestAsyncioConnectionService(testtools.TestCase):
+    """
+    A test suite for the asyncio front end of the KmipServer.
+    """
+
+    def setUp(self):
+        super(TestAsyncioConnectionService, self).setUp()
+
+        self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.server_socket.bind(('127.0.0.1', 0))
+        self.server_socket.listen(5)
+        self.addCleanup(self.server_socket.close)
+        self.address = self.server_socket.getsockname()
+
+        self.session = mock.MagicMock()
+        self.session.name = '00000001'
+        self.session.process_message.side_effect = (
+            lambda data, timer: bytearray(b'response:') + data.buffer
+        )
+        self.session.reject_message.return_value = bytearray(b'rejected')
+        self.create_session = mock.MagicMock(return_value=self.session)
+
+        self.request_pool = pool.WorkerPool(2, 10)
+        self.request_pool.start()
+        self.addCleanup(self.request_pool.stop)
+
+        self.service = aio.AsyncioConnectionService(
+            self.server_socket,
+            None,
+            self.create_session,
+            self.request_pool,
+            max_connections=3
+        )
+        self.service._logger = mock.MagicMock()
+
+        self.thread = threading.Thread(target=self.service.serve)
+        self.thread.daemon = True
+        self.thread.start()
+        self.addCleanup(self._stop_service)
+
+    def _stop_service(self):
+        self.service.stop()
+        self.thread.join(10)
+        self.assertFalse(self.thread.is_alive())
+
+    def _connect(self):
+        client = socket.create_connection(self.address, timeout=10)
+        self.addCleanup(client.close)
+        return client
+
+    def _receive(self, client, size):
+        data = b''
+        while len(data) < size:
+            chunk = client.recv(size - len(data))
+            if not chunk:
+                break
+            data += chunk
+        return data
+
+    def test_serve(self):
+        """
+        Test that framed requests are handed to the session and that the
+        responses are written back to the client, for several requests on
+        one connection.
+        """
+        client = self._connect()
+
+        for body in (b'\x01' * 8, b'\x02' * 16):
+            request = b'\x42\x00\x78\x01' + struct.pack('!I', len(body))
+            request += body
+            client.sendall(request[:5])
+            client.sendall(request[5:])
+
+            response = self._receive(client, 9 + len(request))
+            self.assertEqual(b'response:' + request, response)
+
+        self.assertEqual(1, self.create_session.call_count)
+        self.assertEqual(2, self.session.process_message.call_count)
+
+        # Each request is timed, and its timings are recorded once the
+        # response is sent.
+        timer = self.session.process_message.call_args_list[0][0][1]
+        self.assertIsInstance(timer, metrics.RequestTimer)
+        self.assertIn('read', timer.phases)
+        self.assertIn('send', timer.phases)
+        self.assertEqual(
+            mock.call(timer),
+            self.session.record_request.call_args_list[0]
+        )
+
+    def test_serve_multiple_connections(self):
+        """
+        Test that connections are served concurrently and get separate
+        sessions.
+        """
+        clients = [self._connect() for _ in range(3)]
+        request = b'\x42\x00\x78\x01\x00\x00\x00\x00'
+
+        for client in reversed(clients):
+            client.sendall(request)
+            self.assertEqual(
+                b'response:' + request,
+                self._receive(client, 9 + len(request))
+            )
+
+        self.assertEqual(3, self.create_session.call_count)
+        self.assertEqual(3, self.service.active_connections)
+
+    def test_serve_too_many_connections(self):
+        """
+        Test that connections beyond the maximum are closed and counted.
+        """
+        request = b'\x42\x00\x78\x01\x00\x00\x00\x00'
+        clients = [self._connect() for _ in range(3)]
+        for client in clients:
+            client.sendall(request)
+            self._receive(client, 9 + len(request))
+
+        client = self._connect()
+        self.assertEqual(b'', self._receive(client, 1))
+        self.assertEqual(1, self.service.rejected_connections)
+        self.assertEqual(3, self.create_session.call_count)
+
+    def test_serve_overloaded(self):
+        """
+        Test that a request rejected by the worker pool is answered with the
+        session rejection response.
+        """
+        error = exceptions.ServerOverloaded("busy")
+        self.request_pool.submit = mock.MagicMock(side_effect=error)
+
+        client = self._connect()
+        client.sendall(b'\x42\x00\x78\x01\x00\x00\x00\x00')
+
+        self.assertEqual(b'rejected', self._receive(client, 8))
+        self.session.process_message.assert_not_called()
+        self.session.reject_message.assert_called_once_with(
+            mock.ANY,
+            error,
+            mock.ANY
+        )
+
+    def test_serve_oversized_request(self):
+        """
+        Test that a request larger than the maximum request size is answered
+        with the session rejection response and the connection closed.
+        """
+        self.session.reject_oversized_message.return_value = bytearray(
+            b'too large'
+        )
+        self.service._max_request_size = 8
+
+        client = self._connect()
+        client.sendall(b'\x42\x00\x78\x01\x00\x00\x00\x10')
+
+        self.assertEqual(b'too large', self._receive(client, 10))
+        self.session.process_message.assert_not_called()
+        self.session.reject_oversized_message.assert_called_once_with(
+            mock.ANY
+        )
+        error = self.session.reject_oversized_message.call_args[0][0]
+        self.assertIsInstance(error, exceptions.MessageTooLarge)
+
+    def test_serve_truncated_request(self):
+        """
+        Test that a connection closed in the middle of a request is logged
+        and closed without processing the request.
+        """
+        client = self._connect()
+        client.sendall(b'\x42\x00\x78\x01\x00\x00\x00\x10\x00')
+        client.shutdown(socket.SHUT_WR)
+
+        self.assertEqual(b'', self._receive(client, 1))
+        self.session.process_message.assert_not_called()
+        self.service._logger.info.assert_any_call(
+            "Stopping session: 00000001"
+        )
+
+    def test_stop_with_open_connection(self):
+        """
+        Test that the service stops while a client connection is still open.
+        """
+        client = self._connect()
+        request = b'\x42\x00\x78\x01\x00\x00\x00\x00'
+        client.sendall(request)
+        self._receive(client, 9 + len(request))
+
+        self._stop_service()
+        self.assertEqual(b'', self._receive(client, 1))
@@ -69,6 +69,14 @@ class TestKmipServerConfig(testtools.TestCase):
         c._set_tls_cipher_suites = mock.MagicMock()
         c._set_logging_level = mock.MagicMock()
         c._set_database_path = mock.MagicMock()
+        c._set_serving_mode = mock.MagicMock()
+        c._set_worker_pool_size = mock.MagicMock()
+        c._set_request_queue_size = mock.MagicMock()
+        c._set_max_connections = mock.MagicMock()
+        c._set_listen_backlog = mock.MagicMock()
+        c._set_worker_processes = mock.MagicMock()
+        c._set_slow_request_threshold = mock.MagicMock()
+        c._set_metrics_port = mock.MagicMock()
 
         # Test the right error is generated when setting an unsupported
         # setting.
@@ -119,6 +127,30 @@ class TestKmipServerConfig(testtools.TestCase):
         c.set_setting('database_path', '/var/pykmip/pykmip.db')
         c._set_database_path.assert_called_once_with('/var/pykmip/pykmip.db')
 
+        c.set_setting('serving_mode', 'asyncio')
+        c._set_serving_mode.assert_called_once_with('asyncio')
+
+        c.set_setting('worker_pool_size', 20)
+        c._set_worker_pool_size.assert_called_once_with(20)
+
+        c.set_setting('request_queue_size', 200)
+        c._set_request_queue_size.assert_called_once_with(200)
+
+        c.set_setting('max_connections', 50)
+        c._set_max_connections.assert_called_once_with(50)
+
+        c.set_setting('listen_backlog', 64)
+        c._set_listen_backlog.assert_called_once_with(64)
+
+        c.set_setting('worker_processes', 4)
+        c._set_worker_processes.assert_called_once_with(4)
+
+        c.set_setting('slow_request_threshold', 0.5)
+        c._set_slow_request_threshold.assert_called_once_with(0.5)
+
+        c.set_setting('metrics_port', 9000)
+        c._set_metrics_port.assert_called_once_with(9000)
+
     def test_load_settings(self):
         """
         Test that the right calls are made and the right errors generated when
@@ -237,6 +269,14 @@ class TestKmipServerConfig(testtools.TestCase):
         c._set_tls_cipher_suites = mock.MagicMock()
         c._set_logging_level = mock.MagicMock()
         c._set_database_path = mock.MagicMock()
+        c._set_serving_mode = mock.MagicMock()
+        c._set_worker_pool_size = mock.MagicMock()
+        c._set_request_queue_size = mock.MagicMock()
+        c._set_max_connections = mock.MagicMock()
+        c._set_listen_backlog = mock.MagicMock()
+        c._set_worker_processes = mock.MagicMock()
+        c._set_slow_request_threshold = mock.MagicMock()
+        c._set_metrics_port = mock.MagicMock()
 
         # Test that the right calls are made when correctly parsing settings.
         parser = configparser.ConfigParser()
@@ -256,6 +296,14 @@ class TestKmipServerConfig(testtools.TestCase):
         )
         parser.set('server', 'logging_level', 'ERROR')
         parser.set('server', 'database_path', '/var/pykmip/pykmip.db')
+        parser.set('server', 'serving_mode', 'asyncio')
+        parser.set('server', 'worker_pool_size', '20')
+        parser.set('server', 'request_queue_size', '200')
+        parser.set('server', 'max_connections', '50')
+        parser.set('server', 'listen_backlog', '64')
+        parser.set('server', 'worker_processes', '4')
+        parser.set('server', 'slow_request_threshold', '0.5')
+        parser.set('server', 'metrics_port', '9000')
 
         c._parse_settings(parser)
 
@@ -274,6 +322,14 @@ class TestKmipServerConfig(testtools.TestCase):
         )
         c._set_logging_level.assert_called_once_with('ERROR')
         c._set_database_path.assert_called_once_with('/var/pykmip/pykmip.db')
+        c._set_serving_mode.assert_called_once_with('asyncio')
+        c._set_worker_pool_size.assert_called_once_with(20)
+        c._set_request_queue_size.assert_called_once_with(200)
+        c._set_max_connections.assert_called_once_with(50)
+        c._set_listen_backlog.assert_called_once_with(64)
+        c._set_worker_processes.assert_called_once_with(4)
+        c._set_slow_request_threshold.assert_called_once_with(0.5)
+        c._set_metrics_port.assert_called_once_with(9000)
 
         # Test that a ConfigurationError is generated when the expected
         # section is missing.
@@ -878,3 +934,315 @@ class TestKmipServerConfig(testtools.TestCase):
             *args
         )
         self.assertNotEqual(1, c.settings.get('database_path'))
+
+    def test_set_serving_mode(self):
+        """
+        Test that the serving_mode configuration property can be set
+        correctly.
+        """
+        c = config.KmipServerConfig()
+        c._logger = mock.MagicMock()
+
+        self.assertEqual('threaded', c.settings.get('serving_mode'))
+
+        c._set_serving_mode('asyncio')
+        self.assertEqual('asyncio', c.settings.get('serving_mode'))
+
+        c._set_serving_mode(None)
+        self.assertEqual('threaded', c.settings.get('serving_mode'))
+
+    def test_set_serving_mode_invalid_value(self):
+        """
+        Test that the right error is raised when an invalid value is used to
+        set the serving_mode configuration property.
+        """
+        c = config.KmipServerConfig()
+        c._logger = mock.MagicMock()
+
+        args = ('forking', )
+        self.assertRaisesRegex(
+            exceptions.ConfigurationError,
+            "The serving mode must be one of the following: threaded, "
+            "asyncio",
+            c._set_serving_mode,
+            *args
+        )
+        self.assertEqual('threaded', c.settings.get('serving_mode'))
+
+    def test_set_serving_mode_unsupported_python(self):
+        """
+        Test that the right error is raised when the asyncio serving mode is
+        set on a Python version older than 3.7.
+        """
+        c = config.KmipServerConfig()
+        c._logger = mock.MagicMock()
+
+        args = ('asyncio', )
+        with mock.patch('sys.version_info', (3, 6, 9, 'final', 0)):
+            self.assertRaisesRegex(
+                exceptions.ConfigurationError,
+                "The asyncio serving mode requires Python 3.7 or newer.",
+                c._set_serving_mode,
+                *args
+            )
+        self.assertEqual('threaded', c.settings.get('serving_mode'))
+
+    def test_set_worker_pool_size(self):
+        """
+        Test that the worker_pool_size configuration property can be set
+        correctly.
+        """
+        c = config.KmipServerConfig()
+        c._logger = mock.MagicMock()
+
+        self.assertEqual(10, c.settings.get('worker_pool_size'))
+
+        c._set_worker_pool_size(20)
+        self.assertEqual(20, c.settings.get('worker_pool_size'))
+
+        c._set_worker_pool_size(None)
+        self.assertEqual(10, c.settings.get('worker_pool_size'))
+
+    def test_set_worker_pool_size_invalid_value(self):
+        """
+        Test that the right error is raised when an invalid value is used to
+        set the worker_pool_size configuration property.
+        """
+        c = config.KmipServerConfig()
+        c._logger = mock.MagicMock()
+
+        for value in (0, -1, '8', True):
+            self.assertRaisesRegex(
+                exceptions.ConfigurationError,
+                "The worker pool size must be a positive integer.",
+                c._set_worker_pool_size,
+                value
+            )
+        self.assertEqual(10, c.settings.get('worker_pool_size'))
+
+    def test_set_request_queue_size(self):
+        """
+        Test that the request_queue_size configuration property can be set
+        correctly.
+        """
+        c = config.KmipServerConfig()
+        c._logger = mock.MagicMock()
+
+        self.assertEqual(100, c.settings.get('request_queue_size'))
+
+        c._set_request_queue_size(200)
+        self.assertEqual(200, c.settings.get('request_queue_size'))
+
+        c._set_request_queue_size(None)
+        self.assertEqual(100, c.settings.get('request_queue_size'))
+
+    def test_set_request_queue_size_invalid_value(self):
+        """
+        Test that the right error is raised when an invalid value is used to
+        set the request_queue_size configuration property.
+        """
+        c = config.KmipServerConfig()
+        c._logger = mock.MagicMock()
+
+        for value in (0, -1, '8', True):
+            self.assertRaisesRegex(
+                exceptions.ConfigurationError,
+                "The request queue size must be a positive integer.",
+                c._set_request_queue_size,
+                value
+            )
+        self.assertEqual(100, c.settings.get('request_queue_size'))
+
+    def test_set_max_connections(self):
+        """
+        Test that the max_connections configuration property can be set
+        correctly.
+        """
+        c = config.KmipServerConfig()
+        c._logger = mock.MagicMock()
+
+        self.assertEqual(1000, c.settings.get('max_connections'))
+
+        c._set_max_connections(50)
+        self.assertEqual(50, c.settings.get('max_connections'))
+
+        c._set_max_connections(None)
+        self.assertEqual(1000, c.settings.get('max_connections'))
+
+    def test_set_max_connections_invalid_value(self):
+        """
+        Test that the right error is raised when an invalid value is used to
+        set the max_connections configuration property.
+        """
+        c = config.KmipServerConfig()
+        c._logger = mock.MagicMock()
+
+        for value in (0, -1, '8', True):
+            self.assertRaisesRegex(
+                exceptions.ConfigurationError,
+                "The maximum number of connections must be a positive "
+                "integer.",
+                c._set_max_connections,
+                value
+            )
+        self.assertEqual(1000, c.settings.get('max_connections'))
+
+    def test_set_listen_backlog(self):
+        """
+        Test that the listen_backlog configuration property can be set
+        correctly.
+        """
+        c = config.KmipServerConfig()
+        c._logger = mock.MagicMock()
+
+        self.assertEqual(5, c.settings.get('listen_backlog'))
+
+        c._set_listen_backlog(64)
+        self.assertEqual(64, c.settings.get('listen_backlog'))
+
+        c._set_listen_backlog(None)
+        self.assertEqual(5, c.settings.get('listen_backlog'))
+
+    def test_set_listen_backlog_invalid_value(self):
+        """
+        Test that the right error is raised when an invalid value is used to
+        set the listen_backlog configuration property.
+        """
+        c = config.KmipServerConfig()
+        c._logger = mock.MagicMock()
+
+        for value in (0, -1, '8', True):
+            self.assertRaisesRegex(
+                exceptions.ConfigurationError,
+                "The listen backlog must be a positive integer.",
+                c._set_listen_backlog,
+                value
+            )
+        self.assertEqual(5, c.settings.get('listen_backlog'))
+
+    def test_set_worker_processes(self):
+        """
+        Test that the worker_processes configuration property can be set
+        correctly.
+        """
+        c = config.KmipServerConfig()
+        c._logger = mock.MagicMock()
+
+        self.assertEqual(1, c.settings.get('worker_processes'))
+
+        c._set_worker_processes(4)
+        self.assertEqual(4, c.settings.get('worker_processes'))
+
+        c._set_worker_processes(None)
+        self.assertEqual(1, c.settings.get('worker_processes'))
+
+    def test_set_worker_processes_invalid_value(self):
+        """
+        Test that the right error is raised when an invalid value is used to
+        set the worker_processes configuration property.
+        """
+        c = config.KmipServerConfig()
+        c._logger = mock.MagicMock()
+
+        for value in (0, -1, '4', True):
+            self.assertRaisesRegex(
+                exceptions.ConfigurationError,
+                "The number of worker processes must be a positive integer.",
+                c._set_worker_processes,
+                value
+            )
+        self.assertEqual(1, c.settings.get('worker_processes'))
+
+    def test_set_worker_processes_without_fork(self):
+        """
+        Test that the right error is raised when multiple worker processes
+        are requested on a platform that does not support fork.
+        """
+        c = config.KmipServerConfig()
+        c._logger = mock.MagicMock()
+
+        with mock.patch('kmip.services.server.config.os') as os_mock:
+            del os_mock.fork
+            self.assertRaisesRegex(
+                exceptions.ConfigurationError,
+                "Multiple worker processes require a platform that supports "
+                "fork.",
+                c._set_worker_processes,
+                2
+            )
+            c._set_worker_processes(1)
+        self.assertEqual(1, c.settings.get('worker_processes'))
+
+    def test_set_slow_request_threshold(self):
+        """
+        Test that the slow_request_threshold configuration property can be
+        set correctly.
+        """
+        c = config.KmipServerConfig()
+        c._logger = mock.MagicMock()
+
+        self.assertIsNone(c.settings.get('slow_request_threshold'))
+
+        c._set_slow_request_threshold(0.5)
+        self.assertEqual(0.5, c.settings.get('slow_request_threshold'))
+
+        c._set_slow_request_threshold(2)
+        self.assertEqual(2.0, c.settings.get('slow_request_threshold'))
+
+        c._set_slow_request_threshold(None)
+        self.assertIsNone(c.settings.get('slow_request_threshold'))
+
+    def test_set_slow_request_threshold_invalid_value(self):
+        """
+        Test that the right error is raised when an invalid value is used to
+        set the slow_request_threshold configuration property.
+        """
+        c = config.KmipServerConfig()
+        c._logger = mock.MagicMock()
+
+        for value in (0, -0.5, '0.5', True):
+            self.assertRaisesRegex(
+                exceptions.ConfigurationError,
+                "The slow request threshold, if specified, must be a "
+                "positive number of seconds.",
+                c._set_slow_request_threshold,
+                value
+            )
+        self.assertIsNone(c.settings.get('slow_request_threshold'))
+
+    def test_set_metrics_port(self):
+        """
+        Test that the metrics_port configuration property can be set
+        correctly.
+        """
+        c = config.KmipServerConfig()
+        c._logger = mock.MagicMock()
+
+        self.assertIsNone(c.settings.get('metrics_port'))
+
+        c._set_metrics_port(9000)
+        self.assertEqual(9000, c.settings.get('metrics_port'))
+
+        c._set_metrics_port(65535)
+        self.assertEqual(65535, c.settings.get('metrics_port'))
+
+        c._set_metrics_port(None)
+        self.assertIsNone(c.settings.get('metrics_port'))
+
+    def test_set_metrics_port_invalid_value(self):
+        """
+        Test that the right error is raised when an invalid value is used to
+        set the metrics_port configuration property.
+        """
+        c = config.KmipServerConfig()
+        c._logger = mock.MagicMock()
+
+        for value in (0, -1, 65536, '9000', True):
+            self.assertRaisesRegex(
+                exceptions.ConfigurationError,
+                "The metrics port, if specified, must be an integer in the "
+                "range 1 - 65535.",
+                c._set_metrics_port,
+                value
+            )
+        self.assertIsNone(c.settings.get('metrics_port'))
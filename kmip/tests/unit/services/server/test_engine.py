@@ -15,13 +15,16 @@
 
 import six
 import mock
+import os
 import shutil
 import sqlalchemy
+import struct
 
 from sqlalchemy.orm import exc
 
 import tempfile
 import testtools
+import threading
 import time
 
 import kmip
@@ -33,17 +36,20 @@ from kmip.core import misc
 from kmip.core import objects
 from kmip.core import primitives
 from kmip.core import secrets
+from kmip.core import utils
 
 from kmip.core.factories import attributes as factory
 
 from kmip.core.messages import contents
 from kmip.core.messages import messages
+from kmip.core.messages import operations
 from kmip.core.messages import payloads
 
 from kmip.pie import objects as pie_objects
 from kmip.pie import sqltypes
 
 from kmip.services.server import engine
+from kmip.services.server import metrics
 
 
 class MockRegexString(str):
@@ -168,7 +174,9 @@ class TestKmipEngine(testtools.TestCase):
         e._logger = mock.MagicMock()
         e._protocol_version = contents.ProtocolVersion(1, 0)
 
-        args = (None, )
+        e._process_discover_versions = mock.MagicMock()
+
+        args = (enums.Operation.DISCOVER_VERSIONS, None)
         regex = "DiscoverVersions is not supported by KMIP {0}".format(
             e._protocol_version
         )
@@ -176,9 +184,10 @@ class TestKmipEngine(testtools.TestCase):
             self,
             exceptions.OperationNotSupported,
             regex,
-            e._process_discover_versions,
+            e._process_operation,
             *args
         )
+        e._process_discover_versions.assert_not_called()
 
     def test_process_request(self):
         """
@@ -261,6 +270,206 @@ class TestKmipEngine(testtools.TestCase):
         )
         self.assertIsNone(batch_item.message_extension)
 
+    def test_process_request_with_timer(self):
+        """
+        Test that the time spent processing the operations and committing to
+        the database is recorded in the request timer.
+        """
+        e = engine.KmipEngine()
+        e._logger = mock.MagicMock()
+        timer = mock.MagicMock()
+
+        header = messages.RequestHeader(
+            protocol_version=contents.ProtocolVersion(1, 1),
+            batch_count=contents.BatchCount(1)
+        )
+        batch = [
+            messages.RequestBatchItem(
+                operation=contents.Operation(
+                    enums.Operation.DISCOVER_VERSIONS
+                ),
+                request_payload=payloads.DiscoverVersionsRequestPayload()
+            )
+        ]
+        request = messages.RequestMessage(
+            request_header=header,
+            batch_items=batch
+        )
+
+        e.process_request(request, timer=timer)
+
+        timer.lap.assert_not_called()
+        self.assertEqual(timer, e._timer)
+
+        data_session = e._data_store_session_factory()
+        data_session.commit()
+
+        self.assertEqual(
+            [mock.call('handler'), mock.call('commit')],
+            timer.lap.call_args_list
+        )
+
+        # Requests processed without a timer are not timed.
+        e.process_request(request)
+        timer.reset_mock()
+        data_session.commit()
+
+        timer.lap.assert_not_called()
+
+    def test_process_request_concurrently(self):
+        """
+        Test that requests from different threads are processed concurrently,
+        each with its own request context and database session.
+        """
+        e = engine.KmipEngine()
+        e._logger = mock.MagicMock()
+
+        started = threading.Event()
+        release = threading.Event()
+        contexts = {}
+
+        def process_batch(*args):
+            contexts[threading.current_thread().name] = (
+                e._get_context(),
+                e._protocol_version,
+                e._client_identity,
+                e._data_session
+            )
+            if threading.current_thread().name == 'first':
+                started.set()
+                release.wait(10)
+            return []
+
+        e._process_batch = mock.MagicMock(side_effect=process_batch)
+
+        def process(name, version, credential):
+            request = messages.RequestMessage(
+                request_header=messages.RequestHeader(
+                    protocol_version=version,
+                    batch_count=contents.BatchCount(0)
+                )
+            )
+            e.process_request(request, credential)
+
+        first = threading.Thread(
+            target=process,
+            name='first',
+            args=('first', contents.ProtocolVersion(1, 1), ['John Doe', None])
+        )
+        second = threading.Thread(
+            target=process,
+            name='second',
+            args=('second', contents.ProtocolVersion(1, 4), ['Jane Doe', None])
+        )
+        first.start()
+        self.assertTrue(started.wait(10))
+
+        # The second request completes while the first one is in progress.
+        second.start()
+        second.join(10)
+        self.assertFalse(second.is_alive())
+        self.assertTrue(first.is_alive())
+
+        release.set()
+        first.join(10)
+
+        first_context, first_version, first_identity, _ = contexts['first']
+        second_context, second_version, second_identity, _ = \
+            contexts['second']
+        self.assertIsNot(first_context, second_context)
+        self.assertEqual(contents.ProtocolVersion(1, 1), first_version)
+        self.assertEqual(contents.ProtocolVersion(1, 4), second_version)
+        self.assertEqual(['John Doe', None], first_identity)
+        self.assertEqual(['Jane Doe', None], second_identity)
+        self.assertEqual(contents.ProtocolVersion(1, 2), e._protocol_version)
+
+    def test_process_request_closes_data_session(self):
+        """
+        Test that the database session of a request is closed once the
+        request is processed, even if processing fails.
+        """
+        e = engine.KmipEngine()
+        e._logger = mock.MagicMock()
+        data_session = mock.MagicMock()
+
+        def process_batch(*args):
+            e._data_session = data_session
+            raise exceptions.InvalidMessage("Batch item ID is undefined.")
+
+        e._process_batch = mock.MagicMock(side_effect=process_batch)
+        request = messages.RequestMessage(
+            request_header=messages.RequestHeader(
+                protocol_version=contents.ProtocolVersion(1, 1),
+                batch_count=contents.BatchCount(0)
+            )
+        )
+
+        self.assertRaises(
+            exceptions.InvalidMessage,
+            e.process_request,
+            request
+        )
+        data_session.close.assert_called_once_with()
+        self.assertIsNone(e._data_session)
+
+    def test_database_write_ahead_log(self):
+        """
+        Test that the database is opened with write-ahead logging, so that
+        concurrent requests can read while another one commits.
+        """
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        e = engine.KmipEngine(
+            database_path=os.path.join(directory, 'pykmip.database')
+        )
+
+        data_session = e._data_store_session_factory()
+        journal_mode = data_session.execute('PRAGMA journal_mode').scalar()
+        data_session.close()
+
+        self.assertEqual('wal', journal_mode)
+
+    def test_create_indexes(self):
+        """
+        Test that indexes missing from an existing database are created when
+        the engine starts.
+        """
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        database_path = os.path.join(directory, 'pykmip.database')
+
+        def get_created_indexes(get_logger):
+            return [
+                x[0][0] for x in get_logger.return_value.info.call_args_list
+                if x[0][0].startswith("Creating database index")
+            ]
+
+        e = engine.KmipEngine(database_path=database_path)
+        e._data_store.execute('DROP INDEX ix_managed_object_names_name')
+        e._data_store.execute('DROP INDEX ix_keys_cryptographic_algorithm')
+
+        with mock.patch('logging.getLogger') as get_logger:
+            e = engine.KmipEngine(database_path=database_path)
+        self.assertEqual(
+            [
+                "Creating database index: ix_keys_cryptographic_algorithm",
+                "Creating database index: ix_managed_object_names_name"
+            ],
+            sorted(get_created_indexes(get_logger))
+        )
+
+        inspector = sqlalchemy.inspect(e._data_store)
+        self.assertIn(
+            'ix_managed_object_names_name',
+            [x.get('name') for x in inspector.get_indexes(
+                'managed_object_names'
+            )]
+        )
+
+        with mock.patch('logging.getLogger') as get_logger:
+            engine.KmipEngine(database_path=database_path)
+        self.assertEqual([], get_created_indexes(get_logger))
+
     def test_process_request_unsupported_version(self):
         """
         Test that an InvalidMessage exception is raised when processing a
@@ -355,164 +564,529 @@ class TestKmipEngine(testtools.TestCase):
             )
         )
 
-    def test_process_request_unsupported_async_indicator(self):
+    def test_process_request_asynchronous(self):
         """
-        Test than an InvalidMessage error is generated while processing a
-        batch with an unsupported asynchronous indicator option.
+        Test that a request with the asynchronous indicator set is queued
+        and that its result can be polled once processed.
         """
         e = engine.KmipEngine()
         e._logger = mock.MagicMock()
+        self.addCleanup(e.stop)
 
         protocol = contents.ProtocolVersion(1, 1)
         header = messages.RequestHeader(
             protocol_version=protocol,
-            asynchronous_indicator=contents.AsynchronousIndicator(True)
+            asynchronous_indicator=contents.AsynchronousIndicator(True),
+            batch_count=contents.BatchCount(1)
         )
+        batch = list([
+            messages.RequestBatchItem(
+                operation=contents.Operation(
+                    enums.Operation.DISCOVER_VERSIONS
+                ),
+                request_payload=payloads.DiscoverVersionsRequestPayload()
+            )
+        ])
         request = messages.RequestMessage(
             request_header=header,
+            batch_items=batch
         )
 
-        args = (request, )
-        regex = "Asynchronous operations are not supported."
-        six.assertRaisesRegex(
-            self,
-            exceptions.InvalidMessage,
-            regex,
-            e.process_request,
-            *args
+        response, _, _ = e.process_request(request)
+
+        e._logger.info.assert_any_call(
+            "Queueing asynchronous operation: DiscoverVersions"
+        )
+        batch_item = response.batch_items[0]
+        self.assertEqual(
+            enums.ResultStatus.OPERATION_PENDING,
+            batch_item.result_status.value
         )
+        self.assertIsNone(batch_item.response_payload)
+        correlation_value = batch_item.async_correlation_value.value
+        self.assertEqual(16, len(correlation_value))
 
-    def test_process_request_unsupported_batch_option(self):
+        record = e._asynchronous_operations[correlation_value]
+        self.assertEqual(enums.Operation.DISCOVER_VERSIONS, record.operation)
+        self.assertIsNone(record.owner)
+        record.item.result()
+
+        result = e._process_poll(
+            payloads.PollRequestPayload(
+                asynchronous_correlation_value=correlation_value
+            )
+        )
+
+        self.assertIsInstance(result, messages.ResponseBatchItem)
+        self.assertEqual(
+            enums.Operation.DISCOVER_VERSIONS,
+            result.operation.value
+        )
+        self.assertEqual(
+            enums.ResultStatus.SUCCESS,
+            result.result_status.value
+        )
+        self.assertIsInstance(
+            result.response_payload,
+            payloads.DiscoverVersionsResponsePayload
+        )
+        self.assertEqual({}, dict(e._asynchronous_operations))
+
+    def test_process_request_asynchronous_disabled(self):
         """
-        Test that an InvalidMessage error is generated while processing a
-        batch with an unsupported batch error continuation option.
+        Test that an OperationNotSupported error is raised for a request
+        with the asynchronous indicator set when asynchronous operations are
+        disabled, and that synchronous requests are still processed.
         """
-        e = engine.KmipEngine()
+        e = engine.KmipEngine(enable_asynchronous_operations=False)
         e._logger = mock.MagicMock()
 
-        protocol = contents.ProtocolVersion(1, 1)
-        header = messages.RequestHeader(
-            protocol_version=protocol,
-            authentication=contents.Authentication(),
-            batch_error_cont_option=contents.BatchErrorContinuationOption(
-                enums.BatchErrorContinuationOption.UNDO
+        def build_request(asynchronous):
+            return messages.RequestMessage(
+                request_header=messages.RequestHeader(
+                    protocol_version=contents.ProtocolVersion(1, 1),
+                    asynchronous_indicator=contents.AsynchronousIndicator(
+                        asynchronous
+                    ),
+                    batch_count=contents.BatchCount(1)
+                ),
+                batch_items=[
+                    messages.RequestBatchItem(
+                        operation=contents.Operation(
+                            enums.Operation.DISCOVER_VERSIONS
+                        ),
+                        request_payload=(
+                            payloads.DiscoverVersionsRequestPayload()
+                        )
+                    )
+                ]
             )
-        )
-        request = messages.RequestMessage(
-            request_header=header,
-        )
 
-        args = (request, )
-        regex = "Undo option for batch handling is not supported."
+        args = (build_request(True), )
         six.assertRaisesRegex(
             self,
-            exceptions.InvalidMessage,
-            regex,
+            exceptions.OperationNotSupported,
+            "Asynchronous operations are not supported by this server.",
             e.process_request,
             *args
         )
+        self.assertIsNone(e._asynchronous_pool)
+        self.assertEqual({}, dict(e._asynchronous_operations))
 
-    def test_process_request_missing_credential(self):
+        response, _, _ = e.process_request(build_request(False))
+        self.assertEqual(
+            enums.ResultStatus.SUCCESS,
+            response.batch_items[0].result_status.value
+        )
+
+    def test_process_request_asynchronous_poll(self):
         """
-        Test that the engine does not immediately error out when retrieving
-        a non-existent credential from the request.
+        Test that Poll requests are processed synchronously and respond with
+        the batch item ID of the Poll request.
         """
         e = engine.KmipEngine()
         e._logger = mock.MagicMock()
 
-        protocol = contents.ProtocolVersion(1, 1)
-        header = messages.RequestHeader(
-            protocol_version=protocol,
-            authentication=None,
-            batch_error_cont_option=contents.BatchErrorContinuationOption(
-                enums.BatchErrorContinuationOption.STOP
-            ),
-            batch_order_option=contents.BatchOrderOption(True),
-            time_stamp=contents.TimeStamp(int(time.time())),
-            batch_count=contents.BatchCount(1)
+        item = mock.MagicMock()
+        item.done.return_value = False
+        e._asynchronous_operations[b'\x01'] = engine.AsynchronousOperation(
+            enums.Operation.CREATE,
+            None,
+            item
         )
-        payload = payloads.DiscoverVersionsRequestPayload()
+
         batch = list([
             messages.RequestBatchItem(
-                operation=contents.Operation(
-                    enums.Operation.DISCOVER_VERSIONS
-                ),
-                request_payload=payload
+                operation=contents.Operation(enums.Operation.POLL),
+                unique_batch_item_id=contents.UniqueBatchItemID(b'\x02'),
+                request_payload=payloads.PollRequestPayload(
+                    asynchronous_correlation_value=b'\x01'
+                )
             )
         ])
-        request = messages.RequestMessage(
-            request_header=header,
-            batch_items=batch
+        e.is_asynchronous = True
+        e._client_identity = [None, None]
+
+        results = e._process_batch(
+            batch,
+            enums.BatchErrorContinuationOption.STOP,
+            True
         )
 
-        e.process_request(request)
+        self.assertEqual(1, len(results))
+        self.assertEqual(enums.Operation.CREATE, results[0].operation.value)
+        self.assertEqual(b'\x02', results[0].unique_batch_item_id.value)
+        self.assertEqual(
+            enums.ResultStatus.OPERATION_PENDING,
+            results[0].result_status.value
+        )
+        self.assertEqual(
+            b'\x01',
+            results[0].async_correlation_value.value
+        )
+        self.assertIsNone(results[0].response_payload)
+        self.assertIn(b'\x01', e._asynchronous_operations)
 
-    def test_build_error_response(self):
+    def test_submit_asynchronous_operation_overloaded(self):
         """
-        Test that a bare bones response containing a single error result can
-        be constructed correctly.
+        Test that unpolled results are dropped, oldest first, to make room
+        for new asynchronous operations, and that a ServerOverloaded error is
+        raised if every slot holds a pending operation.
         """
         e = engine.KmipEngine()
         e._logger = mock.MagicMock()
+        e._asynchronous_pool = mock.MagicMock()
+        e._max_asynchronous_operations = 2
+        e._client_identity = ["John Doe", None]
 
-        response = e.build_error_response(
-            contents.ProtocolVersion(1, 1),
-            enums.ResultReason.GENERAL_FAILURE,
-            "A general test failure occurred."
+        done, pending = mock.MagicMock(), mock.MagicMock()
+        done.done.return_value = True
+        done.finish_time = metrics.clock()
+        pending.done.return_value = False
+        e._asynchronous_operations[b'\x01'] = engine.AsynchronousOperation(
+            enums.Operation.CREATE,
+            "John Doe",
+            done
+        )
+        e._asynchronous_operations[b'\x02'] = engine.AsynchronousOperation(
+            enums.Operation.CREATE,
+            "John Doe",
+            pending
         )
 
-        self.assertIsInstance(response, messages.ResponseMessage)
-
-        header = response.response_header
+        result = e._submit_asynchronous_operation(
+            enums.Operation.LOCATE,
+            None
+        )
 
+        self.assertIsInstance(result, contents.AsynchronousCorrelationValue)
         self.assertEqual(
-            contents.ProtocolVersion(1, 1),
-            header.protocol_version
+            [b'\x02', result.value],
+            list(e._asynchronous_operations.keys())
+        )
+        record = e._asynchronous_operations[result.value]
+        self.assertEqual(enums.Operation.LOCATE, record.operation)
+        self.assertEqual("John Doe", record.owner)
+        e._asynchronous_pool.submit.assert_called_once_with(
+            e._run_asynchronous_operation,
+            enums.Operation.LOCATE,
+            None,
+            e._protocol_version,
+            ["John Doe", None]
         )
-        self.assertIsNotNone(header.time_stamp)
-        self.assertIsNotNone(header.batch_count)
-        self.assertEqual(1, header.batch_count.value)
 
-        batch = response.batch_items
+        pending.done.return_value = False
+        e._asynchronous_operations[result.value] = record._replace(
+            item=pending
+        )
+        args = (enums.Operation.LOCATE, None)
+        six.assertRaisesRegex(
+            self,
+            exceptions.ServerOverloaded,
+            "Too many asynchronous operations are pending.",
+            e._submit_asynchronous_operation,
+            *args
+        )
 
-        self.assertEqual(1, len(batch))
+    def test_submit_asynchronous_operation_expired_results(self):
+        """
+        Test that results nobody polled within their lifetime are dropped
+        when new asynchronous operations are submitted.
+        """
+        e = engine.KmipEngine()
+        e._logger = mock.MagicMock()
+        e._asynchronous_pool = mock.MagicMock()
+        e._asynchronous_result_lifetime = 600
 
-        batch_item = batch[0]
+        expired, recent, pending = [mock.MagicMock() for _ in range(3)]
+        expired.done.return_value = True
+        expired.finish_time = 100.0
+        recent.done.return_value = True
+        recent.finish_time = 500.0
+        pending.done.return_value = False
+        pending.finish_time = None
+        for key, item in (
+            (b'\x01', expired),
+            (b'\x02', recent),
+            (b'\x03', pending)
+        ):
+            e._asynchronous_operations[key] = engine.AsynchronousOperation(
+                enums.Operation.CREATE,
+                None,
+                item
+            )
+
+        with mock.patch(
+            'kmip.services.server.metrics.clock',
+            return_value=1000.0
+        ):
+            result = e._submit_asynchronous_operation(
+                enums.Operation.LOCATE,
+                None
+            )
 
-        self.assertIsNone(batch_item.operation)
-        self.assertIsNone(batch_item.unique_batch_item_id)
-        self.assertEqual(
-            enums.ResultStatus.OPERATION_FAILED,
-            batch_item.result_status.value
-        )
-        self.assertEqual(
-            enums.ResultReason.GENERAL_FAILURE,
-            batch_item.result_reason.value
-        )
         self.assertEqual(
-            "A general test failure occurred.",
-            batch_item.result_message.value
+            [b'\x02', b'\x03', result.value],
+            list(e._asynchronous_operations.keys())
         )
-        self.assertIsNone(batch_item.async_correlation_value)
-        self.assertIsNone(batch_item.response_payload)
-        self.assertIsNone(batch_item.message_extension)
 
-    def test_process_batch(self):
+    def test_poll_unknown_operation(self):
         """
-        Test that a batch is processed correctly.
+        Test that an ItemNotFound error is raised when polling an unknown
+        asynchronous operation or one requested by another client.
         """
         e = engine.KmipEngine()
         e._logger = mock.MagicMock()
+        e._client_identity = ["Jane Doe", None]
+        e._asynchronous_operations[b'\x01'] = engine.AsynchronousOperation(
+            enums.Operation.CREATE,
+            "John Doe",
+            mock.MagicMock()
+        )
 
-        payload = payloads.DiscoverVersionsRequestPayload()
-        batch = list([
-            messages.RequestBatchItem(
-                operation=contents.Operation(
-                    enums.Operation.DISCOVER_VERSIONS
+        for correlation_value in (b'\x01', b'\x02'):
+            args = (
+                payloads.PollRequestPayload(
+                    asynchronous_correlation_value=correlation_value
                 ),
-                request_payload=payload
             )
-        ])
+            six.assertRaisesRegex(
+                self,
+                exceptions.ItemNotFound,
+                "Could not locate an asynchronous operation with the given "
+                "correlation value.",
+                e._process_poll,
+                *args
+            )
+        self.assertIn(b'\x01', e._asynchronous_operations)
+
+    def test_cancel(self):
+        """
+        Test that a Cancel request reports whether the asynchronous
+        operation was canceled.
+        """
+        e = engine.KmipEngine()
+        e._logger = mock.MagicMock()
+        e._client_identity = [None, None]
+
+        def build_item(canceled, done, status=None):
+            item = mock.MagicMock()
+            item.cancel.return_value = canceled
+            item.done.return_value = done
+            item.result.return_value = messages.ResponseBatchItem(
+                result_status=contents.ResultStatus(status)
+            )
+            return item
+
+        cases = (
+            (
+                build_item(True, True),
+                enums.CancellationResult.CANCELED
+            ),
+            (
+                build_item(False, False),
+                enums.CancellationResult.UNABLE_TO_CANCEL
+            ),
+            (
+                build_item(False, True, enums.ResultStatus.SUCCESS),
+                enums.CancellationResult.COMPLETED
+            ),
+            (
+                build_item(False, True, enums.ResultStatus.OPERATION_FAILED),
+                enums.CancellationResult.FAILED
+            )
+        )
+        for item, cancellation_result in cases:
+            e._asynchronous_operations[b'\x01'] = \
+                engine.AsynchronousOperation(
+                    enums.Operation.CREATE,
+                    None,
+                    item
+                )
+
+            result = e._process_cancel(
+                payloads.CancelRequestPayload(
+                    asynchronous_correlation_value=b'\x01'
+                )
+            )
+
+            e._logger.info.assert_called_with("Processing operation: Cancel")
+            self.assertIsInstance(result, payloads.CancelResponsePayload)
+            self.assertEqual(b'\x01', result.asynchronous_correlation_value)
+            self.assertEqual(cancellation_result, result.cancellation_result)
+
+        self.assertIn(b'\x01', e._asynchronous_operations)
+        e._asynchronous_operations.clear()
+
+        e._asynchronous_operations[b'\x01'] = engine.AsynchronousOperation(
+            enums.Operation.CREATE,
+            None,
+            build_item(True, True)
+        )
+        e._process_cancel(
+            payloads.CancelRequestPayload(
+                asynchronous_correlation_value=b'\x01'
+            )
+        )
+        self.assertEqual({}, dict(e._asynchronous_operations))
+
+    def test_dispose(self):
+        """
+        Test that disposing of the engine closes its pooled database
+        connections.
+        """
+        e = engine.KmipEngine()
+        e._data_store = mock.MagicMock()
+
+        e.dispose()
+
+        e._data_store.dispose.assert_called_once_with()
+
+    def test_stop(self):
+        """
+        Test that stopping the engine stops the asynchronous worker.
+        """
+        e = engine.KmipEngine()
+        e.stop()
+
+        asynchronous_pool = mock.MagicMock()
+        e._asynchronous_pool = asynchronous_pool
+        e.stop()
+
+        asynchronous_pool.stop.assert_called_once_with()
+        self.assertIsNone(e._asynchronous_pool)
+
+    def test_process_request_unsupported_batch_option(self):
+        """
+        Test that an InvalidMessage error is generated while processing a
+        batch with an unsupported batch error continuation option.
+        """
+        e = engine.KmipEngine()
+        e._logger = mock.MagicMock()
+
+        protocol = contents.ProtocolVersion(1, 1)
+        header = messages.RequestHeader(
+            protocol_version=protocol,
+            authentication=contents.Authentication(),
+            batch_error_cont_option=contents.BatchErrorContinuationOption(
+                enums.BatchErrorContinuationOption.UNDO
+            )
+        )
+        request = messages.RequestMessage(
+            request_header=header,
+        )
+
+        args = (request, )
+        regex = "Undo option for batch handling is not supported."
+        six.assertRaisesRegex(
+            self,
+            exceptions.InvalidMessage,
+            regex,
+            e.process_request,
+            *args
+        )
+
+    def test_process_request_missing_credential(self):
+        """
+        Test that the engine does not immediately error out when retrieving
+        a non-existent credential from the request.
+        """
+        e = engine.KmipEngine()
+        e._logger = mock.MagicMock()
+
+        protocol = contents.ProtocolVersion(1, 1)
+        header = messages.RequestHeader(
+            protocol_version=protocol,
+            authentication=None,
+            batch_error_cont_option=contents.BatchErrorContinuationOption(
+                enums.BatchErrorContinuationOption.STOP
+            ),
+            batch_order_option=contents.BatchOrderOption(True),
+            time_stamp=contents.TimeStamp(int(time.time())),
+            batch_count=contents.BatchCount(1)
+        )
+        payload = payloads.DiscoverVersionsRequestPayload()
+        batch = list([
+            messages.RequestBatchItem(
+                operation=contents.Operation(
+                    enums.Operation.DISCOVER_VERSIONS
+                ),
+                request_payload=payload
+            )
+        ])
+        request = messages.RequestMessage(
+            request_header=header,
+            batch_items=batch
+        )
+
+        e.process_request(request)
+
+    def test_build_error_response(self):
+        """
+        Test that a bare bones response containing a single error result can
+        be constructed correctly.
+        """
+        e = engine.KmipEngine()
+        e._logger = mock.MagicMock()
+
+        response = e.build_error_response(
+            contents.ProtocolVersion(1, 1),
+            enums.ResultReason.GENERAL_FAILURE,
+            "A general test failure occurred."
+        )
+
+        self.assertIsInstance(response, messages.ResponseMessage)
+
+        header = response.response_header
+
+        self.assertEqual(
+            contents.ProtocolVersion(1, 1),
+            header.protocol_version
+        )
+        self.assertIsNotNone(header.time_stamp)
+        self.assertIsNotNone(header.batch_count)
+        self.assertEqual(1, header.batch_count.value)
+
+        batch = response.batch_items
+
+        self.assertEqual(1, len(batch))
+
+        batch_item = batch[0]
+
+        self.assertIsNone(batch_item.operation)
+        self.assertIsNone(batch_item.unique_batch_item_id)
+        self.assertEqual(
+            enums.ResultStatus.OPERATION_FAILED,
+            batch_item.result_status.value
+        )
+        self.assertEqual(
+            enums.ResultReason.GENERAL_FAILURE,
+            batch_item.result_reason.value
+        )
+        self.assertEqual(
+            "A general test failure occurred.",
+            batch_item.result_message.value
+        )
+        self.assertIsNone(batch_item.async_correlation_value)
+        self.assertIsNone(batch_item.response_payload)
+        self.assertIsNone(batch_item.message_extension)
+
+    def test_process_batch(self):
+        """
+        Test that a batch is processed correctly.
+        """
+        e = engine.KmipEngine()
+        e._logger = mock.MagicMock()
+
+        payload = payloads.DiscoverVersionsRequestPayload()
+        batch = list([
+            messages.RequestBatchItem(
+                operation=contents.Operation(
+                    enums.Operation.DISCOVER_VERSIONS
+                ),
+                request_payload=payload
+            )
+        ])
 
         results = e._process_batch(
             batch,
@@ -558,6 +1132,66 @@ class TestKmipEngine(testtools.TestCase):
         self.assertIsNotNone(results)
         self.assertEqual(2, len(results))
 
+    def test_process_batch_lazy_payload_decoding(self):
+        """
+        Test that lazily read batch item payloads are decoded as they are
+        processed, that a payload decoding error only fails its own batch
+        item, and that later batch items are not decoded once processing
+        stops.
+        """
+        e = engine.KmipEngine()
+        e._logger = mock.MagicMock()
+
+        def build_batch_item(batch_item_id, payload_encoding):
+            operation = contents.Operation(enums.Operation.DISCOVER_VERSIONS)
+            unique_batch_item_id = contents.UniqueBatchItemID(batch_item_id)
+            encoding = utils.BytearrayStream()
+            operation.write(encoding)
+            unique_batch_item_id.write(encoding)
+            encoding.write(payload_encoding)
+
+            batch_item = messages.RequestBatchItem()
+            batch_item.read(
+                utils.BytearrayStream(
+                    b'\x42\x00\x0F\x01' +
+                    struct.pack('!I', len(encoding)) +
+                    encoding.buffer
+                ),
+                lazy=True
+            )
+            return batch_item
+
+        batch = [
+            build_batch_item(1, b'\x42\x00\x79\x01\x00\x00\x00\x00'),
+            build_batch_item(
+                2,
+                b'\x42\x00\x79\x01\x00\x00\x00\x08'
+                b'\xFF\xFF\xFF\x01\x00\x00\x00\x00'
+            ),
+            build_batch_item(3, b'\x42\x00\x79\x01\x00\x00\x00\x00')
+        ]
+
+        results = e._process_batch(
+            batch,
+            enums.BatchErrorContinuationOption.STOP,
+            True
+        )
+
+        self.assertEqual(2, len(results))
+        self.assertEqual(
+            enums.ResultStatus.SUCCESS,
+            results[0].result_status.value
+        )
+        self.assertEqual(
+            enums.ResultStatus.OPERATION_FAILED,
+            results[1].result_status.value
+        )
+        self.assertEqual(
+            enums.ResultReason.INVALID_MESSAGE,
+            results[1].result_reason.value
+        )
+        self.assertFalse(batch[2].is_payload_decoded)
+
     def test_process_batch_missing_batch_id(self):
         """
         Test that an InvalidMessage error is generated while processing a
@@ -634,6 +1268,52 @@ class TestKmipEngine(testtools.TestCase):
         self.assertIsNone(result.response_payload)
         self.assertIsNone(result.message_extension)
 
+    def test_process_batch_with_metrics(self):
+        """
+        Test that failed batch items are counted in the metrics sink by
+        operation and result reason.
+        """
+        metrics_sink = mock.MagicMock()
+        e = engine.KmipEngine(metrics_sink=metrics_sink)
+        e._logger = mock.MagicMock()
+        e._protocol_version = contents.ProtocolVersion(1, 0)
+
+        batch = [
+            messages.RequestBatchItem(
+                operation=contents.Operation(
+                    enums.Operation.DISCOVER_VERSIONS
+                ),
+                unique_batch_item_id=contents.UniqueBatchItemID(i),
+                request_payload=payloads.DiscoverVersionsRequestPayload()
+            ) for i in (1, 2)
+        ]
+
+        e._process_batch(
+            batch,
+            enums.BatchErrorContinuationOption.CONTINUE,
+            True
+        )
+
+        self.assertEqual(
+            [
+                mock.call('DiscoverVersions', 'OperationNotSupported'),
+                mock.call('DiscoverVersions', 'OperationNotSupported')
+            ],
+            metrics_sink.count_error.call_args_list
+        )
+
+        # Successful batch items are not counted.
+        metrics_sink.reset_mock()
+        e._protocol_version = contents.ProtocolVersion(1, 1)
+
+        e._process_batch(
+            batch,
+            enums.BatchErrorContinuationOption.CONTINUE,
+            True
+        )
+
+        metrics_sink.count_error.assert_not_called()
+
     def test_process_batch_unexpected_error(self):
         """
         Test that an unexpected, non-KMIP error is handled appropriately
@@ -724,6 +1404,7 @@ class TestKmipEngine(testtools.TestCase):
         e._process_sign = mock.MagicMock()
         e._process_set_attribute = mock.MagicMock()
         e._process_modify_attribute = mock.MagicMock()
+        e._protocol_version = contents.ProtocolVersion(2, 0)
 
         e._process_operation(enums.Operation.CREATE, None)
         e._process_operation(enums.Operation.CREATE_KEY_PAIR, None)
@@ -776,7 +1457,7 @@ class TestKmipEngine(testtools.TestCase):
         e = engine.KmipEngine()
         e._logger = mock.MagicMock()
 
-        args = (enums.Operation.POLL, None)
+        args = (enums.Operation.ARCHIVE, None)
         regex = "{0} operation is not supported by the server.".format(
             args[0].name.title()
         )
@@ -788,38 +1469,160 @@ class TestKmipEngine(testtools.TestCase):
             *args
         )
 
-    def test_get_object_type(self):
+    def test_registered_operation(self):
         """
-        Test that the object type of a stored object can be retrieved
-        correctly.
+        Test that a handler registered for an operation is invoked with the
+        engine and the request payload.
         """
         e = engine.KmipEngine()
-        e._data_store = self.engine
-        e._data_store_session_factory = self.session_factory
-        e._data_session = e._data_store_session_factory()
-        e._is_allowed_by_operation_policy = mock.Mock(return_value=True)
         e._logger = mock.MagicMock()
 
-        obj_a = pie_objects.OpaqueObject(b'', enums.OpaqueDataType.NONE)
-
-        e._data_session.add(obj_a)
-        e._data_session.commit()
-        e._data_session = e._data_store_session_factory()
-
-        id_a = str(obj_a.unique_identifier)
+        handler = mock.MagicMock()
+        operations.register_operation(
+            enums.Operation.ARCHIVE,
+            request_payload=payloads.PollRequestPayload,
+            handler=handler,
+            min_version=enums.KMIPVersion.KMIP_1_2
+        )
+        self.addCleanup(
+            operations.unregister_operation,
+            enums.Operation.ARCHIVE
+        )
 
-        object_type = e._get_object_type(id_a)
-        e._data_session.commit()
+        result = e._process_operation(enums.Operation.ARCHIVE, None)
 
-        self.assertEqual(pie_objects.OpaqueObject, object_type)
+        handler.assert_called_once_with(e, None)
+        self.assertEqual(handler.return_value, result)
 
-    def test_get_object_type_missing_object(self):
+    def test_registered_operation_unsupported_version(self):
         """
-        Test that an ItemNotFound error is generated when attempting to
-        retrieve the object type of an object that does not exist.
+        Test that an OperationNotSupported error is generated when invoking
+        a registered operation with a KMIP version older than the one the
+        handler was registered for.
         """
         e = engine.KmipEngine()
-        e._data_store = self.engine
+        e._logger = mock.MagicMock()
+
+        handler = mock.MagicMock()
+        operations.register_operation(
+            enums.Operation.ARCHIVE,
+            handler=handler,
+            min_version=enums.KMIPVersion.KMIP_2_0
+        )
+        self.addCleanup(
+            operations.unregister_operation,
+            enums.Operation.ARCHIVE
+        )
+
+        args = (enums.Operation.ARCHIVE, None)
+        regex = "Archive is not supported by KMIP {0}".format(
+            e._protocol_version
+        )
+        six.assertRaisesRegex(
+            self,
+            exceptions.OperationNotSupported,
+            regex,
+            e._process_operation,
+            *args
+        )
+        handler.assert_not_called()
+
+    def test_registered_operation_code(self):
+        """
+        Test that a handler registered for an extension operation code is
+        invoked, and that unregistered codes are not supported.
+        """
+        e = engine.KmipEngine()
+        e._logger = mock.MagicMock()
+
+        handler = mock.MagicMock()
+        operations.register_operation(0x80000001, handler=handler)
+        self.addCleanup(operations.unregister_operation, 0x80000001)
+
+        result = e._process_operation(0x80000001, None)
+
+        handler.assert_called_once_with(e, None)
+        self.assertEqual(handler.return_value, result)
+
+        args = (0x80000002, None)
+        regex = "0x80000002 operation is not supported by the server."
+        six.assertRaisesRegex(
+            self,
+            exceptions.OperationNotSupported,
+            regex,
+            e._process_operation,
+            *args
+        )
+
+    def test_builtin_operation_registered_version(self):
+        """
+        Test that the version a built-in operation is registered with is
+        enforced before its handler is invoked.
+        """
+        e = engine.KmipEngine()
+        e._logger = mock.MagicMock()
+        e._process_query = mock.MagicMock()
+
+        entry = operations.get_operation(enums.Operation.QUERY)
+        operations.register_operation(
+            enums.Operation.QUERY,
+            request_payload=entry.request_payload,
+            response_payload=entry.response_payload,
+            handler=entry.handler,
+            min_version=enums.KMIPVersion.KMIP_2_0,
+            replace=True
+        )
+        self.addCleanup(
+            operations.register_operation,
+            *entry,
+            replace=True
+        )
+
+        args = (enums.Operation.QUERY, None)
+        regex = "Query is not supported by KMIP {0}".format(
+            e._protocol_version
+        )
+        six.assertRaisesRegex(
+            self,
+            exceptions.OperationNotSupported,
+            regex,
+            e._process_operation,
+            *args
+        )
+        e._process_query.assert_not_called()
+
+    def test_get_object_type(self):
+        """
+        Test that the object type of a stored object can be retrieved
+        correctly.
+        """
+        e = engine.KmipEngine()
+        e._data_store = self.engine
+        e._data_store_session_factory = self.session_factory
+        e._data_session = e._data_store_session_factory()
+        e._is_allowed_by_operation_policy = mock.Mock(return_value=True)
+        e._logger = mock.MagicMock()
+
+        obj_a = pie_objects.OpaqueObject(b'', enums.OpaqueDataType.NONE)
+
+        e._data_session.add(obj_a)
+        e._data_session.commit()
+        e._data_session = e._data_store_session_factory()
+
+        id_a = str(obj_a.unique_identifier)
+
+        object_type = e._get_object_type(id_a)
+        e._data_session.commit()
+
+        self.assertEqual(pie_objects.OpaqueObject, object_type)
+
+    def test_get_object_type_missing_object(self):
+        """
+        Test that an ItemNotFound error is generated when attempting to
+        retrieve the object type of an object that does not exist.
+        """
+        e = engine.KmipEngine()
+        e._data_store = self.engine
         e._data_store_session_factory = self.session_factory
         e._data_session = e._data_store_session_factory()
         e._is_allowed_by_operation_policy = mock.Mock(return_value=True)
@@ -2874,6 +3677,107 @@ class TestKmipEngine(testtools.TestCase):
         e.is_allowed.assert_not_called()
         self.assertFalse(result)
 
+    def test_is_allowed_by_operation_policy_reuses_decisions(self):
+        """
+        Test that access decisions are made once per request for objects
+        sharing the same policy, object type, and ownership.
+        """
+        e = engine.KmipEngine()
+        e.is_allowed = mock.Mock(return_value=False)
+
+        args = (
+            'test_policy',
+            ['test_user', ['test_group_A']],
+            'other_user',
+            enums.ObjectType.SYMMETRIC_KEY,
+            enums.Operation.GET
+        )
+        self.assertFalse(e._is_allowed_by_operation_policy(*args))
+        self.assertFalse(
+            e._is_allowed_by_operation_policy(
+                'test_policy',
+                ['test_user', ['test_group_A']],
+                None,
+                enums.ObjectType.SYMMETRIC_KEY,
+                enums.Operation.GET
+            )
+        )
+        e.is_allowed.assert_called_once_with(
+            'test_policy',
+            'test_user',
+            'test_group_A',
+            'other_user',
+            enums.ObjectType.SYMMETRIC_KEY,
+            enums.Operation.GET
+        )
+
+        # The owner, another user, or another group get their own decision.
+        e._is_allowed_by_operation_policy(
+            'test_policy',
+            ['test_user', ['test_group_A']],
+            'test_user',
+            enums.ObjectType.SYMMETRIC_KEY,
+            enums.Operation.GET
+        )
+        e._is_allowed_by_operation_policy(
+            'test_policy',
+            ['other_user', ['test_group_A']],
+            'other_user',
+            enums.ObjectType.SYMMETRIC_KEY,
+            enums.Operation.GET
+        )
+        e._is_allowed_by_operation_policy(
+            'test_policy',
+            ['test_user', ['test_group_B']],
+            'other_user',
+            enums.ObjectType.SYMMETRIC_KEY,
+            enums.Operation.GET
+        )
+        self.assertEqual(4, e.is_allowed.call_count)
+
+        # Each request makes its own decisions.
+        e._set_context(
+            engine.RequestContext(contents.ProtocolVersion(1, 2))
+        )
+        e.is_allowed = mock.Mock(return_value=True)
+        self.assertTrue(e._is_allowed_by_operation_policy(*args))
+        e.is_allowed.assert_called_once_with(
+            'test_policy',
+            'test_user',
+            'test_group_A',
+            'other_user',
+            enums.ObjectType.SYMMETRIC_KEY,
+            enums.Operation.GET
+        )
+
+    def test_get_operation_policies(self):
+        """
+        Test that the operation policies are copied and copied again only
+        after they change, if the engine is given a policy change counter.
+        """
+        policies = {'test_policy': {'preset': {}}}
+        e = engine.KmipEngine(policies=policies)
+        self.assertIs(policies, e._get_operation_policies())
+
+        policy_changes = mock.MagicMock(value=3)
+        e = engine.KmipEngine(
+            policies=policies,
+            policy_changes=policy_changes
+        )
+
+        result = e._get_operation_policies()
+        self.assertEqual(policies, result)
+        self.assertIsNot(policies, result)
+
+        policies['new_policy'] = {'preset': {}}
+        self.assertIs(result, e._get_operation_policies())
+        self.assertIsNone(e.get_relevant_policy_section('new_policy'))
+
+        policy_changes.value = 4
+        result = e._get_operation_policies()
+        self.assertEqual(policies, result)
+        self.assertEqual({}, e.get_relevant_policy_section('new_policy'))
+
     def test_get_relevant_policy_section_policy_missing(self):
         """
         Test that the lookup for a non-existent policy is handled correctly.
@@ -6757,17 +7661,9 @@ class TestKmipEngine(testtools.TestCase):
             name='name1'
         )
         obj_a.initial_date = int(time.time())
-        obj_a_time_str = time.strftime(
-            "%a %b %-2d %H:%M:%S %Y",
-            time.gmtime(obj_a.initial_date)
-        )
 
         time.sleep(2)
         mid_time = int(time.time())
-        mid_time_str = time.strftime(
-            "%a %b %-2d %H:%M:%S %Y",
-            time.gmtime(mid_time)
-        )
         time.sleep(2)
 
         obj_b = pie_objects.SymmetricKey(
@@ -6777,10 +7673,6 @@ class TestKmipEngine(testtools.TestCase):
             name='name2'
         )
         obj_b.initial_date = int(time.time())
-        obj_b_time_str = time.strftime(
-            "%a %b %-2d %H:%M:%S %Y",
-            time.gmtime(obj_b.initial_date)
-        )
 
         time.sleep(2)
         end_time = int(time.time())
@@ -6809,16 +7701,6 @@ class TestKmipEngine(testtools.TestCase):
         e._data_session = e._data_store_session_factory()
 
         e._logger.info.assert_any_call("Processing operation: Locate")
-        e._logger.debug.assert_any_call(
-            "Failed match: object's initial date ({}) does not match "
-            "the specified initial date ({}).".format(
-                obj_b_time_str,
-                obj_a_time_str
-            )
-        )
-        e._logger.debug.assert_any_call(
-            "Locate filter matched object: {}".format(id_a)
-        )
         self.assertEqual(len(response_payload.unique_identifiers), 1)
         self.assertIn(id_a, response_payload.unique_identifiers)
 
@@ -6840,16 +7722,6 @@ class TestKmipEngine(testtools.TestCase):
         e._data_session = e._data_store_session_factory()
 
         e._logger.info.assert_any_call("Processing operation: Locate")
-        e._logger.debug.assert_any_call(
-            "Failed match: object's initial date ({}) is less than "
-            "the starting initial date ({}).".format(
-                obj_a_time_str,
-                mid_time_str
-            )
-        )
-        e._logger.debug.assert_any_call(
-            "Locate filter matched object: {}".format(id_b)
-        )
         self.assertEqual(len(response_payload.unique_identifiers), 1)
         self.assertIn(id_b, response_payload.unique_identifiers)
 
@@ -6907,17 +7779,6 @@ class TestKmipEngine(testtools.TestCase):
         e._data_session = e._data_store_session_factory()
 
         e._logger.info.assert_any_call("Processing operation: Locate")
-        e._logger.debug.assert_any_call(
-            "Locate filter matched object: {}".format(id_a)
-        )
-        e._logger.debug.assert_any_call(
-            "Failed match: "
-            "the specified state ({}) does not match "
-            "the object's state ({}).".format(
-                enums.State.PRE_ACTIVE.name,
-                enums.State.ACTIVE.name
-            )
-        )
         self.assertEqual(len(response_payload.unique_identifiers), 1)
         self.assertIn(id_a, response_payload.unique_identifiers)
 
@@ -6934,17 +7795,6 @@ class TestKmipEngine(testtools.TestCase):
         e._data_session = e._data_store_session_factory()
 
         e._logger.info.assert_any_call("Processing operation: Locate")
-        e._logger.debug.assert_any_call(
-            "Failed match: "
-            "the specified state ({}) does not match "
-            "the object's state ({}).".format(
-                enums.State.ACTIVE.name,
-                enums.State.PRE_ACTIVE.name
-            )
-        )
-        e._logger.debug.assert_any_call(
-            "Locate filter matched object: {}".format(id_b)
-        )
         self.assertEqual(len(response_payload.unique_identifiers), 1)
         self.assertIn(id_b, response_payload.unique_identifiers)
 
@@ -6998,14 +7848,6 @@ class TestKmipEngine(testtools.TestCase):
         e._data_session = e._data_store_session_factory()
 
         e._logger.info.assert_any_call("Processing operation: Locate")
-        e._logger.debug.assert_any_call(
-            "Locate filter matched object: {}".format(id_b)
-        )
-        e._logger.debug.assert_any_call(
-            "Failed match: "
-            "the specified object type (SECRET_DATA) does not "
-            "match the object's object type (SYMMETRIC_KEY)."
-        )
         self.assertEqual(1, len(response_payload.unique_identifiers))
         self.assertIn(id_b, response_payload.unique_identifiers)
 
@@ -7023,14 +7865,6 @@ class TestKmipEngine(testtools.TestCase):
         e._data_session = e._data_store_session_factory()
 
         e._logger.info.assert_any_call("Processing operation: Locate")
-        e._logger.debug.assert_any_call(
-            "Locate filter matched object: {}".format(id_a)
-        )
-        e._logger.debug.assert_any_call(
-            "Failed match: "
-            "the specified object type (SYMMETRIC_KEY) does not "
-            "match the object's object type (SECRET_DATA)."
-        )
         self.assertEqual(1, len(response_payload.unique_identifiers))
         self.assertIn(id_a, response_payload.unique_identifiers)
 
@@ -7048,16 +7882,6 @@ class TestKmipEngine(testtools.TestCase):
         e._data_session = e._data_store_session_factory()
 
         e._logger.info.assert_any_call("Processing operation: Locate")
-        e._logger.debug.assert_any_call(
-            "Failed match: "
-            "the specified object type (PUBLIC_KEY) does not "
-            "match the object's object type (SYMMETRIC_KEY)."
-        )
-        e._logger.debug.assert_any_call(
-            "Failed match: "
-            "the specified object type (PUBLIC_KEY) does not "
-            "match the object's object type (SECRET_DATA)."
-        )
         self.assertEqual(0, len(response_payload.unique_identifiers))
 
     def test_locate_with_cryptographic_algorithm(self):
@@ -7110,14 +7934,6 @@ class TestKmipEngine(testtools.TestCase):
         e._data_session = e._data_store_session_factory()
 
         e._logger.info.assert_any_call("Processing operation: Locate")
-        e._logger.debug.assert_any_call(
-            "Locate filter matched object: {}".format(id_a)
-        )
-        e._logger.debug.assert_any_call(
-            "Failed match: "
-            "the specified attribute (Cryptographic Algorithm) is not "
-            "applicable for the object's object type (SECRET_DATA)."
-        )
         self.assertEqual(1, len(response_payload.unique_identifiers))
         self.assertIn(id_a, response_payload.unique_identifiers)
 
@@ -7136,16 +7952,6 @@ class TestKmipEngine(testtools.TestCase):
         e._data_session = e._data_store_session_factory()
 
         e._logger.info.assert_any_call("Processing operation: Locate")
-        e._logger.debug.assert_any_call(
-            "Failed match: "
-            "the specified cryptographic algorithm (RSA) does not match "
-            "the object's cryptographic algorithm (AES)."
-        )
-        e._logger.debug.assert_any_call(
-            "Failed match: "
-            "the specified attribute (Cryptographic Algorithm) is not "
-            "applicable for the object's object type (SECRET_DATA)."
-        )
         self.assertEqual(0, len(response_payload.unique_identifiers))
 
     def test_locate_with_cryptographic_length(self):
@@ -7198,14 +8004,6 @@ class TestKmipEngine(testtools.TestCase):
         e._data_session = e._data_store_session_factory()
 
         e._logger.info.assert_any_call("Processing operation: Locate")
-        e._logger.debug.assert_any_call(
-            "Locate filter matched object: {}".format(id_a)
-        )
-        e._logger.debug.assert_any_call(
-            "Failed match: "
-            "the specified attribute (Cryptographic Length) is not "
-            "applicable for the object's object type (SECRET_DATA)."
-        )
         self.assertEqual(1, len(response_payload.unique_identifiers))
         self.assertIn(id_a, response_payload.unique_identifiers)
 
@@ -7224,16 +8022,6 @@ class TestKmipEngine(testtools.TestCase):
         e._data_session = e._data_store_session_factory()
 
         e._logger.info.assert_any_call("Processing operation: Locate")
-        e._logger.debug.assert_any_call(
-            "Failed match: "
-            "the specified cryptographic length (2048) does not match "
-            "the object's cryptographic length (128)."
-        )
-        e._logger.debug.assert_any_call(
-            "Failed match: "
-            "the specified attribute (Cryptographic Length) is not "
-            "applicable for the object's object type (SECRET_DATA)."
-        )
         self.assertEqual(0, len(response_payload.unique_identifiers))
 
     def test_locate_with_cryptographic_usage_masks(self):
@@ -7295,12 +8083,6 @@ class TestKmipEngine(testtools.TestCase):
         e._data_session = e._data_store_session_factory()
 
         e._logger.info.assert_any_call("Processing operation: Locate")
-        e._logger.debug.assert_any_call(
-            "Locate filter matched object: {}".format(id_a)
-        )
-        e._logger.debug.assert_any_call(
-            "Locate filter matched object: {}".format(id_b)
-        )
         self.assertEqual(2, len(response_payload.unique_identifiers))
         self.assertIn(id_a, response_payload.unique_identifiers)
         self.assertIn(id_b, response_payload.unique_identifiers)
@@ -7322,13 +8104,6 @@ class TestKmipEngine(testtools.TestCase):
         e._data_session = e._data_store_session_factory()
 
         e._logger.info.assert_any_call("Processing operation: Locate")
-        e._logger.debug.assert_any_call(
-            "Locate filter matched object: {}".format(id_a)
-        )
-        e._logger.debug.assert_any_call(
-            "Failed match: the specified cryptographic usage mask (ENCRYPT) "
-            "is not set on the object."
-        )
         self.assertEqual(1, len(response_payload.unique_identifiers))
         self.assertIn(id_a, response_payload.unique_identifiers)
 
@@ -7349,14 +8124,6 @@ class TestKmipEngine(testtools.TestCase):
         e._data_session = e._data_store_session_factory()
 
         e._logger.info.assert_any_call("Processing operation: Locate")
-        e._logger.debug.assert_any_call(
-            "Failed match: the specified cryptographic usage mask (SIGN) "
-            "is not set on the object."
-        )
-        e._logger.debug.assert_any_call(
-            "Failed match: the specified cryptographic usage mask (SIGN) "
-            "is not set on the object."
-        )
         self.assertEqual(0, len(response_payload.unique_identifiers))
 
     def test_locate_with_certificate_type(self):
@@ -7408,14 +8175,6 @@ class TestKmipEngine(testtools.TestCase):
         e._data_session = e._data_store_session_factory()
 
         e._logger.info.assert_any_call("Processing operation: Locate")
-        e._logger.debug.assert_any_call(
-            "Locate filter matched object: {}".format(id_a)
-        )
-        e._logger.debug.assert_any_call(
-            "Failed match: "
-            "the specified attribute (Certificate Type) is not "
-            "applicable for the object's object type (SECRET_DATA)."
-        )
         self.assertEqual(1, len(response_payload.unique_identifiers))
         self.assertIn(id_a, response_payload.unique_identifiers)
 
@@ -7434,16 +8193,6 @@ class TestKmipEngine(testtools.TestCase):
         e._data_session = e._data_store_session_factory()
 
         e._logger.info.assert_any_call("Processing operation: Locate")
-        e._logger.debug.assert_any_call(
-            "Failed match: "
-            "the specified certificate type (PGP) does not match "
-            "the object's certificate type (X_509)."
-        )
-        e._logger.debug.assert_any_call(
-            "Failed match: "
-            "the specified attribute (Certificate Type) is not "
-            "applicable for the object's object type (SECRET_DATA)."
-        )
         self.assertEqual(0, len(response_payload.unique_identifiers))
 
     def test_locate_with_unique_identifier(self):
@@ -7497,14 +8246,6 @@ class TestKmipEngine(testtools.TestCase):
         e._data_session = e._data_store_session_factory()
 
         e._logger.info.assert_any_call("Processing operation: Locate")
-        e._logger.debug.assert_any_call(
-            "Locate filter matched object: {}".format(id_a)
-        )
-        e._logger.debug.assert_any_call(
-            "Failed match: "
-            "the specified unique identifier ({}) does not match "
-            "the object's unique identifier ({}).".format(id_a, id_b)
-        )
         self.assertEqual(1, len(response_payload.unique_identifiers))
         self.assertIn(id_a, response_payload.unique_identifiers)
 
@@ -7521,14 +8262,6 @@ class TestKmipEngine(testtools.TestCase):
         e._data_session = e._data_store_session_factory()
 
         e._logger.info.assert_any_call("Processing operation: Locate")
-        e._logger.debug.assert_any_call(
-            "Failed match: "
-            "the specified unique identifier ({}) does not match "
-            "the object's unique identifier ({}).".format(id_b, id_a)
-        )
-        e._logger.debug.assert_any_call(
-            "Locate filter matched object: {}".format(id_b)
-        )
         self.assertEqual(1, len(response_payload.unique_identifiers))
         self.assertIn(id_b, response_payload.unique_identifiers)
 
@@ -7547,16 +8280,6 @@ class TestKmipEngine(testtools.TestCase):
         e._data_session = e._data_store_session_factory()
 
         e._logger.info.assert_any_call("Processing operation: Locate")
-        e._logger.debug.assert_any_call(
-            "Failed match: "
-            "the specified unique identifier ({}) does not match "
-            "the object's unique identifier ({}).".format("unknown", id_a)
-        )
-        e._logger.debug.assert_any_call(
-            "Failed match: "
-            "the specified unique identifier ({}) does not match "
-            "the object's unique identifier ({}).".format("unknown", id_b)
-        )
         self.assertEqual(0, len(response_payload.unique_identifiers))
 
     def test_locate_with_operation_policy_name(self):
@@ -7612,14 +8335,6 @@ class TestKmipEngine(testtools.TestCase):
         e._data_session = e._data_store_session_factory()
 
         e._logger.info.assert_any_call("Processing operation: Locate")
-        e._logger.debug.assert_any_call(
-            "Locate filter matched object: {}".format(id_a)
-        )
-        e._logger.debug.assert_any_call(
-            "Failed match: "
-            "the specified operation policy name (default) does not match "
-            "the object's operation policy name (custom)."
-        )
         self.assertEqual(1, len(response_payload.unique_identifiers))
         self.assertIn(id_a, response_payload.unique_identifiers)
 
@@ -7636,14 +8351,6 @@ class TestKmipEngine(testtools.TestCase):
         e._data_session = e._data_store_session_factory()
 
         e._logger.info.assert_any_call("Processing operation: Locate")
-        e._logger.debug.assert_any_call(
-            "Locate filter matched object: {}".format(id_b)
-        )
-        e._logger.debug.assert_any_call(
-            "Failed match: "
-            "the specified operation policy name (custom) does not match "
-            "the object's operation policy name (default)."
-        )
         self.assertEqual(1, len(response_payload.unique_identifiers))
         self.assertIn(id_b, response_payload.unique_identifiers)
 
@@ -7660,16 +8367,6 @@ class TestKmipEngine(testtools.TestCase):
         e._data_session = e._data_store_session_factory()
 
         e._logger.info.assert_any_call("Processing operation: Locate")
-        e._logger.debug.assert_any_call(
-            "Failed match: "
-            "the specified operation policy name (unknown) does not match "
-            "the object's operation policy name (default)."
-        )
-        e._logger.debug.assert_any_call(
-            "Failed match: "
-            "the specified operation policy name (unknown) does not match "
-            "the object's operation policy name (custom)."
-        )
         self.assertEqual(0, len(response_payload.unique_identifiers))
 
     def test_locate_with_application_specific_information(self):
@@ -7730,171 +8427,584 @@ class TestKmipEngine(testtools.TestCase):
         # specific information attribute.
         attrs = [
             attribute_factory.create_attribute(
-                enums.AttributeType.APPLICATION_SPECIFIC_INFORMATION,
+                enums.AttributeType.APPLICATION_SPECIFIC_INFORMATION,
+                {
+                    "application_namespace": "ssl",
+                    "application_data": "www.example.com"
+                }
+            )
+        ]
+        payload = payloads.LocateRequestPayload(attributes=attrs)
+        e._logger.reset_mock()
+        response_payload = e._process_locate(payload)
+        e._data_session.commit()
+        e._data_session = e._data_store_session_factory()
+
+        e._logger.info.assert_any_call("Processing operation: Locate")
+        self.assertEqual(2, len(response_payload.unique_identifiers))
+        self.assertIn(id_a, response_payload.unique_identifiers)
+        self.assertIn(id_b, response_payload.unique_identifiers)
+
+        # Locate a single symmetric key object based on its unique application
+        # specific information attribute.
+        attrs = [
+            attribute_factory.create_attribute(
+                enums.AttributeType.APPLICATION_SPECIFIC_INFORMATION,
+                {
+                    "application_namespace": "ssl",
+                    "application_data": "www.test.com"
+                }
+            )
+        ]
+        payload = payloads.LocateRequestPayload(attributes=attrs)
+        e._logger.reset_mock()
+        response_payload = e._process_locate(payload)
+        e._data_session.commit()
+        e._data_session = e._data_store_session_factory()
+
+        e._logger.info.assert_any_call("Processing operation: Locate")
+        self.assertEqual(1, len(response_payload.unique_identifiers))
+        self.assertIn(id_a, response_payload.unique_identifiers)
+
+    def test_locate_with_object_group(self):
+        """
+        Test the Locate operation when the 'Object Group'
+        attribute is given.
+        """
+        e = engine.KmipEngine()
+        e._data_store = self.engine
+        e._data_store_session_factory = self.session_factory
+        e._data_session = e._data_store_session_factory()
+        e._is_allowed_by_operation_policy = mock.Mock(return_value=True)
+        e._logger = mock.MagicMock()
+
+        key = (
+            b'\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+        )
+
+        object_group_a = pie_objects.ObjectGroup(object_group="Group1")
+        object_group_b = pie_objects.ObjectGroup(object_group="Group2")
+
+        obj_a = pie_objects.SymmetricKey(
+            enums.CryptographicAlgorithm.AES,
+            128,
+            key,
+            name='name1'
+        )
+        obj_a.object_groups.append(object_group_a)
+        obj_b = pie_objects.SecretData(
+            key,
+            enums.SecretDataType.PASSWORD
+        )
+        obj_b.object_groups.append(object_group_a)
+        obj_b.object_groups.append(object_group_b)
+        obj_c = pie_objects.SecretData(
+            key,
+            enums.SecretDataType.PASSWORD
+        )
+
+        e._data_session.add(obj_a)
+        e._data_session.add(obj_b)
+        e._data_session.add(obj_c)
+        e._data_session.commit()
+        e._data_session = e._data_store_session_factory()
+
+        id_a = str(obj_a.unique_identifier)
+        id_b = str(obj_b.unique_identifier)
+
+        attribute_factory = factory.AttributeFactory()
+
+        # Locate the symmetric key objects based on their shared object group
+        # attribute.
+        attrs = [
+            attribute_factory.create_attribute(
+                enums.AttributeType.OBJECT_GROUP,
+                "Group1"
+            )
+        ]
+        payload = payloads.LocateRequestPayload(attributes=attrs)
+        e._logger.reset_mock()
+        response_payload = e._process_locate(payload)
+        e._data_session.commit()
+        e._data_session = e._data_store_session_factory()
+
+        e._logger.info.assert_any_call("Processing operation: Locate")
+        self.assertEqual(2, len(response_payload.unique_identifiers))
+        self.assertIn(id_a, response_payload.unique_identifiers)
+        self.assertIn(id_b, response_payload.unique_identifiers)
+
+        # Locate a single symmetric key object based on its unique object group
+        # attribute.
+        attrs = [
+            attribute_factory.create_attribute(
+                enums.AttributeType.OBJECT_GROUP,
+                "Group2"
+            )
+        ]
+        payload = payloads.LocateRequestPayload(attributes=attrs)
+        e._logger.reset_mock()
+        response_payload = e._process_locate(payload)
+        e._data_session.commit()
+        e._data_session = e._data_store_session_factory()
+
+        e._logger.info.assert_any_call("Processing operation: Locate")
+        self.assertEqual(1, len(response_payload.unique_identifiers))
+        self.assertIn(id_b, response_payload.unique_identifiers)
+
+    def test_locate_filters_in_database(self):
+        """
+        Test that the Locate operation compares supported attributes in the
+        database, so that objects not matching them are never evaluated.
+        """
+        e = engine.KmipEngine()
+        e._data_store = self.engine
+        e._data_store_session_factory = self.session_factory
+        e._data_session = e._data_store_session_factory()
+        e._is_allowed_by_operation_policy = mock.Mock(return_value=True)
+        e._get_attribute_from_managed_object = mock.Mock(return_value=None)
+        e._logger = mock.MagicMock()
+
+        key = (
+            b'\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+        )
+        obj_a = pie_objects.SymmetricKey(
+            enums.CryptographicAlgorithm.AES,
+            128,
+            key,
+            [
+                enums.CryptographicUsageMask.ENCRYPT,
+                enums.CryptographicUsageMask.DECRYPT
+            ],
+            name='name0'
+        )
+        obj_a.state = enums.State.ACTIVE
+        obj_b = pie_objects.SymmetricKey(
+            enums.CryptographicAlgorithm.AES,
+            256,
+            key * 2,
+            [enums.CryptographicUsageMask.ENCRYPT],
+            name='name0'
+        )
+        obj_b.state = None
+        obj_c = pie_objects.SecretData(
+            key,
+            enums.SecretDataType.PASSWORD,
+            name='name0'
+        )
+        obj_d = pie_objects.OpaqueObject(
+            key,
+            enums.OpaqueDataType.NONE,
+            name='name0'
+        )
+
+        e._data_session.add(obj_a)
+        e._data_session.add(obj_b)
+        e._data_session.add(obj_c)
+        e._data_session.add(obj_d)
+        e._data_session.commit()
+        e._data_session = e._data_store_session_factory()
+
+        id_a = str(obj_a.unique_identifier)
+        id_b = str(obj_b.unique_identifier)
+        id_c = str(obj_c.unique_identifier)
+
+        attribute_factory = factory.AttributeFactory()
+
+        # Opaque objects have no state, so they never match one.
+        attrs = [
+            attribute_factory.create_attribute(
+                enums.AttributeType.NAME,
+                attributes.Name.create(
+                    'name0',
+                    enums.NameType.UNINTERPRETED_TEXT_STRING
+                )
+            ),
+            attribute_factory.create_attribute(
+                enums.AttributeType.STATE,
+                enums.State.ACTIVE
+            ),
+            attribute_factory.create_attribute(
+                enums.AttributeType.CRYPTOGRAPHIC_USAGE_MASK,
+                [enums.CryptographicUsageMask.DECRYPT]
+            )
+        ]
+        payload = payloads.LocateRequestPayload(attributes=attrs)
+        response_payload = e._process_locate(payload)
+
+        self.assertEqual([id_a], response_payload.unique_identifiers)
+        self.assertEqual(1, e._is_allowed_by_operation_policy.call_count)
+        e._get_attribute_from_managed_object.assert_not_called()
+
+        # Objects without a state match any state.
+        payload = payloads.LocateRequestPayload(attributes=attrs[:2])
+        response_payload = e._process_locate(payload)
+
+        self.assertEqual(
+            [id_a, id_b],
+            sorted(response_payload.unique_identifiers)
+        )
+
+        # Secret data has no cryptographic algorithm, so it cannot match one.
+        attrs = [
+            attribute_factory.create_attribute(
+                enums.AttributeType.CRYPTOGRAPHIC_ALGORITHM,
+                enums.CryptographicAlgorithm.AES
+            ),
+            attribute_factory.create_attribute(
+                enums.AttributeType.CRYPTOGRAPHIC_LENGTH,
+                256
+            )
+        ]
+        payload = payloads.LocateRequestPayload(attributes=attrs)
+        response_payload = e._process_locate(payload)
+
+        self.assertEqual([id_b], response_payload.unique_identifiers)
+
+        # Unique identifiers only match in their canonical form.
+        for unique_identifier, expected in (
+            (id_c, [id_c]),
+            ('0' + id_c, []),
+            ('invalid', [])
+        ):
+            attrs = [
+                attribute_factory.create_attribute(
+                    enums.AttributeType.UNIQUE_IDENTIFIER,
+                    unique_identifier
+                )
+            ]
+            payload = payloads.LocateRequestPayload(attributes=attrs)
+            response_payload = e._process_locate(payload)
+
+            self.assertEqual(expected, response_payload.unique_identifiers)
+
+    def test_locate_with_unsupported_filter(self):
+        """
+        Test that the Locate operation compares attributes that cannot be
+        compared in the database against the objects matching the others.
+        """
+        e = engine.KmipEngine()
+        e._data_store = self.engine
+        e._data_store_session_factory = self.session_factory
+        e._data_session = e._data_store_session_factory()
+        e._is_allowed_by_operation_policy = mock.Mock(return_value=True)
+        e._logger = mock.MagicMock()
+
+        key = (
+            b'\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+        )
+        obj_a = pie_objects.SymmetricKey(
+            enums.CryptographicAlgorithm.AES,
+            128,
+            key,
+            name='name0'
+        )
+        obj_b = pie_objects.SymmetricKey(
+            enums.CryptographicAlgorithm.AES,
+            128,
+            key,
+            name='name1'
+        )
+
+        e._data_session.add(obj_a)
+        e._data_session.add(obj_b)
+        e._data_session.commit()
+        e._data_session = e._data_store_session_factory()
+
+        id_a = str(obj_a.unique_identifier)
+        id_b = str(obj_b.unique_identifier)
+
+        attribute_factory = factory.AttributeFactory()
+        attrs = [
+            attribute_factory.create_attribute(
+                enums.AttributeType.NAME,
+                attributes.Name.create(
+                    'name0',
+                    enums.NameType.UNINTERPRETED_TEXT_STRING
+                )
+            ),
+            attribute_factory.create_attribute(
+                enums.AttributeType.CRYPTOGRAPHIC_PARAMETERS,
                 {
-                    "application_namespace": "ssl",
-                    "application_data": "www.example.com"
+                    'block_cipher_mode': enums.BlockCipherMode.CBC
                 }
             )
         ]
         payload = payloads.LocateRequestPayload(attributes=attrs)
         e._logger.reset_mock()
         response_payload = e._process_locate(payload)
-        e._data_session.commit()
-        e._data_session = e._data_store_session_factory()
 
-        e._logger.info.assert_any_call("Processing operation: Locate")
+        self.assertEqual([id_a], response_payload.unique_identifiers)
         e._logger.debug.assert_any_call(
-            "Locate filter matched object: {}".format(id_a)
+            "Evaluating object: {}".format(id_a)
         )
-        e._logger.debug.assert_any_call(
-            "Locate filter matched object: {}".format(id_b)
+        self.assertNotIn(
+            mock.call("Evaluating object: {}".format(id_b)),
+            e._logger.debug.call_args_list
         )
         e._logger.debug.assert_any_call(
-            "Failed match: "
-            "the specified application specific "
-            "information ('ssl', 'www.example.com') does not match any "
-            "of the object's associated application "
-            "specific information attributes."
+            "Locate filter matched object: {}".format(id_a)
         )
-        self.assertEqual(2, len(response_payload.unique_identifiers))
-        self.assertIn(id_a, response_payload.unique_identifiers)
-        self.assertIn(id_b, response_payload.unique_identifiers)
 
-        # Locate a single symmetric key object based on its unique application
-        # specific information attribute.
-        attrs = [
-            attribute_factory.create_attribute(
-                enums.AttributeType.APPLICATION_SPECIFIC_INFORMATION,
-                {
-                    "application_namespace": "ssl",
-                    "application_data": "www.test.com"
-                }
+    def test_locate_pages_in_database(self):
+        """
+        Test that the Locate operation sorts, counts, and pages the objects
+        the client can access in the database, loading only the objects of
+        the requested page.
+        """
+        e = engine.KmipEngine()
+        e._data_store = self.engine
+        e._data_store_session_factory = self.session_factory
+        e._data_session = e._data_store_session_factory()
+        e._protocol_version = contents.ProtocolVersion(1, 3)
+        e._client_identity = ['test', None]
+        e._is_allowed_by_operation_policy = mock.Mock(
+            side_effect=lambda policy, identity, owner, object_type, op: (
+                owner == identity[0]
             )
-        ]
-        payload = payloads.LocateRequestPayload(attributes=attrs)
-        e._logger.reset_mock()
+        )
+        e._logger = mock.MagicMock()
+
+        key = (
+            b'\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+        )
+        managed_objects = []
+        for initial_date, owner in [
+            (1, 'test'),
+            (2, 'test'),
+            (2, 'other'),
+            (2, 'test'),
+            (3, 'test'),
+            (3, 'other')
+        ]:
+            managed_object = pie_objects.SymmetricKey(
+                enums.CryptographicAlgorithm.AES,
+                128,
+                key
+            )
+            managed_object.initial_date = initial_date
+            managed_object._owner = owner
+            managed_objects.append(managed_object)
+            e._data_session.add(managed_object)
+        e._data_session.commit()
+        e._data_session = e._data_store_session_factory()
+
+        ids = [str(x.unique_identifier) for x in managed_objects]
+
+        # Objects with the same initial date are sorted by their identifiers.
+        payload = payloads.LocateRequestPayload()
         response_payload = e._process_locate(payload)
         e._data_session.commit()
         e._data_session = e._data_store_session_factory()
 
-        e._logger.info.assert_any_call("Processing operation: Locate")
-        e._logger.debug.assert_any_call(
-            "Locate filter matched object: {}".format(id_a)
+        self.assertEqual(4, response_payload.located_items)
+        self.assertEqual(
+            [ids[4], ids[1], ids[3], ids[0]],
+            response_payload.unique_identifiers
         )
-        e._logger.debug.assert_any_call(
-            "Failed match: "
-            "the specified application specific "
-            "information ('ssl', 'www.test.com') does not match any "
-            "of the object's associated application "
-            "specific information attributes."
+
+        # The policies are evaluated once per group of objects sharing the
+        # same policy, object type, and ownership.
+        self.assertEqual(2, e._is_allowed_by_operation_policy.call_count)
+
+        loaded = []
+
+        def record_load(target, context):
+            loaded.append(str(target.unique_identifier))
+
+        sqlalchemy.event.listen(
+            pie_objects.ManagedObject,
+            'load',
+            record_load,
+            propagate=True
+        )
+        self.addCleanup(
+            sqlalchemy.event.remove,
+            pie_objects.ManagedObject,
+            'load',
+            record_load
         )
-        self.assertEqual(1, len(response_payload.unique_identifiers))
-        self.assertIn(id_a, response_payload.unique_identifiers)
 
-    def test_locate_with_object_group(self):
+        payload = payloads.LocateRequestPayload(
+            offset_items=1,
+            maximum_items=2
+        )
+        response_payload = e._process_locate(payload)
+
+        self.assertEqual(4, response_payload.located_items)
+        self.assertEqual(
+            [ids[1], ids[3]],
+            response_payload.unique_identifiers
+        )
+        self.assertEqual([ids[1], ids[3]], loaded)
+        e._data_session.commit()
+        e._data_session = e._data_store_session_factory()
+
+        # No object is returned if the client cannot access any of them.
+        e._is_allowed_by_operation_policy = mock.Mock(return_value=False)
+        payload = payloads.LocateRequestPayload()
+        response_payload = e._process_locate(payload)
+
+        self.assertEqual(0, response_payload.located_items)
+        self.assertEqual([], response_payload.unique_identifiers)
+
+    def test_locate_located_items(self):
         """
-        Test the Locate operation when the 'Object Group'
-        attribute is given.
+        Test that the Locate operation returns the number of matching objects
+        for KMIP 1.3 and later, including when some attributes are compared
+        against the objects loaded from the database.
         """
         e = engine.KmipEngine()
         e._data_store = self.engine
         e._data_store_session_factory = self.session_factory
         e._data_session = e._data_store_session_factory()
+        e._protocol_version = contents.ProtocolVersion(1, 3)
         e._is_allowed_by_operation_policy = mock.Mock(return_value=True)
         e._logger = mock.MagicMock()
 
         key = (
             b'\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
         )
-
-        object_group_a = pie_objects.ObjectGroup(object_group="Group1")
-        object_group_b = pie_objects.ObjectGroup(object_group="Group2")
-
         obj_a = pie_objects.SymmetricKey(
             enums.CryptographicAlgorithm.AES,
             128,
             key,
-            name='name1'
-        )
-        obj_a.object_groups.append(object_group_a)
-        obj_b = pie_objects.SecretData(
-            key,
-            enums.SecretDataType.PASSWORD
+            name='name0'
         )
-        obj_b.object_groups.append(object_group_a)
-        obj_b.object_groups.append(object_group_b)
-        obj_c = pie_objects.SecretData(
+        obj_a.initial_date = 1
+        obj_b = pie_objects.SymmetricKey(
+            enums.CryptographicAlgorithm.AES,
+            128,
             key,
-            enums.SecretDataType.PASSWORD
+            name='name0'
         )
+        obj_b.initial_date = 2
 
         e._data_session.add(obj_a)
         e._data_session.add(obj_b)
-        e._data_session.add(obj_c)
         e._data_session.commit()
         e._data_session = e._data_store_session_factory()
 
-        id_a = str(obj_a.unique_identifier)
         id_b = str(obj_b.unique_identifier)
 
         attribute_factory = factory.AttributeFactory()
-
-        # Locate the symmetric key objects based on their shared object group
-        # attribute.
         attrs = [
             attribute_factory.create_attribute(
-                enums.AttributeType.OBJECT_GROUP,
-                "Group1"
+                enums.AttributeType.NAME,
+                attributes.Name.create(
+                    'name0',
+                    enums.NameType.UNINTERPRETED_TEXT_STRING
+                )
+            ),
+            attribute_factory.create_attribute(
+                enums.AttributeType.CRYPTOGRAPHIC_PARAMETERS,
+                {
+                    'block_cipher_mode': enums.BlockCipherMode.CBC
+                }
             )
         ]
-        payload = payloads.LocateRequestPayload(attributes=attrs)
-        e._logger.reset_mock()
+        payload = payloads.LocateRequestPayload(
+            maximum_items=1,
+            attributes=attrs
+        )
         response_payload = e._process_locate(payload)
         e._data_session.commit()
         e._data_session = e._data_store_session_factory()
 
-        e._logger.info.assert_any_call("Processing operation: Locate")
-        e._logger.debug.assert_any_call(
-            "Locate filter matched object: {}".format(id_a)
-        )
-        e._logger.debug.assert_any_call(
-            "Locate filter matched object: {}".format(id_b)
-        )
-        e._logger.debug.assert_any_call(
-            "Failed match: "
-            "the specified object group ('Group1') does not match any "
-            "of the object's associated object group attributes."
-        )
-        self.assertEqual(2, len(response_payload.unique_identifiers))
-        self.assertIn(id_a, response_payload.unique_identifiers)
-        self.assertIn(id_b, response_payload.unique_identifiers)
+        self.assertEqual(2, response_payload.located_items)
+        self.assertEqual([id_b], response_payload.unique_identifiers)
 
-        # Locate a single symmetric key object based on its unique object group
-        # attribute.
-        attrs = [
-            attribute_factory.create_attribute(
-                enums.AttributeType.OBJECT_GROUP,
-                "Group2"
-            )
-        ]
-        payload = payloads.LocateRequestPayload(attributes=attrs)
-        e._logger.reset_mock()
+        # The Located Items field is not defined before KMIP 1.3.
+        e._protocol_version = contents.ProtocolVersion(1, 2)
+        payload = payloads.LocateRequestPayload(maximum_items=1)
         response_payload = e._process_locate(payload)
+
+        self.assertIsNone(response_payload.located_items)
+        self.assertEqual([id_b], response_payload.unique_identifiers)
+
+    def test_list_objects_with_access_controls(self):
+        """
+        Test that only the objects the client can access are loaded when
+        listing objects, with the policies evaluated once per policy, object
+        type, and ownership.
+        """
+        e = engine.KmipEngine(
+            policies={
+                'default': {
+                    'preset': {
+                        enums.ObjectType.SYMMETRIC_KEY: {
+                            enums.Operation.LOCATE: enums.Policy.ALLOW_OWNER
+                        },
+                        enums.ObjectType.SECRET_DATA: {
+                            enums.Operation.LOCATE: enums.Policy.ALLOW_ALL
+                        }
+                    }
+                }
+            }
+        )
+        e._data_store = self.engine
+        e._data_store_session_factory = self.session_factory
+        e._data_session = e._data_store_session_factory()
+        e._client_identity = ['test', None]
+        e._logger = mock.MagicMock()
+        e.is_allowed = mock.Mock(wraps=e.is_allowed)
+
+        key = (
+            b'\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+        )
+        managed_objects = []
+        for object_type, owner, policy_name in [
+            (enums.ObjectType.SYMMETRIC_KEY, 'test', 'default'),
+            (enums.ObjectType.SYMMETRIC_KEY, 'other', 'default'),
+            (enums.ObjectType.SYMMETRIC_KEY, None, 'default'),
+            (enums.ObjectType.SECRET_DATA, 'other', 'default'),
+            (enums.ObjectType.SYMMETRIC_KEY, 'test', 'missing')
+        ]:
+            if object_type == enums.ObjectType.SYMMETRIC_KEY:
+                managed_object = pie_objects.SymmetricKey(
+                    enums.CryptographicAlgorithm.AES,
+                    128,
+                    key
+                )
+            else:
+                managed_object = pie_objects.SecretData(
+                    key,
+                    enums.SecretDataType.PASSWORD
+                )
+            managed_object._owner = owner
+            managed_object.operation_policy_name = policy_name
+            managed_objects.append(managed_object)
+            e._data_session.add(managed_object)
         e._data_session.commit()
         e._data_session = e._data_store_session_factory()
 
-        e._logger.info.assert_any_call("Processing operation: Locate")
-        e._logger.debug.assert_any_call(
-            "Locate filter matched object: {}".format(id_b)
+        ids = [x.unique_identifier for x in managed_objects]
+
+        loaded = []
+
+        def record_load(target, context):
+            loaded.append(target.unique_identifier)
+
+        sqlalchemy.event.listen(
+            pie_objects.ManagedObject,
+            'load',
+            record_load,
+            propagate=True
         )
-        e._logger.debug.assert_any_call(
-            "Failed match: "
-            "the specified object group ('Group2') does not match any "
-            "of the object's associated object group attributes."
+        self.addCleanup(
+            sqlalchemy.event.remove,
+            pie_objects.ManagedObject,
+            'load',
+            record_load
         )
-        self.assertEqual(1, len(response_payload.unique_identifiers))
-        self.assertIn(id_b, response_payload.unique_identifiers)
+
+        result = e._list_objects_with_access_controls(enums.Operation.LOCATE)
+
+        self.assertEqual(
+            [ids[0], ids[3]],
+            sorted([x.unique_identifier for x in result])
+        )
+        self.assertEqual([ids[0], ids[3]], sorted(loaded))
+        self.assertEqual(4, e.is_allowed.call_count)
 
     def test_get(self):
         """
@@ -9888,7 +10998,7 @@ class TestKmipEngine(testtools.TestCase):
         e._logger.info.assert_called_once_with("Processing operation: Query")
         self.assertIsInstance(result, payloads.QueryResponsePayload)
         self.assertIsInstance(result.operations, list)
-        self.assertEqual(12, len(result.operations))
+        self.assertEqual(14, len(result.operations))
         self.assertEqual(
             enums.Operation.CREATE,
             result.operations[0]
@@ -9937,6 +11047,14 @@ class TestKmipEngine(testtools.TestCase):
             enums.Operation.QUERY,
             result.operations[11]
         )
+        self.assertEqual(
+            enums.Operation.CANCEL,
+            result.operations[12]
+        )
+        self.assertEqual(
+            enums.Operation.POLL,
+            result.operations[13]
+        )
         self.assertIsNone(result.object_types)
         self.assertIsNotNone(result.vendor_identification)
         self.assertEqual(
@@ -9972,7 +11090,7 @@ class TestKmipEngine(testtools.TestCase):
         e._logger.info.assert_called_once_with("Processing operation: Query")
         self.assertIsInstance(result, payloads.QueryResponsePayload)
         self.assertIsInstance(result.operations, list)
-        self.assertEqual(13, len(result.operations))
+        self.assertEqual(15, len(result.operations))
         self.assertEqual(
             enums.Operation.CREATE,
             result.operations[0]
@@ -10022,9 +11140,17 @@ class TestKmipEngine(testtools.TestCase):
             result.operations[11]
         )
         self.assertEqual(
-            enums.Operation.DISCOVER_VERSIONS,
+            enums.Operation.CANCEL,
             result.operations[12]
         )
+        self.assertEqual(
+            enums.Operation.POLL,
+            result.operations[13]
+        )
+        self.assertEqual(
+            enums.Operation.DISCOVER_VERSIONS,
+            result.operations[14]
+        )
         self.assertIsNone(result.object_types)
         self.assertIsNotNone(result.vendor_identification)
         self.assertEqual(
@@ -10060,7 +11186,7 @@ class TestKmipEngine(testtools.TestCase):
         e._logger.info.assert_called_once_with("Processing operation: Query")
         self.assertIsInstance(result, payloads.QueryResponsePayload)
         self.assertIsInstance(result.operations, list)
-        self.assertEqual(18, len(result.operations))
+        self.assertEqual(20, len(result.operations))
         self.assertEqual(
             enums.Operation.CREATE,
             result.operations[0]
@@ -10110,29 +11236,37 @@ class TestKmipEngine(testtools.TestCase):
             result.operations[11]
         )
         self.assertEqual(
-            enums.Operation.DISCOVER_VERSIONS,
+            enums.Operation.CANCEL,
             result.operations[12]
         )
         self.assertEqual(
-            enums.Operation.ENCRYPT,
+            enums.Operation.POLL,
             result.operations[13]
         )
         self.assertEqual(
-            enums.Operation.DECRYPT,
+            enums.Operation.DISCOVER_VERSIONS,
             result.operations[14]
         )
         self.assertEqual(
-            enums.Operation.SIGN,
+            enums.Operation.ENCRYPT,
             result.operations[15]
         )
         self.assertEqual(
-            enums.Operation.SIGNATURE_VERIFY,
+            enums.Operation.DECRYPT,
             result.operations[16]
         )
         self.assertEqual(
-            enums.Operation.MAC,
+            enums.Operation.SIGN,
             result.operations[17]
         )
+        self.assertEqual(
+            enums.Operation.SIGNATURE_VERIFY,
+            result.operations[18]
+        )
+        self.assertEqual(
+            enums.Operation.MAC,
+            result.operations[19]
+        )
         self.assertIsNone(result.object_types)
         self.assertIsNotNone(result.vendor_identification)
         self.assertEqual(
@@ -10221,6 +11355,98 @@ class TestKmipEngine(testtools.TestCase):
         )
         self.assertEqual([], result.protocol_versions)
 
+    def test_discover_versions_cached(self):
+        """
+        Test that DiscoverVersions responses are cached per requested
+        versions.
+        """
+        e = engine.KmipEngine()
+        e._logger = mock.MagicMock()
+
+        payload = payloads.DiscoverVersionsRequestPayload()
+        result = e._process_discover_versions(payload)
+
+        self.assertIsNotNone(
+            result.get_cached_encoding(enums.KMIPVersion.KMIP_1_2)
+        )
+        self.assertIs(result, e._process_discover_versions(payload))
+
+        other = e._process_discover_versions(
+            payloads.DiscoverVersionsRequestPayload([
+                contents.ProtocolVersion(1, 0)
+            ])
+        )
+        self.assertIsNot(result, other)
+        self.assertEqual(
+            [contents.ProtocolVersion(1, 0)],
+            other.protocol_versions
+        )
+        self.assertEqual(2, len(e._response_cache))
+
+    def test_query_cached(self):
+        """
+        Test that Query responses are cached per query functions and KMIP
+        version.
+        """
+        e = engine.KmipEngine()
+        e._logger = mock.MagicMock()
+        e._protocol_version = contents.ProtocolVersion(1, 0)
+
+        result = e._process_query(
+            payloads.QueryRequestPayload(
+                query_functions=[
+                    enums.QueryFunction.QUERY_OPERATIONS,
+                    enums.QueryFunction.QUERY_OBJECTS
+                ]
+            )
+        )
+        self.assertIs(
+            result,
+            e._process_query(
+                payloads.QueryRequestPayload(
+                    query_functions=[
+                        enums.QueryFunction.QUERY_OBJECTS,
+                        enums.QueryFunction.QUERY_OPERATIONS
+                    ]
+                )
+            )
+        )
+        self.assertIsNotNone(
+            result.get_cached_encoding(enums.KMIPVersion.KMIP_1_0)
+        )
+        self.assertEqual(1, len(e._response_cache))
+
+        e._protocol_version = contents.ProtocolVersion(1, 2)
+        other = e._process_query(
+            payloads.QueryRequestPayload(
+                query_functions=[
+                    enums.QueryFunction.QUERY_OPERATIONS,
+                    enums.QueryFunction.QUERY_OBJECTS
+                ]
+            )
+        )
+        self.assertIsNot(result, other)
+        self.assertEqual(14, len(result.operations))
+        self.assertEqual(20, len(other.operations))
+        self.assertEqual(2, len(e._response_cache))
+
+    def test_query_cache_full(self):
+        """
+        Test that responses are still built once the response cache is full.
+        """
+        e = engine.KmipEngine()
+        e._logger = mock.MagicMock()
+        e._response_cache_size = 0
+
+        payload = payloads.QueryRequestPayload(
+            query_functions=[enums.QueryFunction.QUERY_OPERATIONS]
+        )
+        result = e._process_query(payload)
+
+        self.assertIsInstance(result, payloads.QueryResponsePayload)
+        self.assertEqual({}, e._response_cache)
+        self.assertIsNot(result, e._process_query(payload))
+
     def test_encrypt(self):
         """
         Test that an Encrypt request can be processed correctly.
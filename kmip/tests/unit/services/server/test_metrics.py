@@ -0,0 +1,506 @@
+# Copyright (c) 2020 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import mock
+import testtools
+import threading
+
+from six.moves import http_client
+
+from kmip.core import enums
+from kmip.core.messages import operations
+from kmip.services.server import metrics
+
+
+class TestGetOperationLabel(testtools.TestCase):
+    """
+    Test suite for the get_operation_label function.
+    """
+
+    def test_get_operation_label(self):
+        """
+        Test that operations are labeled with their CamelCase name.
+        """
+        self.assertEqual(
+            'Create',
+            metrics.get_operation_label(enums.Operation.CREATE)
+        )
+        self.assertEqual(
+            'CreateKeyPair',
+            metrics.get_operation_label(enums.Operation.CREATE_KEY_PAIR)
+        )
+        self.assertEqual('None', metrics.get_operation_label(None))
+        self.assertEqual('None', metrics.get_operation_label(0xFFFF))
+
+    def test_get_operation_label_registered_code(self):
+        """
+        Test that registered operation codes are labeled with their code.
+        """
+        operations.register_operation(0x80000001)
+        self.addCleanup(operations.unregister_operation, 0x80000001)
+
+        self.assertEqual(
+            '0x80000001',
+            metrics.get_operation_label(0x80000001)
+        )
+        self.assertEqual('None', metrics.get_operation_label(0x80000002))
+
+    def test_get_reason_label(self):
+        """
+        Test that result reasons are labeled with their CamelCase name.
+        """
+        self.assertEqual(
+            'ItemNotFound',
+            metrics.get_reason_label(enums.ResultReason.ITEM_NOT_FOUND)
+        )
+        self.assertEqual('None', metrics.get_reason_label(None))
+
+
+class TestHistogram(testtools.TestCase):
+    """
+    Test suite for the Histogram.
+    """
+
+    def test_observe(self):
+        """
+        Test that observed values are counted in the right bucket.
+        """
+        histogram = metrics.Histogram((0.1, 1.0, float('inf')))
+
+        histogram.observe(0.05)
+        histogram.observe(0.1)
+        histogram.observe(0.5)
+        histogram.observe(20.0)
+
+        self.assertEqual([2, 1, 1], histogram.counts)
+        self.assertEqual(4, histogram.count)
+        self.assertAlmostEqual(20.65, histogram.sum)
+        self.assertEqual(20.0, histogram.max)
+
+    def test_quantile(self):
+        """
+        Test that quantiles are estimated with the bucket upper bounds,
+        capped by the largest observed value.
+        """
+        histogram = metrics.Histogram((0.1, 1.0, float('inf')))
+        self.assertEqual(0.0, histogram.quantile(0.5))
+
+        for _ in range(98):
+            histogram.observe(0.05)
+        histogram.observe(0.5)
+        histogram.observe(5.0)
+
+        self.assertEqual(0.1, histogram.quantile(0.5))
+        self.assertEqual(1.0, histogram.quantile(0.99))
+        self.assertEqual(5.0, histogram.quantile(1.0))
+
+    def test_copy(self):
+        """
+        Test that a copy of a histogram is not affected by later
+        observations.
+        """
+        histogram = metrics.Histogram()
+        histogram.observe(0.01)
+
+        copy = histogram.copy()
+        histogram.observe(0.02)
+
+        self.assertEqual(1, copy.count)
+        self.assertEqual(1, sum(copy.counts))
+        self.assertEqual(2, histogram.count)
+
+    def test_merge(self):
+        """
+        Test that merging a histogram adds up its observations.
+        """
+        a = metrics.Histogram((0.1, 1.0, float('inf')))
+        a.observe(0.05)
+        b = metrics.Histogram((0.1, 1.0, float('inf')))
+        b.observe(0.5)
+        b.observe(2.0)
+
+        a.merge(b)
+
+        self.assertEqual([1, 1, 1], a.counts)
+        self.assertEqual(3, a.count)
+        self.assertAlmostEqual(2.55, a.sum)
+        self.assertEqual(2.0, a.max)
+
+
+class TestInMemoryMetricsSink(testtools.TestCase):
+    """
+    Test suite for the InMemoryMetricsSink.
+    """
+
+    def test_observe(self):
+        """
+        Test that durations are recorded per operation and phase.
+        """
+        sink = metrics.InMemoryMetricsSink()
+
+        sink.observe('Create', 'handler', 0.002)
+        sink.observe('Create', 'handler', 0.004)
+        sink.observe('Create', 'total', 0.005)
+        sink.observe('Get', 'handler', 0.001)
+
+        snapshot = sink.snapshot()
+
+        self.assertEqual(set(['Create', 'Get']), set(snapshot.keys()))
+        self.assertEqual(
+            set(['handler', 'total']),
+            set(snapshot['Create'].keys())
+        )
+        self.assertEqual(2, snapshot['Create']['handler'].count)
+        self.assertEqual(0.004, snapshot['Create']['handler'].max)
+        self.assertEqual(1, snapshot['Get']['handler'].count)
+
+        sink.reset()
+
+        self.assertEqual({}, sink.snapshot())
+
+    def test_count_error(self):
+        """
+        Test that errors are counted per operation and result reason.
+        """
+        sink = metrics.InMemoryMetricsSink()
+
+        sink.count_error('Get', 'ItemNotFound')
+        sink.count_error('Get', 'ItemNotFound')
+        sink.count_error('Get', 'PermissionDenied')
+
+        self.assertEqual(
+            {
+                ('Get', 'ItemNotFound'): 2,
+                ('Get', 'PermissionDenied'): 1
+            },
+            sink.error_counts()
+        )
+
+        sink.reset()
+
+        self.assertEqual({}, sink.error_counts())
+
+    def test_observe_from_threads(self):
+        """
+        Test that the measurements of several threads are merged, and that
+        the shards of exited threads are folded together.
+        """
+        sink = metrics.InMemoryMetricsSink()
+
+        def record():
+            for _ in range(100):
+                sink.observe('Get', 'total', 0.001)
+            sink.count_error('Get', 'ItemNotFound')
+
+        threads = [threading.Thread(target=record) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(10)
+        record()
+
+        self.assertEqual(500, sink.snapshot()['Get']['total'].count)
+        self.assertEqual({('Get', 'ItemNotFound'): 5}, sink.error_counts())
+        self.assertEqual(1, len(sink._shards))
+
+    def test_dump(self):
+        """
+        Test that the summary lists operations by name and phases in request
+        order.
+        """
+        sink = metrics.InMemoryMetricsSink()
+        self.assertEqual("", sink.dump())
+
+        sink.observe('Get', 'total', 0.004)
+        sink.observe('Get', 'handler', 0.002)
+        sink.observe('Get', 'read', 0.001)
+        sink.observe('Create', 'handler', 0.003)
+
+        self.assertEqual(
+            "Create handler: count=1 mean=3.000ms p50=3.000ms p99=3.000ms "
+            "max=3.000ms\n"
+            "Get read: count=1 mean=1.000ms p50=1.000ms p99=1.000ms "
+            "max=1.000ms\n"
+            "Get handler: count=1 mean=2.000ms p50=2.000ms p99=2.000ms "
+            "max=2.000ms\n"
+            "Get total: count=1 mean=4.000ms p50=4.000ms p99=4.000ms "
+            "max=4.000ms",
+            sink.dump()
+        )
+
+        sink.count_error('Get', 'ItemNotFound')
+
+        self.assertEqual(
+            "Get error ItemNotFound: count=1",
+            sink.dump().splitlines()[-1]
+        )
+
+    def test_collect(self):
+        """
+        Test that the measurements are collected as Prometheus metrics.
+        """
+        sink = metrics.InMemoryMetricsSink()
+
+        sink.observe('Get', 'handler', 0.0002)
+        sink.observe('Get', 'total', 0.0002)
+        sink.observe('Get', 'total', 20.0)
+        sink.count_error('Get', 'ItemNotFound')
+
+        requests, durations, errors = sink.collect()
+
+        self.assertEqual('kmip_requests_total', requests.name)
+        self.assertEqual('counter', requests.type)
+        self.assertEqual([('', {'operation': 'Get'}, 2)], requests.samples)
+
+        self.assertEqual('kmip_request_duration_seconds', durations.name)
+        self.assertEqual('histogram', durations.type)
+        self.assertEqual(
+            2 * (len(metrics.BUCKETS) + 2),
+            len(durations.samples)
+        )
+        labels = {'operation': 'Get', 'phase': 'total'}
+        self.assertIn(
+            ('_bucket', dict(labels, le=0.0001), 0),
+            durations.samples
+        )
+        self.assertIn(
+            ('_bucket', dict(labels, le=0.00025), 1),
+            durations.samples
+        )
+        self.assertIn(
+            ('_bucket', dict(labels, le=10.0), 1),
+            durations.samples
+        )
+        self.assertIn(
+            ('_bucket', dict(labels, le=float('inf')), 2),
+            durations.samples
+        )
+        self.assertIn(('_sum', labels, 20.0002), durations.samples)
+        self.assertIn(('_count', labels, 2), durations.samples)
+
+        self.assertEqual('kmip_errors_total', errors.name)
+        self.assertEqual(
+            [('', {'operation': 'Get', 'reason': 'ItemNotFound'}, 1)],
+            errors.samples
+        )
+
+
+class TestFormatMetrics(testtools.TestCase):
+    """
+    Test suite for the format_metrics function.
+    """
+
+    def test_format_metrics(self):
+        """
+        Test that metrics are formatted in the Prometheus text exposition
+        format.
+        """
+        collected = [
+            metrics.Metric(
+                'kmip_active_sessions',
+                'gauge',
+                "The number of open client connections.",
+                [('', {}, 3)]
+            ),
+            metrics.Metric(
+                'kmip_request_duration_seconds',
+                'histogram',
+                "The time spent in each phase of the requests.",
+                [
+                    ('_bucket', {'phase': 'total', 'le': 0.5}, 1),
+                    ('_bucket', {'phase': 'total', 'le': float('inf')}, 1),
+                    ('_sum', {'phase': 'total'}, 0.25)
+                ]
+            ),
+            metrics.Metric(
+                'kmip_errors_total',
+                'counter',
+                "The number of failed operations.",
+                [('', {'reason': 'a "quoted"\\path\n'}, 1)]
+            )
+        ]
+
+        self.assertEqual(
+            "# HELP kmip_active_sessions The number of open client "
+            "connections.\n"
+            "# TYPE kmip_active_sessions gauge\n"
+            "kmip_active_sessions 3\n"
+            "# HELP kmip_request_duration_seconds The time spent in each "
+            "phase of the requests.\n"
+            "# TYPE kmip_request_duration_seconds histogram\n"
+            'kmip_request_duration_seconds_bucket{le="0.5",phase="total"} 1\n'
+            'kmip_request_duration_seconds_bucket{le="+Inf",phase="total"} '
+            "1\n"
+            'kmip_request_duration_seconds_sum{phase="total"} 0.25\n'
+            "# HELP kmip_errors_total The number of failed operations.\n"
+            "# TYPE kmip_errors_total counter\n"
+            'kmip_errors_total{reason="a \\"quoted\\"\\\\path\\n"} 1\n',
+            metrics.format_metrics(collected)
+        )
+
+
+class TestMetricsListener(testtools.TestCase):
+    """
+    Test suite for the MetricsListener.
+    """
+
+    def setUp(self):
+        super(TestMetricsListener, self).setUp()
+
+        self.collect = mock.MagicMock(return_value="kmip_active_sessions 1\n")
+        self.listener = metrics.MetricsListener(self.collect, 0)
+        self.listener._logger = mock.MagicMock()
+        self.listener.start()
+        self.addCleanup(self.listener.stop)
+
+    def _get(self, path):
+        connection = http_client.HTTPConnection(
+            '127.0.0.1',
+            self.listener.port,
+            timeout=10
+        )
+        self.addCleanup(connection.close)
+        connection.request('GET', path)
+        response = connection.getresponse()
+        return response, response.read()
+
+    def test_get_metrics(self):
+        """
+        Test that the collected metrics are served on the /metrics path.
+        """
+        response, body = self._get('/metrics')
+
+        self.assertEqual(200, response.status)
+        self.assertEqual(
+            'text/plain; version=0.0.4; charset=utf-8',
+            response.getheader('Content-Type')
+        )
+        self.assertEqual(b"kmip_active_sessions 1\n", body)
+        self.collect.assert_called_once_with()
+
+    def test_get_unknown_path(self):
+        """
+        Test that paths other than /metrics are not found.
+        """
+        response, _ = self._get('/')
+
+        self.assertEqual(404, response.status)
+        self.collect.assert_not_called()
+
+    def test_get_metrics_with_collection_failure(self):
+        """
+        Test that a failure to collect the metrics is logged and reported
+        as a server error.
+        """
+        error = Exception("collection failed")
+        self.collect.side_effect = error
+
+        response, _ = self._get('/metrics')
+
+        self.assertEqual(500, response.status)
+        self.listener._logger.exception.assert_called_once_with(error)
+
+    def test_stop(self):
+        """
+        Test that a stopped listener no longer has a port.
+        """
+        self.assertIsNotNone(self.listener.port)
+
+        self.listener.stop()
+
+        self.assertIsNone(self.listener.port)
+
+
+class TestRequestTimer(testtools.TestCase):
+    """
+    Test suite for the RequestTimer.
+    """
+
+    def setUp(self):
+        super(TestRequestTimer, self).setUp()
+
+        self.now = 100.0
+        patcher = mock.patch(
+            'kmip.services.server.metrics.clock',
+            side_effect=lambda: self.now
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_lap(self):
+        """
+        Test that each lap closes the phase started by the previous one, and
+        that repeated phases accumulate.
+        """
+        timer = metrics.RequestTimer()
+
+        self.now += 0.5
+        timer.lap('read')
+        self.now += 0.25
+        timer.lap('handler')
+        self.now += 0.125
+        timer.lap('commit')
+        self.now += 0.5
+        timer.lap('handler')
+
+        self.assertEqual(['read', 'handler', 'commit'], list(timer.phases))
+        self.assertEqual(0.5, timer.phases['read'])
+        self.assertEqual(0.75, timer.phases['handler'])
+        self.assertEqual(0.125, timer.phases['commit'])
+        self.assertEqual(1.375, timer.total)
+        self.assertEqual(
+            "read=0.500s, handler=0.750s, commit=0.125s",
+            str(timer)
+        )
+
+    def test_restart(self):
+        """
+        Test that restarting the timer drops the recorded phases.
+        """
+        timer = metrics.RequestTimer()
+
+        self.now += 10.0
+        timer.lap('read')
+        timer.restart()
+        self.now += 0.5
+        timer.lap('read')
+
+        self.assertEqual({'read': 0.5}, dict(timer.phases))
+        self.assertEqual(0.5, timer.total)
+
+    def test_record(self):
+        """
+        Test that the phases and the total duration are recorded under the
+        label of the request operation.
+        """
+        sink = mock.MagicMock(metrics.MetricsSink)
+        timer = metrics.RequestTimer()
+        timer.operation = enums.Operation.GET
+
+        self.now += 0.5
+        timer.lap('read')
+        self.now += 0.25
+        timer.lap('send')
+
+        timer.record(sink)
+
+        self.assertEqual(
+            [
+                mock.call('Get', 'read', 0.5),
+                mock.call('Get', 'send', 0.25),
+                mock.call('Get', 'total', 0.75)
+            ],
+            sink.observe.call_args_list
+        )
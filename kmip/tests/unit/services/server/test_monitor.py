@@ -244,6 +244,9 @@ class TestPolicyDirectoryMonitor(testtools.TestCase):
         self.assertEqual([], m.policy_store.keys())
         self.assertEqual(['default', 'public'], m.reserved_policies)
         self.assertIsInstance(m.logger, logging.Logger)
+        self.assertEqual(0, m.load_count.value)
+        self.assertEqual(0, m.load_failure_count.value)
+        self.assertEqual(0, m.policy_changes.value)
 
     def test_signal_handler(self):
         """
@@ -348,6 +351,7 @@ class TestPolicyDirectoryMonitor(testtools.TestCase):
         )
 
         self.assertEqual(3, len(m.policy_store.keys()))
+        self.assertEqual(3, m.policy_changes.value)
         self.assertEqual(
             {
                 "groups": {
@@ -584,6 +588,9 @@ class TestPolicyDirectoryMonitor(testtools.TestCase):
             "Stopping the operation policy file monitor."
         )
 
+        self.assertEqual(1, m.load_count.value)
+        self.assertEqual(1, m.load_failure_count.value)
+
         self.assertEqual(2, len(m.policy_files))
         path = os.path.join(self.tmp_dir, "policy_1.json")
         self.assertEqual(
@@ -690,6 +697,9 @@ class TestPolicyDirectoryMonitor(testtools.TestCase):
             "Stopping the operation policy file monitor."
         )
 
+        self.assertEqual(2, m.load_count.value)
+        self.assertEqual(1, m.load_failure_count.value)
+
         self.assertEqual(2, len(m.policy_files))
         path = os.path.join(self.tmp_dir, "policy_1.json")
         self.assertEqual(
@@ -1985,6 +1995,7 @@ class TestPolicyDirectoryMonitor(testtools.TestCase):
         m.policy_map["a"] = "b"
         m.policy_store["a"] = {"c": 2}
         m.policy_store["default"] = {"c": 3}
+        policy_changes = m.policy_changes.value
 
         m.initialize_tracking_structures()
 
@@ -1994,6 +2005,7 @@ class TestPolicyDirectoryMonitor(testtools.TestCase):
         self.assertEqual({}, m.policy_map)
         self.assertEqual(["default"], m.policy_store.keys())
         self.assertEqual({"c": 3}, m.policy_store.get("default"))
+        self.assertEqual(policy_changes + 1, m.policy_changes.value)
 
     def test_disassociate_policy_and_file(self):
         """
@@ -2104,6 +2116,7 @@ class TestPolicyDirectoryMonitor(testtools.TestCase):
         m.restore_or_delete_policy("policy_A")
 
         m.logger.info.assert_not_called()
+        self.assertEqual(1, m.policy_changes.value)
         self.assertEqual(
             [
                 (
@@ -2148,6 +2161,7 @@ class TestPolicyDirectoryMonitor(testtools.TestCase):
         m.restore_or_delete_policy("policy_A")
 
         m.logger.info.assert_called_once_with("Removing policy: policy_A")
+        self.assertEqual(1, m.policy_changes.value)
         self.assertNotIn("policy_A", m.policy_cache.keys())
         self.assertNotIn("policy_A", m.policy_store.keys())
         self.assertNotIn("policy_A", m.policy_map.keys())
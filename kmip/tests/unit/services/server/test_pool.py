@@ -0,0 +1,206 @@
+# Copyright (c) 2020 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import mock
+import testtools
+import threading
+
+from kmip.core import enums
+from kmip.core import exceptions
+from kmip.services.server import pool
+
+
+class TestWorkerPool(testtools.TestCase):
+    """
+    A test suite for the WorkerPool.
+    """
+
+    def setUp(self):
+        super(TestWorkerPool, self).setUp()
+
+        self.pool = pool.WorkerPool(1, 2)
+        self.pool._logger = mock.MagicMock()
+        self.pool.start()
+        self.addCleanup(self.pool.stop)
+
+        # Block the single worker until the test releases it.
+        self.release = threading.Event()
+        self.addCleanup(self.release.set)
+
+    def _block_worker(self):
+        started = threading.Event()
+
+        def blocking_function():
+            started.set()
+            self.release.wait()
+            return 'blocked'
+
+        item = self.pool.submit(blocking_function)
+        started.wait()
+        return item
+
+    def test_submit(self):
+        """
+        Test that a submitted request is processed by a worker thread.
+        """
+        item = self.pool.submit(lambda x, y: x + y, 1, 2)
+
+        self.assertEqual(3, item.result())
+        self.assertTrue(item.done())
+
+    def test_finish_time(self):
+        """
+        Test that the time a request is processed at is recorded.
+        """
+        blocked = self._block_worker()
+        self.assertIsNone(blocked.finish_time)
+
+        with mock.patch(
+            'kmip.services.server.metrics.clock',
+            return_value=42.0
+        ):
+            self.release.set()
+            blocked.result()
+        self.assertEqual(42.0, blocked.finish_time)
+
+    def test_submit_with_error(self):
+        """
+        Test that an error raised while processing a request is raised when
+        its result is retrieved.
+        """
+        def failing_function():
+            raise ValueError("failure")
+
+        item = self.pool.submit(failing_function)
+        self.assertRaisesRegex(ValueError, "failure", item.result)
+
+    def test_submit_queue_full(self):
+        """
+        Test that requests submitted while the queue is full are rejected and
+        counted.
+        """
+        blocked = self._block_worker()
+        items = [self.pool.submit(lambda i=i: i) for i in range(2)]
+        self.assertEqual(2, self.pool.queue_depth)
+
+        error = self.assertRaises(
+            exceptions.ServerOverloaded,
+            self.pool.submit,
+            lambda: None
+        )
+        self.assertEqual(enums.ResultStatus.OPERATION_FAILED, error.status)
+        self.assertEqual(enums.ResultReason.GENERAL_FAILURE, error.reason)
+        self.assertEqual(1, self.pool.rejected_requests)
+        self.pool._logger.warning.assert_called_once_with(
+            "Rejecting request: the request queue is full. Rejected "
+            "requests: 1"
+        )
+
+        self.release.set()
+        self.assertEqual('blocked', blocked.result())
+        self.assertEqual([0, 1], [item.result() for item in items])
+        self.assertEqual(0, self.pool.queue_depth)
+
+    def test_stop_queue_full(self):
+        """
+        Test that stopping the pool cancels the queued requests instead of
+        waiting for them, and that requests submitted afterwards are
+        rejected.
+        """
+        blocked = self._block_worker()
+        items = [self.pool.submit(lambda i=i: i) for i in range(2)]
+
+        stopper = threading.Thread(target=self.pool.stop)
+        stopper.start()
+
+        for item in items:
+            error = self.assertRaises(
+                exceptions.ServerOverloaded,
+                item.result
+            )
+            self.assertEqual(
+                "The server is shutting down. Retry the request later.",
+                str(error)
+            )
+        self.assertRaises(
+            exceptions.ServerOverloaded,
+            self.pool.submit,
+            lambda: None
+        )
+
+        self.release.set()
+        stopper.join(10.0)
+        self.assertFalse(stopper.is_alive())
+        self.assertEqual('blocked', blocked.result())
+        self.assertEqual(0, self.pool.queue_depth)
+
+    def test_add_done_callback(self):
+        """
+        Test that done callbacks are called once the request is processed,
+        including callbacks added afterwards.
+        """
+        blocked = self._block_worker()
+        callback = mock.MagicMock()
+        blocked.add_done_callback(callback)
+        callback.assert_not_called()
+
+        self.release.set()
+        blocked.result()
+        self.pool.submit(lambda: None).result()
+        callback.assert_called_once_with(blocked)
+
+        late_callback = mock.MagicMock()
+        blocked.add_done_callback(late_callback)
+        late_callback.assert_called_once_with(blocked)
+
+    def test_cancel(self):
+        """
+        Test that a queued request can be canceled and is then skipped by
+        the worker threads.
+        """
+        blocked = self._block_worker()
+        function = mock.MagicMock()
+        item = self.pool.submit(function)
+        callback = mock.MagicMock()
+        item.add_done_callback(callback)
+
+        self.assertTrue(item.cancel())
+        self.assertTrue(item.done())
+        callback.assert_called_once_with(item)
+        error = self.assertRaises(exceptions.KmipError, item.result)
+        self.assertEqual(
+            enums.ResultReason.OPERATION_CANCELED_BY_REQUESTER,
+            error.reason
+        )
+        self.assertEqual("The request was canceled.", str(error))
+        self.assertFalse(item.cancel())
+
+        self.release.set()
+        blocked.result()
+        self.pool.submit(lambda: None).result()
+        function.assert_not_called()
+
+    def test_cancel_started(self):
+        """
+        Test that a request cannot be canceled once a worker thread has
+        started processing it.
+        """
+        blocked = self._block_worker()
+
+        self.assertFalse(blocked.cancel())
+
+        self.release.set()
+        self.assertEqual('blocked', blocked.result())
+        self.assertFalse(blocked.cancel())
@@ -22,10 +22,12 @@ except Exception:
 
 import signal
 import socket
+import ssl
 import testtools
 
 from kmip.core import exceptions
 from kmip.services import auth
+from kmip.services.server import metrics
 from kmip.services.server import server
 
 
@@ -53,6 +55,11 @@ class TestKmipServer(testtools.TestCase):
         self.assertIsInstance(s.auth_suite, auth.BasicAuthenticationSuite)
         self.assertEqual(1, s._session_id)
         self.assertFalse(s._is_serving)
+        self.assertIsInstance(s.metrics_sink, metrics.InMemoryMetricsSink)
+
+        metrics_sink = mock.MagicMock()
+        s = server.KmipServer(metrics_sink=metrics_sink)
+        self.assertEqual(metrics_sink, s.metrics_sink)
 
     @mock.patch('logging.getLogger', side_effect=mock.MagicMock())
     @mock.patch('logging.handlers.RotatingFileHandler')
@@ -122,7 +129,11 @@ class TestKmipServer(testtools.TestCase):
             False,
             'TLS_RSA_WITH_AES_128_CBC_SHA,TLS_RSA_WITH_AES_256_CBC_SHA',
             'DEBUG',
-            '/var/pykmip/pykmip.db'
+            '/var/pykmip/pykmip.db',
+            'asyncio',
+            4,
+            0.5,
+            9000
         )
 
         s.config.load_settings.assert_called_with('/etc/pykmip/server.conf')
@@ -161,6 +172,10 @@ class TestKmipServer(testtools.TestCase):
             'database_path',
             '/var/pykmip/pykmip.db'
         )
+        s.config.set_setting.assert_any_call('serving_mode', 'asyncio')
+        s.config.set_setting.assert_any_call('worker_processes', 4)
+        s.config.set_setting.assert_any_call('slow_request_threshold', 0.5)
+        s.config.set_setting.assert_any_call('metrics_port', 9000)
 
         # Test that an attempt is made to instantiate the TLS 1.2 auth suite
         s = server.KmipServer(
@@ -171,6 +186,7 @@ class TestKmipServer(testtools.TestCase):
         self.assertEqual('TLS1.2', s.config.settings.get('auth_suite'))
         self.assertIsNotNone(s.auth_suite)
 
+    @mock.patch('kmip.services.server.pool.WorkerPool')
     @mock.patch('multiprocessing.Manager')
     @mock.patch('kmip.services.server.monitor.PolicyDirectoryMonitor')
     @mock.patch('kmip.services.server.engine.KmipEngine')
@@ -179,7 +195,8 @@ class TestKmipServer(testtools.TestCase):
                    logging_mock,
                    engine_mock,
                    monitor_mock,
-                   manager_mock):
+                   manager_mock,
+                   pool_mock):
         """
         Test that starting the KmipServer either runs as expected or generates
         the expected error.
@@ -210,8 +227,9 @@ class TestKmipServer(testtools.TestCase):
         # Test that in ideal cases no errors are generated and the right
         # log messages are.
         with mock.patch('socket.socket') as socket_mock:
-            with mock.patch('ssl.wrap_socket') as ssl_mock:
+            with mock.patch.object(s, '_create_ssl_context') as context_mock:
                 socket_mock.return_value = a_mock
+                ssl_mock = context_mock.return_value.wrap_socket
                 ssl_mock.return_value = b_mock
 
                 manager_mock.assert_not_called()
@@ -245,12 +263,21 @@ class TestKmipServer(testtools.TestCase):
                     socket.SO_REUSEADDR,
                     1
                 )
-                self.assertTrue(ssl_mock.called)
+                context_mock.assert_called_once_with()
+                self.assertEqual(context_mock.return_value, s._ssl_context)
+                ssl_mock.assert_called_once_with(
+                    a_mock,
+                    server_side=True,
+                    do_handshake_on_connect=False,
+                    suppress_ragged_eofs=True
+                )
                 b_mock.bind.assert_called_once_with(('127.0.0.1', 5696))
                 s._logger.info.assert_called_with(
                     "Server successfully bound socket handler to "
                     "127.0.0.1:5696"
                 )
+                pool_mock.assert_called_once_with(10, 100)
+                pool_mock.return_value.start.assert_called_once_with()
 
         monitor_instance_mock.stop.assert_not_called()
         handler = signal.getsignal(signal.SIGINT)
@@ -268,11 +295,13 @@ class TestKmipServer(testtools.TestCase):
         monitor_mock.reset_mock()
         a_mock.reset_mock()
         b_mock.reset_mock()
+        pool_mock.reset_mock()
 
         # Test that a NetworkingError is generated if the socket bind fails.
         with mock.patch('socket.socket') as socket_mock:
-            with mock.patch('ssl.wrap_socket') as ssl_mock:
+            with mock.patch.object(s, '_create_ssl_context') as context_mock:
                 socket_mock.return_value = a_mock
+                ssl_mock = context_mock.return_value.wrap_socket
                 ssl_mock.return_value = b_mock
 
                 test_exception = Exception()
@@ -300,6 +329,7 @@ class TestKmipServer(testtools.TestCase):
                     "Starting server socket handler."
                 )
                 s._logger.exception.assert_called_once_with(test_exception)
+                pool_mock.return_value.start.assert_not_called()
 
     @mock.patch('kmip.services.server.engine.KmipEngine')
     @mock.patch('kmip.services.server.server.KmipServer._setup_logging')
@@ -322,11 +352,21 @@ class TestKmipServer(testtools.TestCase):
         thread_mock.join = mock.MagicMock()
         thread_mock.is_alive = mock.MagicMock(return_value=False)
         thread_mock.name = 'TestThread'
+        s._request_pool = mock.MagicMock()
+        s._engine = mock.MagicMock()
 
         with mock.patch('threading.enumerate') as threading_mock:
             threading_mock.return_value = [thread_mock]
 
             s.stop()
+            s._request_pool.stop.assert_called_once_with()
+            s._logger.info.assert_any_call(
+                "Stopping request worker threads."
+            )
+            s._engine.stop.assert_called_once_with()
+            s._logger.info.assert_any_call(
+                "Stopping asynchronous operation worker."
+            )
             s._logger.info.assert_any_call(
                 "Cleaning up remaining connection threads."
             )
@@ -553,6 +593,394 @@ class TestKmipServer(testtools.TestCase):
         handler(None, None)
         self.assertFalse(s._is_serving)
 
+        # Test that SIGUSR1 logs a summary of the request metrics.
+        s._logger.reset_mock()
+        handler = signal.getsignal(signal.SIGUSR1)
+        handler(signal.SIGUSR1, None)
+        s._logger.info.assert_called_once_with(
+            "Server request metrics:\nNo requests recorded."
+        )
+
+        s._logger.reset_mock()
+        s.metrics_sink.observe('Get', 'total', 0.002)
+        handler(signal.SIGUSR1, None)
+        s._logger.info.assert_called_once_with(
+            "Server request metrics:\n"
+            "Get total: count=1 mean=2.000ms p50=2.000ms p99=2.000ms "
+            "max=2.000ms"
+        )
+
+    @mock.patch('multiprocessing.Manager')
+    @mock.patch('kmip.services.server.monitor.PolicyDirectoryMonitor')
+    @mock.patch('kmip.services.server.engine.KmipEngine')
+    @mock.patch('kmip.services.server.server.KmipServer._setup_logging')
+    def test_start_asyncio(self,
+                           logging_mock,
+                           engine_mock,
+                           monitor_mock,
+                           manager_mock):
+        """
+        Test that starting the KmipServer in the asyncio serving mode binds
+        an unwrapped socket and creates the asyncio connection service.
+        """
+        s = server.KmipServer(
+            hostname='127.0.0.1',
+            port=5696,
+            auth_suite='Basic',
+            config_path=None,
+            policy_path=None,
+            serving_mode='asyncio'
+        )
+        s._logger = mock.MagicMock()
+        s._create_ssl_context = mock.MagicMock()
+
+        with mock.patch('socket.socket') as socket_mock, \
+                mock.patch(
+                    'kmip.services.server.pool.WorkerPool'
+                ) as pool_mock, \
+                mock.patch(
+                    'kmip.services.server.aio.AsyncioConnectionService'
+                ) as service_mock:
+            s.start()
+
+            s._create_ssl_context.assert_called_once_with()
+            s._create_ssl_context.return_value.wrap_socket.assert_not_called()
+            socket_mock.return_value.bind.assert_called_once_with(
+                ('127.0.0.1', 5696)
+            )
+            pool_mock.assert_called_once_with(10, 100)
+            pool_mock.return_value.start.assert_called_once_with()
+            service_mock.assert_called_once_with(
+                socket_mock.return_value,
+                s._create_ssl_context.return_value,
+                s._create_session,
+                pool_mock.return_value,
+                max_connections=1000,
+                backlog=5
+            )
+            self.assertEqual(
+                service_mock.return_value,
+                s._connection_service
+            )
+            self.assertTrue(s._is_serving)
+
+    @mock.patch('kmip.services.server.engine.KmipEngine')
+    @mock.patch('kmip.services.server.server.KmipServer._setup_logging')
+    def test_serve_asyncio(self, logging_mock, engine_mock):
+        """
+        Test that serving in the asyncio serving mode runs the asyncio
+        connection service and that signals stop it.
+        """
+        s = server.KmipServer(
+            hostname='127.0.0.1',
+            port=5696,
+            config_path=None,
+            policy_path=None
+        )
+        s._is_serving = True
+        s._logger = mock.MagicMock()
+        s._socket = mock.MagicMock()
+        s._connection_service = mock.MagicMock()
+
+        s.serve()
+
+        s._connection_service.serve.assert_called_once_with()
+        s._socket.listen.assert_not_called()
+        s._socket.accept.assert_not_called()
+        self.assertFalse(s._is_serving)
+
+        s._is_serving = True
+        handler = signal.getsignal(signal.SIGINT)
+        handler(signal.SIGINT, None)
+        s._connection_service.stop.assert_called_once_with()
+        self.assertFalse(s._is_serving)
+
+        s._is_serving = True
+        handler = signal.getsignal(signal.SIGTERM)
+        handler(signal.SIGTERM, None)
+        self.assertEqual(2, s._connection_service.stop.call_count)
+        self.assertFalse(s._is_serving)
+
+    @mock.patch('multiprocessing.Manager')
+    @mock.patch('kmip.services.server.monitor.PolicyDirectoryMonitor')
+    @mock.patch('kmip.services.server.engine.KmipEngine')
+    @mock.patch('kmip.services.server.server.KmipServer._setup_logging')
+    def test_start_worker_processes(self,
+                                    logging_mock,
+                                    engine_mock,
+                                    monitor_mock,
+                                    manager_mock):
+        """
+        Test that starting the KmipServer with multiple worker processes
+        binds the server socket but leaves the connection service to the
+        workers.
+        """
+        s = server.KmipServer(
+            hostname='127.0.0.1',
+            port=5696,
+            auth_suite='Basic',
+            config_path=None,
+            policy_path=None,
+            worker_processes=2
+        )
+        s._logger = mock.MagicMock()
+        s._create_ssl_context = mock.MagicMock()
+        ssl_mock = s._create_ssl_context.return_value.wrap_socket
+
+        with mock.patch('socket.socket'), \
+                mock.patch(
+                    'kmip.services.server.pool.WorkerPool'
+                ) as pool_mock:
+            s.start()
+
+            ssl_mock.return_value.bind.assert_called_once_with(
+                ('127.0.0.1', 5696)
+            )
+            monitor_mock.return_value.start.assert_called_once_with()
+            pool_mock.assert_not_called()
+            self.assertIsNone(s._request_pool)
+            self.assertIsNone(s._connection_service)
+            self.assertTrue(s._is_serving)
+
+    @mock.patch('kmip.services.server.engine.KmipEngine')
+    @mock.patch('kmip.services.server.server.KmipServer._setup_logging')
+    def test_serve_worker_processes(self, logging_mock, engine_mock):
+        """
+        Test that serving with multiple worker processes starts the workers,
+        restarts workers that exit, and stops them once a signal is received.
+        """
+        s = server.KmipServer(
+            hostname='127.0.0.1',
+            port=5696,
+            config_path=None,
+            policy_path=None,
+            worker_processes=2
+        )
+        s._is_serving = True
+        s._logger = mock.MagicMock()
+        s._socket = mock.MagicMock()
+        s._engine = mock.MagicMock()
+        s._engine.dispose.side_effect = (
+            lambda: context_mock.return_value.Process.assert_not_called()
+        )
+
+        workers = []
+        for i in range(3):
+            worker = mock.MagicMock()
+            worker.name = 'worker {0}'.format(i)
+            worker.is_alive.return_value = True
+            worker.terminate.side_effect = (
+                lambda w=worker: setattr(w.is_alive, 'return_value', False)
+            )
+            workers.append(worker)
+
+        def join(timeout):
+            # The first wake up finds a dead worker, the second a signal.
+            if workers[0].join.call_count == 1:
+                workers[1].is_alive.return_value = False
+                workers[1].exitcode = 1
+            elif workers[0].join.call_count == 2:
+                handler = signal.getsignal(signal.SIGUSR1)
+                handler(signal.SIGUSR1, None)
+                handler = signal.getsignal(signal.SIGTERM)
+                handler(signal.SIGTERM, None)
+        workers[0].join.side_effect = join
+
+        with mock.patch('multiprocessing.get_context') as context_mock, \
+                mock.patch('os.kill') as kill_mock:
+            context_mock.return_value.Process.side_effect = workers
+            s.serve()
+
+            # Requests for metrics are forwarded to the live workers.
+            kill_mock.assert_has_calls(
+                [
+                    mock.call(workers[0].pid, signal.SIGUSR1),
+                    mock.call(workers[2].pid, signal.SIGUSR1)
+                ]
+            )
+            self.assertEqual(2, kill_mock.call_count)
+
+            context_mock.assert_called_once_with('fork')
+            context_mock.return_value.Process.assert_has_calls(
+                [
+                    mock.call(
+                        target=s._run_worker_process,
+                        args=(0, ),
+                        name='kmip.server.worker_process.0'
+                    ),
+                    mock.call(
+                        target=s._run_worker_process,
+                        args=(1, ),
+                        name='kmip.server.worker_process.1'
+                    ),
+                    mock.call(
+                        target=s._run_worker_process,
+                        args=(1, ),
+                        name='kmip.server.worker_process.1'
+                    )
+                ]
+            )
+
+        s._engine.dispose.assert_called_once_with()
+        s._socket.listen.assert_called_once_with(5)
+        s._socket.accept.assert_not_called()
+        for worker in workers:
+            self.assertTrue(worker.daemon)
+            worker.start.assert_called_once_with()
+        s._logger.warning.assert_called_once_with(
+            "Worker process 1 exited with code 1. Restarting it."
+        )
+        workers[0].terminate.assert_called_once_with()
+        workers[1].terminate.assert_not_called()
+        workers[2].terminate.assert_called_once_with()
+        workers[2].join.assert_called_once_with(10.0)
+        self.assertFalse(s._is_serving)
+        self.assertEqual([], s._worker_processes)
+
+    @mock.patch('kmip.services.server.engine.KmipEngine')
+    @mock.patch('kmip.services.server.server.KmipServer._setup_logging')
+    def test_run_worker_process(self, logging_mock, engine_mock):
+        """
+        Test that a worker process creates its own engine and connection
+        service, serves connections, and cleans up afterwards.
+        """
+        s = server.KmipServer(
+            hostname='127.0.0.1',
+            port=5696,
+            config_path=None,
+            policy_path=None,
+            database_path='/tmp/pykmip.db',
+            worker_processes=2
+        )
+        s._logger = mock.MagicMock()
+        s._session_id = 5
+        s.policies = {}
+        s.policy_monitor = mock.MagicMock()
+        s.config.settings['metrics_port'] = 9000
+
+        request_pool = mock.MagicMock()
+        session_mock = mock.MagicMock()
+
+        def setup_connection_service():
+            s._request_pool = request_pool
+
+        def serve():
+            s._sessions = [session_mock]
+            self.assertEqual(1, s._worker_id)
+            self.assertEqual(1, s._session_id)
+        s._setup_connection_service = mock.MagicMock(
+            side_effect=setup_connection_service
+        )
+        s.serve = mock.MagicMock(side_effect=serve)
+
+        with mock.patch(
+            'kmip.services.server.engine.KmipEngine'
+        ) as worker_engine_mock, mock.patch(
+            'kmip.services.server.metrics.MetricsListener'
+        ) as listener_mock:
+            s._run_worker_process(1)
+
+            worker_engine_mock.assert_called_once_with(
+                policies=s.policies,
+                database_path='/tmp/pykmip.db',
+                metrics_sink=s.metrics_sink,
+                policy_changes=s.policy_monitor.policy_changes,
+                enable_asynchronous_operations=False
+            )
+            self.assertEqual(worker_engine_mock.return_value, s._engine)
+
+            # Each worker serves its metrics on its own port.
+            listener_mock.assert_called_once_with(s._collect_metrics, 9001)
+            listener_mock.return_value.start.assert_called_once_with()
+            listener_mock.return_value.stop.assert_called_once_with()
+            self.assertIsNone(s._metrics_listener)
+
+        s._setup_connection_service.assert_called_once_with()
+        s.serve.assert_called_once_with()
+        request_pool.stop.assert_called_once_with()
+        session_mock.join.assert_called_once_with(10.0)
+
+        # Test that a session started in a worker process is named after the
+        # worker.
+        with mock.patch('kmip.services.server.session.KmipSession'):
+            s._create_session(None, ('127.0.0.1', 5696))
+        s._logger.info.assert_any_call(
+            "Dedicating session 1.00000001 to 127.0.0.1:5696"
+        )
+
+    @mock.patch('kmip.services.server.engine.KmipEngine')
+    @mock.patch('kmip.services.server.server.KmipServer._setup_logging')
+    def test_serve_in_worker_process(self, logging_mock, engine_mock):
+        """
+        Test that a worker process serves connections itself and stops on
+        SIGTERM.
+        """
+        s = server.KmipServer(
+            hostname='127.0.0.1',
+            port=5696,
+            config_path=None,
+            policy_path=None,
+            worker_processes=2
+        )
+        s._is_serving = False
+        s._worker_id = 0
+        s._logger = mock.MagicMock()
+        s._socket = mock.MagicMock()
+
+        with mock.patch('multiprocessing.get_context') as context_mock:
+            s.serve()
+            context_mock.assert_not_called()
+
+        s._socket.listen.assert_called_once_with(5)
+        s._logger.info.assert_any_call("Starting connection service...")
+
+        s._is_serving = True
+        handler = signal.getsignal(signal.SIGTERM)
+        self.assertRaises(
+            KeyboardInterrupt,
+            handler,
+            signal.SIGTERM,
+            None
+        )
+        self.assertFalse(s._is_serving)
+
+    @mock.patch('kmip.services.server.engine.KmipEngine')
+    @mock.patch('kmip.services.server.server.KmipServer._setup_logging')
+    def test_create_ssl_context(self, logging_mock, engine_mock):
+        """
+        Test that the TLS context shared by all client connections is built
+        from the server settings and allows TLS session resumption.
+        """
+        s = server.KmipServer(
+            hostname='127.0.0.1',
+            port=5696,
+            auth_suite='TLS1.2',
+            config_path=None,
+            policy_path=None
+        )
+        s.config.settings['certificate_path'] = '/test/path/server.crt'
+        s.config.settings['key_path'] = '/test/path/server.key'
+        s.config.settings['ca_path'] = '/test/path/ca.crt'
+
+        with mock.patch('ssl.SSLContext') as context_mock:
+            context_mock.return_value.options = (
+                ssl.OP_NO_SSLv2 | ssl.OP_NO_TICKET
+            )
+            context = s._create_ssl_context()
+
+        context_mock.assert_called_once_with(ssl.PROTOCOL_TLSv1_2)
+        self.assertEqual(context_mock.return_value, context)
+        self.assertEqual(ssl.CERT_REQUIRED, context.verify_mode)
+        context.load_cert_chain.assert_called_once_with(
+            '/test/path/server.crt',
+            keyfile='/test/path/server.key'
+        )
+        context.load_verify_locations.assert_called_once_with(
+            cafile='/test/path/ca.crt'
+        )
+        context.set_ciphers.assert_called_once_with(s.auth_suite.ciphers)
+        self.assertEqual(ssl.OP_NO_SSLv2, context.options)
+
     @mock.patch('kmip.services.server.engine.KmipEngine')
     @mock.patch('kmip.services.server.server.KmipServer._setup_logging')
     def test_setup_connection_handler(self, logging_mock, engine_mock):
@@ -586,6 +1014,7 @@ class TestKmipServer(testtools.TestCase):
             session_mock.assert_called_once_with()
 
         self.assertEqual(2, s._session_id)
+        self.assertEqual(s.metrics_sink, s._sessions[0]._metrics_sink)
 
         # Test that the right error messages are logged when the session
         # fails to start.
@@ -611,6 +1040,231 @@ class TestKmipServer(testtools.TestCase):
 
         self.assertEqual(3, s._session_id)
 
+        # Test that failures are logged with the name of the session of a
+        # worker process.
+        s._worker_id = 1
+        s._logger.reset_mock()
+        with mock.patch(
+            'kmip.services.server.session.KmipSession.start',
+            side_effect=test_exception
+        ):
+            s._setup_connection_handler(None, address)
+
+            s._logger.warning.assert_called_once_with(
+                "Failure occurred while starting session: 1.00000003"
+            )
+
+        # Test that the right error messages are logged when the session
+        # cannot be created.
+        s._logger.reset_mock()
+        with mock.patch(
+            'kmip.services.server.session.KmipSession',
+            side_effect=test_exception
+        ):
+            s._setup_connection_handler(None, address)
+
+            s._logger.warning.assert_called_once_with(
+                "Failure occurred while creating a session for "
+                "127.0.0.1:5696"
+            )
+            s._logger.exception.assert_called_once_with(test_exception)
+
+    @mock.patch('kmip.services.server.engine.KmipEngine')
+    @mock.patch('kmip.services.server.server.KmipServer._setup_logging')
+    def test_setup_connection_handler_max_connections(self,
+                                                      logging_mock,
+                                                      engine_mock):
+        """
+        Test that connections beyond the maximum number of connections are
+        closed and counted.
+        """
+        s = server.KmipServer(
+            hostname='127.0.0.1',
+            port=5696,
+            config_path=None,
+            policy_path=None
+        )
+        s.config.settings['max_connections'] = 1
+        s._logger = mock.MagicMock()
+        s._engine = engine_mock
+
+        alive_session = mock.MagicMock()
+        alive_session.is_alive.return_value = True
+        dead_session = mock.MagicMock()
+        dead_session.is_alive.return_value = False
+        s._sessions = [alive_session, dead_session]
+
+        connection = mock.MagicMock()
+        with mock.patch(
+            'kmip.services.server.session.KmipSession.start'
+        ) as session_mock:
+            s._setup_connection_handler(connection, ('127.0.0.1', 5696))
+            session_mock.assert_not_called()
+
+        connection.close.assert_called_once_with()
+        self.assertEqual([alive_session], s._sessions)
+        s._logger.warning.assert_called_once_with(
+            "Rejecting connection from 127.0.0.1:5696: the maximum of 1 "
+            "connections is reached. Rejected connections: 1"
+        )
+        self.assertEqual(1, s.statistics['rejected_connections'])
+
+        # Test that a new connection is accepted once a session ends.
+        alive_session.is_alive.return_value = False
+        connection = mock.MagicMock()
+        with mock.patch(
+            'kmip.services.server.session.KmipSession.start'
+        ) as session_mock:
+            s._setup_connection_handler(connection, ('127.0.0.1', 5697))
+            session_mock.assert_called_once_with()
+
+        connection.close.assert_not_called()
+        self.assertEqual(1, len(s._sessions))
+
+    @mock.patch('kmip.services.server.engine.KmipEngine')
+    @mock.patch('kmip.services.server.server.KmipServer._setup_logging')
+    def test_statistics(self, logging_mock, engine_mock):
+        """
+        Test that the server load counters are reported correctly.
+        """
+        s = server.KmipServer(
+            hostname='127.0.0.1',
+            port=5696,
+            config_path=None,
+            policy_path=None
+        )
+
+        self.assertEqual(
+            {
+                'active_connections': 0,
+                'rejected_connections': 0,
+                'queue_depth': 0,
+                'rejected_requests': 0,
+                'tls_handshakes': 0,
+                'tls_resumptions': 0
+            },
+            s.statistics
+        )
+
+        session_mock = mock.MagicMock()
+        session_mock.is_alive.return_value = True
+        s._sessions = [session_mock]
+        s._rejected_connections = 2
+        s._request_pool = mock.MagicMock(queue_depth=3, rejected_requests=4)
+        s._ssl_context = mock.MagicMock()
+        s._ssl_context.session_stats.return_value = {
+            'accept': 9,
+            'accept_good': 8,
+            'hits': 7,
+            'misses': 1
+        }
+        self.assertEqual(
+            {
+                'active_connections': 1,
+                'rejected_connections': 2,
+                'queue_depth': 3,
+                'rejected_requests': 4,
+                'tls_handshakes': 8,
+                'tls_resumptions': 7
+            },
+            s.statistics
+        )
+
+        s._connection_service = mock.MagicMock(
+            active_connections=5,
+            rejected_connections=6
+        )
+        self.assertEqual(
+            {
+                'active_connections': 5,
+                'rejected_connections': 6,
+                'queue_depth': 3,
+                'rejected_requests': 4,
+                'tls_handshakes': 8,
+                'tls_resumptions': 7
+            },
+            s.statistics
+        )
+
+    @mock.patch('kmip.services.server.engine.KmipEngine')
+    @mock.patch('kmip.services.server.server.KmipServer._setup_logging')
+    def test_start_metrics_listener(self, logging_mock, engine_mock):
+        """
+        Test that the metrics listener is only started when a metrics port is
+        configured, and that a failure to start it is logged.
+        """
+        s = server.KmipServer(
+            hostname='127.0.0.1',
+            port=5696,
+            config_path=None,
+            policy_path=None
+        )
+        s._logger = mock.MagicMock()
+
+        with mock.patch(
+            'kmip.services.server.metrics.MetricsListener'
+        ) as listener_mock:
+            s._start_metrics_listener()
+            listener_mock.assert_not_called()
+
+            s.config.settings['metrics_port'] = 9000
+            s._start_metrics_listener()
+            listener_mock.assert_called_once_with(s._collect_metrics, 9000)
+            self.assertEqual(listener_mock.return_value, s._metrics_listener)
+
+            s._stop_metrics_listener()
+            listener_mock.return_value.stop.assert_called_once_with()
+            self.assertIsNone(s._metrics_listener)
+
+            error = socket.error("Address already in use")
+            listener_mock.return_value.start.side_effect = error
+            s._start_metrics_listener()
+            s._logger.warning.assert_called_once_with(
+                "Failure occurred while starting the metrics listener on "
+                "port 9000. Metrics will not be served."
+            )
+            s._logger.exception.assert_called_once_with(error)
+            self.assertIsNone(s._metrics_listener)
+
+    @mock.patch('kmip.services.server.engine.KmipEngine')
+    @mock.patch('kmip.services.server.server.KmipServer._setup_logging')
+    def test_collect_metrics(self, logging_mock, engine_mock):
+        """
+        Test that the request metrics, the load counters and the policy load
+        counters are formatted for Prometheus.
+        """
+        s = server.KmipServer(
+            hostname='127.0.0.1',
+            port=5696,
+            config_path=None,
+            policy_path=None
+        )
+        s.metrics_sink.observe('Get', 'total', 0.002)
+        s.metrics_sink.count_error('Get', 'ItemNotFound')
+        s._rejected_connections = 2
+        s.policy_monitor = mock.MagicMock()
+        s.policy_monitor.load_count.value = 3
+        s.policy_monitor.load_failure_count.value = 1
+
+        lines = s._collect_metrics().splitlines()
+
+        for line in (
+            'kmip_requests_total{operation="Get"} 1',
+            'kmip_request_duration_seconds_count'
+            '{operation="Get",phase="total"} 1',
+            'kmip_errors_total{operation="Get",reason="ItemNotFound"} 1',
+            '# TYPE kmip_active_sessions gauge',
+            'kmip_active_sessions 0',
+            'kmip_rejected_connections_total 2',
+            'kmip_request_queue_depth 0',
+            'kmip_rejected_requests_total 0',
+            'kmip_tls_handshakes_total 0',
+            'kmip_tls_resumptions_total 0',
+            'kmip_policy_loads_total 3',
+            'kmip_policy_load_failures_total 1'
+        ):
+            self.assertIn(line, lines)
+
     @mock.patch('kmip.services.server.engine.KmipEngine')
     @mock.patch('kmip.services.server.server.KmipServer._setup_logging')
     def test_as_context_manager(self, logging_mock, engine_mock):
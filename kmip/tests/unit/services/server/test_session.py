@@ -32,8 +32,11 @@ from kmip.core import utils
 
 from kmip.core.messages import contents
 from kmip.core.messages import messages
+from kmip.core.messages import payloads
 
+from kmip.services.server import auth
 from kmip.services.server import engine
+from kmip.services.server import metrics
 from kmip.services.server import session
 
 
@@ -115,6 +118,9 @@ class TestKmipSession(testtools.TestCase):
     def setUp(self):
         super(TestKmipSession, self).setUp()
 
+        session._auth_plugins.clear()
+        self.addCleanup(session._auth_plugins.clear)
+
     def tearDown(self):
         super(TestKmipSession, self).tearDown()
 
@@ -144,10 +150,16 @@ class TestKmipSession(testtools.TestCase):
             ]
         )
         kmip_session._connection = mock.MagicMock()
+        kmip_session._metrics_sink = mock.MagicMock()
 
         kmip_session.run()
 
         kmip_session._logger.info.assert_any_call("Starting session: name")
+        kmip_session._metrics_sink.observe.assert_called_once_with(
+            'None',
+            'handshake',
+            mock.ANY
+        )
         self.assertTrue(kmip_session._handle_message_loop.called)
         kmip_session._connection.shutdown.assert_called_once_with(
             socket.SHUT_RDWR
@@ -186,6 +198,57 @@ class TestKmipSession(testtools.TestCase):
         kmip_session._connection.close.assert_called_once_with()
         kmip_session._logger.info.assert_called_with("Stopping session: name")
 
+    def test_run_with_oversized_request(self):
+        """
+        Test that the session answers a request larger than the maximum
+        request size with an error response and then closes.
+        """
+        kmip_session = session.KmipSession(None, None, None, 'name')
+        kmip_session._logger = mock.MagicMock()
+        kmip_session._connection = mock.MagicMock()
+        kmip_session.reject_oversized_message = mock.MagicMock(
+            return_value=bytearray(b'rejected')
+        )
+
+        test_exception = exceptions.MessageTooLarge("test")
+        kmip_session._handle_message_loop = mock.MagicMock(
+            side_effect=[test_exception, None]
+        )
+
+        kmip_session.run()
+
+        kmip_session._handle_message_loop.assert_called_once_with()
+        kmip_session.reject_oversized_message.assert_called_once_with(
+            test_exception
+        )
+        kmip_session._connection.sendall.assert_called_once_with(b'rejected')
+        kmip_session._connection.close.assert_called_once_with()
+
+    def test_run_with_oversized_request_send_failure(self):
+        """
+        Test that the session still closes when the error response for an
+        oversized request cannot be sent.
+        """
+        kmip_session = session.KmipSession(None, None, None, 'name')
+        kmip_session._logger = mock.MagicMock()
+        kmip_session._connection = mock.MagicMock()
+        kmip_session.reject_oversized_message = mock.MagicMock(
+            return_value=bytearray(b'rejected')
+        )
+
+        test_exception = socket.error("connection reset")
+        kmip_session._connection.sendall.side_effect = test_exception
+        kmip_session._handle_message_loop = mock.MagicMock(
+            side_effect=[exceptions.MessageTooLarge("test"), None]
+        )
+
+        kmip_session.run()
+
+        kmip_session._handle_message_loop.assert_called_once_with()
+        kmip_session._logger.info.assert_any_call("Failure rejecting request")
+        kmip_session._logger.exception.assert_called_once_with(test_exception)
+        kmip_session._connection.close.assert_called_once_with()
+
     @mock.patch('kmip.services.server.auth.get_certificate_from_connection')
     @mock.patch('kmip.core.messages.messages.RequestMessage')
     def test_handle_message_loop(self, request_mock, cert_mock):
@@ -258,7 +321,7 @@ class TestKmipSession(testtools.TestCase):
 
         kmip_session._handle_message_loop()
 
-        kmip_session._receive_request.assert_called_once_with()
+        kmip_session._receive_request.assert_called_once_with(mock.ANY)
         kmip_session._logger.info.assert_any_call(
             "Session client identity: John Doe"
         )
@@ -280,6 +343,29 @@ class TestKmipSession(testtools.TestCase):
         kmip_session._logger.exception.assert_not_called()
         self.assertTrue(kmip_session._send_response.called)
 
+        # Test that the client certificate is only verified once per session.
+        kmip_session._logger.reset_mock()
+
+        kmip_session._handle_message_loop()
+
+        cert_mock.assert_called_once_with(kmip_session._connection)
+        kmip_session._connection.shared_ciphers.assert_called_once_with()
+        self.assertEqual(2, kmip_session._send_response.call_count)
+
+        # Test that a resumed TLS session, which has no shared cipher list,
+        # is handled correctly.
+        kmip_session._logger.reset_mock()
+        kmip_session._certificate = None
+        kmip_session._connection.shared_ciphers.return_value = None
+
+        kmip_session._handle_message_loop()
+
+        kmip_session._logger.debug.assert_any_call(
+            "Possible session ciphers: 0"
+        )
+        kmip_session._logger.warning.assert_not_called()
+        kmip_session._logger.exception.assert_not_called()
+
     @mock.patch('kmip.services.server.auth.get_certificate_from_connection')
     @mock.patch('kmip.core.messages.messages.RequestMessage.read',
                 mock.MagicMock(side_effect=Exception()))
@@ -311,7 +397,7 @@ class TestKmipSession(testtools.TestCase):
 
         kmip_session._handle_message_loop()
 
-        kmip_session._receive_request.assert_called_once_with()
+        kmip_session._receive_request.assert_called_once_with(mock.ANY)
         kmip_session._logger.warning.assert_called_once_with(
             "Failure parsing request message."
         )
@@ -352,7 +438,7 @@ class TestKmipSession(testtools.TestCase):
 
         kmip_session._handle_message_loop()
 
-        kmip_session._receive_request.assert_called_once_with()
+        kmip_session._receive_request.assert_called_once_with(mock.ANY)
         self.assertTrue(kmip_session._logger.warning.called)
         kmip_session._logger.exception.assert_not_called()
         self.assertTrue(kmip_session._send_response.called)
@@ -395,7 +481,7 @@ class TestKmipSession(testtools.TestCase):
 
         kmip_session._handle_message_loop()
 
-        kmip_session._receive_request.assert_called_once_with()
+        kmip_session._receive_request.assert_called_once_with(mock.ANY)
         kmip_session._logger.warning.assert_called_once_with(
             "An unexpected error occurred while processing request."
         )
@@ -427,6 +513,7 @@ class TestKmipSession(testtools.TestCase):
         kmip_session.authenticate.side_effect = exceptions.PermissionDenied(
             "Authentication failed."
         )
+        kmip_session._metrics_sink = mock.MagicMock()
         kmip_session._engine = mock.MagicMock()
         kmip_session._engine.default_protocol_version = \
             kmip_engine.default_protocol_version
@@ -455,10 +542,11 @@ class TestKmipSession(testtools.TestCase):
 
         kmip_session._handle_message_loop()
 
-        kmip_session._receive_request.assert_called_once_with()
+        kmip_session._receive_request.assert_called_once_with(mock.ANY)
         fake_request.read.assert_called_once_with(
             data,
-            kmip_version=enums.KMIPVersion.KMIP_1_2
+            kmip_version=enums.KMIPVersion.KMIP_1_2,
+            lazy=True
         )
         kmip_session.authenticate.assert_called_once_with(
             "test_certificate",
@@ -475,6 +563,10 @@ class TestKmipSession(testtools.TestCase):
         )
         kmip_session._logger.exception.assert_not_called()
         self.assertTrue(kmip_session._send_response.called)
+        kmip_session._metrics_sink.count_error.assert_called_once_with(
+            'None',
+            'AuthenticationNotSuccessful'
+        )
 
     @mock.patch('kmip.services.server.auth.get_certificate_from_connection')
     @mock.patch('kmip.core.messages.messages.RequestMessage')
@@ -506,7 +598,7 @@ class TestKmipSession(testtools.TestCase):
 
         kmip_session._handle_message_loop()
 
-        kmip_session._receive_request.assert_called_once_with()
+        kmip_session._receive_request.assert_called_once_with(mock.ANY)
         kmip_session._logger.warning(
             "Failure verifying the client certificate."
         )
@@ -559,7 +651,7 @@ class TestKmipSession(testtools.TestCase):
 
         kmip_session._handle_message_loop()
 
-        kmip_session._receive_request.assert_called_once_with()
+        kmip_session._receive_request.assert_called_once_with(mock.ANY)
         kmip_session._logger.warning(
             "Failure verifying the client certificate."
         )
@@ -612,7 +704,7 @@ class TestKmipSession(testtools.TestCase):
 
         kmip_session._handle_message_loop()
 
-        kmip_session._receive_request.assert_called_once_with()
+        kmip_session._receive_request.assert_called_once_with(mock.ANY)
         kmip_session._logger.warning(
             "Failure verifying the client certificate."
         )
@@ -630,6 +722,290 @@ class TestKmipSession(testtools.TestCase):
         )
         self.assertTrue(kmip_session._send_response.called)
 
+    def test_handle_message_loop_with_request_pool(self):
+        """
+        Test that the message handling loop processes requests on the request
+        pool when one is provided.
+        """
+        data = utils.BytearrayStream(b'\x42\x00\x78\x01\x00\x00\x00\x00')
+        request_pool = mock.MagicMock()
+        request_pool.submit.return_value.result.return_value = bytearray(
+            b'response'
+        )
+
+        kmip_session = session.KmipSession(
+            None,
+            None,
+            None,
+            name='name',
+            request_pool=request_pool
+        )
+        kmip_session._receive_request = mock.MagicMock(return_value=data)
+        kmip_session._send_response = mock.MagicMock()
+
+        kmip_session._handle_message_loop()
+
+        request_pool.submit.assert_called_once_with(
+            kmip_session.process_message,
+            data,
+            mock.ANY
+        )
+        kmip_session._send_response.assert_called_once_with(
+            bytearray(b'response')
+        )
+
+    def test_handle_message_loop_with_request_pool_overloaded(self):
+        """
+        Test that the message handling loop sends a rejection response when
+        the request pool is full.
+        """
+        data = utils.BytearrayStream(b'\x42\x00\x78\x01\x00\x00\x00\x00')
+        error = exceptions.ServerOverloaded("busy")
+        request_pool = mock.MagicMock()
+        request_pool.submit.side_effect = error
+
+        kmip_session = session.KmipSession(
+            None,
+            None,
+            None,
+            name='name',
+            request_pool=request_pool
+        )
+        kmip_session._receive_request = mock.MagicMock(return_value=data)
+        kmip_session._send_response = mock.MagicMock()
+        kmip_session.reject_message = mock.MagicMock(
+            return_value=bytearray(b'rejected')
+        )
+
+        kmip_session._handle_message_loop()
+
+        kmip_session.reject_message.assert_called_once_with(
+            data,
+            error,
+            mock.ANY
+        )
+        kmip_session._send_response.assert_called_once_with(
+            bytearray(b'rejected')
+        )
+
+    def test_handle_message_loop_with_metrics(self):
+        """
+        Test that the message handling loop times each request and records
+        its phases in the metrics sink.
+        """
+        data = utils.BytearrayStream(b'\x42\x00\x78\x01\x00\x00\x00\x00')
+        metrics_sink = metrics.InMemoryMetricsSink()
+
+        kmip_session = session.KmipSession(
+            None,
+            None,
+            None,
+            name='name',
+            metrics_sink=metrics_sink
+        )
+        kmip_session._receive_request = mock.MagicMock(return_value=data)
+        kmip_session._send_response = mock.MagicMock()
+
+        def process_message(request_data, timer):
+            timer.operation = enums.Operation.CREATE
+            timer.lap('handler')
+            return bytearray(b'response')
+
+        kmip_session.process_message = mock.MagicMock(
+            side_effect=process_message
+        )
+
+        kmip_session._handle_message_loop()
+
+        snapshot = metrics_sink.snapshot()
+        self.assertEqual(['Create'], list(snapshot.keys()))
+        self.assertEqual(
+            set(['read', 'handler', 'send', 'total']),
+            set(snapshot['Create'].keys())
+        )
+        for histogram in snapshot['Create'].values():
+            self.assertEqual(1, histogram.count)
+
+    def test_record_request_with_slow_request(self):
+        """
+        Test that a request taking longer than the slow request threshold is
+        logged with the duration of its phases.
+        """
+        kmip_session = session.KmipSession(
+            None,
+            None,
+            None,
+            name='name',
+            slow_request_threshold=0.5
+        )
+        kmip_session._logger = mock.MagicMock()
+
+        timer = metrics.RequestTimer()
+        timer.operation = enums.Operation.LOCATE
+        timer.phases['handler'] = 0.25
+        timer.started = timer._last - 0.25
+
+        kmip_session.record_request(timer)
+
+        kmip_session._logger.warning.assert_not_called()
+
+        timer.phases['handler'] = 0.75
+        timer.started = timer._last - 0.75
+
+        kmip_session.record_request(timer)
+
+        kmip_session._logger.warning.assert_called_once_with(
+            "Slow request: Locate took 0.750s (handler=0.750s)"
+        )
+
+    def test_reject_message(self):
+        """
+        Test that a rejected request gets an error response using the
+        protocol version of the request.
+        """
+        request = messages.RequestMessage(
+            request_header=messages.RequestHeader(
+                protocol_version=contents.ProtocolVersion(1, 1),
+                batch_count=contents.BatchCount(1)
+            ),
+            batch_items=[
+                messages.RequestBatchItem(
+                    operation=contents.Operation(enums.Operation.QUERY),
+                    request_payload=payloads.QueryRequestPayload(
+                        query_functions=[enums.QueryFunction.QUERY_OPERATIONS]
+                    )
+                )
+            ]
+        )
+        data = utils.BytearrayStream()
+        request.write(data, kmip_version=enums.KMIPVersion.KMIP_1_1)
+
+        kmip_session = session.KmipSession(
+            engine.KmipEngine(),
+            None,
+            None,
+            name='name',
+            metrics_sink=mock.MagicMock()
+        )
+        timer = metrics.RequestTimer()
+        response_data = kmip_session.reject_message(
+            utils.BytearrayStream(data.buffer),
+            exceptions.ServerOverloaded("The server is too busy."),
+            timer
+        )
+
+        # The rejection is counted under the operation of the request.
+        self.assertEqual(enums.Operation.QUERY, timer.operation)
+        self.assertIn('encode', timer.phases)
+        kmip_session._metrics_sink.count_error.assert_called_once_with(
+            'Query',
+            'GeneralFailure'
+        )
+
+        response = messages.ResponseMessage()
+        response.read(
+            utils.BytearrayStream(response_data),
+            kmip_version=enums.KMIPVersion.KMIP_1_1
+        )
+        self.assertEqual(
+            contents.ProtocolVersion(1, 1),
+            response.response_header.protocol_version
+        )
+        batch_item = response.batch_items[0]
+        self.assertEqual(
+            enums.ResultStatus.OPERATION_FAILED,
+            batch_item.result_status.value
+        )
+        self.assertEqual(
+            enums.ResultReason.GENERAL_FAILURE,
+            batch_item.result_reason.value
+        )
+        self.assertEqual(
+            "The server is too busy.",
+            batch_item.result_message.value
+        )
+
+    def test_reject_message_with_invalid_request(self):
+        """
+        Test that a rejected request that cannot be parsed gets a KMIP 1.0
+        error response.
+        """
+        kmip_session = session.KmipSession(
+            None,
+            None,
+            None,
+            name='name'
+        )
+        kmip_session._engine = mock.MagicMock()
+        kmip_session._engine.build_error_response.return_value = (
+            messages.ResponseMessage()
+        )
+        kmip_session._engine.build_error_response.return_value.write = (
+            mock.MagicMock()
+        )
+
+        kmip_session.reject_message(
+            utils.BytearrayStream(b'\x00\x01\x02'),
+            exceptions.ServerOverloaded("busy")
+        )
+
+        kmip_session._engine.build_error_response.assert_called_once_with(
+            contents.ProtocolVersion(1, 0),
+            enums.ResultReason.GENERAL_FAILURE,
+            "busy"
+        )
+
+    def test_reject_oversized_message(self):
+        """
+        Test that an oversized request gets an InvalidMessage error response
+        and that its advertised size is logged as a warning.
+        """
+        kmip_session = session.KmipSession(
+            engine.KmipEngine(),
+            None,
+            None,
+            name='name',
+            metrics_sink=mock.MagicMock()
+        )
+        kmip_session._logger = mock.MagicMock()
+
+        error = exceptions.MessageTooLarge(
+            "The message size (2097152 bytes) exceeds the maximum allowed "
+            "message size (1048576 bytes)."
+        )
+        response_data = kmip_session.reject_oversized_message(error)
+
+        kmip_session._logger.warning.assert_called_once_with(
+            "Rejecting oversized request: The message size (2097152 bytes) "
+            "exceeds the maximum allowed message size (1048576 bytes)."
+        )
+        kmip_session._metrics_sink.count_error.assert_called_once_with(
+            'None',
+            'InvalidMessage'
+        )
+
+        # Only the message header was read, so the response falls back to
+        # KMIP 1.0.
+        response = messages.ResponseMessage()
+        response.read(
+            utils.BytearrayStream(response_data),
+            kmip_version=enums.KMIPVersion.KMIP_1_0
+        )
+        self.assertEqual(
+            contents.ProtocolVersion(1, 0),
+            response.response_header.protocol_version
+        )
+        batch_item = response.batch_items[0]
+        self.assertEqual(
+            enums.ResultStatus.OPERATION_FAILED,
+            batch_item.result_status.value
+        )
+        self.assertEqual(
+            enums.ResultReason.INVALID_MESSAGE,
+            batch_item.result_reason.value
+        )
+        self.assertEqual(str(error), batch_item.result_message.value)
+
     @mock.patch(
         "kmip.services.server.auth.get_client_identity_from_certificate"
     )
@@ -665,6 +1041,35 @@ class TestKmipSession(testtools.TestCase):
         )
         self.assertEqual(("John Doe", None), session_identity)
 
+    @mock.patch(
+        "kmip.services.server.auth.get_client_identity_from_certificate"
+    )
+    def test_authenticate_with_cached_identity(self, mock_get):
+        """
+        Test that the client identity extracted from the client certificate
+        is reused for the rest of the session.
+        """
+        mock_get.return_value = "John Doe"
+        kmip_session = session.KmipSession(
+            None,
+            None,
+            None,
+            name='TestSession'
+        )
+        kmip_session._logger = mock.MagicMock()
+        fake_request = messages.RequestMessage(
+            request_header=messages.RequestHeader()
+        )
+
+        for _ in range(2):
+            session_identity = kmip_session.authenticate(
+                "fake_certificate",
+                fake_request
+            )
+            self.assertEqual(("John Doe", None), session_identity)
+
+        mock_get.assert_called_once_with("fake_certificate")
+
     @mock.patch("kmip.services.server.auth.SLUGSConnector")
     def test_authenticate_against_slugs(self, mock_connector):
         """
@@ -704,7 +1109,7 @@ class TestKmipSession(testtools.TestCase):
             fake_request
         )
 
-        mock_connector.assert_any_call("test_url")
+        mock_connector.assert_any_call("test_url", timeout=10.0)
         kmip_session._logger.debug.assert_any_call(
             "Authenticating with plugin: auth:slugs"
         )
@@ -720,6 +1125,52 @@ class TestKmipSession(testtools.TestCase):
         self.assertEqual("John Doe", result[0])
         self.assertEqual(["Group A"], result[1])
 
+    @mock.patch("kmip.services.server.auth.SLUGSConnector")
+    def test_authenticate_against_slugs_with_cache(self, mock_connector):
+        """
+        Test that SLUGS plugins are shared by sessions and that their results
+        are cached with the configured settings.
+        """
+        mock_instance = mock.MagicMock()
+        mock_instance.authenticate.return_value = ("John Doe", ["Group A"])
+        mock_connector.return_value = mock_instance
+        auth_settings = [(
+            "auth:slugs",
+            {
+                "enabled": "True",
+                "url": "test_url",
+                "timeout": "2.5",
+                "cache_ttl": "60",
+                "cache_negative_ttl": "5"
+            }
+        )]
+        fake_request = messages.RequestMessage(
+            request_header=messages.RequestHeader()
+        )
+
+        for name in ("TestSession1", "TestSession2"):
+            kmip_session = session.KmipSession(
+                None,
+                None,
+                ("127.0.0.1", 48026),
+                name=name,
+                auth_settings=auth_settings
+            )
+            kmip_session._logger = mock.MagicMock()
+            result = kmip_session.authenticate(
+                "fake_certificate",
+                fake_request
+            )
+            self.assertEqual(("John Doe", ["Group A"]), result)
+
+        mock_connector.assert_called_once_with("test_url", timeout=2.5)
+        self.assertEqual(1, mock_instance.authenticate.call_count)
+
+        plugin = list(session._auth_plugins.values())[0]
+        self.assertIsInstance(plugin, auth.CachingAuthenticator)
+        self.assertEqual(60.0, plugin._ttl)
+        self.assertEqual(5.0, plugin._negative_ttl)
+
     @mock.patch("kmip.services.server.auth.SLUGSConnector")
     def test_authenticate_against_slugs_with_failure(self, mock_connector):
         """
@@ -765,7 +1216,7 @@ class TestKmipSession(testtools.TestCase):
             *args
         )
 
-        mock_connector.assert_any_call("test_url")
+        mock_connector.assert_any_call("test_url", timeout=10.0)
         kmip_session._logger.debug.assert_any_call(
             "Authenticating with plugin: auth:slugs"
         )
@@ -806,68 +1257,84 @@ class TestKmipSession(testtools.TestCase):
         Test that the session can correctly receive and parse a message
         encoding.
         """
-        content = b'\x00\x00\x00\x00\x00\x00\x00\x00'
-        expected = utils.BytearrayStream((content))
+        content = b'\x42\x00\x78\x01\x00\x00\x00\x08' + b'\x01' * 8
+        chunks = [content[:6], content[6:8], content[8:]]
 
-        kmip_session = session.KmipSession(None, None, None, 'name')
-        kmip_session._receive_bytes = mock.MagicMock(
-            side_effect=[content, b'']
-        )
+        def recv_into(view):
+            chunk = chunks.pop(0)
+            view[:len(chunk)] = chunk
+            return len(chunk)
 
-        observed = kmip_session._receive_request()
+        kmip_session = session.KmipSession(None, None, None, 'name')
+        kmip_session._connection = mock.MagicMock()
+        kmip_session._connection.recv_into.side_effect = recv_into
 
-        kmip_session._receive_bytes.assert_any_call(8)
-        kmip_session._receive_bytes.assert_any_call(0)
+        observed = kmip_session._receive_request(metrics.RequestTimer())
 
-        self.assertEqual(expected.buffer, observed.buffer)
+        self.assertEqual(3, kmip_session._connection.recv_into.call_count)
+        self.assertEqual(content, observed.buffer)
 
-    def test_receive_bytes(self):
+    def test_receive_request_with_closed_connection(self):
         """
-        Test that the session can receive a message.
+        Test that a ConnectionClosed error is raised when the client closes
+        the connection.
         """
-        content = b'\x00\x00\x00\x00\x00\x00\x00\x00'
-
         kmip_session = session.KmipSession(None, None, None, 'name')
         kmip_session._connection = mock.MagicMock()
-        kmip_session._connection.recv = mock.MagicMock(
-            side_effect=[content, content]
-        )
-
-        observed = kmip_session._receive_bytes(16)
+        kmip_session._connection.recv_into.return_value = 0
 
-        kmip_session._connection.recv.assert_any_call(16)
-        kmip_session._connection.recv.assert_called_with(8)
-        self.assertEqual(content + content, observed)
-
-        kmip_session._connection.recv = mock.MagicMock(
-            side_effect=['']
-        )
-
-        args = (8, )
         self.assertRaises(
             exceptions.ConnectionClosed,
-            kmip_session._receive_bytes,
-            *args
+            kmip_session._receive_request,
+            metrics.RequestTimer()
         )
 
-    def test_receive_bytes_with_bad_length(self):
+    def test_receive_request_with_bad_length(self):
         """
         Test that the session generates an error on an incorrectly sized
         message.
         """
-        content = b'\x00\x00\x00\x00\x00\x00\x00\x00'
+        content = b'\x42\x00\x78\x01\x00\x00\x00\x20' + b'\x01' * 8
+        chunks = [content[:8], content[8:]]
+
+        def recv_into(view):
+            if not chunks:
+                return 0
+            chunk = chunks.pop(0)
+            view[:len(chunk)] = chunk
+            return len(chunk)
 
         kmip_session = session.KmipSession(None, None, None, 'name')
         kmip_session._connection = mock.MagicMock()
-        kmip_session._connection.recv = mock.MagicMock(
-            side_effect=[content, content, None]
+        kmip_session._connection.recv_into.side_effect = recv_into
+
+        self.assertRaises(
+            ValueError,
+            kmip_session._receive_request,
+            metrics.RequestTimer()
         )
 
-        args = [32]
-        self.assertRaises(ValueError, kmip_session._receive_bytes, *args)
+    def test_receive_request_too_large(self):
+        """
+        Test that a request larger than the maximum request size is rejected
+        before its body is read.
+        """
+        header = b'\x42\x00\x78\x01\x00\x10\x00\x08'
+
+        def recv_into(view):
+            view[:8] = header
+            return 8
 
-        kmip_session._connection.recv.assert_any_call(16)
-        kmip_session._connection.recv.assert_called_with(16)
+        kmip_session = session.KmipSession(None, None, None, 'name')
+        kmip_session._connection = mock.MagicMock()
+        kmip_session._connection.recv_into.side_effect = recv_into
+
+        self.assertRaises(
+            exceptions.MessageTooLarge,
+            kmip_session._receive_request,
+            metrics.RequestTimer()
+        )
+        kmip_session._connection.recv_into.assert_called_once_with(mock.ANY)
 
     def test_send_message(self):
         """
@@ -0,0 +1,212 @@
+# Copyright (c) 2020 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import mock
+import socket
+import testtools
+
+from kmip.core import exceptions
+from kmip.services import framing
+
+
+class FakeConnection(object):
+    """
+    A connection delivering a sequence of chunks through recv_into.
+    """
+
+    def __init__(self, chunks):
+        self.chunks = list(chunks)
+        self.recv_into = mock.MagicMock(side_effect=self._recv_into)
+
+    def _recv_into(self, view):
+        if not self.chunks:
+            return 0
+        chunk = self.chunks.pop(0)
+        count = min(len(chunk), len(view))
+        view[:count] = chunk[:count]
+        if count < len(chunk):
+            self.chunks.insert(0, chunk[count:])
+        return count
+
+
+class TestFraming(testtools.TestCase):
+    """
+    Test suite for the message framing functions.
+    """
+
+    def setUp(self):
+        super(TestFraming, self).setUp()
+
+        self.message = b'\x42\x00\x78\x01\x00\x00\x00\x10' + b'\x01' * 16
+
+    def test_get_message_size(self):
+        """
+        Test that the message size is read from a message header.
+        """
+        self.assertEqual(16, framing.get_message_size(self.message[:8]))
+        self.assertEqual(
+            16,
+            framing.get_message_size(bytearray(self.message[:8]), 16)
+        )
+
+    def test_get_message_size_too_large(self):
+        """
+        Test that a MessageTooLarge error is raised for a message larger than
+        the maximum size.
+        """
+        args = (self.message[:8], 15)
+        self.assertRaisesRegex(
+            exceptions.MessageTooLarge,
+            "The message size \\(16 bytes\\) exceeds the maximum allowed "
+            "message size \\(15 bytes\\).",
+            framing.get_message_size,
+            *args
+        )
+
+    def test_allocate_message(self):
+        """
+        Test that a writable buffer sized for the whole message is allocated
+        from the message header.
+        """
+        view = framing.allocate_message(self.message[:8], 16)
+
+        self.assertIsInstance(view, memoryview)
+        self.assertFalse(view.readonly)
+        self.assertEqual(self.message[:8] + b'\x00' * 16, bytes(view))
+
+        args = (self.message[:8], 15)
+        self.assertRaises(
+            exceptions.MessageTooLarge,
+            framing.allocate_message,
+            *args
+        )
+
+    def test_receive_message(self):
+        """
+        Test that a message split across several chunks is received into a
+        single read-only buffer.
+        """
+        connection = FakeConnection(
+            [self.message[:3], self.message[3:12], self.message[12:]]
+        )
+
+        message = framing.receive_message(connection, max_size=16)
+
+        self.assertIsInstance(message, memoryview)
+        self.assertTrue(message.readonly)
+        self.assertEqual(self.message, bytes(message))
+        self.assertEqual(4, connection.recv_into.call_count)
+
+    def test_receive_message_with_header_callback(self):
+        """
+        Test that the header callback is called once the header is received,
+        before the message body is read.
+        """
+        connection = FakeConnection([self.message[:8], self.message[8:]])
+
+        def on_header():
+            self.assertEqual([self.message[8:]], connection.chunks)
+
+        on_header = mock.MagicMock(side_effect=on_header)
+
+        message = framing.receive_message(connection, on_header=on_header)
+
+        on_header.assert_called_once_with()
+        self.assertEqual(self.message, bytes(message))
+
+    def test_receive_message_closed(self):
+        """
+        Test that a ConnectionClosed error is raised if the connection is
+        closed before a message starts.
+        """
+        connection = FakeConnection([])
+
+        self.assertRaises(
+            exceptions.ConnectionClosed,
+            framing.receive_message,
+            connection
+        )
+
+    def test_receive_message_incomplete_header(self):
+        """
+        Test that an IncompleteMessage error is raised if the connection is
+        closed within the message header.
+        """
+        connection = FakeConnection([self.message[:5]])
+
+        e = self.assertRaises(
+            framing.IncompleteMessage,
+            framing.receive_message,
+            connection
+        )
+        self.assertEqual(8, e.expected)
+        self.assertEqual(5, e.received)
+
+    def test_receive_message_incomplete_body(self):
+        """
+        Test that an IncompleteMessage error is raised if the connection is
+        closed within the message body.
+        """
+        connection = FakeConnection([self.message[:20]])
+
+        e = self.assertRaises(
+            framing.IncompleteMessage,
+            framing.receive_message,
+            connection
+        )
+        self.assertEqual(
+            "Invalid KMIP message received. Actual message length does not "
+            "match the advertised header length.",
+            str(e)
+        )
+        self.assertEqual(16, e.expected)
+        self.assertEqual(12, e.received)
+
+    def test_receive_message_too_large(self):
+        """
+        Test that an oversized message is rejected before its body is read.
+        """
+        connection = FakeConnection([self.message])
+
+        self.assertRaises(
+            exceptions.MessageTooLarge,
+            framing.receive_message,
+            connection,
+            max_size=8
+        )
+        connection.recv_into.assert_called_once_with(mock.ANY)
+        self.assertEqual([self.message[8:]], connection.chunks)
+
+    def test_receive_message_from_socket(self):
+        """
+        Test that messages are received from a socket.
+        """
+        a, b = socket.socketpair()
+        self.addCleanup(a.close)
+        self.addCleanup(b.close)
+
+        a.sendall(self.message + self.message[:8] + b'\x00' * 16)
+        a.close()
+
+        self.assertEqual(self.message, bytes(framing.receive_message(b)))
+        self.assertEqual(
+            self.message[:8] + b'\x00' * 16,
+            bytes(framing.receive_message(b))
+        )
+        self.assertRaises(
+            exceptions.ConnectionClosed,
+            framing.receive_message,
+            b
+        )
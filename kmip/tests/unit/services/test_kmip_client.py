@@ -39,6 +39,7 @@ from kmip.core.factories.secrets import SecretFactory
 from kmip.core.messages.messages import RequestBatchItem
 from kmip.core.messages.messages import ResponseBatchItem
 from kmip.core.messages.messages import ResponseMessage
+from kmip.core.messages.contents import AsynchronousCorrelationValue
 from kmip.core.messages.contents import Operation
 from kmip.core.messages.contents import ResultStatus
 from kmip.core.messages.contents import ResultReason
@@ -774,6 +775,103 @@ class TestKMIPClient(TestCase):
         self.client._create_socket(sock)
         self.assertEqual(ssl.SSLSocket, type(self.client.socket))
 
+    def test_create_ssl_context(self):
+        """
+        Test that the TLS context is built from the client settings.
+        """
+        c = KMIPProxy(
+            host='127.0.0.1',
+            port=5696,
+            keyfile='/test/path/client.key',
+            certfile='/test/path/client.crt',
+            cert_reqs='CERT_REQUIRED',
+            ssl_version='PROTOCOL_TLSv1_2',
+            ca_certs='/test/path/ca.crt'
+        )
+
+        with mock.patch('ssl.SSLContext') as context_mock:
+            context = c._create_ssl_context()
+
+        context_mock.assert_called_once_with(ssl.PROTOCOL_TLSv1_2)
+        self.assertEqual(ssl.CERT_REQUIRED, context.verify_mode)
+        context.load_cert_chain.assert_called_once_with(
+            '/test/path/client.crt',
+            '/test/path/client.key'
+        )
+        context.load_verify_locations.assert_called_once_with(
+            '/test/path/ca.crt'
+        )
+
+    def test_create_socket_with_tls_session(self):
+        """
+        Test that the TLS context is reused across connections and that a
+        saved TLS session is offered when reconnecting to the same server.
+        """
+        c = KMIPProxy(host='IP_ADDR_1, IP_ADDR_2', port=5696)
+        c._create_ssl_context = mock.MagicMock()
+        context = c._create_ssl_context.return_value
+        tls_session = mock.MagicMock()
+
+        c.host = 'IP_ADDR_1'
+        c._create_socket(mock.MagicMock())
+        c.socket.session = tls_session
+        c._save_tls_session()
+
+        sock = mock.MagicMock()
+        c._create_socket(sock)
+        context.wrap_socket.assert_called_with(
+            sock,
+            do_handshake_on_connect=True,
+            suppress_ragged_eofs=True,
+            session=tls_session
+        )
+
+        c.host = 'IP_ADDR_2'
+        c._create_socket(sock)
+        context.wrap_socket.assert_called_with(
+            sock,
+            do_handshake_on_connect=True,
+            suppress_ragged_eofs=True
+        )
+        c._create_ssl_context.assert_called_once_with()
+
+    @mock.patch.object(KMIPProxy, '_create_socket')
+    def test_open_with_tls_session(self, mock_create_socket):
+        """
+        Test that the TLS handshakes and session resumptions are counted and
+        that the TLS session is saved when the connection is opened and
+        closed.
+        """
+        self.mock_client.socket.connect.side_effect = [Exception, None, None]
+        self.mock_client.socket.session_reused = False
+        self.mock_client.open()
+
+        self.assertEqual(
+            {'tls_handshakes': 1, 'tls_resumptions': 0},
+            self.mock_client.statistics
+        )
+        self.assertEqual(
+            self.mock_client.socket.session,
+            self.mock_client._tls_sessions[('IP_ADDR_2', 9090)]
+        )
+
+        tls_session = mock.MagicMock()
+        self.mock_client.socket.session = tls_session
+        self.mock_client.close()
+        self.assertEqual(
+            tls_session,
+            self.mock_client._tls_sessions[('IP_ADDR_2', 9090)]
+        )
+
+        self.mock_client.socket = mock.MagicMock()
+        self.mock_client.socket.session_reused = True
+        self.mock_client.open()
+
+        self.assertEqual(
+            {'tls_handshakes': 2, 'tls_resumptions': 1},
+            self.mock_client.statistics
+        )
+
     @mock.patch(
         "kmip.services.kmip_client.KMIPProxy._build_request_message"
     )
@@ -1083,6 +1181,199 @@ class TestKMIPClient(TestCase):
             *args
         )
 
+    @mock.patch(
+        "kmip.services.kmip_client.KMIPProxy._send_and_receive_message"
+    )
+    def test_send_asynchronous_request_payload(self, send_mock):
+        """
+        Test that an asynchronous request is sent with the asynchronous
+        indicator set and that the asynchronous correlation value is
+        returned.
+        """
+        batch_item = ResponseBatchItem(
+            operation=Operation(OperationEnum.CREATE_KEY_PAIR),
+            result_status=ResultStatus(ResultStatusEnum.OPERATION_PENDING),
+            async_correlation_value=AsynchronousCorrelationValue(b'\x01')
+        )
+        send_mock.return_value = ResponseMessage(batch_items=[batch_item])
+
+        result = self.client.send_asynchronous_request_payload(
+            OperationEnum.CREATE_KEY_PAIR,
+            payloads.CreateKeyPairRequestPayload()
+        )
+
+        self.assertEqual(b'\x01', result)
+        request = send_mock.call_args[0][0]
+        self.assertTrue(
+            request.request_header.asynchronous_indicator.value
+        )
+        self.assertEqual(
+            OperationEnum.CREATE_KEY_PAIR,
+            request.batch_items[0].operation.value
+        )
+
+    @mock.patch(
+        "kmip.services.kmip_client.KMIPProxy._send_and_receive_message"
+    )
+    def test_send_asynchronous_request_payload_not_pending(self, send_mock):
+        """
+        Test that the right errors are raised when an asynchronous request
+        fails or is not processed asynchronously.
+        """
+        args = (
+            OperationEnum.CREATE_KEY_PAIR,
+            payloads.CreateKeyPairRequestPayload()
+        )
+        self.assertRaisesRegex(
+            TypeError,
+            "The request payload must be a RequestPayload object.",
+            self.client.send_asynchronous_request_payload,
+            OperationEnum.CREATE_KEY_PAIR,
+            None
+        )
+
+        send_mock.return_value = ResponseMessage(batch_items=[
+            ResponseBatchItem(
+                operation=Operation(OperationEnum.CREATE_KEY_PAIR),
+                result_status=ResultStatus(ResultStatusEnum.OPERATION_FAILED),
+                result_reason=ResultReason(ResultReasonEnum.GENERAL_FAILURE),
+                result_message=ResultMessage("Test failed!")
+            )
+        ])
+        self.assertRaisesRegex(
+            exceptions.OperationFailure,
+            "Test failed!",
+            self.client.send_asynchronous_request_payload,
+            *args
+        )
+
+        send_mock.return_value = ResponseMessage(batch_items=[
+            ResponseBatchItem(
+                operation=Operation(OperationEnum.CREATE_KEY_PAIR),
+                result_status=ResultStatus(ResultStatusEnum.SUCCESS),
+                response_payload=payloads.CreateKeyPairResponsePayload()
+            )
+        ])
+        self.assertRaisesRegex(
+            exceptions.InvalidMessage,
+            "The server did not process the request asynchronously.",
+            self.client.send_asynchronous_request_payload,
+            *args
+        )
+
+    @mock.patch(
+        "kmip.services.kmip_client.KMIPProxy._send_and_receive_message"
+    )
+    def test_poll(self, send_mock):
+        """
+        Test that a Poll request returns the result of the asynchronous
+        operation, or None while it is pending.
+        """
+        send_mock.return_value = ResponseMessage(batch_items=[
+            ResponseBatchItem(
+                operation=Operation(OperationEnum.CREATE_KEY_PAIR),
+                result_status=ResultStatus(ResultStatusEnum.OPERATION_PENDING),
+                async_correlation_value=AsynchronousCorrelationValue(b'\x01')
+            )
+        ])
+
+        self.assertIsNone(self.client.poll(b'\x01'))
+        request = send_mock.call_args[0][0]
+        self.assertIsNone(request.request_header.asynchronous_indicator)
+        self.assertEqual(
+            OperationEnum.POLL,
+            request.batch_items[0].operation.value
+        )
+        self.assertEqual(
+            b'\x01',
+            request.batch_items[0].request_payload.
+            asynchronous_correlation_value
+        )
+
+        response_payload = payloads.CreateKeyPairResponsePayload(
+            private_key_unique_identifier="2",
+            public_key_unique_identifier="1"
+        )
+        send_mock.return_value = ResponseMessage(batch_items=[
+            ResponseBatchItem(
+                operation=Operation(OperationEnum.CREATE_KEY_PAIR),
+                result_status=ResultStatus(ResultStatusEnum.SUCCESS),
+                response_payload=response_payload
+            )
+        ])
+        self.assertEqual(response_payload, self.client.poll(b'\x01'))
+
+        send_mock.return_value = ResponseMessage(batch_items=[
+            ResponseBatchItem(
+                operation=Operation(OperationEnum.CREATE_KEY_PAIR),
+                result_status=ResultStatus(ResultStatusEnum.OPERATION_FAILED),
+                result_reason=ResultReason(ResultReasonEnum.ITEM_NOT_FOUND),
+                result_message=ResultMessage("Test failed!")
+            )
+        ])
+        self.assertRaisesRegex(
+            exceptions.OperationFailure,
+            "Test failed!",
+            self.client.poll,
+            b'\x01'
+        )
+
+    @mock.patch(
+        "kmip.services.kmip_client.KMIPProxy._send_and_receive_message"
+    )
+    def test_cancel(self, send_mock):
+        """
+        Test that a Cancel request returns the cancellation result.
+        """
+        send_mock.return_value = ResponseMessage(batch_items=[
+            ResponseBatchItem(
+                operation=Operation(OperationEnum.CANCEL),
+                result_status=ResultStatus(ResultStatusEnum.SUCCESS),
+                response_payload=payloads.CancelResponsePayload(
+                    asynchronous_correlation_value=b'\x01',
+                    cancellation_result=enums.CancellationResult.CANCELED
+                )
+            )
+        ])
+
+        self.assertEqual(
+            enums.CancellationResult.CANCELED,
+            self.client.cancel(b'\x01')
+        )
+        request = send_mock.call_args[0][0]
+        self.assertEqual(
+            OperationEnum.CANCEL,
+            request.batch_items[0].operation.value
+        )
+
+        send_mock.return_value = ResponseMessage(batch_items=[
+            ResponseBatchItem(
+                operation=Operation(OperationEnum.CANCEL),
+                result_status=ResultStatus(ResultStatusEnum.OPERATION_FAILED),
+                result_reason=ResultReason(ResultReasonEnum.ITEM_NOT_FOUND),
+                result_message=ResultMessage("Test failed!")
+            )
+        ])
+        self.assertRaisesRegex(
+            exceptions.OperationFailure,
+            "Test failed!",
+            self.client.cancel,
+            b'\x01'
+        )
+
+        send_mock.return_value = ResponseMessage(batch_items=[
+            ResponseBatchItem(
+                operation=Operation(OperationEnum.CANCEL),
+                result_status=ResultStatus(ResultStatusEnum.SUCCESS)
+            )
+        ])
+        self.assertRaisesRegex(
+            exceptions.InvalidMessage,
+            "Invalid response payload received for the Cancel operation.",
+            self.client.cancel,
+            b'\x01'
+        )
+
     @mock.patch(
         'kmip.services.kmip_client.KMIPProxy._build_request_message'
     )
@@ -13,11 +13,12 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
-from mock import call, MagicMock
+from mock import MagicMock
 from testtools import TestCase
 
 import binascii
 
+from kmip.core import exceptions
 from kmip.services.kmip_protocol import KMIPProtocol
 from kmip.services.kmip_protocol import RequestLengthMismatch
 from kmip.services.kmip_protocol import KMIPProtocolFactory
@@ -75,22 +76,31 @@ class TestKMIPProtocol(TestCase):
             "KMIPProtocol.write: {0}".format(binascii.hexlify(self.request)))
         protocol.socket.sendall.assert_called_once_with(self.request)
 
+    def _recv_into(self, socket, chunks):
+        chunks = list(chunks)
+
+        def recv_into(view):
+            if not chunks:
+                return 0
+            chunk = chunks.pop(0)
+            view[:len(chunk)] = chunk
+            return len(chunk)
+
+        socket.recv_into = MagicMock(side_effect=recv_into)
+
     def test_IO_read(self):
         socket = MagicMock()
-        socket.recv = MagicMock(
-            side_effect=[self.response[:8], self.response[8:]])
+        self._recv_into(socket, [self.response[:8], self.response[8:]])
         protocol = self.factory.getProtocol(socket)
 
         received = protocol.read()
 
-        socket.recv.assert_any_call(8)
-        socket.recv.assert_any_call(len(self.response) - 8)
-
+        self.assertEqual(2, socket.recv_into.call_count)
         self.assertEqual(self.response, received.peek())
 
     def test_IO_read_EOF(self):
         socket = MagicMock()
-        socket.recv = MagicMock(side_effect=[[]])
+        self._recv_into(socket, [])
         protocol = self.factory.getProtocol(socket)
 
         try:
@@ -100,12 +110,11 @@ class TestKMIPProtocol(TestCase):
         else:
             self.assertTrue(False, "Unexpected error")
 
-        socket.recv.assert_any_call(8)
+        self.assertEqual(1, socket.recv_into.call_count)
 
     def test_IO_read_request_length_mismatch(self):
         socket = MagicMock()
-        socket.recv = MagicMock(
-            side_effect=[self.response[:8], self.response[8:16], []])
+        self._recv_into(socket, [self.response[:8], self.response[8:16]])
         protocol = self.factory.getProtocol(socket)
         resp_len = len(self.response)
 
@@ -124,5 +133,12 @@ class TestKMIPProtocol(TestCase):
         else:
             self.assertTrue(False, "Unexpected error")
 
-        calls = [call(8), call(resp_len - 8), call(resp_len - 16)]
-        socket.recv.assert_has_calls(calls)
+        self.assertEqual(3, socket.recv_into.call_count)
+
+    def test_IO_read_too_large(self):
+        socket = MagicMock()
+        self._recv_into(socket, [self.response[:8], self.response[8:]])
+        protocol = KMIPProtocol(socket, max_message_size=16)
+
+        self.assertRaises(exceptions.MessageTooLarge, protocol.read)
+        self.assertEqual(1, socket.recv_into.call_count)